@@ -87,14 +87,16 @@ def __init__( self                 ,
                   maxfiles    = 100000 ,
                   check       = True   ,
                   silent      = False  , 
-                  parallel    = False  ) :  
+                  parallel    = False  ,
+                  cache       = True   ) :  
         
         Data.__init__ ( self , files , lumi ,  
                         description = description ,
                         maxfiles    = maxfiles    ,
                         check       = check       , 
                         silent      = silent      , 
-                        parallel    = parallel    )
+                        parallel    = parallel    ,
+                        cache       = cache       )
     # =========================================================================
     @property
     def lumi ( self ) :
@@ -151,7 +153,8 @@ def __init__( self                 ,
                   maxfiles    = 100000 ,
                   check       = True   ,
                   silent      = False  , 
-                  parallel    = False  ) :  
+                  parallel    = False  ,
+                  cache       = True   ) :  
 
         allchains = chains + ( lumi , ) 
         Data.__init__ ( self  , files , *allchains ,
@@ -159,7 +162,8 @@ def __init__( self                 ,
                         maxfiles    = maxfiles     ,
                         check       = check        , 
                         silent      = silent       ,
-                        parallel    = parallel     )
+                        parallel    = parallel     ,
+                        cache       = cache        )
         
     # =========================================================================
     @property
@@ -82,6 +82,7 @@
                                           OSTAP_NCPUS          ,
                                           OSTAP_IMPLICITMT     ,                                          
                                           OSTAP_PROFILE        ,                                          
+                                          OSTAP_LAZY           ,
                                           ##
                                           OSTAP_TABLE          ,
                                           OSTAP_PROTOCOL       ,
@@ -144,6 +145,7 @@ def get_list ( expression ) :
     'NCPus'       : str ( default_config.ncpus         ) ,
     'ImplicitMT'  : str ( default_config.implicitMT    ) ,
     'Profile'     : str ( default_config.profile       ) ,
+    'Lazy'        : str ( default_config.lazy          ) ,
     'Protocol'    : str ( default_config.protocol      ) ,    
     ##
     'Startup'     : ', ' .join ( v for v in default_config.startup_files ) ,
@@ -317,6 +319,12 @@ def get_list ( expression ) :
     value = get_env ( OSTAP_PROFILE , '' , silent = True  )
     if    boolean_false ( value ) :  general [ 'Profile' ] = 'False'
     elif  boolean_true  ( value ) :  general [ 'Profile' ] = 'True'
+
+if has_env ( OSTAP_LAZY ) :
+    
+    value = get_env ( OSTAP_LAZY , '' , silent = True  )
+    if    boolean_false ( value ) :  general [ 'Lazy' ] = 'False'
+    elif  boolean_true  ( value ) :  general [ 'Lazy' ] = 'True'
     
 # ============================================================================
 ## redefine web display from the environment variable
@@ -395,6 +403,7 @@ def get_list ( expression ) :
 parallel     = general.get        ( 'Parallel'    , fallback = default_config.parallel     )
 implicitMT   = general.getboolean ( 'ImplicitMT'  , fallback = default_config.implicitMT   )
 profile      = general.getboolean ( 'Profile'     , fallback = default_config.profile      )
+lazy         = general.getboolean ( 'Lazy'        , fallback = default_config.lazy         )
 
 protocol     = general.getint     ( 'Protocol'    , fallback = default_config.protocol     )
 
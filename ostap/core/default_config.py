@@ -50,6 +50,7 @@
 ncpus        = -1                    ## use all CPUs 
 implicitMT   = True                  ## implicit multithreading 
 profile      = False                 ## profile the execution? 
+lazy         = True                  ## lazy loading of decorations? 
 
 table_style  = 'default'             ## Table style
 
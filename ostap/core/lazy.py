@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file ostap/core/lazy.py
+#  Lazy loading of decorations for ROOT/RooFit classes
+#
+#  Decorations are installed at the first use of the decorated class,
+#  using the standard ROOT pythonization mechanism.
+#  The decorating module is imported when the class proxy is created
+#  (or immediately, if the class is already in use)
+#
+#  @code
+#  from ostap.core.lazy import lazy_decorate
+#  lazy_decorate ( 'ostap.trees.trees' , 'TTree' , 'TChain' , 'TLeaf' )
+#  @endcode
+#
+#  The lazy mode can be switched off via <code>Lazy</code> configuration
+#  parameter in <code>General</code> section or <code>OSTAP_LAZY</code>
+#  environment variable
+#  @see ROOT.pythonization
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2026-10-17
+# =============================================================================
+""" Lazy loading of decorations for ROOT/RooFit classes
+
+Decorations are installed at the first use of the decorated class,
+using the standard ROOT pythonization mechanism.
+The decorating module is imported when the class proxy is created
+(or immediately, if the class is already in use)
+
+>>> from ostap.core.lazy import lazy_decorate
+>>> lazy_decorate ( 'ostap.trees.trees' , 'TTree' , 'TChain' , 'TLeaf' )
+
+The lazy mode can be switched off via `Lazy` configuration
+parameter in `General` section or `OSTAP_LAZY` environment variable
+- see `ROOT.pythonization`
+"""
+# =============================================================================
+__version__ = "$Revision$"
+__author__  = "Vanya BELYAEV Ivan.Belyaev@itep.ru"
+__date__    = "2026-10-17"
+__all__     = (
+    'lazy'             , ## is lazy mode activated ?
+    'lazy_decorate'    , ## register lazy decorations for ROOT classes
+    'lazy_modules'     , ## registered modules and their status
+    'load_decorations' , ## load all registered decorations
+    )
+# =============================================================================
+import ostap.core.config as     config
+import ROOT, sys, importlib
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'ostap.core.lazy' )
+else                       : logger = getLogger ( __name__          )
+# =============================================================================
+## is lazy mode activated ?
+lazy = config.lazy and hasattr ( ROOT , 'pythonization' )
+# =============================================================================
+## registered modules: module name -> ( namespace , class-prefixes )
+_modules = {}
+# =============================================================================
+## import the decorating module
+def _load_ ( module ) :
+    """ Import the decorating module
+    """
+    if module in sys.modules : return sys.modules [ module ]
+    logger.debug ( "Load decorations from '%s'" % module )
+    return importlib.import_module ( module )
+
+# =============================================================================
+## Register lazy decorations for ROOT classes
+#  The module is imported at the first use of any class,
+#  which name starts from one of the specified prefixes
+#  @code
+#  lazy_decorate ( 'ostap.trees.trees'   , 'TTree' , 'TChain' , 'TLeaf' )
+#  lazy_decorate ( 'ostap.fitting.roofit' , 'Roo'  )
+#  @endcode
+#  @param module  the name of decorating module
+#  @param classes class-name prefixes
+#  @param ns      the namespace for classes
+def lazy_decorate ( module , *classes , ns = '::' ) :
+    """ Register lazy decorations for ROOT classes
+    The module is imported at the first use of any class,
+    which name starts from one of the specified prefixes
+    >>> lazy_decorate ( 'ostap.trees.trees'   , 'TTree' , 'TChain' , 'TLeaf' )
+    >>> lazy_decorate ( 'ostap.fitting.roofit' , 'Roo'  )
+    """
+    ns_ , prefixes = _modules.get ( module , ( ns , () ) )
+    _modules [ module ] = ns , prefixes + tuple ( classes )
+
+    ## no lazy mode: import the module right now
+    if not lazy or not classes : return _load_ ( module )
+
+    ## the pythonizor: import the module at the first use of the class
+    def _pythonizor_ ( klass , name ) :
+        if module in sys.modules : return
+        try :
+            _load_ ( module )
+        except Exception :
+            logger.error ( "Cannot load decorations for '%s' from '%s'" % ( name , module ) , exc_info = True )
+
+    for prefix in classes :
+        ROOT.pythonization ( prefix , ns = ns , is_prefix = True ) ( _pythonizor_ )
+
+# =============================================================================
+## Get the registered modules and their status
+#  @code
+#  for module , loaded in lazy_modules () : ...
+#  @endcode
+def lazy_modules () :
+    """ Get the registered modules and their status
+    >>> for module , loaded in lazy_modules () : ...
+    """
+    return tuple ( ( m , m in sys.modules ) for m in _modules )
+
+# =============================================================================
+## Load all registered decorations
+#  @code
+#  load_decorations ()
+#  @endcode
+def load_decorations () :
+    """ Load all registered decorations
+    >>> load_decorations ()
+    """
+    for module in _modules : _load_ ( module )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+# =============================================================================
+##                                                                      The END
+# =============================================================================
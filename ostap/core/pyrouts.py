@@ -80,40 +80,72 @@
                                     zechEff  , wilsonEff , agrestiCoullEff ,
                                     iszero   , isequal   ,
                                     isint    , islong    , natural_entry   )
-from   ostap.histos.histos import ( binomEff_h1 , binomEff_h2 , binomEff_h3 ,
-                                    h1_axis     , h2_axes     , h3_axes     ,
-                                    ve_adjust   , histoGuess  )
 #
 from   ostap.io.root_file   import ROOTCWD
-
-import ostap.trees.trees
-import ostap.trees.cuts
-
-import ostap.histos.param
-import ostap.histos.compare
+from   ostap.core.lazy      import lazy_decorate
 
 import ostap.io.root_file
 
 import ostap.math.polynomials
 import ostap.math.models
-import ostap.utils.hepdata 
 import ostap.utils.pdg_format 
 
 import ostap.plotting.canvas
 import ostap.plotting.style 
 import ostap.plotting.color 
 
-import ostap.fitting.minuit 
-import ostap.fitting.roofit 
-
 import ostap.plotting.draw_attributes 
 
 # =============================================================================
-## graphs 
+## decorations, loaded at the first use of the decorated classes 
 # =============================================================================
-from ostap.histos.graphs import ( makeGraph , lw_graph  , 
-                                  hToGraph  , hToGraph2 , hToGraph3 )
+lazy_decorate ( 'ostap.trees.trees'    , 'TTree' , 'TChain' , 'TLeaf' , 'TBranch' )
+lazy_decorate ( 'ostap.trees.trees'    , 'Branches'  , ns = 'Ostap::Trees' )
+lazy_decorate ( 'ostap.trees.trees'    , 'IFuncTree' , ns = 'Ostap'        )
+lazy_decorate ( 'ostap.trees.cuts'     , 'TCut'  )
+
+lazy_decorate ( 'ostap.histos.histos'  , 'TH1'   , 'TH2'    , 'TH3'   , 'TAxis' , 'TProfile' , 'TF1' , 'TF2' )
+lazy_decorate ( 'ostap.histos.histos'  , 'Histo1D' , 'Histo2D' , 'Histo3D' , ns = 'Ostap::Math' )
+lazy_decorate ( 'ostap.histos.param'   , 'TH1'   , 'TH2'    , 'TH3'   )
+lazy_decorate ( 'ostap.histos.compare' , 'TH1'   , 'TH2'    , 'TH3'   )
+lazy_decorate ( 'ostap.histos.graphs'  , 'TGraph', 'TMultiGraph' , 'TSpline' , 'TH1' ,
+                'TArrow' , 'TBox' , 'TLine' , 'TText' , 'RooPlot' )
+lazy_decorate ( 'ostap.utils.hepdata'  , 'TGraph', 'TH1'    , 'TH2'   )
 
+lazy_decorate ( 'ostap.fitting.minuit' , 'TMinuit' )
+lazy_decorate ( 'ostap.fitting.roofit' , 'Roo'     )
+
+# =============================================================================
+## histos & graphs: symbols are imported at the first access 
+# =============================================================================
+_lazy_symbols = {
+    'binomEff_h1' : 'ostap.histos.histos' ,
+    'binomEff_h2' : 'ostap.histos.histos' ,
+    'binomEff_h3' : 'ostap.histos.histos' ,
+    'h1_axis'     : 'ostap.histos.histos' ,
+    'h2_axes'     : 'ostap.histos.histos' ,
+    'h3_axes'     : 'ostap.histos.histos' ,
+    've_adjust'   : 'ostap.histos.histos' ,
+    'histoGuess'  : 'ostap.histos.histos' ,
+    ## 
+    'makeGraph'   : 'ostap.histos.graphs' ,
+    'lw_graph'    : 'ostap.histos.graphs' ,
+    'hToGraph'    : 'ostap.histos.graphs' ,
+    'hToGraph2'   : 'ostap.histos.graphs' ,
+    'hToGraph3'   : 'ostap.histos.graphs' ,
+    }
+# =============================================================================
+## get the lazy symbol (PEP-562)
+def __getattr__ ( name ) :
+    """ Get the lazy symbol (PEP-562)
+    """
+    module = _lazy_symbols.get ( name , None )
+    if module is None : 
+        raise AttributeError ( "module '%s' has no attribute '%s'" % ( __name__ , name ) )
+    import importlib 
+    value = getattr ( importlib.import_module ( module ) , name )
+    globals () [ name ] = value
+    return value 
 
 # =============================================================================
 if '__main__' == __name__ :
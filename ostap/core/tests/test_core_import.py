@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# @file ostap/core/tests/test_core_import.py
+# Copyright (c) Ostap developpers.
+# =============================================================================
+""" Test module for import time of ostap and lazy loading of decorations
+"""
+# =============================================================================
+from   ostap.core.lazy import lazy, lazy_modules
+import ostap.logger.table as T
+import sys, subprocess
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_core_import' )
+else                       : logger = getLogger ( __name__           )
+# =============================================================================
+## import-time benchmark: the slowest modules for the given import
+#  @see https://docs.python.org/3/using/cmdline.html#cmdoption-X
+def import_time ( module , lazy = True , N = 15 ) :
+    """ Import-time benchmark: the slowest modules for the given import
+    """
+    import os
+    env = dict ( os.environ )
+    env [ 'OSTAP_LAZY'     ] = 'True' if lazy else 'False'
+    env [ 'OSTAP_ARGPARSE' ] = 'False'
+    result = subprocess.run ( [ sys.executable , '-X' , 'importtime' , '-c' , 'import %s' % module ] ,
+                              stdout = subprocess.PIPE , stderr = subprocess.PIPE , env = env ,
+                              universal_newlines = True )
+    assert 0 == result.returncode , 'Cannot import %s:\n%s' % ( module , result.stderr )
+
+    ## parse the output: "import time: self [us] | cumulative | imported package"
+    items = []
+    for line in result.stderr.splitlines () :
+        if not line.startswith ( 'import time:' ) : continue
+        fields = line [ len ( 'import time:' ) : ].split ( '|' )
+        if 3 != len ( fields ) : continue
+        try :
+            items.append ( ( int ( fields [ 1 ] ) , int ( fields [ 0 ] ) , fields [ 2 ].strip () ) )
+        except ValueError :
+            pass
+
+    items.sort ( reverse = True )
+    total = items [ 0 ] [ 0 ] if items else 0
+    return total , items [ : N ]
+
+# =============================================================================
+## import-time benchmark for ostap.core.pyrouts: lazy vs eager
+def test_core_import_time () :
+    """ Import-time benchmark for ostap.core.pyrouts: lazy vs eager
+    """
+
+    t_lazy  , top = import_time ( 'ostap.core.pyrouts' , lazy = True  )
+    t_eager , _   = import_time ( 'ostap.core.pyrouts' , lazy = False )
+
+    rows = [ ( 'Module' , 'cumulative [ms]' , 'self [ms]' ) ]
+    for cumulative , own , name in top :
+        rows.append ( ( name , '%.1f' % ( cumulative / 1000.0 ) , '%.1f' % ( own / 1000.0 ) ) )
+
+    title = 'Import time (lazy mode)'
+    logger.info ( '%s:\n%s' % ( title , T.table ( rows , title = title , prefix = '# ' , alignment = 'lrr' ) ) )
+    logger.info ( 'Import time of ostap.core.pyrouts: lazy %.2fs , eager %.2fs' % ( t_lazy * 1.e-6 , t_eager * 1.e-6 ) )
+
+    if t_eager < t_lazy :
+        logger.warning ( 'Lazy import is not faster: %.2fs vs %.2fs' % ( t_lazy * 1.e-6 , t_eager * 1.e-6 ) )
+
+# =============================================================================
+## decorations are loaded at the first use of the class
+def test_core_lazy_decorations () :
+    """ Decorations are loaded at the first use of the class
+    """
+    import ostap.core.pyrouts
+    import ROOT
+
+    logger.info ( 'Lazy mode: %s' % lazy )
+
+    h = ROOT.TH1D ( 'h_lazy' , '' , 10 , 0 , 1 )
+    assert hasattr ( h , 'numEmpty' ) , 'Histogram decorations are not loaded!'
+    assert 10 == len ( h )            , 'Histogram decorations are not loaded!'
+
+    t = ROOT.TTree ( 't_lazy' , '' )
+    assert hasattr ( t , 'withCuts' ) , 'Tree decorations are not loaded!'
+
+    from ostap.core.pyrouts import h1_axis, hToGraph
+
+    rows = [ ( 'Module' , 'Loaded' ) ]
+    for module , loaded in lazy_modules () :
+        rows.append ( ( module , 'yes' if loaded else 'no' ) )
+    title = 'Lazy decorations'
+    logger.info ( '%s:\n%s' % ( title , T.table ( rows , title = title , prefix = '# ' , alignment = 'lc' ) ) )
+
+# =============================================================================
+## the script for the fresh interpreter: the modules are really loaded lazily
+#  and all decorations are available after the first use of the classes 
+_lazy_script = '''
+import sys
+import ostap.core.pyrouts
+from   ostap.core.core import Ostap
+import ROOT
+assert not 'ostap.fitting.minuit' in sys.modules , 'ostap.fitting.minuit is loaded eagerly!'
+m = ROOT.TMinuit ( 1 )
+assert 'ostap.fitting.minuit' in sys.modules , 'ostap.fitting.minuit is not loaded!'
+for a in ( 'minv' , 'maxv' , 'minmax' , 'xminmax' ) :
+    assert hasattr ( ROOT.TF1 , a ) , 'TF1.%s is missing!' % a
+for k in ( Ostap.Math.Histo1D , Ostap.Math.Histo2D , Ostap.Math.Histo3D ) :
+    assert hasattr ( k , 'name' ) , '%s.name is missing!' % k.__name__
+assert hasattr ( Ostap.Trees.Branches , 'items' ) , 'Ostap.Trees.Branches decorations are missing!'
+Ostap.IFuncTree
+assert 'ostap.trees.trees' in sys.modules , 'Ostap.IFuncTree decorations are missing!'
+'''
+# =============================================================================
+## the modules are really loaded lazily and all decorations are available
+#  after the first use of the decorated classes (fresh interpreter) 
+def test_core_lazy_modules () :
+    """ The modules are really loaded lazily and all decorations are available
+    after the first use of the decorated classes (fresh interpreter) 
+    """
+    import os
+    env = dict ( os.environ )
+    env [ 'OSTAP_LAZY'     ] = 'True'
+    env [ 'OSTAP_ARGPARSE' ] = 'False'
+    result = subprocess.run ( [ sys.executable , '-c' , _lazy_script ] ,
+                              stdout = subprocess.PIPE , stderr = subprocess.PIPE , env = env ,
+                              universal_newlines = True )
+    assert 0 == result.returncode , 'Lazy decorations failed:\n%s' % result.stderr
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_core_import_time      ()
+    test_core_lazy_decorations ()
+    test_core_lazy_modules     ()
+
+# =============================================================================
+##                                                                      The END
+# =============================================================================
@@ -26,7 +26,7 @@
 # =============================================================================
 from   collections                  import defaultdict 
 from   ostap.core.meta_info         import root_info
-from   ostap.core.core              import ( Ostap          ,
+from   ostap.core.core              import ( Ostap          , strings ,
                                              VE , SE , dsID , rootID ,  
                                              valid_pointer  )
 from   ostap.core.ostap_types       import ( integer_types , string_types   ,
@@ -34,7 +34,7 @@
                                              sized_types   , dictlike_types ,
                                              ordered_dict  )
 from   ostap.utils.core             import typename            
-from   ostap.math.math_base         import std, evt_range, FIRST_ENTRY, LAST_ENTRY, isint, isequal   
+from   ostap.math.math_base         import std, evt_range, FIRST_ENTRY, LAST_ENTRY, isint, isequal, np2raw
 from   ostap.utils.random_seed      import random_seed
 from   ostap.fitting.variables      import valid_formula, make_formula 
 from   ostap.trees.cuts             import expression_types, vars_and_cuts, order_warning
@@ -3643,9 +3643,77 @@ def _rad_rows_ ( dataset                  ,
     del formulas
     
 ROOT.RooAbsData.rows = _rad_rows_         
+
+# ===========================================================================
+## Iterator over dataset in batches:
+#  get a 2D-array of values ( batch_size x #variables ) and 1D-array of weights
+#  for each block of good entries
+#  @code
+#  dataset = ...
+#  for values , weights in dataset.batches ( 'pt, pt/p, mass ' , 'pt>1' , batch_size = 10000 ) :
+#     print ( values.shape , weights.sum() ) 
+#  @endcode
+#  @attention selection/cut is treated as weight!
+#  @attention with <code>copy=False</code> the same buffers are reused for all batches 
+def _rad_batches_ ( dataset                  ,
+                    variables  = []          ,
+                    cuts       = ''          ,
+                    cut_range  = ''          ,
+                    first      = FIRST_ENTRY ,
+                    last       = LAST_ENTRY  ,
+                    batch_size = 10000       ,
+                    copy       = True        ) :
+    """ Iterator over dataset in batches:
+    get a 2D-array of values ( batch_size x #variables ) and 1D-array of weights
+    for each block of good entries
+    >>> dataset = ...
+    >>> for values , weights in dataset.batches ( 'pt, pt/p, mass ' , 'pt>1' , batch_size = 10000 ) :
+    >>>    print ( values.shape , weights.sum() ) 
+    - attention: selection/cut is treated as weight!
+    - attention: with `copy=False` the same buffers are reused for all batches 
+    """
+    assert isinstance ( batch_size , integer_types ) and 0 < batch_size , \
+        "batches: Invalid `batch_size`: %s" % batch_size 
+
+    first  , last    = evt_range      ( dataset   , first , last ) 
+    varlst , cuts, _ = vars_and_cuts  ( variables , cuts )
+    
+    varlst = strings ( varlst )
+    nvars  = len     ( varlst ) 
+
+    ## preallocated buffers 
+    values  = numpy.empty ( ( batch_size , nvars ) , dtype = float )
+    weights = numpy.empty (   batch_size           , dtype = float )
     
+    raw_values  , _ = np2raw ( values  )
+    raw_weights , _ = np2raw ( weights ) 
+
+    entry = first 
+    while entry < last :
+        
+        result      = Ostap.Utils.fill_batch ( dataset     ,
+                                               varlst      ,
+                                               cuts        ,
+                                               cut_range   , 
+                                               raw_values  ,
+                                               raw_weights ,
+                                               batch_size  ,
+                                               entry       ,
+                                               last        ) 
+        nrows , nxt = result.first , result.second
+        if nxt <= entry : break 
+        entry = nxt 
+        
+        if not nrows : continue
+        
+        if copy : yield values [ : nrows ].copy () , weights [ : nrows ].copy ()
+        else    : yield values [ : nrows ]         , weights [ : nrows ] 
+
+ROOT.RooAbsData.batches = _rad_batches_
+
 _new_methods_ += [
-    ROOT.RooAbsData.rows 
+    ROOT.RooAbsData.rows    ,
+    ROOT.RooAbsData.batches , 
     ]
 
 # ============================================================================
@@ -1640,14 +1640,23 @@ def graph_nll ( self             ,
                     silent   = True  ,
                     draw     = False ,
                     subtract = True  , 
-                    args     = ()    , **kwargs ) :
+                    args     = ()    ,
+                    parallel = False , **kwargs ) :
         """ Get NLL/profile-graph for the variable, using the specified abscissas
         >>> pdf   = ...
         >>> graph = pdf.graph_nll ( 'S'                     ,
         ...                          vrange ( 0 , 100 , 100 ) ,
         ...                          dataset                )
+        - use `parallel=True` (or dictionary of configuration parameters
+          for `ostap.parallel.parallel_scan.parallel_scan`) for parallel processing
         """
 
+        if parallel :
+            return self._parallel_graph_ ( 'graph_nll' , variable , values , dataset ,
+                                           profile  = False    , subtract = subtract ,
+                                           silent   = silent   , draw     = draw     ,
+                                           args     = args     , parallel = parallel , **kwargs )
+
         ## 1) create NLL 
         nLL, sf = self.nll ( dataset , silent = silent ,  args = args , **kwargs )
 
@@ -1716,16 +1725,27 @@ def graph_profile ( self             ,
                         silent   = False ,
                         draw     = False ,
                         subtract = True  , 
-                        args     = ()    , **kwargs ) :
+                        args     = ()    ,
+                        parallel = False , **kwargs ) :
         """ Get profile-graph for the variable, using the specified abscissas
         >>> pdf   = ...
         >>> graph = pdf.graph_profile ( 'S'                      ,
         ...                             vrange ( 0 , 12.5 , 20 ) ,
         ...                             dataset                  )
+        - use `parallel=True` (or dictionary of configuration parameters
+          for `ostap.parallel.parallel_scan.parallel_scan`) for parallel processing,
+          each minimisation starts from the solution for the neighbour point
         """
         
         vals = [ v for v in values ]
         assert vals, 'graph_profile: no points are specified!'
+
+        if parallel :
+            return self._parallel_graph_ ( 'graph_profile' , variable , vals , dataset ,
+                                           profile  = True     , subtract = subtract ,
+                                           silent   = silent   , draw     = draw     ,
+                                           fix      = fix      , 
+                                           args     = args     , parallel = parallel , **kwargs )
                 
         vmin = min ( vals )
         vmax = max ( vals )
@@ -1800,6 +1820,223 @@ def graph_profile ( self             ,
         if draw : graph.draw ('apl')
         
         return graph 
+
+    # =========================================================================
+    ## helper method to run (parallel) scan with warm starts
+    #  @see ostap.parallel.parallel_scan.parallel_scan
+    def _scan_nll_ ( self             ,
+                     variables        ,
+                     points           ,
+                     dataset          ,
+                     profile  = False ,
+                     fix      = ()    ,
+                     silent   = True  , 
+                     args     = ()    ,
+                     parallel = True  , **kwargs ) :
+        """ Helper method to run (parallel) scan with warm starts
+        - see `ostap.parallel.parallel_scan.parallel_scan`
+        """
+        pars = self.params ( dataset )
+        for v in tuple ( variables ) + tuple ( fix ) :
+            assert v in pars , "Variable %s is not a parameter" % v
+        del pars
+
+        from ostap.parallel.parallel_scan import parallel_scan
+        config = parallel if isinstance ( parallel , dict ) else {}
+        return parallel_scan ( self , dataset , variables , points ,
+                               profile = profile , fix    = fix   ,
+                               silent  = silent  , args   = args  ,
+                               config  = kwargs  , **config  )
+    
+    # =========================================================================
+    ## helper method to create NLL/profile-graph using the parallel scan
+    #  @see ostap.parallel.parallel_scan.parallel_scan
+    def _parallel_graph_ ( self             ,
+                           what             , 
+                           variable         ,
+                           values           ,
+                           dataset          ,
+                           profile  = False ,
+                           fix      = ()    ,
+                           silent   = True  ,
+                           draw     = False ,
+                           subtract = True  , 
+                           args     = ()    ,
+                           parallel = True  , **kwargs ) :
+        """ Helper method to create NLL/profile-graph using the parallel scan
+        - see `ostap.parallel.parallel_scan.parallel_scan`
+        """
+        from ostap.parallel.parallel_scan import scan_order
+        points = scan_order ( values ) 
+        assert points , '%s: no points are specified!' % what 
+
+        results , sf = self._scan_nll_ ( ( variable , ) , points , dataset ,
+                                         profile  = profile  , fix  = fix  ,
+                                         silent   = silent   , args = args ,
+                                         parallel = parallel , **kwargs    )
+
+        import ostap.histos.graphs
+        ## create the graph
+        graph = ROOT.TGraph ( len ( results ) )
+        ymin  = min ( y for p , y in results ) 
+        for i , r in enumerate ( sorted ( results ) ) :
+            point , y   = r 
+            graph [ i ] = point [ 0 ] , y 
+            
+        ## subtract the minimum
+        if subtract :
+            self.info ( "%s: minimal value of %.5g is subtracted" % ( what , ymin ) ) 
+            graph -= ymin 
+
+        ## scale it if needed
+        if 1 != sf :
+            self.info ('%s: apply scale factor of %.5g due to dataset weights' % ( what , sf ) )
+            graph *= sf 
+
+        if draw : graph.draw ('apl')
+        
+        return graph 
+
+    # =========================================================================
+    ## helper method to create 2D NLL/profile-histogram using the (parallel) scan
+    #  @see ostap.parallel.parallel_scan.parallel_scan
+    def _scan_histo_ ( self             ,
+                       what             , 
+                       var1             ,
+                       var2             ,
+                       values1          ,
+                       values2          ,
+                       dataset          ,
+                       profile  = False ,
+                       fix      = ()    ,
+                       silent   = True  ,
+                       draw     = False ,
+                       subtract = True  , 
+                       args     = ()    ,
+                       parallel = True  , **kwargs ) :
+        """ Helper method to create 2D NLL/profile-histogram using the (parallel) scan
+        - see `ostap.parallel.parallel_scan.parallel_scan`
+        """
+        from ostap.parallel.parallel_scan import scan_order, scan_nll
+        xs = sorted ( set ( float ( v ) for v in values1 ) )
+        ys = sorted ( set ( float ( v ) for v in values2 ) )
+        assert 2 <= len ( xs ) and 2 <= len ( ys ) , '%s: not enough points are specified!' % what
+
+        ## "snake" ordering of the grid 
+        points = scan_order ( xs , ys )
+        
+        if parallel : 
+            results , sf = self._scan_nll_ ( ( var1 , var2 ) , points , dataset ,
+                                             profile  = profile  , fix  = fix   ,
+                                             silent   = silent   , args = args  ,
+                                             parallel = parallel , **kwargs     )
+        else :
+            results , sf = scan_nll ( self , dataset , ( var1 , var2 ) , points ,
+                                      profile  = profile  , fix  = fix  ,
+                                      silent   = silent   , args = args , **kwargs )
+
+        ## bin edges: the grid points are bin centers 
+        def _edges_ ( vals ) :
+            mids = [ 0.5 * ( a + b ) for a , b in zip ( vals [ :-1 ] , vals [ 1: ] ) ]
+            return [ 2 * vals [ 0 ] - mids [ 0 ] ] + mids + [ 2 * vals [ -1 ] - mids [ -1 ] ]
+
+        from array import array 
+        ex = array ( 'd' , _edges_ ( xs ) )
+        ey = array ( 'd' , _edges_ ( ys ) )
+        
+        n1    = var1.name if isinstance ( var1 , ROOT.RooAbsReal ) else var1
+        n2    = var2.name if isinstance ( var2 , ROOT.RooAbsReal ) else var2
+        histo = ROOT.TH2D ( hID () , '%s(%s,%s)' % ( what , n1 , n2 ) ,
+                            len ( xs ) , ex , len ( ys ) , ey )
+        
+        ix = dict ( ( x , i + 1 ) for i , x in enumerate ( xs ) )
+        iy = dict ( ( y , i + 1 ) for i , y in enumerate ( ys ) )
+
+        zmin = min ( z for p , z in results ) if subtract else 0 
+        if subtract :
+            self.info ( "%s: minimal value of %.5g is subtracted" % ( what , zmin ) ) 
+        if 1 != sf :
+            self.info ('%s: apply scale factor of %.5g due to dataset weights' % ( what , sf ) )
+
+        for point , z in results :
+            x , y = point
+            histo.SetBinContent ( ix [ x ] , iy [ y ] , ( z - zmin ) * sf )
+
+        if draw : histo.draw ('colz')
+        
+        return histo 
+            
+    # =========================================================================
+    ## get 2D NLL-histogram for two variables, using the specified grid
+    #  - parallel processing is activated with <code>parallel=True</code>
+    #  @code
+    #  pdf   = ...
+    #  histo = pdf.histo_nll ( 'S' , 'B'                ,
+    #                          vrange ( 0 , 100 , 20 )  ,
+    #                          vrange ( 0 , 100 , 20 )  ,
+    #                          dataset                  )
+    #  @endcode
+    def histo_nll ( self             ,
+                    var1             ,
+                    var2             , 
+                    values1          ,
+                    values2          ,
+                    dataset          ,
+                    silent   = True  ,
+                    draw     = False ,
+                    subtract = True  , 
+                    args     = ()    ,
+                    parallel = False , **kwargs ) :
+        """ Get 2D NLL-histogram for two variables, using the specified grid
+        - parallel processing is activated with `parallel=True`
+        >>> pdf   = ...
+        >>> histo = pdf.histo_nll ( 'S' , 'B'               ,
+        ...                         vrange ( 0 , 100 , 20 ) ,
+        ...                         vrange ( 0 , 100 , 20 ) ,
+        ...                         dataset                 )
+        """
+        return self._scan_histo_ ( 'histo_nll' , var1 , var2 , values1 , values2 , dataset ,
+                                   profile  = False    , subtract = subtract ,
+                                   silent   = silent   , draw     = draw     ,
+                                   args     = args     , parallel = parallel , **kwargs )
+    
+    # =========================================================================
+    ## get 2D profile-likelihood histogram for two variables, using the specified grid
+    #  - each minimisation starts from the solution for the neighbour point of the grid
+    #  - parallel processing is activated with <code>parallel=True</code>
+    #  @code
+    #  pdf   = ...
+    #  histo = pdf.histo_profile ( 'S' , 'B'                ,
+    #                              vrange ( 0 , 100 , 20 )  ,
+    #                              vrange ( 0 , 100 , 20 )  ,
+    #                              dataset , parallel = True )
+    #  @endcode
+    def histo_profile ( self             ,
+                        var1             ,
+                        var2             , 
+                        values1          ,
+                        values2          ,
+                        dataset          ,
+                        fix      = []    ,
+                        silent   = True  ,
+                        draw     = False ,
+                        subtract = True  , 
+                        args     = ()    ,
+                        parallel = False , **kwargs ) :
+        """ Get 2D profile-likelihood histogram for two variables, using the specified grid
+        - each minimisation starts from the solution for the neighbour point of the grid
+        - parallel processing is activated with `parallel=True`
+        >>> pdf   = ...
+        >>> histo = pdf.histo_profile ( 'S' , 'B'               ,
+        ...                             vrange ( 0 , 100 , 20 ) ,
+        ...                             vrange ( 0 , 100 , 20 ) ,
+        ...                             dataset , parallel = True )
+        """
+        return self._scan_histo_ ( 'histo_profile' , var1 , var2 , values1 , values2 , dataset ,
+                                   profile  = True     , subtract = subtract ,
+                                   silent   = silent   , draw     = draw     ,
+                                   fix      = fix      , 
+                                   args     = args     , parallel = parallel , **kwargs )
         
     # ========================================================================
     ## evaluate "significance" using Wilks' theorem via NLL
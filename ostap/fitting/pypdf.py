@@ -16,6 +16,7 @@
     ##
     'PyPDF'     , ## 'pythonic' PDF for RooFit 
     'PyPDFLite' , ## 'pythonic' PDF for RooFit 
+    'BatchFunction' , ## helper wrapper for vectorised function for PyPdfLite 
     )
 # =============================================================================
 from   ostap.core.meta_info         import root_info 
@@ -25,7 +26,7 @@
 from   ostap.utils.basic            import prntrf  
 import ostap.fitting.roocollections
 import ostap.fitting.variables 
-import ROOT, math, abc 
+import ROOT, math, abc, numpy 
 # =============================================================================
 from   ostap.logger.logger import getLogger
 if '__main__' ==  __name__ : logger = getLogger ( 'ostap.fitting.pypdf' )
@@ -42,6 +43,19 @@
 # Two more methods are needed if one needs analystical integrals :
 #  - `get_analytical_integral`
 #  - `analytical_integral`
+#
+# Optionally one can define the vectorised evaluation 
+#  - <code>evaluate_batch ( arrays ) -> numpy array</code>,
+#  where <code>arrays</code> is a tuple of numpy arrays with values 
+#  of all variables (in the order of <code>varlist</code>).
+#  It is used by RooFit CPU evaluation backend (ROOT>=6.32)
+#  @code
+#  class MyPDF(PyPDF) :
+#     ...
+#     def evaluate_batch ( self , arrays ) :
+#         x , mu , sigma = arrays
+#         return numpy.exp ( -0.5 * ( ( x - mu ) / sigma ) ** 2 )
+#  @endcode 
 class PyPDF(Ostap.Models.PyPdf) :
     """ Very simple `pythonic' PDF 
     One must define: 
@@ -49,6 +63,16 @@ class PyPDF(Ostap.Models.PyPdf) :
     - proper constructor that takes keyword <code>clone</code>
     - `evaluate` method 
     - method `reduce` for serialization (if needed) 
+
+    Optionally one can define the vectorised evaluation 
+    - `evaluate_batch ( arrays ) -> numpy array`, 
+    where `arrays` is a tuple of numpy arrays with values of all variables
+    (in the order of `varlist`). It is used by RooFit CPU evaluation backend (ROOT>=6.32)
+    
+    >>> class MyPDF(PyPDF) :
+    ...     def evaluate_batch ( self , arrays ) :
+    ...         x , mu , sigma = arrays
+    ...         return numpy.exp ( -0.5 * ( ( x - mu ) / sigma ) ** 2 )
     """
     def __init__ ( self , name , title = '' , variables = () , clone = None ) :
         """ Constructor that accepts `clone` argument 
@@ -89,6 +113,22 @@ def clone ( self  , newname = '' ) :
     @abc.abstractmethod
     def evaluate ( self ) :
         raise NotImplementedError("PyPDF.evaluate must be implemented")
+
+    ## redefine: vectorised evaluation via `evaluate_batch` (if defined)
+    #  @see Ostap::Models::PyPdf::evaluate_buffers 
+    def evaluate_buffers ( self , inputs , output ) :
+        """ Vectorised evaluation via `evaluate_batch` (if defined)
+        - see `Ostap.Models.PyPdf.evaluate_buffers`
+        """
+        batch = getattr ( self , 'evaluate_batch' , None )
+        if batch is None : return False
+        ##
+        size   = len ( output )
+        if not size      : return True 
+        arrays = numpy.frombuffer ( inputs.data () , count = len ( inputs ) , dtype = float )
+        result = numpy.frombuffer ( output.data () , count = size           , dtype = float )
+        result [ : ] = batch ( tuple ( arrays.reshape ( -1 , size ) ) )
+        return True 
     
     @property 
     def values    ( self ) :
@@ -102,14 +142,57 @@ def variables ( self ) :
         """
         return self.varlist()
 
+# =============================================================================
+## Helper wrapper for the vectorised function for <code>PyPdfLite</code>:
+#  it gets the memoryviews for (nvars x size) input matrix and the output,
+#  and invokes the function with numpy arrays: <code>function ( *arrays )</code>
+#  @see Ostap::Models::PyPdfLite::doEval 
+class BatchFunction(object) :
+    """ Helper wrapper for the vectorised function for `PyPdfLite`:
+    it gets the memoryviews for (nvars x size) input matrix and the output,
+    and invokes the function with numpy arrays: `function ( *arrays )`
+    - see `Ostap.Models.PyPdfLite.doEval`
+    """
+    def __init__ ( self , function ) :
+        assert callable ( function ) , \
+            "BatchFunction: invalid `function`: %s/%s" %  ( typename ( function ) , prntrf ( function ) )
+        self.__function = function
+    def __call__ ( self , inputs , output ) :
+        result = numpy.frombuffer ( output , dtype = float )
+        size   = len ( result )
+        if not size : return True 
+        arrays = numpy.frombuffer ( inputs , dtype = float ).reshape ( -1 , size ) 
+        result [ : ] = self.__function ( *arrays )
+        return True
+    def __reduce__ ( self ) : return BatchFunction , ( self.__function , )
+    @property
+    def function ( self ) :
+        """`function` : the actual vectorised function"""
+        return self.__function
+
 # =============================================================================
 ## Very simple `ready-to-use' pythonic PDF
+#  - optional vectorised function <code>batch</code> is invoked 
+#    with numpy arrays of values of all variables: <code>batch ( *arrays )</code> 
+#    and it is used by RooFit CPU evaluation backend (ROOT>=6.32)
+#  @code
+#  pdf = PyPDFLite ( 'G' , lambda x , mu , sigma : math.exp  ( -0.5 * ( ( x - mu ) / sigma ) ** 2 ) ,
+#                     ( x , mu , sigma ) , 
+#                    batch = lambda x , mu , sigma : numpy.exp ( -0.5 * ( ( x - mu ) / sigma ) ** 2 ) )
+#  @endcode 
 #  @see Ostap.Modeld.PyPdfLite 
 def PyPDFLite ( name            ,
                 function        ,
                 variables       ,
-                title     = ''  ) : 
+                title     = ''  ,
+                batch     = None ) : 
     """ Very simple `ready-to-use' pythonic PDF
+    - optional vectorised function `batch` is invoked with numpy arrays
+    of values of all variables: `batch ( *arrays )` and it is used
+    by RooFit CPU evaluation backend (ROOT>=6.32)
+    >>> pdf = PyPDFLite ( 'G' , lambda x , mu , sigma : math.exp  ( -0.5 * ( ( x - mu ) / sigma ) ** 2 ) ,
+    ...                   ( x , mu , sigma ) , 
+    ...                   batch = lambda x , mu , sigma : numpy.exp ( -0.5 * ( ( x - mu ) / sigma ) ** 2 ) ) 
     - see `Ostap.Modeld.PyPdfLite` 
     """
 
@@ -127,7 +210,8 @@ def PyPDFLite ( name            ,
     vv = ROOT.RooArgList () ;
     for v in variables : vv.add ( v )    
     result = Ostap.Models.PyPdfLite ( name , title , function , vv )
-
+    if batch : result.set_batch ( BatchFunction ( batch ) )
+    
     from ostap.io.checker import PickleChecker as Checker
     ## from ostap.parallel.parallel import Checker
     checker = Checker() 
@@ -164,7 +248,9 @@ def _ppdfl_reduce_ ( self ) :
     config = { 'name'      : self.name       ,
                'function'  : self.function() ,
                'variables' : self.varlist()  , 
-               'title'     : self.title      } 
+               'title'     : self.title      }
+    batch = self.batch ()
+    if batch : config [ 'batch' ] = batch.function 
     return  ppdfl_factory , ( config , )
                
 Ostap.Models.PyPdfLite.values     = _ppdfl_values_
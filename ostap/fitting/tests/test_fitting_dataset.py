@@ -16,6 +16,7 @@
 from   ostap.plotting.canvas    import use_canvas 
 from   ostap.utils.root_utils   import batch_env
 from   ostap.utils.core         import typename 
+from   ostap.stats.statvars     import data_get_stat 
 import ostap.logger.table       as     T
 import ostap.fitting.roofit
 import ostap.fitting.ds2numpy 
@@ -94,6 +95,36 @@
 for index, row , weight in weighted .rows ( 'Mass, 2*Mass, Mass/2' , '(Evt<5) && (Mass<5)' , first = 100 , last = 1000 , progress = False  ) :
     print ( index, row , weight ) 
 
+# =============================================================================
+## (3') loop and get certain information as batches 
+# =============================================================================
+logger.info  ('Batches over unweighted dataset') 
+nrows = 0 
+for values , weights in dataset  .batches ( 'Mass, 2*Mass, Mass/2' , '(Evt<5) && (Mass<5)' , first = 100 , last = 1000 , batch_size = 50 ) :
+    assert values.shape == ( len ( weights ) , 3 ) , 'Invalid batch shape %s' % str ( values.shape ) 
+    nrows += len ( weights ) 
+assert nrows == sum ( 1 for _ in dataset.rows ( 'Mass' , '(Evt<5) && (Mass<5)' , first = 100 , last = 1000 ) ) , \
+       'Mismatch between rows and batches'
+    
+logger.info  ('Batches over  weighted dataset') 
+for values , weights in weighted .batches ( 'Mass, 2*Mass, Mass/2' , '(Evt<5) && (Mass<5)' , first = 100 , last = 1000 , batch_size = 50 ) :
+    print ( values.shape , weights.sum () ) 
+
+# =============================================================================
+## (3'') many counters in a single loop
+# =============================================================================
+logger.info  ('Statistics plan for unweighted dataset') 
+plan = { 'hmean' : ( Ostap.Math.HarmonicMean  () , 'Mass'               ) ,
+         'gmean' : ( Ostap.Math.GeometricMean () , 'Mass' , 'Evt<5'     ) ,
+         'amean' : ( Ostap.Math.ArithmeticMean() , 'Mass' , 'Mass<5'    ) } 
+result = dataset.stat_plan ( plan , 'Mass>0' ) 
+for key , ( stat , expr ) , cuts in ( ( 'hmean' , plan [ 'hmean' ][:2] , 'Mass>0'               ) ,
+                                      ( 'gmean' , plan [ 'gmean' ][:2] , '(Mass>0)&&(Evt<5)'    ) ,
+                                      ( 'amean' , plan [ 'amean' ][:2] , '(Mass>0)&&(Mass<5)'   ) ) :
+    other = data_get_stat ( dataset , type ( stat ) () , expr , cuts )
+    assert result [ key ].size () == other.size () , 'Mismatch for %s: %s vs %s' % ( key , result [ key ].size () , other.size () )
+    logger.info ( 'Statistics plan %-6s : %s entries' % ( key , result [ key ].size () ) )
+
 # =============================================================================
 ## (4) subset 
 # =============================================================================
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developers.
+# =============================================================================
+# @file test_fitting_gencontext.py
+# Test module for reusable generation context for toys
+# - compare per-toy overhead for tiny datasets
+# =============================================================================
+""" Test module for reusable generation context for toys
+- compare per-toy overhead for tiny datasets
+"""
+# =============================================================================
+__author__ = "Ostap developers"
+__all__    = () ## nothing to import
+# =============================================================================
+from   ostap.fitting.toys       import GenContext, generate_data
+from   ostap.utils.root_utils   import batch_env
+import ostap.fitting.models     as     Models
+import ostap.logger.table       as     T
+import ROOT, time
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' == __name__  : logger = getLogger ( 'test_fitting_gencontext' )
+else                       : logger = getLogger ( __name__ )
+# =============================================================================
+## set batch from environment
+batch_env ( logger )
+# =============================================================================
+def test_gencontext () :
+    """ Compare per-toy overhead for tiny datasets
+    """
+    mass  = ROOT.RooRealVar ( 'mass_gc' , '', 0 , 1 )
+    gauss = Models.Gauss_pdf ( 'GGC' , xvar = mass , mean = ( 0.5 , 0 , 1 ) , sigma = ( 0.1 , 0.01 , 0.5 ) )
+    model = Models.Fit1D ( signal = gauss , background = 'flat' , suffix = 'GC' )
+    model.S = 20
+    model.B = 10
+
+    varset = ROOT.RooArgSet ( mass )
+    config = { 'nEvents' : 30 , 'sample' : True }
+    NTOYS  = 1000
+
+    t0 = time.time ()
+    for i in range ( NTOYS ) : ds = model.generate ( varset = varset , **config )
+    t1 = time.time ()
+    for i in range ( NTOYS ) : ds = generate_data  ( model , varset , **config )
+    t2 = time.time ()
+
+    context = GenContext ( model , varset , **config )
+    for i in range ( NTOYS ) : ds = context ()
+    assert 1 == context.nbuilds , 'Generation context is rebuilt!'
+
+    ## change of parameters triggers the rebuild
+    model.S = 30
+    ds = context ()
+    assert 2 == context.nbuilds , 'Generation context is not rebuilt!'
+
+    rows = [ ( 'Method' , 'per toy [ms]' ) ]
+    rows.append ( ( 'generate'      , '%.3f' % ( ( t1 - t0 ) * 1000.0 / NTOYS ) ) )
+    rows.append ( ( 'generate_data' , '%.3f' % ( ( t2 - t1 ) * 1000.0 / NTOYS ) ) )
+
+    title = 'Per-toy generation overhead'
+    table = T.table ( rows , title = title , prefix = '# ' )
+    logger.info ( '%s\n%s' % ( title , table ) )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_gencontext ()
+
+# =============================================================================
+##                                                                      The END
+# =============================================================================
@@ -23,7 +23,7 @@
 from   ostap.fitting.pypdf      import PyPDF, PyPDFLite
 from   ostap.io.zipshelve       import tmpdb 
 import ostap.fitting.roofit 
-import ROOT, math 
+import ROOT, math, numpy 
 # =============================================================================
 # logging 
 # =============================================================================
@@ -429,6 +429,44 @@ def local_fun ( *args ) :
         r, _ = model.fitTo ( dataset , draw = True , nbins = 50 , quiet  = True  )
         del r
         
+# =============================================================================
+## vectorised version of gaussian function 
+def gauss_batch ( x , mean , sigma ) :
+    return numpy.exp ( -0.5 * ( ( x - mean ) / sigma ) ** 2 ) / ( math.sqrt ( 2 * math.pi ) * sigma ) 
+
+# =============================================================================
+## Test pure python PDF: <code>PyPDFLite</code> with vectorised evaluation 
+#  @see ostap.fitting.pypdf.PyPDFLite
+#  @see Ostap::Models::PyPdfLite 
+def test_PyPDFLite5 () :
+    """ Test pure python PDF: PyPDFLite with vectorised evaluation 
+    - see `ostap.fitting.pypdf.PyPDFLite`
+    - see `Ostap::Models::PyPdfLite` 
+    """
+
+    logger   = getLogger("test_PyPDFLite5")
+    logger.info ( "Use `light' PDF: global function with vectorised evaluation" )
+
+    variables = gauss_ref.xvar, gauss_ref.mean, gauss_ref.sigma    
+    mygauss   = PyPDFLite ( "MyGauss7"              ,
+                            function   = gauss_fun   ,
+                            variables  = variables   ,
+                            batch      = gauss_batch ) 
+    
+    logger.info ( 'Use %s' % mygauss ) 
+    
+    signal = Generic1D_pdf ( pdf = mygauss , xvar = xvar )
+    model  = Fit1D ( signal = signal  , background = None , suffix = '_P5' )
+    
+    ##  fit!
+    with timing ( "test_PyPDFLite5: vectorised fit" , logger = logger ) : 
+        r, _ = model.fitTo ( dataset , draw = False , quiet  = True  )
+    logger.info ( 'Fit results:\n%s' % r.table ( prefix = '# ' ) ) 
+        
+    with tmpdb ( )as db :
+        db [ mygauss.name ] = mygauss
+        db.ls()
+    
 # =============================================================================
 if '__main__' == __name__ :
     
@@ -439,6 +477,7 @@ def local_fun ( *args ) :
     test_PyPDFLite2 () 
     test_PyPDFLite3 () 
     test_PyPDFLite4 () 
+    test_PyPDFLite5 () 
     
 # =============================================================================
 ##                                                                      The END 
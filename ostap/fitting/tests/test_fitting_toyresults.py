@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developers.
+# =============================================================================
+# @file test_fitting_toyresults.py
+# Test module for ostap/fitting/toyresults.py
+# - columnar, streaming storage of toy results
+# =============================================================================
+""" Test module for ostap/fitting/toyresults.py
+- columnar, streaming storage of toy results
+"""
+# =============================================================================
+__author__ = "Ostap developers"
+__all__    = () ## nothing to import
+# =============================================================================
+from   ostap.fitting.toyresults import ToyResults
+from   ostap.core.core          import VE
+from   ostap.utils.cleanup      import CleanUp
+from   ostap.utils.timing       import timing
+from   ostap.utils.root_utils   import batch_env
+import ostap.fitting.models     as     Models
+import ostap.fitting.toys       as     Toys
+import ostap.io.zipshelve       as     DBASE
+from   array                    import array
+import ROOT, random
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' == __name__  : logger = getLogger ( 'test_fitting_toyresults' )
+else                       : logger = getLogger ( __name__ )
+# =============================================================================
+## set batch from environment
+batch_env ( logger )
+# =============================================================================
+def test_toyresults () :
+    """ Test the container itself: append, merge and streaming
+    """
+    dbname = CleanUp.tempfile ( prefix = 'ostap-test-toyresults-' , suffix = '.zdb' )
+
+    r1 = ToyResults ( store = dbname , chunk = 100 )
+    r2 = ToyResults ()
+
+    values = [ random.gauss ( 0 , 1 ) for i in range ( 1000 ) ]
+    for v in values [ :700 ] : r1.append ( 'x' , v )
+    for v in values [ 700: ] : r2.append ( 'x' , v )
+
+    r1.merge ( r2 )
+    r1.flush ()
+
+    assert 10 == r1.nchunks                 , 'Invalid number of chunks'
+    assert list ( r1 [ 'x' ] ) == values    , 'Mismatch in values!'
+    assert 1000 == r1.counters [ 'x' ].nEntries () , 'Mismatch in statistics!'
+
+    stats = Toys.make_stats ( r1 )
+    logger.info ( 'Statistics: %s' % stats [ 'x' ] )
+    r1.close ()
+
+    with DBASE.open ( dbname , 'r' ) as db :
+        assert 10 == len ( db ) , 'Invalid number of chunks in the store'
+
+    ## VE-values are stored as floats and counted 
+    r3 = ToyResults ()
+    for v in values [ :100 ] : r3.append ( 've' , VE ( v , 1.0 ) )
+    assert isinstance ( r3 [ 've' ] , array )       , 'VE-values are not in typed array!'
+    assert list ( r3 [ 've' ] ) == values [ :100 ] , 'Mismatch in VE-values!'
+    assert 100 == r3.counters [ 've' ].nEntries ()  , 'Mismatch in VE-statistics!'
+
+# =============================================================================
+def test_toys_store () :
+    """ Make toys with streaming of results into the database
+    """
+    mass  = ROOT.RooRealVar  ( 'mass_tr' , '', 0 , 1 )
+    gauss = Models.Gauss_pdf ( 'GTR' , xvar = mass , mean = ( 0.5 , 0 , 1 ) , sigma = ( 0.1 , 0.01 , 0.5 ) )
+
+    dbname = CleanUp.tempfile ( prefix = 'ostap-test-toys-store-' , suffix = '.zdb' )
+
+    with timing ( 'Toys with store' , logger = logger ) :
+        results , stats = Toys.make_toys (
+            pdf         = gauss             ,
+            nToys       = 100               ,
+            data        = [ mass ]          ,
+            gen_config  = { 'nEvents' : 500 } ,
+            fit_config  = { 'silent'  : True } ,
+            init_pars   = { 'mean_GTR' : 0.5 , 'sigma_GTR' : 0.1 } ,
+            silent      = True              ,
+            progress    = False             ,
+            store       = dbname            )
+
+    assert isinstance ( results , ToyResults ) , 'Invalid type of results!'
+    assert isinstance ( results [ 'mean_GTR' ] , array ) , 'Parameters are not in typed array!'
+    assert 100 == len ( results [ 'mean_GTR' ] )                , 'Invalid number of entries!'
+    assert 100 == stats [ 'mean_GTR' ].nEntries ()              , 'Mismatch in entries!'
+    results.close ()
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_toyresults ()
+    test_toys_store ()
+
+# =============================================================================
+##                                                                      The END
+# =============================================================================
@@ -0,0 +1,364 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file ostap/fitting/toyresults.py
+#  Compact columnar container for results of toys/jackknife/bootstrap studies
+#  - numerical results (including VE) are kept as floats in typed arrays
+#  - the running statistics is updated incrementally at each append
+#  - the containers can be merged (e.g. for parallel processing)
+#  - optionally the content can be streamed in chunks into the
+#    (compressed) shelve database
+#  @code
+#  results = ToyResults ()
+#  results.append ( 'mean' , 0.1 )
+#  results.append ( 'mean' , 0.2 )
+#  print ( results [ 'mean' ] , results.counters [ 'mean' ] )
+#  @endcode
+#  @see ostap.fitting.toys
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2026-10-17
+# =============================================================================
+""" Compact columnar container for results of toys/jackknife/bootstrap studies
+- numerical results (including VE) are kept as floats in typed arrays
+- the running statistics is updated incrementally at each append
+- the containers can be merged (e.g. for parallel processing)
+- optionally the content can be streamed in chunks into the
+  (compressed) shelve database
+>>> results = ToyResults ()
+>>> results.append ( 'mean' , 0.1 )
+>>> results.append ( 'mean' , 0.2 )
+>>> print ( results [ 'mean' ] , results.counters [ 'mean' ] )
+- see `ostap.fitting.toys`
+"""
+# =============================================================================
+__author__  = 'Vanya BELYAEV  Ivan.Belyaev@itep.ru'
+__date__    = "2026-10-17"
+__version__ = '$Revision$'
+__all__     = (
+    'ToyResults' , ## compact columnar container for results of toys
+    )
+# =============================================================================
+from   ostap.core.ostap_types import string_types, num_types
+from   array                  import array
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger( 'ostap.fitting.toyresults' )
+else                       : logger = getLogger( __name__                   )
+# =============================================================================
+## @class ToyResults
+#  Compact columnar container for results of toys/jackknife/bootstrap studies
+#  - numerical results (including VE) are kept as floats in typed arrays
+#  - the special column '' keeps arbitrary objects (e.g. fit results)
+#  - the running statistics is updated incrementally at each append
+#  - the containers can be merged (e.g. for parallel processing)
+#  - optionally the content can be streamed in chunks into the
+#    (compressed) shelve database
+#  It behaves (almost) like dictionary <code>{ name : column }</code>
+#  @code
+#  results = ToyResults ( store = 'toys.db' , chunk = 10000 )
+#  results.append ( 'mean' , 0.1 )
+#  results.append ( ''     , fit_result )
+#  for v in results [ 'mean' ] : ...
+#  stats = results.counters
+#  @endcode
+class ToyResults(object) :
+    """ Compact columnar container for results of toys/jackknife/bootstrap studies
+    - numerical results (including VE) are kept as floats in typed arrays
+    - the special column '' keeps arbitrary objects (e.g. fit results)
+    - the running statistics is updated incrementally at each append
+    - the containers can be merged (e.g. for parallel processing)
+    - optionally the content can be streamed in chunks into the
+      (compressed) shelve database
+    It behaves (almost) like dictionary `{ name : column }`
+    >>> results = ToyResults ( store = 'toys.db' , chunk = 10000 )
+    >>> results.append ( 'mean' , 0.1 )
+    >>> results.append ( ''     , fit_result )
+    >>> for v in results [ 'mean' ] : ...
+    >>> stats = results.counters
+    """
+    def __init__ ( self , store = None , chunk = 10000 ) :
+
+        assert isinstance ( chunk , int ) and 1 <= chunk , "Invalid `chunk` size: %s" % chunk
+
+        self.__columns  = {}    ## in-memory columns
+        self.__counters = {}    ## running statistics
+        self.__names    = set() ## names of all columns
+        self.__chunk    = chunk ## chunk size
+        self.__nchunks  = 0     ## number of chunks in the store
+        self.__nrows    = 0     ## number of rows in memory
+        self.__store    = None
+        self.__dbname   = None
+
+        if   isinstance ( store , string_types ) :
+            import ostap.io.zipshelve as DBASE
+            self.__dbname = store
+            self.__store  = DBASE.open ( store , 'c' )
+        elif store is not None :
+            self.__store  = store
+
+    # =========================================================================
+    ## get the numerical (float) representation of the value, e.g. for VE
+    #  @return float value or None for non-numerical values 
+    @staticmethod
+    def _as_float ( value ) :
+        """ Get the numerical (float) representation of the value, e.g. for VE
+        - return float value or None for non-numerical values 
+        """
+        if isinstance ( value , string_types + ( bool , ) ) : return None
+        if isinstance ( value , num_types ) : return float ( value )
+        try :
+            return float ( value )
+        except ( TypeError , ValueError , AttributeError ) :
+            return None
+        
+    # =========================================================================
+    ## create new column
+    @staticmethod
+    def _new_column ( name , value = 0.0 ) :
+        """ Create new column
+        """
+        if not name : return []
+        if isinstance ( value , ( float , int ) ) and not isinstance ( value , bool ) :
+            return array ( 'd' )
+        return []
+
+    # =========================================================================
+    ## Append the value to the column
+    #  @code
+    #  results = ...
+    #  results.append ( 'mean' , 0.1 )
+    #  @endcode
+    def append ( self , name , value ) :
+        """ Append the value to the column
+        >>> results = ...
+        >>> results.append ( 'mean' , 0.1 )
+        - numerical values (e.g. VE) are stored as floats 
+        """
+        number = self._as_float ( value ) if name else None 
+        if number is not None : value = number
+        
+        column = self.__columns.get ( name , None )
+        if column is None :
+            column = self._new_column ( name , value )
+            self.__columns [ name ] = column
+            self.__names.add ( name )
+
+        try :
+            column.append ( value )
+        except TypeError :
+            ## non-numerical value in numerical column: convert to list 
+            column = list ( column )
+            column.append ( value )
+            self.__columns [ name ] = column
+
+        ## update the running statistics (numerical values only)
+        if number is not None :
+            cnt = self.__counters.get ( name , None )
+            if cnt is None :
+                from ostap.core.core import SE
+                cnt = SE ()
+                self.__counters [ name ] = cnt
+            cnt += number
+
+        self.__nrows = max ( self.__nrows , len ( column ) )
+        if self.__store is not None and self.__chunk <= self.__nrows : self.flush ()
+
+    # =========================================================================
+    ## Write the in-memory chunk into the store
+    def flush ( self ) :
+        """ Write the in-memory chunk into the store
+        """
+        if self.__store is None or not self.__columns : return
+        key = 'chunk/%06d' % self.__nchunks
+        self.__store [ key ] = self.__columns
+        self.__nchunks += 1
+        self.__columns  = {}
+        self.__nrows    = 0
+        if hasattr ( self.__store , 'sync' ) : self.__store.sync ()
+
+    # =========================================================================
+    ## Flush and close the store
+    def close ( self ) :
+        """ Flush and close the store
+        """
+        self.flush ()
+        if self.__dbname and self.__store is not None : self.__store.close ()
+        self.__store = None
+
+    # =========================================================================
+    ## the chunks from the store
+    def __chunks ( self ) :
+        if self.__store is None : return
+        for i in range ( self.__nchunks ) :
+            yield self.__store [ 'chunk/%06d' % i ]
+
+    # =========================================================================
+    ## Get the full column (including the chunks from the store)
+    def __getitem__ ( self , name ) :
+        """ Get the full column (including the chunks from the store)
+        """
+        if not name in self : raise KeyError ( name )
+        result = None
+        for chunk in self.__chunks () :
+            if not name in chunk : continue
+            data = chunk [ name ]
+            if result is None : result = array ( 'd' ) if isinstance ( data , array ) else []
+            if isinstance ( result , array ) and not isinstance ( data , array ) : result = list ( result )
+            result.extend ( data )
+        column = self.__columns.get ( name , None )
+        if   result is None : return column
+        elif column         :
+            if isinstance ( result , array ) and not isinstance ( column , array ) : result = list ( result )
+            result.extend ( column )
+        return result
+
+    ## get the column or default value
+    def get ( self , name , default = None ) :
+        """ Get the column or default value
+        """
+        return self [ name ] if name in self else default
+
+    ## names of columns
+    def keys ( self ) :
+        """ Names of columns
+        """
+        return tuple ( sorted ( self.__names ) )
+
+    def __contains__ ( self , name ) : return name in self.__names
+
+    def __iter__ ( self ) :
+        for name in self.keys () : yield name
+
+    def items ( self ) :
+        """ Iterator over ( name , column ) pairs
+        """
+        for name in self.keys () : yield name , self [ name ]
+
+    def __len__  ( self ) : return len ( self.keys () )
+
+    # =========================================================================
+    @property
+    def counters ( self ) :
+        """`counters` : running statistics for all (numerical) columns : `{ name : SE }`"""
+        return self.__counters
+
+    @property
+    def chunk ( self ) :
+        """`chunk` : chunk size for streaming into the store"""
+        return self.__chunk
+
+    @property
+    def nchunks ( self ) :
+        """`nchunks` : number of chunks in the store"""
+        return self.__nchunks
+
+    @property
+    def store ( self ) :
+        """`store` : the store (if any)"""
+        return self.__store
+
+    # =========================================================================
+    ## Merge with another container (or dictionary of lists)
+    #  @code
+    #  results = ...
+    #  other   = ...
+    #  results.merge ( other )
+    #  @endcode
+    def merge ( self , other ) :
+        """ Merge with another container (or dictionary of lists)
+        >>> results = ...
+        >>> other   = ...
+        >>> results.merge ( other )
+        """
+        if not isinstance ( other , ToyResults ) :
+            for name in other :
+                for value in other [ name ] : self.append ( name , value )
+            return self
+
+        ## merge the columns in pieces of at most `chunk` rows
+        columns = dict ( other.items () )
+        size    = max ( [ len ( c ) for c in columns.values () ] + [ 0 ] )
+        start   = 0
+        while start < size :
+            step = size - start
+            if self.__store is not None : step = min ( step , max ( 1 , self.__chunk - self.__nrows ) )
+            for name , column in columns.items () :
+                piece = column [ start : start + step ]
+                if len ( piece ) : self.__extend ( name , piece )
+            start += step
+            if self.__store is not None and self.__chunk <= self.__nrows : self.flush ()
+
+        for name , cnt in other.counters.items () :
+            mine = self.__counters.get ( name , None )
+            if mine is None :
+                from ostap.core.core import SE
+                mine = SE ()
+                self.__counters [ name ] = mine
+            mine += cnt
+
+        return self
+
+    __iadd__ = merge
+
+    # =========================================================================
+    ## extend the column with the piece of another column
+    #  (the numerical column is converted to the list for non-numerical values)
+    def __extend ( self , name , piece ) :
+        mine = self.__columns.get ( name , None )
+        if mine is None :
+            mine = array ( 'd' ) if isinstance ( piece , array ) else []
+            self.__columns [ name ] = mine
+            self.__names.add ( name )
+        if isinstance ( mine , array ) and not isinstance ( piece , array ) :
+            try :
+                piece = array ( 'd' , piece )
+            except TypeError :
+                mine = list ( mine )
+                self.__columns [ name ] = mine
+        mine.extend ( piece )
+        self.__nrows = max ( self.__nrows , len ( mine ) )
+
+    ## remove all content
+    def clear ( self ) :
+        """ Remove all content (the chunks already written to the store are detached)
+        """
+        self.__columns  = {}
+        self.__counters = {}
+        self.__names    = set ()
+        self.__nrows    = 0
+        self.__nchunks  = 0
+
+    # =========================================================================
+    ## pickling: the store is not pickled, all content is loaded into memory
+    def __getstate__ ( self ) :
+        columns = dict ( self.items () ) if self.__store is not None else self.__columns
+        return { 'columns'  : columns        ,
+                 'counters' : self.__counters ,
+                 'chunk'    : self.__chunk    }
+
+    ## unpickling
+    def __setstate__ ( self , state ) :
+        self.__columns  = state [ 'columns'  ]
+        self.__counters = state [ 'counters' ]
+        self.__chunk    = state [ 'chunk'    ]
+        self.__names    = set ( self.__columns )
+        self.__nchunks  = 0
+        self.__nrows    = max ( [ len ( c ) for c in self.__columns.values () ] + [ 0 ] )
+        self.__store    = None
+        self.__dbname   = None
+
+    def __str__ ( self ) :
+        return 'ToyResults(%s)' % ', '.join ( '%s:%d' % ( k , len ( self [ k ] ) ) for k in self.keys () )
+    __repr__ = __str__
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+# =============================================================================
+##                                                                      The END
+# =============================================================================
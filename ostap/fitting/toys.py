@@ -20,6 +20,8 @@
     'make_bootstrap'   , ## run Bootstrapanalysis 
     "make_funtoys"     , ## propagate fit uncertainties for the model features 
     "vars_transform"   , ## helper function to transform the variables
+    "generate_data"    , ## default function to generate the data (with cached generation context)
+    "GenContext"       , ## reusable generation context for toys 
     "print_stats"      , ## print toys      statistics 
     "print_jackknife"  , ## print jackknife statistics 
     "print_bootstrap"  , ## print bootstrap statistics 
@@ -27,7 +29,7 @@
 # =============================================================================
 from   ostap.core.ostap_types     import  ( string_types   , integer_types  ,
                                             listlike_types , dictlike_types )
-from   ostap.core.core            import VE, SE, Ostap 
+from   ostap.core.core            import VE, SE, Ostap, dsID 
 from   ostap.logger.pretty        import pretty_float, fmt_pretty_float
 from   ostap.logger.colorized     import attention
 from   ostap.fitting.funbasic     import AFUN1
@@ -115,11 +117,16 @@ def make_stats ( results , fits = {} , covs = {} , accept = SE () ) :
     from ostap.core.core import VE, SE
 
     stats = defaultdict ( SE )
-    
-    for par in results :
-        if par : 
-            pars = results [ par ] 
-            for v in pars : stats [ par ] += float ( v )
+
+    from ostap.fitting.toyresults import ToyResults
+    if isinstance ( results , ToyResults ) :
+        ## running statistics is already here 
+        for par , cnt in results.counters.items () : stats [ par ] += cnt 
+    else : 
+        for par in results :
+            if par : 
+                pars = results [ par ] 
+                for v in pars : stats [ par ] += float ( v )
             
     if isinstance ( accept , VE ) and 2 <= accept.nEntries() and 0 <= accept.eff() <= 1  :
         stats ['- Accept '         ] = accept 
@@ -436,14 +443,190 @@ def print_bootstrap  ( fitresult             ,
                           prefix    = "# "     )
     logger.info ( '%s:\n%s' % ( title , table ) )
     
+# ==============================================================================
+## @class GenContext
+#  Reusable generation context for toys.
+#  RooFit generator context (accept/reject envelope, integrals, cached maxima)
+#  is created once and reused for all toys. 
+#  It is refreshed only when the parameters (values, ranges, constness)
+#  or the ranges of observables are changed 
+#  @code
+#  pdf     = ...
+#  context = GenContext ( pdf , varset , nEvents = 100 ) 
+#  for i in range ( 1000 ) :
+#     dataset = context () 
+#  @endcode
+#  For unsupported configurations (binned generation, special storage,
+#  additional RooFit arguments, simultaneous PDFs) it is
+#  just a simple call for <code>PDF.generate</code> 
+#  @see RooAbsPdf::genContext
+#  @see RooAbsPdf::prepareMultiGen
+class GenContext(object) :
+    """ Reusable generation context for toys.
+    RooFit generator context (accept/reject envelope, integrals, cached maxima)
+    is created once and reused for all toys. 
+    It is refreshed only when the parameters (values, ranges, constness)
+    or the ranges of observables are changed 
+    >>> pdf     = ...
+    >>> context = GenContext ( pdf , varset , nEvents = 100 ) 
+    >>> for i in range ( 1000 ) :
+    ...     dataset = context () 
+    For unsupported configurations (binned generation, special storage,
+    additional RooFit arguments, simultaneous PDFs) it is
+    just a simple call for `PDF.generate` 
+    - see `ROOT.RooAbsPdf.genContext`
+    - see `ROOT.RooAbsPdf.prepareMultiGen`
+    """
+    def __init__ ( self , pdf , varset , **config ) :
+        
+        self.__pdf     = pdf
+        self.__config  = config
+        self.__varset  = varset 
+        self.__context = None
+        self.__state   = None
+        self.__init    = False 
+        self.__nbuilds = 0
+        self.__ncalls  = 0 
+        
+        rpdf = getattr ( pdf , 'pdf' , None )
+        
+        self.__ok = isinstance ( rpdf , ROOT.RooAbsPdf                  ) and \
+            not     isinstance ( rpdf , ROOT.RooSimultaneous            ) and \
+            hasattr ( rpdf , 'genContext' ) and hasattr ( pdf , 'gen_sample' ) and \
+            not config.get ( 'binning' , None ) and \
+            not config.get ( 'args'    , ()   ) and \
+            config.get ( 'storage' , None ) is None 
+
+        if self.__ok :
+            
+            vs = ROOT.RooArgSet()
+            if   isinstance ( varset , ROOT.RooAbsData ) :
+                for v in varset.get () :
+                    if v in pdf.vars : vs.add ( v )
+            elif isinstance ( varset , ROOT.RooAbsArg  ) : vs.add ( varset ) 
+            elif varset :
+                for v in varset : vs.add ( v )
+            for v in pdf.vars :
+                if not v in vs : vs.add ( v )
+                
+            self.__varset = vs
+            self.__params = rpdf.getParameters ( vs )
+            
+    # =========================================================================
+    ## the current state of parameters and observables 
+    def state ( self ) :
+        """ The current state of parameters and observables 
+        """
+        result = []
+        for p in self.__params :
+            if   isinstance ( p , ROOT.RooRealVar     ) : 
+                result.append ( ( p.GetName () , p.getVal () , p.getMin () , p.getMax () , p.isConstant () ) ) 
+            elif isinstance ( p , ROOT.RooAbsCategory ) :
+                result.append ( ( p.GetName () , p.getCurrentIndex () , p.isConstant () ) )
+            elif isinstance ( p , ROOT.RooAbsReal     ) : 
+                result.append ( ( p.GetName () , p.getVal () , p.isConstant () ) )
+        for v in self.__varset :
+            if isinstance ( v , ROOT.RooRealVar ) : 
+                result.append ( ( v.GetName () , v.getMin () , v.getMax () ) )
+        return tuple ( result )
+    
+    # =========================================================================
+    ## (re)build the RooFit generator context 
+    def build ( self ) :
+        """ (Re)build the RooFit generator context 
+        """
+        silent  = self.__config.get ( 'silent' , True )
+        context = self.__pdf.pdf.genContext ( self.__varset , ROOT.nullptr , ROOT.nullptr , not silent )
+        if not context : raise TypeError ( "Cannot create generator context!" )
+        ROOT.SetOwnership ( context , True ) 
+        self.__context  = context 
+        self.__init     = False
+        self.__nbuilds += 1
+        
+    # =========================================================================
+    ## generate the dataset 
+    def __call__ ( self ) :
+        """ Generate the dataset 
+        """
+        self.__ncalls += 1
+        
+        if self.__ok :
+            try : 
+                state = self.state ()
+                if self.__context is None or state != self.__state :
+                    self.build ()
+                    self.__state = state
+                    
+                config  = self.__config 
+                nEvents = self.__pdf.gen_sample ( config [ 'nEvents' ] , config.get ( 'sample' , True ) )
+                result  = self.__context.generate ( nEvents , self.__init )
+                if result :
+                    self.__init = True 
+                    ROOT.SetOwnership ( result , True )
+                    result.SetName ( dsID () )
+                    return result 
+            except Exception : 
+                logger.warning ( "GenContext: cannot use generator context, switch to `generate`" , exc_info = True ) 
+                self.__ok      = False
+                self.__context = None 
+                
+        return self.__pdf.generate ( varset = self.__varset , **self.__config ) 
+
+    @property
+    def nbuilds ( self ) :
+        """`nbuilds' : number of (re)builds of the generator context"""
+        return self.__nbuilds
+
+    @property
+    def ncalls ( self ) :
+        """`ncalls' : number of generated datasets"""
+        return self.__ncalls 
+
+    @property
+    def cached ( self ) :
+        """`cached' : is the cached generator context used?"""
+        return self.__ok 
+    
+# ==============================================================================
+## cache of the generation contexts
+from ostap.utils.basic import LRUCache as _LRUCache
+_gen_contexts = _LRUCache ( maxsize = 16 ) 
+# ==============================================================================
+## Get the (cached) generation context for ( pdf , varset , config ) 
+#  @code
+#  context = gen_context ( pdf , varset , **config )
+#  dataset = context () 
+#  @endcode 
+def gen_context ( pdf , varset , **config ) :
+    """ Get the (cached) generation context for ( pdf , varset , config ) 
+    >>> context = gen_context ( pdf , varset , **config )
+    >>> dataset = context () 
+    """
+    vkey = id ( varset ) if isinstance ( varset , ROOT.RooAbsData ) else \
+           tuple ( v.GetName () for v in ( ( varset , ) if isinstance ( varset , ROOT.RooAbsArg ) else varset ) ) if varset else () 
+    try :
+        key  = id ( pdf ) , vkey , repr ( sorted ( config.items () ) )
+        hash ( key ) 
+    except TypeError :
+        return GenContext ( pdf , varset , **config )
+    
+    entry = _gen_contexts.get ( key , None )
+    ## keep the reference to pdf & varset: their ids must not be reused
+    if entry is None or entry [ 0 ] is not pdf or entry [ 1 ] is not varset :
+        entry = pdf , varset , GenContext ( pdf , varset , **config )
+        _gen_contexts [ key ] = entry
+    return entry [ 2 ]
+    
 # ==============================================================================
 ## Default function to generate the data
-#  - simple call for <code>PDF.generate</code>
+#  - (cached) generation context is reused for the same ( pdf , varset , config )  
+#  @see GenContext 
 def generate_data ( pdf , varset , **config ) :
     """ Default function to generate the data
-    - simple call for `PDF.generate`
+    - (cached) generation context is reused for the same ( pdf , varset , config )
+    - see `GenContext`
     """
-    return pdf.generate ( varset = varset , **config )
+    return gen_context ( pdf , varset , **config ) () 
 
 # ==============================================================================
 ## Default function to perform the actual fit
@@ -546,7 +729,8 @@ def make_toys ( pdf                   ,
                 silent       = True   ,                
                 progress     = True   ,
                 logger       = logger ,
-                frequency    = 500    ) : ## 
+                frequency    = 500    ,
+                store        = None   ) : ## stream results into this (shelve) database
     """ Make `nToys` pseudoexperiments
 
     -   Schematically:
@@ -582,6 +766,7 @@ def make_toys ( pdf                   ,
     - `progress`     : show progress bar? 
     - `logger`       : use this logger 
     - `frequency`    : how often to dump the intermediate results ? 
+    - `store`        : stream results in chunks into this (shelve) database
     
     It returns a dictionary with fit results for the toys and a dictionary of statistics
     
@@ -668,8 +853,9 @@ def make_toys ( pdf                   ,
     fitcnf.update ( fit_config )
     if not 'silent' in fitcnf : fitcnf [ 'silent' ] = silent
 
-    from collections import defaultdict 
-    results = defaultdict(list) 
+    from collections              import defaultdict 
+    from ostap.fitting.toyresults import ToyResults 
+    results = ToyResults ( store = store ) 
 
     from   ostap.core.core        import SE, VE
 
@@ -713,22 +899,22 @@ def make_toys ( pdf                   ,
             ## 4.1 save results 
             rpf = fit_result.params ( float_only = True ) 
             for p in rpf : 
-                results [ p ].append ( rpf [ p ][0] ) 
+                results.append ( p , rpf [ p ][0] ) 
                 
             ## 4.2 save results 
             for v in more_vars :
                 func  = more_vars [ v ] 
-                results [ v ] .append ( func ( fit_result , pdf ) )
+                results.append ( v , func ( fit_result , pdf ) )
 
             if histo : 
-                results [ '#'     ] .append ( histo.GetEntries   () )
-                results [ '#sumw' ] .append ( histo.the_integral () )
+                results.append ( '#'     , histo.GetEntries   () )
+                results.append ( '#sumw' , histo.the_integral () )
             else :
-                results [ '#'     ] .append ( len ( dataset ) )
-                results [ '#sumw' ] .append ( dataset.sumVar ( '1' ) )
+                results.append ( '#'     , len ( dataset ) )
+                results.append ( '#sumw' , dataset.sumVar ( '1' ) )
                 
             ## 4.3 save results 
-            if  add_results : results [ '' ].append ( fit_result )
+            if  add_results : results.append ( '' , fit_result )
 
         if isinstance ( dataset , ROOT.RooAbsData ) :
             ROOT.SetOwnership ( dataset , True )
@@ -749,6 +935,9 @@ def make_toys ( pdf                   ,
         delta_memory = memory_usage ()  - memory_init                               
         print_stats ( stats , nToys , logger = logger , delta_memory = delta_memory ) 
     
+    ## write the last chunk into the store (if any) 
+    results.flush ()
+    
     return results, stats 
 
 # =============================================================================
@@ -833,7 +1022,8 @@ def make_toys2 ( gen_pdf               , ## pdf to generate toys
                  silent       = True   ,
                  progress     = True   ,
                  logger       = logger ,
-                 frequency    = 500    ) :
+                 frequency    = 500    ,
+                 store        = None   ) : ## stream results into this (shelve) database
     """ Make `nToys` pseudoexperiments
     
     -   Schematically:
@@ -871,6 +1061,7 @@ def make_toys2 ( gen_pdf               , ## pdf to generate toys
     - `progress`     : show progress bar?
     - `logger`       : use this logger 
     - `frequency`    : how often to dump the intermediate results ? 
+    - `store`        : stream results in chunks into this (shelve) database
     
     It returns a dictionary with fit results for the toys and a dictionary of statistics
     >>> pdf = ...
@@ -950,8 +1141,9 @@ def make_toys2 ( gen_pdf               , ## pdf to generate toys
     fitcnf.update ( fit_config )
     if not 'silent' in fitcnf : fitcnf [ 'silent' ] = silent
 
-    from collections import defaultdict 
-    results = defaultdict(list) 
+    from collections              import defaultdict 
+    from ostap.fitting.toyresults import ToyResults 
+    results = ToyResults ( store = store ) 
 
     from   ostap.core.core        import SE
     
@@ -998,22 +1190,22 @@ def make_toys2 ( gen_pdf               , ## pdf to generate toys
             ## 5.1 save results 
             rpf = fit_result.params ( float_only = True ) 
             for j in rpf : 
-                results [ j ].append ( rpf [ j ] [ 0 ] ) 
+                results.append ( j , rpf [ j ] [ 0 ] ) 
                     
             ## 5.2 save results 
             for v in more_vars :
                 func  = more_vars[v] 
-                results [ v ] .append ( func ( fit_result , fit_pdf ) )
+                results.append ( v , func ( fit_result , fit_pdf ) )
                 
             if histo :
-                results [ '#'     ] .append ( histo.GetEntries   () )
-                results [ '#sumw' ] .append ( histo.the_integral () )
+                results.append ( '#'     , histo.GetEntries   () )
+                results.append ( '#sumw' , histo.the_integral () )
             else :                
-                results [ '#'     ] .append ( len ( dataset ) )
-                results [ '#sumw' ] .append ( dataset.sumVar ( '1' ) ) 
+                results.append ( '#'     , len ( dataset ) )
+                results.append ( '#sumw' , dataset.sumVar ( '1' ) ) 
                 
             ## 5.3 save results 
-            if add_results  : results [ '' ].append ( fit_result )
+            if add_results  : results.append ( '' , fit_result )
 
         if isinstance ( dataset , ROOT.RooAbsData ) :
             ROOT.SetOwnership ( dataset , True ) 
@@ -1034,6 +1226,9 @@ def make_toys2 ( gen_pdf               , ## pdf to generate toys
         delta_memory = memory_usage ()  - memory_init                         
         print_stats ( stats , nToys , logger = logger , delta_memory = delta_memory )
     
+    ## write the last chunk into the store (if any) 
+    results.flush ()
+    
     return results, stats 
 
 # =============================================================================
@@ -1108,7 +1303,8 @@ def make_toys3 ( gen_pdf               , ## pdf to generate toys
                  silent       = True   ,
                  progress     = True   ,
                  logger       = logger ,
-                 frequency    = 500    ) :
+                 frequency    = 500    ,
+                 store        = None   ) : ## stream results into this (shelve) database
     """ Make `nToys` pseudoexperiments
     
     -   Schematically:
@@ -1146,6 +1342,7 @@ def make_toys3 ( gen_pdf               , ## pdf to generate toys
     - `progress`     : show progress bar?
     - `logger`       : use this logger 
     - `frequency`    : how often to dump the intermediate results ? 
+    - `store`        : stream results in chunks into this (shelve) database
     
     It returns a dictionary with fit results for the toys and a dictionary of statistics
     >>> pdf = ...
@@ -1226,8 +1423,9 @@ def make_toys3 ( gen_pdf               , ## pdf to generate toys
     fitcnf.update ( fit_config )
     if not 'silent' in fitcnf : fitcnf [ 'silent' ] = silent
 
-    from collections import defaultdict 
-    results = defaultdict(list) 
+    from collections              import defaultdict 
+    from ostap.fitting.toyresults import ToyResults 
+    results = ToyResults ( store = store ) 
 
     from   ostap.core.core        import SE
     
@@ -1273,14 +1471,14 @@ def make_toys3 ( gen_pdf               , ## pdf to generate toys
 
             ## action!
             result = action ( fit_result , fit_pdf , dataset )
-            results [ '' ].append ( result )
+            results.append ( '' , result )
                         
             if histo :
-                results [ '#'     ] .append ( histo.GetEntries   () )
-                results [ '#sumw' ] .append ( histo.the_integral () )
+                results.append ( '#'     , histo.GetEntries   () )
+                results.append ( '#sumw' , histo.the_integral () )
             else :                
-                results [ '#'     ] .append ( len ( dataset ) )
-                results [ '#sumw' ] .append ( dataset.sumVar ( '1' ) ) 
+                results.append ( '#'     , len ( dataset ) )
+                results.append ( '#sumw' , dataset.sumVar ( '1' ) ) 
                                         
         if isinstance ( dataset , ROOT.RooAbsData ) :
             ROOT.SetOwnership ( dataset , True ) 
@@ -1301,6 +1499,9 @@ def make_toys3 ( gen_pdf               , ## pdf to generate toys
         delta_memory = memory_usage ()  - memory_init                                       
         print_stats ( stats , nToys , logger = logger , delta_memory = delta_memory )
     
+    ## write the last chunk into the store (if any) 
+    results.flush ()
+    
     return results, stats 
 
 # =============================================================================
@@ -1428,8 +1629,9 @@ def make_jackknife ( pdf                  ,
     fitcnf.update ( fit_config )
     if not 'silent' in fitcnf : fitcnf [ 'silent' ] = silent
     
-    from collections import defaultdict 
-    results = defaultdict(list) 
+    from collections              import defaultdict 
+    from ostap.fitting.toyresults import ToyResults 
+    results = ToyResults () 
 
     from     ostap.core.core        import SE    
     fits   = defaultdict ( SE )  ## fit statuses 
@@ -1472,18 +1674,18 @@ def make_jackknife ( pdf                  ,
             ## 6.1 save results 
             rpf = r.params ( float_only = True ) 
             for j in rpf : 
-                results [ j ].append ( rpf [ j ] [ 0 ] ) 
+                results.append ( j , rpf [ j ] [ 0 ] ) 
 
             ## 6.2. more variables to be calculated? 
             for v in more_vars :
                 func  = more_vars[v] 
-                results [ v ] .append ( func ( r , pdf ) )
+                results.append ( v , func ( r , pdf ) )
                 
-            results [ '#'     ] .append ( len ( ds ) )
-            results [ '#sumw' ] .append ( ds.sumVar ( '1' ) )
+            results.append ( '#'     , len ( ds ) )
+            results.append ( '#sumw' , ds.sumVar ( '1' ) )
             
             ## 6.3 save results 
-            if   add_results                          : results [ '' ].append ( r )
+            if   add_results                          : results.append ( '' , r )
 
             NN += 1
             
@@ -1645,8 +1847,9 @@ def make_bootstrap (
     fitcnf.update ( fit_config )
     if not 'silent' in fitcnf : fitcnf [ 'silent' ] = silent
     
-    from collections import defaultdict 
-    results = defaultdict(list) 
+    from collections              import defaultdict 
+    from ostap.fitting.toyresults import ToyResults 
+    results = ToyResults () 
 
     from   ostap.core.core        import SE    
     fits   = defaultdict ( SE )  ## fit statuses 
@@ -1689,18 +1892,18 @@ def make_bootstrap (
             ## 6.1 save results 
             rpf = r.params ( float_only = True ) 
             for j in rpf : 
-                results [ j ].append ( rpf [ j ] [ 0 ] ) 
+                results.append ( j , rpf [ j ] [ 0 ] ) 
 
             ## 6.2 more variables to be calculated? 
             for v in more_vars :
                 func  = more_vars[v] 
-                results [ v ] .append ( func ( r , pdf ) )
+                results.append ( v , func ( r , pdf ) )
                 
-            results [ '#'     ] .append ( len ( ds ) )
-            results [ '#sumw' ] .append ( ds.sumVar ( '1' ) )
+            results.append ( '#'     , len ( ds ) )
+            results.append ( '#sumw' , ds.sumVar ( '1' ) )
             
             ## 6.3 save results 
-            if   add_results                          : results [ '' ].append ( r )
+            if   add_results                          : results.append ( '' , r )
 
             NN += 1
 
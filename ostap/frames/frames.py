@@ -731,18 +731,32 @@ def frame_length ( frame            ,
 #  stat  = frame_statistic ( 'pt'           )
 #  stat  = frame_statistic ( 'pt' , 'eta>0' )
 #  @endcode
+#
+#  Other (mergeable) 1D counters can be used via <code>model</code> argument
+#  (the cuts are treated as boolean in this case):
+#  @code
+#  frame = ....
+#  stat  = frame_statistic ( 'pt' , model = Ostap.Math.TDigest () )
+#  @endcode
 #  @see Ostap::Math::StatEntity 
 #  @see Ostap::Math::WStatEntity 
+#  @see Ostap::Math::TDigest 
+#  @attention counter for <code>model</code> must support <code>+=</code> 
 def frame_statistic ( frame               , 
                       expressions         , 
                       cuts        = ''    , * , 
                       as_weight   = True  , 
                       progress    = False ,
                       report      = False ,
-                      lazy        = False ) :
+                      lazy        = False ,
+                      model       = None  ) :
     """ Get statistics of variable(s)
     >>> frame = ....
     >>> stat  = frame_statistic ( frame , 'pt' )
+    Other (mergeable) 1D counters can be used via `model` argument
+    (the cuts are treated as boolean in this case):
+    >>> stat  = frame_statistic ( frame , 'pt' , model = Ostap.Math.TDigest () )
+    - attention: counter for `model` must support `+=`
     """
     current, vname , cname , input_string = \
         _fr_helper_ ( frame , expressions , cuts ) 
@@ -752,8 +766,19 @@ def frame_statistic ( frame               ,
         logger.warning ( "The cut is treated as boolean: %s" % cuts ) 
         cname = ''
 
+    if not model is None :
+        assert isinstance ( model , Ostap.Math.Statistic ) , \
+            "Invalid model type: %s" % typename ( model )
+        ## fresh copy of the model 
+        model = type ( model ) ( model )
+        model.reset ()
+        
     def screator ( node , var_name , cut_name ) :
-        if cut_name : 
+        if   not model is None :
+            ## cuts are already applied as (boolean) pre-filter 
+            TT = SA1  [ type ( model ) ]
+            return node.Book ( std_move ( TT ( model ) ) , CNT ( 1 , var_name ) ) 
+        elif cut_name : 
             TT = SA1w [ Ostap.WStatEntity ] 
             return node.Book ( std_move ( TT () ) , CNT ( [ var_name , cut_name ] ) ) 
         else :
@@ -2862,12 +2862,137 @@ def objectAsFunctionObject ( obj ) :
     ## the original stuff    
     return FUNC_OTHER ( obj ) 
 
+# =============================================================================
+## Vectorised versions of the basic <code>VE</code> operations
+#  ( v1 , c1 , v2 , c2 ) -> ( v , c ),
+#  where <code>v</code> are values and <code>c</code> are squared uncertainties.
+#  The formulae are the same as for <code>Ostap::Math::ValueWithError</code>
+#  @see Ostap::Math::ValueWithError
+def _ve_vadd_ ( v1 , c1 , v2 , c2 ) :
+    """ Vectorised `VE`-addition: ( v1 , c1 , v2 , c2 ) -> ( v , c ) """
+    return v1 + v2 , c1 + numpy.maximum ( c2 , 0 )
+def _ve_vsub_ ( v1 , c1 , v2 , c2 ) :
+    """ Vectorised `VE`-subtraction: ( v1 , c1 , v2 , c2 ) -> ( v , c ) """
+    return v1 - v2 , c1 + numpy.maximum ( c2 , 0 )
+def _ve_vmul_ ( v1 , c1 , v2 , c2 ) :
+    """ Vectorised `VE`-multiplication: ( v1 , c1 , v2 , c2 ) -> ( v , c ) """
+    return v1 * v2 , c1 * v2 * v2 + v1 * v1 * numpy.maximum ( c2 , 0 ) 
+def _ve_vdiv_ ( v1 , c1 , v2 , c2 ) :
+    """ Vectorised `VE`-division: ( v1 , c1 , v2 , c2 ) -> ( v , c ) """
+    b2 = v2 * v2 
+    return v1 / v2 , c1 / b2 + ( v1 * v1 / ( b2 * b2 ) ) * numpy.maximum ( c2 , 0 ) 
+## reversed operations
+def _ve_vrsub_ ( v1 , c1 , v2 , c2 ) : return _ve_vsub_ ( v2 , c2 , v1 , c1 )
+def _ve_vrdiv_ ( v1 , c1 , v2 , c2 ) : return _ve_vdiv_ ( v2 , c2 , v1 , c1 )
+
+# =============================================================================
+## numpy types for the content arrays of the histograms
+_h_numpy_types = ( ( ROOT.TH1D , numpy.float64 ) ,
+                   ( ROOT.TH2D , numpy.float64 ) ,
+                   ( ROOT.TH3D , numpy.float64 ) ,
+                   ( ROOT.TH1F , numpy.float32 ) ,
+                   ( ROOT.TH2F , numpy.float32 ) ,
+                   ( ROOT.TH3F , numpy.float32 ) )
+# =============================================================================
+## Get zero-copy numpy views for the inner bins of the histogram:
+#  ( content , sumw2 ), where the shape is (nx,) , (ny,nx) or (nz,ny,nx) 
+#  @code
+#  histo = ...
+#  content , sumw2 = _h_numpy_views_ ( histo ) 
+#  @endcode 
+#  @return pair of numpy arrays or <code>None</code> if views can't be created 
+def _h_numpy_views_ ( histo ) :
+    """ Get zero-copy numpy views for the inner bins of the histogram:
+    ( content , sumw2 ), where the shape is (nx,) , (ny,nx) or (nz,ny,nx) 
+    - `None` is returned if views can't be created 
+    """
+    if isinstance ( histo , profile_types ) : return None
+    dtype = None 
+    for htype , ntype in _h_numpy_types :
+        if isinstance ( histo , htype ) :
+            dtype = ntype
+            break
+    if dtype is None : return None
+    ##
+    if not histo.GetSumw2N () : histo.Sumw2 ()
+    ## 
+    ncells = histo.GetNcells ()
+    sumw2  = histo.GetSumw2  ()
+    if sumw2.GetSize () != ncells : return None
+    ##
+    content = numpy.frombuffer ( histo.GetArray () , count = ncells , dtype = dtype         )
+    sumw2   = numpy.frombuffer ( sumw2.GetArray () , count = ncells , dtype = numpy.float64 )
+    if not content.flags.writeable or not sumw2.flags.writeable : return None
+    ##
+    dim   = histo.GetDimension () 
+    shape = tuple ( reversed ( [ a.GetNbins () + 2 for a in ( histo.GetXaxis () , histo.GetYaxis () , histo.GetZaxis () ) [ : dim ] ] ) )
+    inner = dim * ( slice ( 1 , -1 ) , ) 
+    ## 
+    return content.reshape ( shape ) [ inner ] , sumw2.reshape ( shape ) [ inner ] 
+
+# =============================================================================
+## Vectorised operation for the histograms:
+#  the fast path for identically binned histograms (or constants)
+#  that operates on zero-copy numpy views
+#  @param result the result histogram (clone of h1 or h1 itself) 
+#  @param h1     the first operand (histogram)
+#  @param h2     the second operand (histogram, number or VE)
+#  @param voper  vectorised VE-operation ( v1 , c1 , v2 , c2 ) -> ( v , c )
+#  @return True if operation is performed, False otherwise 
+def _h_numpy_oper_ ( result , h1 , h2 , voper ) :
+    """ Vectorised operation for the histograms:
+    the fast path for identically binned histograms (or constants)
+    that operates on zero-copy numpy views
+    - return True if operation is performed, False otherwise 
+    """
+    if voper is None : return False
+    ## 
+    if   isinstance ( h2 , num_types ) : v2 , c2 = float ( h2 ) , 0.0
+    elif isinstance ( h2 , VE        ) : v2 , c2 = h2.value () , h2.cov2 () 
+    elif isinstance ( h2 , ROOT.TH1  ) :
+        if h1.GetDimension () != h2.GetDimension () : return False
+        if not h1.same_binning ( h2 )               : return False
+        views2 = _h_numpy_views_ ( h2 )
+        if not views2                               : return False
+        v2 , c2 = views2
+        v2 = numpy.asarray ( v2 , dtype = numpy.float64 ) 
+    else : return False
+    ## 
+    views1 = _h_numpy_views_ ( h1 )
+    if not views1 : return False
+    views  = views1 if result is h1 else _h_numpy_views_ ( result ) 
+    if not views  : return False
+    ## 
+    v1 , c1 = views1
+    v1 = numpy.asarray ( v1 , dtype = numpy.float64 ) 
+    ##
+    with numpy.errstate ( all = 'ignore' ) :
+        v , c = voper ( v1 , c1 , v2 , c2 )
+        ok    = numpy.isfinite ( v ) & numpy.isfinite ( c )
+        ## the same as VE.error()**2 
+        c     = numpy.where ( 0 <= c , c , -c ) 
+        ## non-finite bins: in-place operations keep the original content 
+        if result is h1 :
+            v = numpy.where ( ok , v , v1 )
+            c = numpy.where ( ok , c , numpy.asarray ( c1 , dtype = numpy.float64 ) )
+        else :
+            v = numpy.where ( ok , v , 0.0 )
+            c = numpy.where ( ok , c , 0.0 )
+    ##
+    content , sumw2 = views 
+    content [ ... ] = v
+    sumw2   [ ... ] = c
+    ## 
+    result.ResetStats () 
+    return True 
+
 # =============================================================================
 ## operation with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2011-06-07
-def _h1_oper_ ( h1 , h2 , oper , prefix = '' , suffix = '' ) :
+def _h1_oper_ ( h1 , h2 , oper , prefix = '' , suffix = '' , voper = None ) :
     """ Operation with the histogram
+    - for identically binned histograms (or constants) the vectorised `voper` is used, if specified
     >>> h1     = ...
     >>> h2     = ...
     >>> result = h1 (oper) h2 
@@ -2877,12 +3002,15 @@ def _h1_oper_ ( h1 , h2 , oper , prefix = '' , suffix = '' ) :
     ## 
     if isinstance ( h1 , ROOT.TProfile ) :
         hh = h1.asH1()
-        return _h1_oper_ ( hh , h2 , oper ) 
+        return _h1_oper_ ( hh , h2 , oper , voper = voper ) 
     #
     if                                 not h1.GetSumw2() : h1.Sumw2()
     if hasattr ( h2 , 'GetSumw2' ) and not h2.GetSumw2() : h2.Sumw2()
     #
     result = h1.clone ( prefix = prefix , suffix = suffix )
+    ##
+    ## fast path: identical binning 
+    if _h_numpy_oper_ ( result , h1 , h2 , voper ) : return result 
     ## 
     f2 = objectAsFunction ( h2 )
     
@@ -2908,7 +3036,7 @@ def _h1_oper_ ( h1 , h2 , oper , prefix = '' , suffix = '' ) :
 ## operation with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2011-06-07
-def _h1_ioper_ ( h1 , h2 , oper ) :
+def _h1_ioper_ ( h1 , h2 , oper , voper = None ) :
     """ Operation with the histogram
     >>> obj= ...
     >>> h2     = ...
@@ -2920,6 +3048,9 @@ def _h1_ioper_ ( h1 , h2 , oper ) :
     if                                 not h1.GetSumw2() : h1.Sumw2()
     if hasattr ( h2 , 'GetSumw2' ) and not h2.GetSumw2() : h2.Sumw2()
     #
+    ## fast path: identical binning 
+    if _h_numpy_oper_ ( h1 , h1 , h2 , voper ) : return h1 
+    #
     f2 = objectAsFunction ( h2 ) 
     ##
     for i1,x1,y1 in h1.items() :
@@ -2947,7 +3078,7 @@ def _h1_div_ ( h1 , h2 ) :
     >>> result = h1 / h2  
     """
     #
-    return _h1_oper_ ( h1 , h2 , lambda x,y : x/y , prefix = 'div' ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : x/y , prefix = 'div' , voper = _ve_vdiv_ ) 
 # =============================================================================
 ##  Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2958,7 +3089,7 @@ def _h1_mul_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 * h2  
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : x*y , prefix = 'mul' ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : x*y , prefix = 'mul' , voper = _ve_vmul_ ) 
 # =============================================================================
 ##  Addition with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2969,7 +3100,7 @@ def _h1_add_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 + h2  
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : x+y , prefix = 'add' ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : x+y , prefix = 'add' , voper = _ve_vadd_ ) 
 # =============================================================================
 ## Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2980,7 +3111,7 @@ def _h1_sub_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 - h2  
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : x-y , prefix = 'sub' ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : x-y , prefix = 'sub' , voper = _ve_vsub_ ) 
 # =============================================================================
 ##  Fraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3133,7 +3264,7 @@ def _h1_idiv_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 /=  h2     
     """
-    return _h1_ioper_ ( h1 , h2 , lambda x,y : x/y ) 
+    return _h1_ioper_ ( h1 , h2 , lambda x,y : x/y , voper = _ve_vdiv_ ) 
 
 # =============================================================================
 ## Multiplication with the histograms 
@@ -3145,7 +3276,7 @@ def _h1_imul_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 *=  h2     
     """
-    return _h1_ioper_ ( h1 , h2 , lambda x,y : x*y ) 
+    return _h1_ioper_ ( h1 , h2 , lambda x,y : x*y , voper = _ve_vmul_ ) 
 
 # =============================================================================
 ## Addition with the histograms 
@@ -3157,7 +3288,7 @@ def _h1_iadd_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 +=  h2     
     """
-    return _h1_ioper_ ( h1 , h2 , lambda x,y : x+y ) 
+    return _h1_ioper_ ( h1 , h2 , lambda x,y : x+y , voper = _ve_vadd_ ) 
 
 # =============================================================================
 ##  Subtraction of the histograms 
@@ -3169,7 +3300,7 @@ def _h1_isub_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 -=  h2     
     """
-    return _h1_ioper_ ( h1 , h2 , lambda x,y : x-y ) 
+    return _h1_ioper_ ( h1 , h2 , lambda x,y : x-y , voper = _ve_vsub_ ) 
 
 # =============================================================================
 ## Division with the histograms 
@@ -3181,7 +3312,7 @@ def _h1_rdiv_ ( h1 , h2 ) :
     >>> obj    = ...
     >>> result = obj / h1 
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : y/x , prefix = 'rdiv' ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : y/x , prefix = 'rdiv' , voper = _ve_vrdiv_ ) 
 # =============================================================================
 ## Multiplication with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3192,7 +3323,7 @@ def _h1_rmul_ ( h1 , h2 ) :
     >>> obj    = ...
     >>> result = obj * h1 
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : y*x , prefix = 'rmul') 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : y*x , prefix = 'rmul' , voper = _ve_vmul_ ) 
 
 # =============================================================================
 ## Addition with the histograms 
@@ -3204,7 +3335,7 @@ def _h1_radd_ ( h1 , h2 ) :
     >>> obj    = ...
     >>> result = obj + h1 
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : y+x , prefix = 'radd' )
+    return _h1_oper_ ( h1 , h2 , lambda x,y : y+x , prefix = 'radd' , voper = _ve_vadd_ ) 
 
 # =============================================================================
 ## Subtraction of the histograms 
@@ -3216,7 +3347,7 @@ def _h1_rsub_ ( h1 , h2 ) :
     >>> obj    = ...
     >>> result = obj - h1 
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : y-x , prefix = 'rsub' ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : y-x , prefix = 'rsub' , voper = _ve_vrsub_ ) 
 
 # =============================================================================
 ## Feed the histogram from other object, e.g. function
@@ -3860,7 +3991,7 @@ def _h3_shoot_ ( h3 , N , accept = lambda x,y,z : True ) :
 ## operation with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2011-06-07
-def _h2_oper_ ( h1 , h2 , oper , prefix = '' , suffix = '' ) :
+def _h2_oper_ ( h1 , h2 , oper , prefix = '' , suffix = '' , voper = None ) :
     """ Operation with the histogram        
     >>> h1     = ...
     >>> h2     = ...
@@ -3874,6 +4005,9 @@ def _h2_oper_ ( h1 , h2 , oper , prefix = '' , suffix = '' ) :
     #
     result = h1.clone ( prefix = prefix , suffix = suffix )
     #
+    ## fast path: identical binning 
+    if _h_numpy_oper_ ( result , h1 , h2 , voper ) : return result 
+    #
     f2 = objectAsFunction ( h2 )
     # 
     for ix1,iy1,x1,y1,z1 in h1.items() :
@@ -3897,7 +4031,7 @@ def _h2_oper_ ( h1 , h2 , oper , prefix = '' , suffix = '' ) :
 ## operation with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2012-06-03
-def _h2_ioper_ ( h1 , h2 , oper ) :
+def _h2_ioper_ ( h1 , h2 , oper , voper = None ) :
     """
     Operation with the histogram 
     """
@@ -3907,6 +4041,9 @@ def _h2_ioper_ ( h1 , h2 , oper ) :
     if                                 not h1.GetSumw2() : h1.Sumw2()
     if hasattr ( h2 , 'GetSumw2' ) and not h2.GetSumw2() : h2.Sumw2()
     #
+    ## fast path: identical binning 
+    if _h_numpy_oper_ ( h1 , h1 , h2 , voper ) : return h1 
+    #
     f2 = objectAsFunction ( h2 )
     # 
     for ix1 , iy1 , x1 , y1 , z1 in h1.items() :
@@ -3937,7 +4074,7 @@ def _h2_div_ ( h1 , h2 ) :
     >>> result = h1 / h2
     
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : x/y , prefix = 'div' ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : x/y , prefix = 'div' , voper = _ve_vdiv_ ) 
 # =============================================================================
 ## Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3948,7 +4085,7 @@ def _h2_mul_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 * h2 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : x*y , prefix = 'mul' ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : x*y , prefix = 'mul' , voper = _ve_vmul_ ) 
 # =============================================================================
 ## Addition with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3959,7 +4096,7 @@ def _h2_add_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 + h2 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : x+y , prefix = 'add' ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : x+y , prefix = 'add' , voper = _ve_vadd_ ) 
 # =============================================================================
 ## Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3970,7 +4107,7 @@ def _h2_sub_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 - h2 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : x-y , prefix = 'sub' ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : x-y , prefix = 'sub' , voper = _ve_vsub_ ) 
 
 
 # =============================================================================
@@ -3983,7 +4120,7 @@ def _h2_rdiv_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 / h2    
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : y/x , prefix = 'rdiv' ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : y/x , prefix = 'rdiv' , voper = _ve_vrdiv_ ) 
 # =============================================================================
 ## Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3994,7 +4131,7 @@ def _h2_rmul_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 * h2 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : y*x , prefix = 'rmul' ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : y*x , prefix = 'rmul' , voper = _ve_vmul_ ) 
 # =============================================================================
 ## Addition with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -4005,7 +4142,7 @@ def _h2_radd_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 + h2 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : y+x , prefix = 'radd' ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : y+x , prefix = 'radd' , voper = _ve_vadd_ ) 
 # =============================================================================
 ## Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -4016,7 +4153,7 @@ def _h2_rsub_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 - h2 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : y-x , prefix = 'rsub' ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : y-x , prefix = 'rsub' , voper = _ve_vrsub_ ) 
 
 
 # =============================================================================
@@ -4165,7 +4302,7 @@ def _h2_idiv_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 /=  h2     
     """
-    return _h2_ioper_ ( h1 , h2 , lambda x,y : x/y ) 
+    return _h2_ioper_ ( h1 , h2 , lambda x,y : x/y , voper = _ve_vdiv_ ) 
 # =============================================================================
 ## Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -4176,7 +4313,7 @@ def _h2_imul_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 *=  h2     
     """
-    return _h2_ioper_ ( h1 , h2 , lambda x,y : x*y ) 
+    return _h2_ioper_ ( h1 , h2 , lambda x,y : x*y , voper = _ve_vmul_ ) 
 
 # =============================================================================
 ## Addition with the histograms 
@@ -4188,7 +4325,7 @@ def _h2_iadd_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 +=  h2     
     """
-    return _h2_ioper_ ( h1 , h2 , lambda x,y : x+y ) 
+    return _h2_ioper_ ( h1 , h2 , lambda x,y : x+y , voper = _ve_vadd_ ) 
 # =============================================================================
 ## Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -4199,7 +4336,7 @@ def _h2_isub_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 -=  h2     
     """
-    return _h2_ioper_ ( h1 , h2 , lambda x,y : x-y ) 
+    return _h2_ioper_ ( h1 , h2 , lambda x,y : x-y , voper = _ve_vsub_ ) 
 # =============================================================================
 
 def _h2_box_   ( self , option = '' , *options , **kwargs ) : return self.draw ( option , 'box'   , *options , **kwargs )
@@ -4249,7 +4386,7 @@ def _h2_surf2_ ( self , option = '' , *options , **kwargs ) : return self.draw (
 ## operation with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2011-06-07
-def _h3_oper_ ( h1 , h2 , oper , prefix = '' , suffix = '' ) :
+def _h3_oper_ ( h1 , h2 , oper , prefix = '' , suffix = '' , voper = None ) :
     """ Operation with the 3D-histogram     
     >>> h1 = ...
     >>> h2 = ...
@@ -4263,6 +4400,9 @@ def _h3_oper_ ( h1 , h2 , oper , prefix = '' , suffix = '' ) :
     #
     result = h1.clone ( prefix = prefix , suffix = suffix  )
     #
+    ## fast path: identical binning 
+    if _h_numpy_oper_ ( result , h1 , h2 , voper ) : return result 
+    #
     f2 = objectAsFunction ( h2 ) 
     #
     
@@ -4287,7 +4427,7 @@ def _h3_oper_ ( h1 , h2 , oper , prefix = '' , suffix = '' ) :
 ## operation with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2012-06-03
-def _h3_ioper_ ( h1 , h2 , oper ) :
+def _h3_ioper_ ( h1 , h2 , oper , voper = None ) :
     """ Operation with the 3D-histogram 
     """
     ##
@@ -4296,6 +4436,9 @@ def _h3_ioper_ ( h1 , h2 , oper ) :
     if                                 not h1.GetSumw2() : h1.Sumw2()
     if hasattr ( h2 , 'GetSumw2' ) and not h2.GetSumw2() : h2.Sumw2()
     #
+    ## fast path: identical binning 
+    if _h_numpy_oper_ ( h1 , h1 , h2 , voper ) : return h1 
+    #
     f2 = objectAsFunction ( h2 ) 
     # 
     for ix1,iy1,iz1,x1,y1,z1,v1 in h1.items() :
@@ -4325,7 +4468,7 @@ def _h3_div_ ( h1 , h2 ) :
     >>> h2 = ...
     >>> h3 = h1 / h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : x/y , prefix = 'div' ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : x/y , prefix = 'div' , voper = _ve_vdiv_ ) 
 # =============================================================================
 ##  Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -4336,7 +4479,7 @@ def _h3_mul_ ( h1 , h2 ) :
     >>> h2 = ...
     >>> h3 = h1 * h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : x*y , prefix = 'mul' ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : x*y , prefix = 'mul' , voper = _ve_vmul_ ) 
 # =============================================================================
 ##  Addition with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -4347,7 +4490,7 @@ def _h3_add_ ( h1 , h2 ) :
     >>> h2 = ...
     >>> h3 = h1 + h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : x+y , prefix = 'add'  ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : x+y , prefix = 'add' , voper = _ve_vadd_ ) 
 # =============================================================================
 ##  Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -4358,7 +4501,7 @@ def _h3_sub_ ( h1 , h2 ) :
     >>> h2 = ...
     >>> h3 = h1 - h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : x-y , prefix = 'sub' ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : x-y , prefix = 'sub' , voper = _ve_vsub_ ) 
 # =============================================================================
 ##  ``Fraction'' of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -4469,7 +4612,7 @@ def _h3_rdiv_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 / h2    
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : y/x , prefix = 'rdiv' ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : y/x , prefix = 'rdiv' , voper = _ve_vrdiv_ ) 
 # =============================================================================
 ## Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -4480,7 +4623,7 @@ def _h3_rmul_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 * h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : y*x , prefix = 'rmul' ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : y*x , prefix = 'rmul' , voper = _ve_vmul_ ) 
 
 # =============================================================================
 ## Addition with the histograms 
@@ -4492,7 +4635,7 @@ def _h3_radd_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 + h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : y+x , prefix = 'radd' ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : y+x , prefix = 'radd' , voper = _ve_vadd_ ) 
 # =============================================================================
 ## Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -4503,7 +4646,7 @@ def _h3_rsub_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 - h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : y-x , prefix = 'rsub' ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : y-x , prefix = 'rsub' , voper = _ve_vrsub_ ) 
 
 # =============================================================================
 ## 'abs' the histograms 
@@ -4541,7 +4684,7 @@ def _h3_idiv_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 /=  h2 
     """
-    return _h3_ioper_ ( h1 , h2 , lambda x,y : x/y ) 
+    return _h3_ioper_ ( h1 , h2 , lambda x,y : x/y , voper = _ve_vdiv_ ) 
 # =============================================================================
 ## Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -4552,7 +4695,7 @@ def _h3_imul_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 *=  h2     
     """
-    return _h3_ioper_ ( h1 , h2 , lambda x,y : x*y ) 
+    return _h3_ioper_ ( h1 , h2 , lambda x,y : x*y , voper = _ve_vmul_ ) 
 # =============================================================================
 ## Addition with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -4563,7 +4706,7 @@ def _h3_iadd_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 +=  h2     
     """
-    return _h3_ioper_ ( h1 , h2 , lambda x,y : x+y ) 
+    return _h3_ioper_ ( h1 , h2 , lambda x,y : x+y , voper = _ve_vadd_ ) 
 # =============================================================================
 ## Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -4574,7 +4717,7 @@ def _h3_isub_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 -=  h2     
     """
-    return _h3_ioper_ ( h1 , h2 , lambda x,y : x-y ) 
+    return _h3_ioper_ ( h1 , h2 , lambda x,y : x-y , voper = _ve_vsub_ ) 
 # =============================================================================
 
 ROOT.TH3._oper_    = _h3_oper_
@@ -335,12 +335,51 @@ def test_efficiency() :
                 vals = ' '.join ( vals ) 
                 logger.info ( "%43s: %s" % ( n , vals ) ) 
     
+# =============================================================================
+## Test for vectorised operations with identically binned histograms 
+def test_vectorised () :
+    
+    logger.info ( 'Test for vectorised operations with histograms')
+
+    from ostap.histos.histos import _h2_oper_, _ve_vadd_, _ve_vsub_, _ve_vmul_, _ve_vdiv_
+    
+    h1 = ROOT.TH2D ( hID() , '' , 20 , 0 , 1 , 15 , 0 , 1 ) ; h1.Sumw2() 
+    h2 = h1.clone () 
+
+    random.seed (100) 
+    for i in range ( 5000 ) :
+        h1.Fill ( random.random () , random.random () , random.uniform ( 0.5 , 1.5 ) )
+        h2.Fill ( random.random () , random.random () , random.uniform ( 0.5 , 1.5 ) )
+        
+    for oper , voper in ( ( lambda x,y : x+y , _ve_vadd_ ) ,
+                          ( lambda x,y : x-y , _ve_vsub_ ) ,
+                          ( lambda x,y : x*y , _ve_vmul_ ) ,
+                          ( lambda x,y : x/y , _ve_vdiv_ ) ) :
+        
+        fast = _h2_oper_ ( h1 , h2 , oper , voper = voper ) ## fast path 
+        slow = _h2_oper_ ( h1 , h2 , oper )                 ## per-bin 
+        for ix , iy , x , y , v in slow.items () :
+            f = fast [ ix , iy ] 
+            assert abs ( f.value () - v.value () ) <= 1.e-10 * max ( 1 , abs ( v.value () ) ) and \
+                   abs ( f.error () - v.error () ) <= 1.e-10 * max ( 1 , abs ( v.error () ) )  , \
+                   'Mismatch between vectorised and per-bin operations!'
+
+    ## in-place operations and operations with constants 
+    h3 = h1.clone()
+    h3 /= h2
+    h3 *= VE ( 2 , 0.1**2 ) 
+    h4 = ( h1 / h2 ) * VE ( 2 , 0.1**2 )
+    for ix , iy , x , y , v in h4.items () :
+        assert abs ( h3 [ ix , iy ].value () - v.value () ) <= 1.e-10 * max ( 1 , abs ( v.value () ) ) , \
+               'Mismatch for in-place operations!'
+        
 # =============================================================================
 if '__main__' == __name__ :
 
     test_basic_1D   ()
     test_basic_2D   ()
     test_efficiency () 
+    test_vectorised () 
     
 # =============================================================================
 ##                                                                      The END 
@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file ostap/io/archivedict.py
+#  Read-only dictionary that serves the items directly from zip/tar-archive
+#  - the archive keeps one member per key ("items"-layout),
+#    each member is the raw (already compressed) item of the shelve database
+#  - no extraction into temporary location is needed
+#  - opening reads only the archive index (zip central directory/tar headers)
+#  - the items are served from the memory-mapped archive for uncompressed
+#    members (the default for this layout)
+#  @code
+#  write_items_archive ( 'db.zip' , items )
+#  with ArchiveDict ( 'db.zip' ) as db :
+#      value = db [ b'key' ]
+#  @endcode
+#  @see ostap.io.compress_shelve
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2026-10-17
+# =============================================================================
+""" Read-only dictionary that serves the items directly from zip/tar-archive
+- the archive keeps one member per key (`items`-layout),
+  each member is the raw (already compressed) item of the shelve database
+- no extraction into temporary location is needed
+- opening reads only the archive index (zip central directory/tar headers)
+- the items are served from the memory-mapped archive for uncompressed
+  members (the default for this layout)
+>>> write_items_archive ( 'db.zip' , items )
+>>> with ArchiveDict ( 'db.zip' ) as db :
+...     value = db [ b'key' ]
+- see `ostap.io.compress_shelve`
+"""
+# =============================================================================
+__author__  = 'Vanya BELYAEV Ivan.Belyaev@itep.ru'
+__date__    = "2026-10-17"
+__version__ = '$Revision$'
+__all__     = (
+    'ArchiveDict'         , ## read-only dictionary that serves items from zip/tar-archive
+    'is_items_archive'    , ## is it zip/tar-archive with `items`-layout?
+    'write_items_archive' , ## write zip/tar-archive with `items`-layout
+    )
+# =============================================================================
+from   collections.abc import Mapping
+import os, io, mmap, struct, time, zipfile, tarfile
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger( 'ostap.io.archivedict' )
+else                       : logger = getLogger( __name__ )
+# =============================================================================
+## the marker member: the first member of the archive
+MARKER   = '__ostap_items__'
+## the content of the marker member
+MAGIC    = b'ostap-items-1'
+## prefix for the names of item-members
+PREFIX   = 'items/'
+## encoding for keys
+ENCODING = 'utf-8'
+# =============================================================================
+## zip local file header: signature & fixed part
+_ZIP_LOCAL_SIGNATURE = b'PK\x03\x04'
+_ZIP_LOCAL_SIZE      = 30
+# =============================================================================
+## Is it zip/tar-archive with `items`-layout?
+#  @code
+#  ok = is_items_archive ( 'mydbase.zip' )
+#  @endcode
+def is_items_archive ( filename ) :
+    """ Is it zip/tar-archive with `items`-layout?
+    >>> ok = is_items_archive ( 'mydbase.zip' )
+    """
+    if not os.path.exists ( filename ) or not os.path.isfile ( filename ) : return False
+    try : # ===================================================================
+        # =====================================================================
+        if zipfile.is_zipfile ( filename ) :
+            with zipfile.ZipFile ( filename , 'r' , allowZip64 = True ) as zfile :
+                try :
+                    return MAGIC == zfile.read ( MARKER )
+                except KeyError :
+                    return False
+        if tarfile.is_tarfile ( filename ) :
+            ## the marker is the first member: read only the first header
+            with tarfile.open ( filename , 'r:*' ) as tfile :
+                first = tfile.next ()
+                return first is not None and MARKER == first.name
+        # =====================================================================
+    except ( OSError , zipfile.BadZipfile , tarfile.TarError ) : # ===========
+        # =====================================================================
+        pass
+    return False
+
+# =============================================================================
+## Write zip/tar-archive with `items`-layout
+#  - the archive is written into the temporary file and then moved
+#  - the members are not compressed: the items are already compressed
+#  @code
+#  items = [ ( b'key1' , b'...' ) , ( b'key2' , b'...' ) ]
+#  write_items_archive ( 'mydbase.zip' , items )
+#  write_items_archive ( 'mydbase.tar' , items , tar = True )
+#  @endcode
+#  @param output the name of archive
+#  @param items  sequence of ( key , raw bytes ) pairs
+#  @param tar    use tar-archive instead of zip-archive
+#  @return number of written items
+def write_items_archive ( output , items , tar = False ) :
+    """ Write zip/tar-archive with `items`-layout
+    - the archive is written into the temporary file and then moved
+    - the members are not compressed: the items are already compressed
+    >>> items = [ ( b'key1' , b'...' ) , ( b'key2' , b'...' ) ]
+    >>> write_items_archive ( 'mydbase.zip' , items )
+    >>> write_items_archive ( 'mydbase.tar' , items , tar = True )
+    - return number of written items
+    """
+    tmpfile = '%s.%d.tmp' % ( output , os.getpid () )
+    nitems  = 0
+    now     = time.time ()
+    try : # ===================================================================
+        # =====================================================================
+        if tar :
+            with tarfile.open ( tmpfile , 'w' ) as tfile :
+                info       = tarfile.TarInfo ( MARKER )
+                info.size  = len ( MAGIC )
+                info.mtime = now
+                tfile.addfile ( info , io.BytesIO ( MAGIC ) )
+                for key , value in items :
+                    if isinstance ( key , bytes ) : key = key.decode ( ENCODING )
+                    value      = bytes ( value )
+                    info       = tarfile.TarInfo ( PREFIX + key )
+                    info.size  = len ( value )
+                    info.mtime = now
+                    tfile.addfile ( info , io.BytesIO ( value ) )
+                    nitems += 1
+        else :
+            with zipfile.ZipFile ( tmpfile , 'w' , compression = zipfile.ZIP_STORED , allowZip64 = True ) as zfile :
+                zfile.writestr ( MARKER , MAGIC )
+                for key , value in items :
+                    if isinstance ( key , bytes ) : key = key.decode ( ENCODING )
+                    zfile.writestr ( PREFIX + key , bytes ( value ) )
+                    nitems += 1
+        os.replace ( tmpfile , output )
+        # =====================================================================
+    finally : # ===============================================================
+        # =====================================================================
+        if os.path.exists ( tmpfile ) :
+            try    : os.remove ( tmpfile )
+            except : pass
+
+    logger.debug ( '%s-archive %s with %d items is written' % ( 'tar' if tar else 'zip' , output , nitems ) )
+    return nitems
+
+# =============================================================================
+## @class ArchiveDict
+#  Read-only dictionary that serves the items directly from zip/tar-archive
+#  with `items`-layout
+#  - opening reads only the archive index
+#  - uncompressed members are served from the memory-mapped archive
+#  - compressed members are read (and decompressed) on demand
+#  @attention both keys and values are bytestrings!
+#  @code
+#  with ArchiveDict ( 'db.zip' ) as db :
+#      for key in db : print ( key , len ( db [ key ] ) )
+#  @endcode
+class ArchiveDict ( Mapping ) :
+    """ Read-only dictionary that serves the items directly from zip/tar-archive
+    with `items`-layout
+    - opening reads only the archive index
+    - uncompressed members are served from the memory-mapped archive
+    - compressed members are read (and decompressed) on demand
+    - both keys and values are bytestrings!
+    >>> with ArchiveDict ( 'db.zip' ) as db :
+    ...     for key in db : print ( key , len ( db [ key ] ) )
+    """
+    def __init__ ( self , filename ) :
+
+        assert os.path.exists ( filename ) and os.path.isfile ( filename ) , \
+            "Non existing/invalid file:`%s'" % filename
+
+        self.__filename = filename
+        self.__file     = None
+        self.__mmap     = None
+        self.__zip      = None
+        self.__tar      = None
+        self.__index    = {}
+        self.__dbtype   = ''
+
+        self.__file = io.open ( filename , 'rb' )
+        try : # ===============================================================
+            # =================================================================
+            self.__mmap = mmap.mmap ( self.__file.fileno () , 0 , access = mmap.ACCESS_READ )
+            # =================================================================
+        except ( ValueError , OSError ) : # ===================================
+            # =================================================================
+            logger.warning ( "Cannot memory-map the file `%s'" % filename )
+            self.__mmap = None
+
+        if zipfile.is_zipfile ( filename ) :
+            self.__dbtype = 'zip'
+            self.__zip    = zipfile.ZipFile ( self.__file , 'r' , allowZip64 = True )
+            for info in self.__zip.infolist () :
+                name = info.filename
+                if name.startswith ( PREFIX ) :
+                    self.__index [ name [ len ( PREFIX ) : ].encode ( ENCODING ) ] = info
+        elif tarfile.is_tarfile ( filename ) :
+            self.__dbtype = 'tar'
+            try : # ===========================================================
+                # =============================================================
+                ## uncompressed tar: members are served from mmap
+                self.__tar = tarfile.open ( fileobj = self.__file , mode = 'r:' )
+                # =============================================================
+            except tarfile.ReadError : # ======================================
+                # =============================================================
+                ## compressed tar: members are read on demand
+                self.__file.seek ( 0 )
+                self.__tar  = tarfile.open ( fileobj = self.__file , mode = 'r:*' )
+                self.__mmap = None
+                self.__dbtype = 'tar-compressed'
+            for info in self.__tar :
+                name = info.name
+                if info.isfile () and name.startswith ( PREFIX ) :
+                    self.__index [ name [ len ( PREFIX ) : ].encode ( ENCODING ) ] = info
+        else :
+            self.close ()
+            raise TypeError ( "Neither zip nor tar archive: `%s'" % filename )
+
+    # =========================================================================
+    ## Get the item from the archive
+    def __getitem__ ( self , key ) :
+        """ Get the item from the archive
+        """
+        if isinstance ( key , str ) : key = key.encode ( ENCODING )
+        info  = self.__index [ key ]
+        span  = self.__span ( info )
+        if span : return self.__mmap [ span [ 0 ] : span [ 1 ] ]
+        if self.__zip : return self.__zip.read ( info )
+        return self.__tar.extractfile ( info ).read ()
+
+    # =========================================================================
+    ## Get the item from the archive as read-only memoryview into 
+    #  the memory-mapped archive (no copy), or as bytes if it is not possible
+    #  @code
+    #  db   = ...
+    #  view = db.view ( b'key' )
+    #  @endcode
+    def view ( self , key ) :
+        """ Get the item from the archive as read-only memoryview into 
+        the memory-mapped archive (no copy), or as bytes if it is not possible
+        >>> db   = ...
+        >>> view = db.view ( b'key' )
+        """
+        if isinstance ( key , str ) : key = key.encode ( ENCODING )
+        span = self.__span ( self.__index [ key ] )
+        if span : return memoryview ( self.__mmap ) [ span [ 0 ] : span [ 1 ] ]
+        return self [ key ]
+
+    ## the position of uncompressed member in the memory-mapped archive 
+    def __span ( self , info ) :
+        if self.__mmap is None : return None
+        if self.__tar is not None :
+            start = info.offset_data
+            return start , start + info.size 
+        if zipfile.ZIP_STORED == info.compress_type and not info.flag_bits & 0x1 :
+            offset = info.header_offset
+            header = self.__mmap [ offset : offset + _ZIP_LOCAL_SIZE ]
+            if _ZIP_LOCAL_SIGNATURE == header [ : 4 ] :
+                nlen , elen = struct.unpack ( '<HH' , header [ 26 : 30 ] )
+                start = offset + _ZIP_LOCAL_SIZE + nlen + elen
+                return start , start + info.file_size
+        return None 
+
+    def __contains__ ( self , key ) :
+        if isinstance ( key , str ) : key = key.encode ( ENCODING )
+        return key in self.__index
+
+    def __iter__ ( self ) : return iter ( self.__index )
+    def __len__  ( self ) : return len  ( self.__index )
+    def keys     ( self ) : return self.__index.keys ()
+
+    # =========================================================================
+    ## close the archive
+    def close ( self ) :
+        """ Close the archive
+        """
+        if self.__zip  is not None : self.__zip.close  ()
+        if self.__tar  is not None : self.__tar.close  ()
+        if self.__mmap is not None :
+            try : # ===========================================================
+                # =============================================================
+                self.__mmap.close ()
+                # =============================================================
+            except BufferError : # ============================================
+                # =============================================================
+                ## there are alive views (e.g. numpy arrays) into the archive:
+                #  the mapping is released together with them
+                logger.debug ( "Memory-mapped `%s` is still in use" % self.__filename )
+        if self.__file is not None : self.__file.close ()
+        self.__zip   = None
+        self.__tar   = None
+        self.__mmap  = None
+        self.__file  = None
+        self.__index = {}
+
+    ## nothing to sync for read-only archive
+    def sync ( self ) : pass
+
+    ## context manager: ENTER
+    def __enter__ ( self ) : return self
+    ## context manager: EXIT
+    def __exit__  ( self , *_ ) : self.close ()
+
+    @property
+    def filename ( self ) :
+        """`filename` : the name of the archive"""
+        return self.__filename
+
+    @property
+    def dbtype ( self ) :
+        """`dbtype` : the type of archive"""
+        return self.__dbtype
+
+    @property
+    def mapped ( self ) :
+        """`mapped` : is archive memory-mapped?"""
+        return self.__mmap is not None
+
+    def __repr__ ( self ) :
+        return "ArchiveDict('%s')|%s: %d item(s)" % ( self.__filename , self.__dbtype , len ( self ) )
+    __str__ = __repr__
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+# =============================================================================
+##                                                                      The END
+# =============================================================================
@@ -183,13 +183,20 @@ def __init__( self               ,
 
         self.taropts = "x:bz2"
         
+    # ==========================================================================
+    ## compress the (pickled) bytes using <code>bz2.compress</code>
+    def compress_bytes ( self , data ) :
+        """ Compress the (pickled) bytes using `bz2.compress`
+        """
+        return bz2.compress ( data , self.compresslevel )
+        
     # ==========================================================================
     ## compress (bzip2)  the item  using <code>bz2.compress</code>
     def compress_item ( self , value ) :
         """ Compress (zip) the item using ``bz2.compress''
         - see bz2.compress
         """
-        return bz2.compress ( self.pickle ( value ) , self.compresslevel )
+        return self.compress_bytes ( self.pickle ( value ) )
 
     # =========================================================================
     ## uncompres (bzip2) the item using <code>bz2.decompress</code>
@@ -58,10 +58,12 @@
 from   ostap.io.dbase       import dbopen     , whichdb, Item, ordered_dict, dbfiles   
 from   ostap.io.pickling    import ( Pickler  , Unpickler, BytesIO,
                                      PROTOCOL , HIGHEST_PROTOCOL  , DEFAULT_PROTOCOL, 
-                                     pickle_dependencies )
+                                     pickle_dependencies ,
+                                     OOB_THRESHOLD , oob_dumps , oob_frame , oob_unframe , is_oob_frame )
 from   ostap.utils.core     import typename  
 from   ostap.utils.cleanup  import CUBase
-from   ostap.io.utils       import file_size, writeable
+from   ostap.io.utils       import file_size, writeable, thread_map
+from   ostap.io.archivedict import ArchiveDict, is_items_archive, write_items_archive
 from   collections          import defaultdict 
 import sys, os, abc, shelve, glob, time, datetime, zipfile, tarfile 
 # =============================================================================
@@ -120,6 +122,14 @@ class CompressShelf (shelve.Shelf,CUBase) :
     ZIP_EXTS      = ( '.zip' , '.zipdb' , '.dbzip' , '.zdb' , '.dbz' ) 
     ## whole DB is in tar-archive
     TAR_EXTS      = ( '.tar' , '.tardb' , '.dbtar' , '.tdb' , '.dbt' ) 
+    ## layouts of zip/tar-archive:
+    #  - `files` : the files of underlying DB are archived,
+    #              the archive is extracted when opened
+    #  - `items` : one archive member per key, 
+    #              read-only access is served directly from the archive 
+    LAYOUTS       = ( 'files' , 'items' )
+    ## service keys, not shown in the table of content 
+    HIDDEN_KEYS   = ( '__metainfo__' , ) 
 
     def __init__(
             self                   ,
@@ -150,6 +160,10 @@ def __init__(
         dbname  = self.name_expand ( dbname ) ## from CUBase 
         
         self.__compresstype    = kwargs.pop ( 'compresstype' , '???' ) 
+        layout                 = kwargs.pop ( 'layout'       , 'files' )
+        assert layout in self.LAYOUTS , "Invalid `layout`: %s" % layout 
+        self.__oob_threshold   = kwargs.pop ( 'oob_threshold' , OOB_THRESHOLD )
+        self.__oob_compress    = kwargs.pop ( 'oob_compress'  , False         )
         self.__compresslevel   = compress
         self.__silent          = silent
         self.__protocol        = protocol
@@ -165,6 +179,9 @@ def __init__(
             'dbtype'       : self.dbtype         , ## preferred dbtype 
             'silent'       : self.silent         ,
             'keyencoding'  : keyencoding         ,   
+            'layout'       : layout              , ## layout of zip/tar-archive 
+            'oob_threshold': self.oob_threshold  , ## minimal size of out-of-band buffers 
+            'oob_compress' : self.oob_compress   , ## compress out-of-band buffers? 
         }
         self.__kwargs.update ( kwargs )
 
@@ -198,8 +215,21 @@ def __init__(
                 
         self.__zip = zip
         self.__tar = tar 
-    
-        if 'r' == mode and ( tarf or zipf ) : 
+
+        ## archive with `items`-layout: one archive member per key 
+        archived = ( zipf or tarf ) and is_items_archive ( dbname )
+        if   archived                          : layout = 'items'
+        elif not ( zip or tar ) or 'r' == mode : layout = 'files' 
+        self.__layout = layout 
+        items         = 'items' == layout 
+        
+        if 'r' == mode and archived :
+
+            ## the keys are served directly from the archive, no extraction 
+            self.__files         = ( dbname , )
+            self.__actual_dbname = dbname
+            
+        elif 'r' == mode and ( tarf or zipf ) : 
             
             ## uncompress into the temporary location
             tmpdir   = self.tempdir () 
@@ -210,6 +240,14 @@ def __init__(
             self.__files         = tfiles
             self.__actual_dbname = os.path.join ( tmpdir , os.path.basename ( fname ) ) 
 
+        elif items and ( archived or 'n' == mode or not ( tarf or zipf ) ) :
+
+            ## archive with `items`-layout: the working DB
+            #  (filled from the existing archive, see below) 
+            self.__compress      = True 
+            self.__remove        = ()
+            self.__actual_dbname = fname
+            
         elif 'r' != mode and ( tarf or zipf ) :
 
             ## uncompress locally
@@ -235,6 +273,21 @@ def __init__(
             self.__remove        = ()
             self.__actual_dbname = filename
 
+        self.__taropts = 'x:gz' 
+
+        # =====================================================================
+        ## read-only archive with `items`-layout: no underlying DB files 
+        # =====================================================================
+        if 'r' == mode and archived :
+            dbase         = ArchiveDict ( dbname )
+            self.__opened = True 
+            conf  = { 'protocol' : protocol , 'writeback' : writeback }
+            conf [ 'keyencoding'] = keyencoding
+            shelve.Shelf.__init__ ( self   , dbase  , **conf )
+            self.__dbtype = dbase.dbtype 
+            if not self.silent : self.ls ()
+            return
+        
         # =====================================================================
         the_path = lambda s : os.path.normpath ( os.path.abspath ( s ) )
         ## all files  before dbopen
@@ -247,7 +300,8 @@ def __init__(
         ## open/create the actual underlying database 
         # =====================================================================
         self.__opened = False        
-        dbase = dbopen ( self.dbname , flag = mode , dbtype = dbtype , **kwargs )
+        dbmode = 'c' if archived and 'w' == mode else mode 
+        dbase  = dbopen ( self.dbname , flag = dbmode , dbtype = dbtype , **kwargs )
         self.__opened = True
         if 'r' != mode and hasattr ( dbase , 'sync' ) : dbase.sync()
         
@@ -268,6 +322,11 @@ def __init__(
         conf [ 'keyencoding'] = keyencoding
         shelve.Shelf.__init__ ( self   , dbase  , **conf )
 
+        ## fill the working DB from the archive with `items`-layout
+        if archived and 'n' != mode :
+            with ArchiveDict ( dbname ) as archive :
+                for key in archive : self.dict [ key ] = archive [ key ]
+
         # ======================================================================
         ## actual type of underlying database 
         self.__dbtype        =  whichdb ( self.dbname ) ## actual dbtype 
@@ -325,8 +384,6 @@ def __init__(
             logger.info ( 'DB files are %s|%s' % ( ff , self.dbtype ) )
 
         self.sync ()
-
-        self.__taropts = 'x:gz' 
         
 
     @property
@@ -353,6 +410,16 @@ def compresslevel ( self ) :
     def compresstype ( self ) :
         """`compresstype' : type of compression"""
         return self.__compresstype
+
+    @property
+    def oob_threshold ( self ) :
+        """`oob_threshold` : minimal size of contiguous buffers (e.g. numpy arrays) to be stored out-of-band (protocol 5)"""
+        return self.__oob_threshold
+    
+    @property
+    def oob_compress ( self ) :
+        """`oob_compress` : compress out-of-band buffers? (uncompressed buffers are read without copy)"""
+        return self.__oob_compress
     
     @property 
     def dbname ( self ) :
@@ -394,6 +461,11 @@ def files  ( self ) :
         """`files' : the files assocated with the database"""
         return self.__files
 
+    @property
+    def layout ( self ) :
+        """`layout` : layout of zip/tar-archive: `files` (DB files) or `items` (one member per key)"""
+        return self.__layout
+    
     @property
     def kwargs ( self )  :
         """`kwargs` : all constructor arguments"""
@@ -516,7 +588,7 @@ def table ( self , pattern = '' , load = True , prefix = '' ) :
         for k in keys :
 
             ## skip it
-            if '__metainfo__' == k : continue
+            if k in self.HIDDEN_KEYS : continue
             
             ss = len ( self.dict [ k.encode ( self.keyencoding ) ] )
             
@@ -636,12 +708,17 @@ def close ( self ) :
             self [ '__metainfo__'                ] = dct
 
         if not self.silent : self.ls ()
+
+        ## archive with `items`-layout is written from the working DB 
+        if self.__compress and 'items' == self.layout :
+            self.sync ()
+            self.compress_items ( self.nominal_dbname )
         
         shelve.Shelf.close ( self )
         self.__opened = False
         
         ##
-        if self.__compress :
+        if self.__compress and 'items' != self.layout :
             self.compress_files ( self.__compress , self.nominal_dbname ) 
             
         ##  remove the intermediate files 
@@ -674,12 +751,24 @@ def __repr__ ( self ) :
     
     __str__ = __repr__
 
+    # ==========================================================================
+    ## get the raw (compressed) record from the backend for the given key
+    #  - memoryview into the memory-mapped file is used if backend allows
+    def __get_raw_value__ ( self , key ) :
+        """ Get the raw (compressed) record from the backend for the given key
+        - memoryview into the memory-mapped file is used if backend allows 
+        """
+        key  = key.encode ( self.keyencoding )
+        view = getattr ( self.dict , 'view' , None )
+        return view ( key ) if view else self.dict [ key ] 
+    
     # ==========================================================================
     ## get raw uncompressed bytes (the input for unpickling) for the given key
     def __get_raw_bytes__ ( self , key ) :
         """ Get raw uncompressed bytes (the input for unpickling) for the given key
         """
-        return self.uncompress_item ( self.dict [ key.encode ( self.keyencoding ) ] )
+        data , _ = self.uncompress_oob ( self.__get_raw_value__ ( key ) )
+        return data 
         
     # =========================================================================
     ## `get-and-uncompress-item' from dbase
@@ -697,8 +786,8 @@ def __get_raw_item__ ( self , key ) :
         except KeyError: # ====================================================
             # =================================================================
             ## value = self.uncompress_item ( self.dict [ key.encode ( self.keyencoding ) ] )
-            value = self.__get_raw_bytes__ ( key ) 
-            value = self.unpickle ( value )
+            data , buffers = self.uncompress_oob ( self.__get_raw_value__ ( key ) )
+            value = self.unpickle ( data , buffers )
             if self.writeback : self.cache [ key ] = value
             
         return value
@@ -748,7 +837,116 @@ def __setitem__  ( self , key , value ) :
         item = Item ( time.time()  , value )
         if self.writeback : self.cache [ key ] = item
         ##
-        self.dict [ key.encode ( self.keyencoding ) ] = self.compress_item ( item )
+        if self.compress_bytes is None :
+            ## no bytes-level compression is defined: no out-of-band buffers 
+            self.dict [ key.encode ( self.keyencoding ) ] = self.compress_item ( item )
+        else :
+            self.dict [ key.encode ( self.keyencoding ) ] = self.compress_oob ( *self.pickle_oob ( item ) )
+
+    # =========================================================================
+    ## Bulk update of the database
+    #  - pickling is performed in the calling thread
+    #  - compression is performed in the thread pool 
+    #    (zlib/bz2/lzma/zstd release GIL)
+    #  - the compressed items are written to the backend in a single go 
+    #  @code
+    #  db = ...
+    #  db.update_many ( { 'h1' : h1 , 'h2' : h2 } )
+    #  db.update_many ( [ ( 'h1' , h1 ) , ( 'h2' , h2 ) ] , nthreads = 4 )
+    #  @endcode
+    #  @param items    dictionary or sequence of ( key , value ) pairs
+    #  @param nthreads number of threads (non-positive: number of cores) 
+    def update_many ( self , items = () , nthreads = -1 , **kwargs ) :
+        """ Bulk update of the database
+        - pickling is performed in the calling thread
+        - compression is performed in the thread pool (zlib/bz2/lzma/zstd release GIL)
+        - the compressed items are written to the backend in a single go 
+        >>> db = ...
+        >>> db.update_many ( { 'h1' : h1 , 'h2' : h2 } )
+        >>> db.update_many ( [ ( 'h1' , h1 ) , ( 'h2' , h2 ) ] , nthreads = 4 )
+        """
+        if   hasattr ( items , 'items' ) : items = items.items () 
+        items = [ item for item in items ]
+        if kwargs : items += [ item for item in kwargs.items () ]
+        if not items : return
+        
+        now    = time.time () 
+        keys   = [ k                 for k , v in items ]
+        values = [ Item ( now , v )  for k , v in items ]
+
+        if self.writeback :
+            for k , v in zip ( keys , values ) : self.cache [ k ] = v
+            
+        ## (1) pickle: the calling thread
+        if self.compress_bytes is None :
+            ## no bytes-level compression is defined: sequential processing  
+            compressed = [ self.compress_item ( v ) for v in values ] 
+        else : 
+            data       = [ self.pickle_oob ( v ) for v in values ]
+            ## (2) compress: the thread pool  
+            compressed = thread_map ( lambda d : self.compress_oob ( *d ) , data , nthreads )
+            
+        ## (3) write into the backend in a single go 
+        encoded = [ ( k.encode ( self.keyencoding ) , c ) for k , c in zip ( keys , compressed ) ]
+        update  = getattr ( self.dict , 'update' , None )
+        if update : update ( encoded )
+        else      :
+            for k , c in encoded : self.dict [ k ] = c 
+
+    # =========================================================================
+    ## Bulk read from the database
+    #  - raw compressed items are read from the backend in the calling thread
+    #  - decompression is performed in the thread pool
+    #    (zlib/bz2/lzma/zstd release GIL)
+    #  - unpickling is performed in the calling thread 
+    #  @code
+    #  db = ...
+    #  result = db.get_many ( [ 'h1' , 'h2' ] )
+    #  h1 = result [ 'h1' ] 
+    #  @endcode
+    #  @param keys     the keys to read
+    #  @param default  the value for missing keys 
+    #  @param nthreads number of threads (non-positive: number of cores) 
+    #  @return dictionary { key : value }
+    def get_many ( self , keys , default = None , nthreads = -1 ) :
+        """ Bulk read from the database
+        - raw compressed items are read from the backend in the calling thread
+        - decompression is performed in the thread pool (zlib/bz2/lzma/zstd release GIL)
+        - unpickling is performed in the calling thread 
+        >>> db = ...
+        >>> result = db.get_many ( [ 'h1' , 'h2' ] )
+        >>> h1 = result [ 'h1' ] 
+        - returns dictionary `{ key : value }`
+        """
+        result  = ordered_dict ()
+        toread  = [] 
+        raw     = [] 
+        for key in keys :
+            try : 
+                result [ key ] = self.cache [ key ]
+                continue 
+            except KeyError :
+                pass
+            try : 
+                raw.append ( self.__get_raw_value__ ( key ) )
+                toread.append ( key )
+                result [ key ] = None 
+            except KeyError :
+                result [ key ] = default
+
+        ## decompress: the thread pool 
+        data = thread_map ( self.uncompress_oob , raw , nthreads )
+
+        ## unpickle: the calling thread 
+        for key , ( d , b ) in zip ( toread , data ) :
+            value = self.unpickle ( d , b )
+            if self.writeback : self.cache [ key ] = value
+            result [ key ] = value
+            
+        for key , value in result.items () :
+            if isinstance ( value , Item ) : result [ key ] = value.payload
+            
+        return result 
 
     # =========================================================================
     ##  get the disk size of the db
@@ -774,10 +972,63 @@ def pickle ( self , value ) :
     
     # =========================================================================
     ## Unpickle/deserialize the uncompressed data
-    def unpickle ( self , value ) :
-        """ Unpickle/deserialize uncompressed data"""
+    #  @param value   the pickled data
+    #  @param buffers out-of-band buffers (protocol 5)
+    def unpickle ( self , value , buffers = None ) :
+        """ Unpickle/deserialize uncompressed data
+        - buffers : out-of-band buffers (protocol 5)
+        """
         f = BytesIO ( value )
-        return Unpickler ( f ) . load ( )
+        return Unpickler ( f , buffers = buffers ) . load ( )
+
+    # =========================================================================
+    ## Pickle/serialize the value, large contiguous buffers (e.g. numpy arrays)
+    #  are kept out-of-band (protocol 5) without copy
+    #  @return pickled data and the list of out-of-band buffers 
+    def pickle_oob ( self , value ) :
+        """ Pickle/serialize the value, large contiguous buffers (e.g. numpy arrays)
+        are kept out-of-band (protocol 5) without copy
+        - return pickled data and the list of out-of-band buffers 
+        """
+        return oob_dumps ( value , self.protocol , self.oob_threshold )
+    
+    # =========================================================================
+    ## Compress the pickled data and pack it together with out-of-band buffers
+    #  into the single record
+    #  - without out-of-band buffers the record is the same as from `compress_item` 
+    #  - the buffers are compressed only for `oob_compress=True`
+    def compress_oob ( self , data , buffers ) :
+        """ Compress the pickled data and pack it together with out-of-band buffers
+        into the single record
+        - without out-of-band buffers the record is the same as from `compress_item` 
+        - the buffers are compressed only for `oob_compress=True`
+        """
+        if not buffers : return self.compress_bytes ( data )
+        if self.oob_compress : buffers = [ ( self.compress_bytes ( b ) , True  ) for b in buffers ]
+        else                 : buffers = [ ( b                         , False ) for b in buffers ]
+        return oob_frame ( self.compress_bytes ( data ) , buffers ) 
+        
+    # =========================================================================
+    ## Unpack & uncompress the record into pickled data and out-of-band buffers
+    #  - uncompressed buffers are not copied 
+    #  @return pickled data and the list of out-of-band buffers (or None)
+    def uncompress_oob ( self , value ) :
+        """ Unpack & uncompress the record into pickled data and out-of-band buffers
+        - uncompressed buffers are not copied 
+        - return pickled data and the list of out-of-band buffers (or None)
+        """
+        if not is_oob_frame ( value ) : return self.uncompress_item ( value ) , None
+        data , buffers = oob_unframe ( value )
+        buffers = [ self.uncompress_item ( b ) if c else b for b , c in buffers ] 
+        return self.uncompress_item ( data ) , buffers 
+    
+    # =========================================================================
+    ## Compress the (pickled) bytes: method <code>compress_bytes ( self , data )</code>
+    #  to be defined in subclasses (<code>None</code>: bytes-level compression is not defined,
+    #  no out-of-band buffers and no parallel compression are used)
+    #  It must be thread-safe: it is used for parallel compression 
+    #  @see CompressShelf.update_many
+    compress_bytes = None 
     
     # =========================================================================
     @abc.abstractmethod
@@ -836,6 +1087,18 @@ def compress_files  ( self , files  , output  ) :
             
         return None  
         
+    # =========================================================================
+    ## Write the content of DB into zip/tar-archive with `items`-layout:
+    #  one archive member per key with raw (compressed) item 
+    def compress_items ( self , output ) :
+        """ Write the content of DB into zip/tar-archive with `items`-layout:
+        one archive member per key with raw (compressed) item 
+        """
+        if not self.silent : logger.info ( 'Compress items into %s' % output )
+        items = ( ( key , self.dict [ key ] ) for key in self.dict.keys () ) 
+        write_items_archive ( output , items , tar = self.tar )
+        return output 
+        
     # =========================================================================
     ## Uncompress the file into specified location, keep original
     def uncompress_file ( self , filein , where ) :
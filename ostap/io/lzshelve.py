@@ -183,13 +183,20 @@ def __init__( self                              ,
 
         self.taropts = 'x:xz'
             
+    # ==========================================================================
+    ## compress the (pickled) bytes using <code>lzma.compress</code>
+    def compress_bytes ( self , data ) :
+        """ Compress the (pickled) bytes using `lzma.compress`
+        """
+        return lzma.compress ( data , preset = self.compresslevel )
+        
     # ==========================================================================
     ## compress (LZMA)  the item  using <code>lzma.compress</code>
     def compress_item ( self , value ) :
         """ Compress (LZMA) the item using ``bz2.compress''
         - see lzma.compress
         """
-        return lzma.compress ( self.pickle ( value ) , preset = self.compresslevel )
+        return self.compress_bytes ( self.pickle ( value ) )
     
     # =========================================================================
     ## uncompres (LZMA) the item using <code>lzma.decompress</code>
@@ -24,13 +24,19 @@
     'loads'               ,
     ## 
     'pickle_dependencies' , ## inspect pickeld stream 
+    ##
+    'OOB_THRESHOLD'       , ## minimal size of out-of-band buffers 
+    'oob_dumps'           , ## pickle with out-of-band buffers 
+    'oob_frame'           , ## pack pickled data and out-of-band buffers into single record
+    'oob_unframe'         , ## unpack the record into pickled data and out-of-band buffers
+    'is_oob_frame'        , ## is it a record with out-of-band buffers?
 )
 # =============================================================================
 import pickle 
 from   io                import BytesIO 
 import ostap.core.config as     config
 from   ostap.core.reduce import cpptype_reduce, CPP_META 
-import sys, array, pickletools, re, cppyy 
+import sys, array, pickletools, re, struct, cppyy 
 # =============================================================================
 from ostap.logger.logger import getLogger
 if '__main__' == __name__ : logger = getLogger ( 'ostap.io.pickling' )
@@ -190,6 +196,135 @@ def _xv_loads ( bytes_object , * ,
 load      = _xv_load
 loads     = _xv_loads
 
+# =============================================================================
+## Out-of-band buffers (pickle protocol 5)
+# =============================================================================
+## minimal size of the contiguous buffer (e.g. numpy array) to be stored out-of-band
+OOB_THRESHOLD = 2**20
+## the signature of the record with out-of-band buffers
+#  (the leading zero byte never starts zlib/bz2/lzma/zstd streams)
+_OOB_MAGIC    = b'\x00OSTAP5\x00'
+## the fixed header: number of buffers and the length of pickled data
+_OOB_HEADER   = struct.Struct ( '<IQ' )
+## per-buffer header: the length and the compression flag
+_OOB_BUFFER   = struct.Struct ( '<QB' )
+## the alignment of buffers within the record 
+_OOB_ALIGN    = 64
+# =============================================================================
+## Pickle the object, keeping large contiguous buffers (e.g. numpy arrays) out-of-band
+#  - buffers are not copied: the memoryviews to the original data are returned
+#  - for protocol < 5 all data are pickled in-band 
+#  @code
+#  data , buffers = oob_dumps ( obj , protocol = 5 )
+#  obj  = loads ( data , buffers = buffers ) 
+#  @endcode
+#  @param obj       the object to pickle
+#  @param protocol  pickle protocol
+#  @param threshold minimal size of the buffer to be kept out-of-band
+#  @return pickled data and the list of out-of-band buffers
+def oob_dumps ( obj , protocol = HIGHEST_PROTOCOL , threshold = OOB_THRESHOLD ) :
+    """ Pickle the object, keeping large contiguous buffers (e.g. numpy arrays) out-of-band
+    - buffers are not copied: the memoryviews to the original data are returned
+    - for protocol < 5 all data are pickled in-band 
+    >>> data , buffers = oob_dumps ( obj , protocol = 5 )
+    >>> obj  = loads ( data , buffers = buffers ) 
+    - return pickled data and the list of out-of-band buffers
+    """
+    f = BytesIO ()
+    if protocol < 5 or not threshold or threshold < 0 : 
+        Pickler ( f , protocol ).dump ( obj )
+        return f.getvalue () , []
+    
+    buffers = []
+    def _callback_ ( pb ) :
+        try : # ===============================================================
+            # =================================================================
+            view = pb.raw ()
+            # =================================================================
+        except BufferError : # ================================================
+            # =================================================================
+            return True                             ## non-contiguous: in-band 
+        if view.nbytes < threshold : return True    ## small: in-band
+        buffers.append ( view )
+        return False                                ## out-of-band 
+    
+    Pickler ( f , protocol , buffer_callback = _callback_ ).dump ( obj )
+    return f.getvalue () , buffers 
+
+# =============================================================================
+## Pack the pickled data and out-of-band buffers into the single record
+#  - buffers are aligned within the record
+#  - the only copy of buffers is done here 
+#  @code
+#  data , buffers = oob_dumps ( obj , protocol = 5 )
+#  record = oob_frame ( data , [ ( b , False ) for b in buffers ] ) 
+#  @endcode
+#  @param data    the (compressed) pickled data
+#  @param buffers the list of ( buffer , compressed-flag ) pairs
+#  @return the record 
+def oob_frame ( data , buffers ) :
+    """ Pack the pickled data and out-of-band buffers into the single record
+    - buffers are aligned within the record
+    - the only copy of buffers is done here 
+    >>> data , buffers = oob_dumps ( obj , protocol = 5 )
+    >>> record = oob_frame ( data , [ ( b , False ) for b in buffers ] ) 
+    """
+    header = [ _OOB_MAGIC , _OOB_HEADER.pack ( len ( buffers ) , len ( data ) ) ]
+    for b , c in buffers : header.append ( _OOB_BUFFER.pack ( memoryview ( b ).nbytes , 1 if c else 0 ) )
+    parts  = header + [ data ]
+    pos    = sum ( len ( h ) for h in header ) + len ( data )
+    for b , c in buffers :
+        pad = -pos % _OOB_ALIGN
+        if pad : parts.append ( bytes ( pad ) )
+        parts.append ( b )
+        pos += pad + memoryview ( b ).nbytes 
+    return b''.join ( parts ) 
+
+# =============================================================================
+## Is it a record with out-of-band buffers?
+#  @see oob_frame 
+def is_oob_frame ( record ) :
+    """ Is it a record with out-of-band buffers?
+    - see `oob_frame`
+    """
+    return bytes ( record [ : len ( _OOB_MAGIC ) ] ) == _OOB_MAGIC 
+
+# =============================================================================
+## Unpack the record into the pickled data and out-of-band buffers
+#  - no data is copied: the memoryviews into the record are returned,
+#    e.g. numpy arrays are unpickled as read-only views into the record 
+#  @code
+#  data , buffers = oob_unframe ( record )
+#  @endcode
+#  @param record the record
+#  @return pickled data and the list of ( buffer , compressed-flag ) pairs
+#  @see oob_frame 
+def oob_unframe ( record ) :
+    """ Unpack the record into the pickled data and out-of-band buffers
+    - no data is copied: the memoryviews into the record are returned,
+      e.g. numpy arrays are unpickled as read-only views into the record 
+    >>> data , buffers = oob_unframe ( record )
+    - return pickled data and the list of ( buffer , compressed-flag ) pairs
+    - see `oob_frame`
+    """
+    assert is_oob_frame ( record ) , 'oob_unframe: invalid record!'
+    view   = memoryview ( record ).cast ( 'B' )
+    pos    = len ( _OOB_MAGIC )
+    nbuffers , ndata = _OOB_HEADER.unpack_from ( view , pos )
+    pos   += _OOB_HEADER.size
+    sizes  = []
+    for i in range ( nbuffers ) :
+        sizes.append ( _OOB_BUFFER.unpack_from ( view , pos ) )
+        pos += _OOB_BUFFER.size
+    data   = view [ pos : pos + ndata ]
+    pos   += ndata 
+    buffers = []
+    for size , c in sizes :
+        pos += -pos % _OOB_ALIGN
+        buffers.append ( ( view [ pos : pos + size ] , True if c else False ) ) 
+        pos += size 
+    return data , buffers 
+
 # =============================================================================
 ## py-moduel patters for pickeltools 
 _PY_MODULE_PATTERN        = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)+$')
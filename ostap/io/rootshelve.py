@@ -118,7 +118,9 @@
 from   ostap.io.dbase          import TmpDB 
 from   ostap.io.pickling       import ( Pickler, Unpickler, BytesIO, 
                                         PROTOCOL,
-                                        HIGHEST_PROTOCOL, DEFAULT_PROTOCOL )
+                                        HIGHEST_PROTOCOL, DEFAULT_PROTOCOL,
+                                        OOB_THRESHOLD, oob_dumps, oob_frame,
+                                        oob_unframe, is_oob_frame )
 from   ostap.core.core         import Ostap 
 import ROOT, shelve, zlib, os, ctypes, cppyy, cppyy.ll 
 # =============================================================================
@@ -166,6 +168,27 @@ def as_buffer ( blob ) : return blob
     def as_buffer ( blob ) : return bytes ( blob.__buffer__ () )
     # ========================================================================
 
+# =============================================================================
+## Compress the pickled data and pack it together with out-of-band buffers
+#  (protocol 5) into the content of the blob 
+def _pack_blob_ ( data , buffers , level ) :
+    """ Compress the pickled data and pack it together with out-of-band buffers
+    (protocol 5) into the content of the blob 
+    """
+    z = zlib.compress ( data , level )
+    return oob_frame ( z , [ ( b , False ) for b in buffers ] ) if buffers else z
+
+# =============================================================================
+## Unpack & uncompress the content of the blob into the pickled data
+#  and out-of-band buffers (or None) 
+def _unpack_blob_ ( z ) :
+    """ Unpack & uncompress the content of the blob into the pickled data
+    and out-of-band buffers (or None) 
+    """
+    if not is_oob_frame ( z ) : return zlib.decompress ( z ) , None 
+    data , buffers = oob_unframe ( z )
+    return zlib.decompress ( data ) , [ b for b , c in buffers ]
+
 # =============================================================================
 ## @class RootOnlyShelf
 #  Plain vanilla DBASE for ROOT-object (only)
@@ -325,6 +348,36 @@ def __setitem__ ( self , key , value ) :
         if self.writeback : self.cache [ key ] = value
         self.dict [ key ] = value 
 
+    # =========================================================================
+    ## Bulk update of the database
+    #  @code
+    #  db.update_many ( { 'h1' : h1 , 'h2' : h2 } ) 
+    #  @endcode 
+    #  @attention ROOT I/O is not thread-safe: items are written sequentially
+    def update_many ( self , items = () , nthreads = -1 , **kwargs ) :
+        """ Bulk update of the database
+        >>> db.update_many ( { 'h1' : h1 , 'h2' : h2 } ) 
+        - attention: ROOT I/O is not thread-safe: items are written sequentially
+        """
+        if hasattr ( items , 'items' ) : items = items.items () 
+        for key , value in items            : self [ key ] = value
+        for key , value in kwargs.items ()  : self [ key ] = value
+
+    # =========================================================================
+    ## Bulk read from the database
+    #  @code
+    #  result = db.get_many ( [ 'h1' , 'h2' ] ) 
+    #  @endcode 
+    #  @attention ROOT I/O is not thread-safe: items are read sequentially
+    def get_many ( self , keys , default = None , nthreads = -1 ) :
+        """ Bulk read from the database
+        >>> result = db.get_many ( [ 'h1' , 'h2' ] ) 
+        - attention: ROOT I/O is not thread-safe: items are read sequentially
+        """
+        result = {}
+        for key in keys : result [ key ] = self [ key ] if key in self else default 
+        return result 
+    
     # =========================================================================
     ## close the database 
     def close ( self ) :
@@ -423,7 +476,8 @@ def __init__( self                                ,
                   writeback = False                   ,
                   protocol  = PROTOCOL                , ## pickling protocol
                   compress  = zlib.Z_BEST_COMPRESSION , ## compression level 
-                  args      = ()       ):
+                  args      = ()                      ,
+                  oob_threshold = OOB_THRESHOLD       ) : ## minimal size of out-of-band buffers 
 
         if not 0 <= protocol <= HIGHEST_PROTOCOL :
             logger.warning ("Invalid protocol:%s" % protocol )
@@ -432,6 +486,7 @@ def __init__( self                                ,
         RootOnlyShelf.__init__ ( self , filename , mode , writeback , args = args )
         self.__protocol      = protocol
         self.__compresslevel = compress
+        self.__oob_threshold = oob_threshold
         self.__sizes         = {}
         
     # =========================================================================
@@ -445,10 +500,11 @@ def clone ( self , new_name , keys = () ) :
         >>> old_db = ...
         >>> new_db = new_db.clone ( 'new_file.db' )
         """
-        new_db = RootShelf ( new_name                         ,
-                             mode        =  'c'               ,
-                             protocol    = self.protocol      ,
-                             compress    = self.compresslevel )
+        new_db = RootShelf ( new_name                           ,
+                             mode          =  'c'               ,
+                             protocol      = self.protocol      ,
+                             compress      = self.compresslevel ,
+                             oob_threshold = self.oob_threshold )
         
         ## copy the content
         if keys :
@@ -465,6 +521,10 @@ def protocol ( self ) :
         """`protocol' : pickle protocol"""
         return self.__protocol
     @property
+    def oob_threshold ( self ) :
+        """`oob_threshold` : minimal size of contiguous buffers (e.g. numpy arrays) to be stored out-of-band (protocol 5)"""
+        return self.__oob_threshold
+    @property
     def compresslevel ( self ) :
         """``compresslevel'' : zlib compression level
         """
@@ -504,13 +564,15 @@ def __getitem__ ( self , key ):
                 
                 ## (1) get access to buffer
                 ## z     = blob ## memoryview ( blob )
-                z     = as_buffer ( blob )
+                z     = memoryview ( as_buffer ( blob ) )
+                ## out-of-band buffers: copy the content, the blob is owned by ROOT 
+                if is_oob_frame ( z ) : z = bytes ( z ) 
                 
                 ## (2) decompress 
-                u     = zlib.decompress ( z )
+                u , b = _unpack_blob_ ( z )
                 ## (3) unpickle it! 
                 f     = BytesIO ( u )
-                value = Unpickler(f).load()
+                value = Unpickler ( f , buffers = b ).load()
                 
                 ## del z , u , f
                 
@@ -534,24 +596,109 @@ def __setitem__ ( self , key , value ) :
         blob = None 
         ## not TObject? pickle it and convert to Ostap.BLOB
         if not isinstance  ( value , ROOT.TObject ) :
-            ## (1) pickle it 
-            f = BytesIO    ( )
-            p = Pickler    ( f , self.protocol )
-            p.dump ( value )
+            ## (1) pickle it, large buffers are kept out-of-band 
+            d , b  = oob_dumps ( value , self.protocol , self.oob_threshold )
             ## (2) zip it
-            z      = zlib.compress ( f.getvalue() , self.compresslevel )
+            z      = _pack_blob_ ( d , b , self.compresslevel )
             self.__sizes [ key ] = len ( z ) 
             ## (3) put it into  BLOB 
             from  ostap.core.core import  Ostap
             blob   = Ostap.BLOB            ( key      ) 
             status = Ostap.blob_from_bytes ( blob , z )
             value  = blob
-            del z , f , p 
+            del z , d , b 
         
         ## finally use ROOT 
         self.dict [ key ] = value
         if blob : del blob 
 
+    # =========================================================================
+    ## Bulk update of the database
+    #  - non-ROOT objects are pickled in the calling thread,
+    #    compressed in the thread pool and written sequentially
+    #  @code
+    #  db.update_many ( { 'h1' : h1 , 'h2' : h2 } ) 
+    #  @endcode 
+    def update_many ( self , items = () , nthreads = -1 , **kwargs ) :
+        """ Bulk update of the database
+        - non-ROOT objects are pickled in the calling thread,
+          compressed in the thread pool and written sequentially
+        >>> db.update_many ( { 'h1' : h1 , 'h2' : h2 } ) 
+        """
+        if hasattr ( items , 'items' ) : items = items.items () 
+        items = [ item for item in items ]
+        if kwargs : items += [ item for item in kwargs.items () ]
+        
+        objects = [ ( k , v ) for k , v in items if     isinstance ( v , ROOT.TObject ) ]
+        others  = [ ( k , v ) for k , v in items if not isinstance ( v , ROOT.TObject ) ]
+
+        ## (1) ROOT objects: directly 
+        for key , value in objects : self [ key ] = value
+        
+        if not others : return
+        
+        ## (2) pickle
+        data = []
+        for key , value in others :
+            if self.writeback : self.cache [ key ] = value 
+            data.append ( oob_dumps ( value , self.protocol , self.oob_threshold ) ) 
+
+        ## (3) compress in the thread pool
+        from ostap.io.utils import thread_map 
+        level  = self.compresslevel 
+        zipped = thread_map ( lambda d : _pack_blob_ ( d [ 0 ] , d [ 1 ] , level ) , data , nthreads )
+        
+        ## (4) write sequentially 
+        for ( key , _ ) , z in zip ( others , zipped ) :
+            self.__sizes [ key ] = len ( z ) 
+            blob   = Ostap.BLOB            ( key      ) 
+            status = Ostap.blob_from_bytes ( blob , z )
+            self.dict [ key ] = blob
+            del blob 
+            
+    # =========================================================================
+    ## Bulk read from the database
+    #  - objects are read sequentially,
+    #    pickled objects are decompressed in the thread pool 
+    #  @code
+    #  result = db.get_many ( [ 'h1' , 'h2' ] ) 
+    #  @endcode 
+    def get_many ( self , keys , default = None , nthreads = -1 ) :
+        """ Bulk read from the database
+        - objects are read sequentially,
+          pickled objects are decompressed in the thread pool 
+        >>> result = db.get_many ( [ 'h1' , 'h2' ] ) 
+        """
+        result = {}
+        blobs  = [] 
+        for key in keys :
+            if key in self.cache :
+                result [ key ] = self.cache [ key ]
+                continue
+            if not key in self :
+                result [ key ] = default
+                continue 
+            tkey , value = self.dict.get_key_object ( key )
+            self.__sizes [ key ] = tkey.GetNbytes()
+            if isinstance ( value , Ostap.BLOB ) :
+                blobs.append ( ( key , bytes ( as_buffer ( value ) ) ) )
+                result [ key ] = None 
+            else :
+                if self.writeback : self.cache [ key ] = value 
+                result [ key ] = value
+                
+        ## decompress in the thread pool 
+        from ostap.io.utils import thread_map 
+        data = thread_map ( _unpack_blob_ , [ z for k , z in blobs ] , nthreads )
+        
+        ## unpickle 
+        for ( key , _ ) , ( u , b ) in zip ( blobs , data ) :
+            value = Unpickler ( BytesIO ( u ) , buffers = b ).load ()
+            if self.writeback : self.cache [ key ] = value 
+            result [ key ] = value
+            
+        return result 
+        
     # =========================================================================
     ## list the available keys 
     def ls    ( self , pattern = '' , load = True ) :
@@ -252,11 +252,181 @@ def test_shelves2 () :
                 db [ 'two' ] = 2                
                 db.ls()
     
+# =============================================================================
+## benchmark for bulk update_many/get_many vs item-by-item access 
+def test_shelves3 () :
+
+    logger = getLogger ('Test shelves: bulk I/O')
+    logger.info ( 'Test bulk update_many/get_many for various shelves' ) 
+
+    shelves = [ zipshelve , bz2shelve , rootshelve ]
+    if lzshelve  : shelves.append ( lzshelve  )
+    if zstshelve : shelves.append ( zstshelve )
+
+    items = data [ 'histos' ] 
+    keys  = list ( items.keys () ) 
+    
+    rows = [  ( 'DBASE' , 'write [ms]' , 'update_many [ms]' , 'read [ms]' , 'get_many [ms]' ) ] 
+    for sh in shelves :
+        
+        with sh.tmpdb () as db :
+            with timing ( 'Write %s' % sh.__name__ , logger = logger ) as tw :
+                for key in keys : db [ key ] = items [ key ]
+            with timing ( 'Read  %s' % sh.__name__ , logger = logger ) as tr :
+                r1 = [ db [ key ] for key in keys ]
+                
+        with sh.tmpdb () as db :
+            with timing ( 'Update_many %s' % sh.__name__ , logger = logger ) as tu :
+                db.update_many ( items )
+            with timing ( 'Get_many    %s' % sh.__name__ , logger = logger ) as tg :
+                r2 = db.get_many ( keys )
+            missing = db.get_many ( [ 'no-such-key' ] , default = 'default' )
+            
+        assert len ( r2 ) == len ( keys ) , 'Invalid number of items from get_many!'
+        assert all ( r2 [ k ].GetEntries () == items [ k ].GetEntries () for k in keys ) , 'Mismatch in content!'
+        assert 'default' == missing [ 'no-such-key' ] , 'Invalid default value!'
+        
+        row = sh.__name__ , \
+              '%.1f' % ( tw.delta * 1000 ) , '%.1f' % ( tu.delta * 1000 ) , \
+              '%.1f' % ( tr.delta * 1000 ) , '%.1f' % ( tg.delta * 1000 )
+        rows.append ( row ) 
+
+    title = 'Bulk I/O'
+    table = T.table ( rows , title = title , prefix = '# ' , alignment = 'lrrrr' )
+    logger.info ( '%s:\n%s' % ( title , table ) ) 
+    
+# =============================================================================
+## benchmark for trained-dictionary mode of zstshelve: many small records  
+def test_shelves4 () :
+
+    logger = getLogger ('Test shelves: zstd dictionary')
+    if not zstshelve :
+        logger.warning ( 'zstshelve is not available, skip the test' )
+        return
+    
+    logger.info ( 'Test trained-dictionary mode for zstshelve' ) 
+
+    items = {}
+    for i in range ( 10000 ) :
+        items [ 'item%d' % i ] = ( VE ( random.gauss ( 0 , 1 ) , random.uniform ( 0.1 , 1 ) ) , 'status' , i , { 'ok' : True } ) 
+    keys  = list ( items.keys () ) 
+        
+    rows = [  ( 'Mode' , 'size [kB]' , 'write [ms]' , 'read [ms]' ) ]
+    sizes = {} 
+    for mode , conf in ( ( 'plain'      , {} ) ,
+                         ( 'dictionary' , { 'dictionary' : True } ) ) :
+        name = CU.CleanUp.tempfile ( suffix = '.zstsh' )
+        with timing ( 'Write %s' % mode , logger = logger ) as tw :
+            with zstshelve.open ( name , 'c' , **conf ) as db :
+                for key in keys : db [ key ] = items [ key ]
+                if conf : assert db.active_dict , 'No trained dictionary!' 
+        with timing ( 'Read  %s' % mode , logger = logger ) as tr :
+            with zstshelve.open ( name , 'r' ) as db :
+                for key in keys : assert db [ key ] [ 2 ] == items [ key ] [ 2 ] , 'Mismatch in content!'
+        with zstshelve.open ( name , 'r' ) as db : size = db.disk_size () 
+        ## reopen for update: the stored dictionaries must be used 
+        with zstshelve.open ( name , 'c' , silent = False ) as db :
+            db [ 'new' ] = items [ keys [ 0 ] ] 
+            assert db [ keys [ -1 ] ] [ 2 ] == items [ keys [ -1 ] ] [ 2 ] , 'Mismatch in content!'
+            if conf : assert db.active_dict , 'No trained dictionary after reopen!'
+        with zstshelve.open ( name , 'r' ) as db :
+            assert db [ 'new' ] [ 2 ] == items [ keys [ 0 ] ] [ 2 ] , 'Mismatch in content!'
+        sizes [ mode ] = size 
+        rows.append ( ( mode , '%.1f' % ( size / 1024.0 ) , '%.1f' % ( tw.delta * 1000 ) , '%.1f' % ( tr.delta * 1000 ) ) )
+
+    title = 'zstd: plain vs dictionary, gain %.2f' % ( float ( sizes [ 'plain' ] ) / sizes [ 'dictionary' ] ) 
+    table = T.table ( rows , title = title , prefix = '# ' , alignment = 'lrrr' )
+    logger.info ( '%s:\n%s' % ( title , table ) ) 
+    
+# =============================================================================
+## random-access read of archived databases: `files` vs `items` layout 
+def test_shelves5 () :
+
+    logger = getLogger ('Test shelves: archived DBs')
+    logger.info ( 'Test `files` and `items` layouts for archived databases' ) 
+
+    items = data [ 'histos' ] 
+    keys  = list ( items.keys () ) 
+    
+    rows = [ ( 'Archive' , 'layout' , 'open [ms]' , 'read 10 keys [ms]' ) ]
+    for suffix in ( '.zip' , '.tar' ) :
+        for layout in ( 'files' , 'items' ) :
+            name = CU.CleanUp.tempfile ( suffix = suffix )
+            with zipshelve.open ( name , 'c' , layout = layout ) as db :
+                db.update_many ( items )
+            with timing ( 'Open %s/%s' % ( suffix , layout ) , logger = logger ) as to :
+                db = zipshelve.open ( name , 'r' )
+            with timing ( 'Read %s/%s' % ( suffix , layout ) , logger = logger ) as tr :
+                for key in keys [ :10 ] :
+                    assert db [ key ].GetEntries () == items [ key ].GetEntries () , 'Mismatch in content!'
+            assert layout == db.layout , 'Invalid layout!'
+            assert len ( keys ) + 1 == len ( db ) , 'Invalid number of keys!'
+            db.close ()
+            rows.append ( ( suffix , layout , '%.1f' % ( to.delta * 1000 ) , '%.1f' % ( tr.delta * 1000 ) ) )
+
+        ## update the archive with `items`-layout 
+        with zipshelve.open ( name , 'a' ) as db :
+            db [ 'one' ] = 1
+        with zipshelve.open ( name , 'r' ) as db :
+            assert 1 == db [ 'one' ] , 'Mismatch in content!'
+            assert len ( keys ) + 2 == len ( db ) , 'Invalid number of keys!'
+
+    title = 'Archived DBs'
+    table = T.table ( rows , title = title , prefix = '# ' , alignment = 'llrr' )
+    logger.info ( '%s:\n%s' % ( title , table ) ) 
+    
+# =============================================================================
+## large numpy arrays: out-of-band buffers (pickle protocol 5) vs in-band pickling
+def test_shelves6 () :
+
+    logger = getLogger ('Test shelves: out-of-band buffers')
+    try :
+        import numpy as np
+    except ImportError :
+        logger.warning ( 'numpy is not available, skip the test' )
+        return
+    
+    import tracemalloc
+    
+    array = np.random.normal ( size = 2**22 ) ## 32MB 
+    size  = array.nbytes / 1024.0**2
+
+    rows = [ ( 'Archive' , 'out-of-band' , 'write peak' , 'read peak' , 'read-only' ) ]
+    for suffix in ( '.db' , '.zip' ) :
+        for threshold in ( 0 , 2**20 ) :
+            name = CU.CleanUp.tempfile ( suffix = suffix )
+            with zipshelve.open ( name , 'c' , protocol = 5 , oob_threshold = threshold , layout = 'items' if '.zip' == suffix else 'files' ) as db :
+                tracemalloc.start () 
+                db [ 'array' ] = array
+                _ , wpeak = tracemalloc.get_traced_memory ()
+                tracemalloc.stop  ()
+            with zipshelve.open ( name , 'r' ) as db :
+                tracemalloc.start () 
+                value = db [ 'array' ]
+                _ , rpeak = tracemalloc.get_traced_memory ()
+                tracemalloc.stop  ()
+                assert np.array_equal ( value , array ) , 'Mismatch in content!'
+                readonly = not value.flags.writeable
+                if threshold : assert readonly , 'Out-of-band array must be read-only!'
+                del value 
+            rows.append ( ( suffix , 'yes' if threshold else 'no' ,
+                            '%.1f' % ( wpeak / 1024.0**2 / size ) ,
+                            '%.1f' % ( rpeak / 1024.0**2 / size ) , 
+                            'yes' if readonly else 'no' ) )
+
+    title = 'Peak memory for %.0fMB array (in units of array size)' % size 
+    table = T.table ( rows , title = title , prefix = '# ' , alignment = 'llrrl' )
+    logger.info ( '%s:\n%s' % ( title , table ) ) 
+    
 # =============================================================================
 if '__main__' == __name__ :
     
     test_shelves1 ()
     test_shelves2 ()
+    test_shelves3 ()
+    test_shelves4 ()
+    test_shelves5 ()
+    test_shelves6 ()
 
 # =============================================================================
 ##                                                                      The END
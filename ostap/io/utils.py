@@ -24,6 +24,7 @@
     'get_open_fds' , ## get all open file descriptors
     'num_fds'      , ## get number of opened file descriptors
     'get_file_names_from_file_number' , ## get the actual file name from the file descriptors 
+    'thread_map'   , ## apply the function to all data items using thread pool
 )
 # =============================================================================
 import os, datetime  
@@ -310,6 +311,31 @@ def get_file_names_from_file_number ( *fds ) :
     """
     return tuple ( os.readlink ( '/proc/self/fd/%d' % fd ) for fd in fds ) 
     
+# =============================================================================
+## Apply the function to all data items using thread pool
+#  Useful for (de)compression: zlib/bz2/lzma/zstd release GIL
+#  @code
+#  compressed = thread_map ( zlib.compress , data , nthreads = 4 )
+#  @endcode
+#  @param func     the function
+#  @param data     the data items
+#  @param nthreads number of threads (non-positive: number of cores) 
+#  @return list of results
+def thread_map ( func , data , nthreads = -1 ) :
+    """ Apply the function to all data items using thread pool
+    - Useful for (de)compression: zlib/bz2/lzma/zstd release GIL
+    >>> compressed = thread_map ( zlib.compress , data , nthreads = 4 )
+    """
+    data = data if isinstance ( data , ( list , tuple ) ) else list ( data ) 
+    if not nthreads or nthreads < 1 :
+        from ostap.utils.basic import numcpu 
+        nthreads = numcpu () 
+    nthreads = min ( nthreads , len ( data ) )
+    if nthreads <= 1 : return [ func ( d ) for d in data ]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor ( max_workers = nthreads ) as pool :
+        return list ( pool.map ( func , data ) )
+    
 # =============================================================================
 if __name__ == '__main__' :
 
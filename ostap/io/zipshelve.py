@@ -178,13 +178,20 @@ def __init__(
                                  compress     = compress ,
                                  compresstype = 'zip'    , **kwargs ) 
         
+    # ==========================================================================
+    ## compress the (pickled) bytes using <code>zlib.compress</code>
+    def compress_bytes ( self , data ) :
+        """ Compress the (pickled) bytes using `zlib.compress`
+        """
+        return zlib.compress ( data , self.compresslevel )
+        
     # ==========================================================================
     ## Serialize & compress (zip)  the item  using <code>zlib.compress</code>
     def compress_item ( self , value ) :
         """ Serialze & Compress (zip) the item using ``zlib.compress''
         - see zlib.compress
         """
-        return zlib.compress ( self.pickle ( value ) , self.compresslevel )
+        return self.compress_bytes ( self.pickle ( value ) )
         
     # =========================================================================
     ## uncompress (unzip) & deserialize the item using <code>zlib.decompress</code>
@@ -140,8 +140,8 @@
 )
 # =============================================================================
 from   ostap.io.compress_shelve import CompressShelf, HIGHEST_PROTOCOL
-from   ostap.io.dbase           import TmpDB 
-import shelve
+from   ostap.io.dbase           import TmpDB, Item 
+import shelve, threading, time 
 # =============================================================================
 from ostap.logger.logger import getLogger
 if '__main__' == __name__ : logger = getLogger ( 'ostap.io.zstshelve' )
@@ -166,6 +166,20 @@
 #    - 'w' Open existing database for reading and writing
 #    - 'c' Open database for reading and writing, creating if it does not  exist (default)
 #    - 'n' Always create a new, empty database, open for reading and writing
+#
+#  Optionally the trained-dictionary mode can be activated. It is very efficient
+#  for databases with many small records that share their structure 
+#  (e.g. VE-values, small histograms, fit-results summaries) 
+#  - the zstd dictionary is trained from the sample of stored values 
+#  - the dictionary is kept inside the database 
+#  - the dictionary is used for all new items
+#  - the dictionary can be retrained on demand, the items compressed 
+#    with older dictionaries (or without dictionary) are still readable 
+#  @code
+#  db = ZstShelf ( 'a_db' , 'c' , dictionary = True ) ## train after the first 1000 items
+#  ...
+#  db.train_dictionary ()  ## (re)train the dictionary on demand 
+#  @endcode
 #  @author Vanya BELYAEV Ivan.Belyaev@cern.ch
 #  @date   2010-04-30
 class ZstShelf(CompressShelf):
@@ -175,23 +189,53 @@ class ZstShelf(CompressShelf):
     - 'w'  Open existing database for reading and writing
     - 'c'  Open database for reading and writing, creating if it does not exist
     - 'n'  Always create a new, empty database, open for reading and writing
+
+    Optionally the trained-dictionary mode can be activated. It is very efficient
+    for databases with many small records that share their structure 
+    (e.g. VE-values, small histograms, fit-results summaries) 
+    - the zstd dictionary is trained from the sample of stored values 
+    - the dictionary is kept inside the database 
+    - the dictionary is used for all new items
+    - the dictionary can be retrained on demand, the items compressed 
+      with older dictionaries (or without dictionary) are still readable 
+    >>> db = ZstShelf ( 'a_db' , 'c' , dictionary = True ) ## train after the first 1000 items
+    >>> ...
+    >>> db.train_dictionary ()  ## (re)train the dictionary on demand 
     """
+    ## the key to keep the dictionaries in the database 
+    DICTKEY     = '__zstd_dicts__'
+    ## service keys, not shown in the table of content 
+    HIDDEN_KEYS = CompressShelf.HIDDEN_KEYS + ( DICTKEY , ) 
     ## 
     def __init__( self                                   ,
                   dbname                                 ,
                   mode        = 'c'                      ,
                   compress    = 22                       , ## level in Zstandard 
-                  threads     = -1                       , **kwargs ) :
+                  threads     = -1                       ,
+                  dictionary  = False                    , ## use trained dictionary? 
+                  dict_size   = 16384                    , ## the size of trained dictionary 
+                  dict_samples= 1000                     , ## number of samples for training 
+                  **kwargs ) :
         
         assert zst , "`zstandard` module is not available!"
         assert 1 <= compress <= 22 , 'Invalid `compress` for `zstandard`-compression: %s' % compress
+        assert isinstance ( dict_size    , int ) and 256 <= dict_size    , "Invalid `dict_size`: %s"    % dict_size 
+        assert isinstance ( dict_samples , int ) and 10  <= dict_samples , "Invalid `dict_samples`: %s" % dict_samples 
         
         self.__threads      = threads 
-        self.__compressor   = zst.ZstdCompressor   ( level              = compress ,
-                                                     threads            = threads  ,
-                                                     write_checksum     = True     ,
-                                                     write_content_size = True     ) 
-        self.__decompressor = zst.ZstdDecompressor ( )
+        self.__level        = compress 
+        ## compressors/decompressors are not thread-safe: keep them per thread 
+        self.__local        = threading.local () 
+
+        ## trained dictionaries: { id : dictionary }
+        #  (the mode is activated after the base class is initialized:
+        #  no automatic training before the stored dictionaries are loaded)
+        self.__dictionary   = False 
+        self.__dict_size    = dict_size
+        self.__dict_samples = dict_samples 
+        self.__dicts        = {}
+        self.__active       = 0  ## no active dictionary
+        self.__train_failed = False ## automatic training failed? 
         
         ## initialize the base class 
         CompressShelf.__init__ ( self                    ,
@@ -200,35 +244,216 @@ def __init__( self                                   ,
                                  compress     = compress ,
                                  compresstype = 'zstd'   , **kwargs ) 
         
-        conf = { 'threads' : threads } 
+        conf = { 'threads'      : threads      ,
+                 'dictionary'   : dictionary   ,
+                 'dict_size'    : dict_size    ,
+                 'dict_samples' : dict_samples }
         self.kwargs.update ( conf )
+
+        ## load the dictionaries (if not loaded yet) and activate the mode 
+        if not self.__dicts : self.__load_dicts ()
+        if dictionary       : self.__dictionary = True 
     
     @property
     def threads ( self ) :
         """'threads' : now many (C)-thread can be used for compression/decompression?"""
         return self.__threads
     @property
+    def dictionary ( self ) :
+        """'dictionary' : is the trained-dictionary mode activated?"""
+        return self.__dictionary 
+    @property
+    def active_dict ( self ) :
+        """'active_dict' : ID of the active dictionary (0: no dictionary)"""
+        return self.__active 
+    @property
+    def dicts ( self ) :
+        """'dicts' : all known dictionaries { id : dictionary }"""
+        return self.__dicts 
+    @property
     def compressor ( self ) :
-        """'compressor' : get the actual compressor object"""
-        return self.__compressor
+        """'compressor' : get the actual (thread-local) compressor object"""
+        return self.__compressor ( self.__active ) 
     @property
     def decompressor ( self ) :
-        """'decompressor' : get the actual decompressor object"""
-        return self.__decompressor        
+        """'decompressor' : get the actual (thread-local) decompressor object"""
+        return self.__decompressor ( 0 ) 
+
+    # ==========================================================================
+    ## get (thread-local) compressor for the given dictionary 
+    def __compressor ( self , dict_id ) :
+        compressors = getattr ( self.__local , 'compressors' , None )
+        if compressors is None :
+            compressors = {}
+            self.__local.compressors = compressors 
+        compressor = compressors.get ( dict_id , None )
+        if compressor is None :
+            conf = { 'level'              : self.__level   ,
+                     'threads'            : self.__threads ,
+                     'write_checksum'     : True           ,
+                     'write_content_size' : True           }
+            if dict_id : conf [ 'dict_data' ] = self.__dicts [ dict_id ]
+            compressor = zst.ZstdCompressor ( **conf ) 
+            compressors [ dict_id ] = compressor
+        return compressor 
+
+    # ==========================================================================
+    ## get (thread-local) decompressor for the given dictionary 
+    def __decompressor ( self , dict_id ) :
+        decompressors = getattr ( self.__local , 'decompressors' , None )
+        if decompressors is None :
+            decompressors = {}
+            self.__local.decompressors = decompressors 
+        decompressor = decompressors.get ( dict_id , None )
+        if decompressor is None :
+            if dict_id : decompressor = zst.ZstdDecompressor ( dict_data = self.__dicts [ dict_id ] ) 
+            else       : decompressor = zst.ZstdDecompressor ()
+            decompressors [ dict_id ] = decompressor
+        return decompressor 
+    
+    # ==========================================================================
+    ## load the dictionaries from the database
+    def __load_dicts ( self ) :
+        if not self.DICTKEY in self : return
+        entry = self [ self.DICTKEY ]
+        self.__dicts  = dict ( ( i , zst.ZstdCompressionDict ( d ) ) for i , d in entry [ 'dicts' ].items () )
+        self.__active = entry [ 'active' ]
+        ## dictionaries are stored in the database: the mode is activated 
+        if self.__dicts : self.__dictionary = True 
+        
+    # ==========================================================================
+    ## save the dictionaries into the database (without dictionary compression)
+    def __save_dicts ( self ) :
+        entry = { 'active' : self.__active ,
+                  'dicts'  : dict ( ( i , d.as_bytes () ) for i , d in self.__dicts.items () ) }
+        item  = Item ( time.time () , entry )
+        self.dict [ self.DICTKEY.encode ( self.keyencoding ) ] = self.__compressor ( 0 ).compress ( self.pickle ( item ) )
+        
+    # ==========================================================================
+    ## Train (or retrain) the zstd dictionary from the sample of stored values
+    #  @code
+    #  db = ...
+    #  db.train_dictionary () 
+    #  db.train_dictionary ( keys = [ ... ] , size = 2**16 , recompress = True ) 
+    #  @endcode
+    #  @param keys       the keys to use for training (default: random sample of stored keys)
+    #  @param size       the size of the dictionary
+    #  @param samples    maximal number of samples 
+    #  @param recompress recompress all items with the new dictionary? 
+    #  @return ID of the new dictionary (0 in case of failure) 
+    def train_dictionary ( self , keys = None , size = None , samples = None , recompress = False ) :
+        """ Train (or retrain) the zstd dictionary from the sample of stored values
+        >>> db = ...
+        >>> db.train_dictionary () 
+        >>> db.train_dictionary ( keys = [ ... ] , size = 2**16 , recompress = True ) 
+        - returns ID of the new dictionary (0 in case of failure) 
+        """
+        assert 'r' != self.mode , 'Database is opened in read-only mode!'
+        
+        size    = size    if size    else self.__dict_size
+        samples = samples if samples else self.__dict_samples 
+        
+        special = self.HIDDEN_KEYS 
+        if keys is None :
+            keys = [ k for k in self.keys () if not k in special ]
+            if samples < len ( keys ) :
+                import random 
+                keys = random.sample ( keys , samples ) 
+                
+        data = [ self.__get_raw_bytes__ ( k ) for k in keys if not k in special ]
+        if not data :
+            logger.warning ( 'train_dictionary: no samples for training' ) 
+            return 0 
+        
+        try : 
+            zdict = zst.train_dictionary ( size , data , level = self.__level )
+        except zst.ZstdError :
+            logger.warning ( 'train_dictionary: cannot train dictionary from %d samples' % len ( data ) , exc_info = True ) 
+            return 0 
+
+        dict_id = zdict.dict_id ()
+        self.__dicts [ dict_id ] = zdict
+        self.__active            = dict_id
+        self.__dictionary        = True 
+        self.__train_failed      = False 
+        self.__save_dicts ()
+        
+        if not self.silent :
+            logger.info ( 'train_dictionary: new dictionary ID=%s size=%d from %d samples' % ( dict_id , len ( zdict.as_bytes () ) , len ( data ) ) ) 
+
+        if recompress :
+            for k in self.keys () :
+                if k in special : continue 
+                data , buffers = self.uncompress_oob ( self.dict [ k.encode ( self.keyencoding ) ] )
+                self.dict [ k.encode ( self.keyencoding ) ] = self.compress_oob ( data , buffers ) 
+                
+        return dict_id 
+
+    # ==========================================================================
+    ## train the dictionary when enough items are stored
+    #  - after the failure the automatic training is switched off,
+    #    use the explicit `train_dictionary` to retry 
+    def __auto_train ( self ) :
+        if self.__train_failed or not self.__dictionary or self.__active : return 
+        nitems = len ( self.dict ) - sum ( 1 for k in self.HIDDEN_KEYS if k in self ) 
+        if self.__dict_samples <= nitems : 
+            if not self.train_dictionary () : self.__train_failed = True 
+            
+    # ==========================================================================
+    ## copy the database into new one
+    #  - the dictionaries are not copied: items are recompressed by the new database 
+    def copy ( self , dbname , copykeys = () , **kwargs ) :
+        """ Copy the database into new one
+        - the dictionaries are not copied: items are recompressed by the new database 
+        """
+        copykeys = [ k for k in copykeys if self.DICTKEY != k ]
+        return CompressShelf.copy ( self , dbname , copykeys = copykeys , **kwargs )
+    
+    # ==========================================================================
+    ## `set-and-compress-item' to dbase
+    def __setitem__  ( self , key , value ) :
+        """ `set-and-compress-item' to dbase 
+        >>> dbase['item'] = value 
+        """
+        CompressShelf.__setitem__ ( self , key , value )
+        self.__auto_train () 
+        
+    # ==========================================================================
+    ## Bulk update of the database
+    def update_many ( self , items = () , nthreads = -1 , **kwargs ) :
+        """ Bulk update of the database
+        - see `CompressShelf.update_many`
+        """
+        CompressShelf.update_many ( self , items , nthreads = nthreads , **kwargs )
+        self.__auto_train () 
+        
+    # ==========================================================================
+    ## compress (ZST) the (pickled) bytes using compressor 
+    def compress_bytes ( self , data ) :
+        """ Compress (ZST) the (pickled) bytes using compressor 
+        """
+        return self.compressor.compress ( data )
     
     # ==========================================================================
     ## compress (ZST)  the item  using compressor 
     def compress_item ( self , value ) :
         """ Compress (ZST) the item using compressor 
         """
-        return self.compressor.compress (  self.pickle ( value ) )
+        return self.compress_bytes ( self.pickle ( value ) )
     
     # =========================================================================
-    ## uncompres (ZST) the item using decompressor 
+    ## uncompres (ZST) the item using decompressor
+    #  the dictionary is chosen according to the frame header 
+    #  (the stored dictionaries are loaded on demand, e.g. for items
+    #  that are read by the base class constructor)
     def uncompress_item ( self , value ) :                             ## FIXED 
         """ Uncompress (ZST) the item using decompressor 
-        """        
-        return self.decompressor.decompress ( value ) 
+        - the dictionary is chosen according to the frame header 
+        - the stored dictionaries are loaded on demand 
+        """
+        dict_id = zst.get_frame_parameters ( value ).dict_id 
+        if dict_id and not dict_id in self.__dicts : self.__load_dicts () 
+        return self.__decompressor ( dict_id ).decompress ( value ) 
 
 # =============================================================================
 ## helper function to access ZstShelve data base
@@ -85,7 +85,7 @@
                                        integral2_ostap , 
                                        integral3_ostap ) 
 from   sortedcontainers       import SortedKeyList  
-import math, array , warnings   
+import math, array , warnings, bisect, functools  
 # =============================================================================
 # logging 
 # =============================================================================
@@ -214,7 +214,7 @@ def adaptive_integral ( rule_name           ,
     # we'll split regions by factor of 2
     # For nested rules one can get a large gain from memoization 
     
-    func = memoize ( lambda x : float ( fun ( x , *args , **kwargs ) ) ) 
+    func = functools.lru_cache ( maxsize = 2**16 ) ( lambda x : float ( fun ( x , *args , **kwargs ) ) ) 
     
     ## (1) just one step: apply rule to whole interval 
     result , error = rule ( func , xmin , xmax , epsabs = epsabs , epsrel = epsrel , **rconf )
@@ -1628,6 +1628,19 @@ def xmin ( self  ) :
 #  >>> func  = lambda x : x * x 
 #  >>> iint  = IntegralCache(func,0) ## specify x_low 
 #  >>> value = iint  ( 10 )          ## specify x_hgh 
+#  @endcode
+#  - the results of the previous evaluations are cached and used as 
+#    starting points for the next evaluations
+#  - `maxsize` bounds the number of cached entries, 
+#     the least recently used entries are evicted 
+#  - `grid` : precompute the monotone table of integrals at these points 
+#     (or at `grid` uniformly distributed points from `xlow` to `xmax`) and use 
+#     the cubic Hermite interpolation (with the function values as derivatives)
+#     inside the grid
+#  @code 
+#  >>> iint  = IntegralCache ( func , 0 , maxsize = 1000 )
+#  >>> iint  = IntegralCache ( func , 0 , grid = 1000 , xmax = 10 ) 
+#  >>> print ( iint.hits , iint.misses )  
 #  @endcode 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2014-06-06
@@ -1636,14 +1649,28 @@ class IntegralCache(Integral) :
     >>> func   = lambda x : x*x 
     >>> iint   = IntegralCache ( func , 0 ) ## specify x_low 
     >>> value  = iint ( 10 )                ## specify x_high
+    - the results of the previous evaluations are cached and used as 
+      starting points for the next evaluations
+    - `maxsize` bounds the number of cached entries, 
+       the least recently used entries are evicted 
+    - `grid` : precompute the monotone table of integrals at these points 
+       (or at `grid` uniformly distributed points from `xlow` to `xmax`) and use 
+       the cubic Hermite interpolation (with the function values as derivatives)
+       inside the grid
+    >>> iint  = IntegralCache ( func , 0 , maxsize = 1000 )
+    >>> iint  = IntegralCache ( func , 0 , grid = 1000 , xmax = 10 ) 
+    >>> print ( iint.hits , iint.misses )  
     """
-    def __init__ ( self           ,
-                   func           ,
-                   xlow   = 0     , * ,
-                   args   = ()    ,
-                   kwargs = {}    ,
-                   err    = False ,
-                   silent = False , **other ) :
+    def __init__ ( self            ,
+                   func            ,
+                   xlow    = 0     , * ,
+                   args    = ()    ,
+                   kwargs  = {}    ,
+                   err     = False ,
+                   silent  = False ,
+                   maxsize = 10000 ,
+                   grid    = None  ,
+                   xmax    = None  , **other ) :
         """ Calculate the integral for the 1D-function
         
         >>> func = ...
@@ -1656,10 +1683,80 @@ def __init__ ( self           ,
                                              err    = err    ,
                                              silent = silent , **other  )
         
+        assert maxsize is None or isinstance ( maxsize , int ) , "Invalid `maxsize` %s" % maxsize 
+        
         ## the first (trivial) entry in the cache 
-        entry        = self.xmin , 0.0  
-        self.__cache = SortedKeyList ( [ entry ] , key = lambda e : e[0] )
+        entry          = self.xmin , 0.0  
+        self.__cache   = SortedKeyList ( [ entry ] , key = lambda e : e[0] )
+        self.__maxsize = maxsize if maxsize and 0 < maxsize else 0 
+        self.__used    = {}   ## x -> "time" of the last use (for LRU eviction)  
+        self.__tick    = 0 
+        self.__hits    = 0
+        self.__misses  = 0
+        self.__grid    = ()
+        
+        if grid is not None : self.precompute ( grid , xmax ) 
+        
+    # =========================================================================
+    ## Precompute the monotone table of integrals at the grid points
+    #  @code
+    #  iint = IntegralCache ( func , 0 )
+    #  iint.precompute ( 1000 , 10 )            ## 1000 uniform points in (0,10)
+    #  iint.precompute ( [ 1 , 2 , 5 , 10 ] )   ## explicit points 
+    #  @endcode
+    #  Inside the grid the cubic Hermite interpolation is used 
+    def precompute ( self , grid , xmax = None ) :
+        """ Precompute the monotone table of integrals at the grid points
+        >>> iint = IntegralCache ( func , 0 )
+        >>> iint.precompute ( 1000 , 10 )            ## 1000 uniform points in (0,10)
+        >>> iint.precompute ( [ 1 , 2 , 5 , 10 ] )   ## explicit points 
+        - Inside the grid the cubic Hermite interpolation is used 
+        """
+        if isinstance ( grid , int ) :
+            assert 2 <= grid     , "Invalid number of grid points %s" % grid 
+            assert not xmax is None and isfinite ( xmax ) , "`xmax` must be specified for the uniform grid!"
+            xmin  = self.xmin
+            xmax  = float ( xmax )
+            grid  = [ xmin + ( xmax - xmin ) * i / ( grid - 1.0 ) for i in range ( grid ) ]
+            
+        points = sorted ( set ( float ( x ) for x in grid ) | set ( [ self.xmin ] ) ) 
+        assert 2 <= len ( points ) , "Invalid grid!"
+
+        func , args , kwargs = self.func , self.args , self.kwargs 
+        
+        ## start from the lower limit of integration in both directions  
+        i0     = points.index ( self.xmin ) 
+        values = [ 0.0 ] * len ( points )
+        for i in range ( i0 + 1 , len ( points ) ) :
+            values [ i ] = values [ i - 1 ] + self._integrate_1D_ ( func , points [ i - 1 ] , points [ i ] , args = args , kwargs = kwargs )
+        for i in range ( i0 - 1 , -1 , -1 ) :
+            values [ i ] = values [ i + 1 ] - self._integrate_1D_ ( func , points [ i ] , points [ i + 1 ] , args = args , kwargs = kwargs )
+            
+        derivs = [ float ( func ( x , *args , **kwargs ) ) for x in points ]
+        
+        self.__grid = tuple ( points ) , tuple ( values ) , tuple ( derivs )  
+        
+    ## interpolate inside the grid 
+    def __interpolate ( self , x ) :
+        
+        points , values , derivs = self.__grid
+        if not points [ 0 ] <= x <= points [ -1 ] : return None 
+        
+        i = bisect.bisect_right ( points , x ) - 1
+        i = min ( i , len ( points ) - 2 ) 
+        
+        x0 , x1 = points [ i ] , points [ i + 1 ] 
+        h       = x1 - x0 
+        t       = ( x - x0 ) / h
+        t2 , t3 = t * t , t * t * t
+        
+        h00 =  2 * t3 - 3 * t2 + 1
+        h10 =      t3 - 2 * t2 + t
+        h01 = -2 * t3 + 3 * t2
+        h11 =      t3 -     t2
         
+        return h00 * values [ i ] + h01 * values [ i + 1 ] + h * ( h10 * derivs [ i ] + h11 * derivs [ i + 1 ] ) 
+            
     ## Calculate the numerical integral for the 1D-function
     def __call__ ( self , x , *args , **kwargs ) :
         """ Calculate the integral for the 1D-function
@@ -1677,7 +1774,14 @@ def __call__ ( self , x , *args , **kwargs ) :
         kwargs = kwargs if kwargs else self.kwargs 
         
         x       = float ( x ) 
-        
+
+        ## inside the precomputed grid? 
+        if self.__grid :
+            result = self.__interpolate ( x ) 
+            if not result is None :
+                self.__hits += 1 
+                return result 
+            
         cache = self.__cache 
         n      = len ( cache )
         left   = cache.bisect_key_left  ( x )
@@ -1689,8 +1793,15 @@ def __call__ ( self , x , *args , **kwargs ) :
             right = left + 1 
             entry  = min ( ( cache [ i ] for i in range ( left , right + 1 ) ) , key = lambda e : abs ( e [ 0 ] - x ) ) 
             
-        xclose = entry [ 0 ] 
-        if xclose == x : return  entry [ 1 ] 
+        xclose = entry [ 0 ]
+        self.__tick += 1
+        if xclose != self.xmin : self.__used [ xclose ] = self.__tick 
+        
+        if xclose == x :
+            self.__hits += 1 
+            return  entry [ 1 ]
+        
+        self.__misses += 1 
         
         ## integral from closest previous point 
         delta  = self._integrate_1D_ ( self.func , xclose , x , args = args , kwargs = kwargs  )
@@ -1698,14 +1809,49 @@ def __call__ ( self , x , *args , **kwargs ) :
         
         new_entry = x , result 
         cache.add ( new_entry ) 
+        self.__used [ x ] = self.__tick 
+        
+        ## evict the least recently used entries (the trivial entry is always kept)  
+        if self.__maxsize and self.__maxsize < len ( cache ) : self.__evict () 
         
         return  result 
 
+    ## evict the least recently used entries 
+    def __evict ( self ) :
+        cache = self.__cache 
+        nkeep = max ( 1 , self.__maxsize * 3 // 4 )
+        nkill = len ( cache ) - nkeep 
+        if nkill <= 0 : return 
+        used  = self.__used 
+        for x in sorted ( used , key = used.get ) [ : nkill ] :
+            cache.pop ( cache.bisect_key_left ( x ) ) 
+            del used [ x ] 
+            
     @property
     def cache ( self ) :
         """`cache': results of the previous integral evaluations"""
         return self.__cache 
 
+    @property
+    def maxsize ( self ) :
+        """`maxsize' : maximal number of cached entries (0: unbounded)"""
+        return self.__maxsize 
+
+    @property
+    def grid ( self ) :
+        """`grid' : precomputed grid points (if any)"""
+        return self.__grid [ 0 ] if self.__grid else () 
+    
+    @property
+    def hits ( self ) :
+        """`hits' : number of cache hits"""
+        return self.__hits 
+
+    @property
+    def misses ( self ) :
+        """`misses' : number of cache misses"""
+        return self.__misses
+
 # =============================================================================
 # 2D-integration
 # =============================================================================
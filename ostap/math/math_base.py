@@ -120,6 +120,7 @@
     'epsilon'        , ## float/double-epsilon
     ##
     'np2raw'         , ## numpy array to raw C++ buffer
+    'vct_cpp_call'   , ## vectorised evaluation of C++ callables with the loop in C++
     'product'        , ## Make a product over iterable `data`
     ) 
 # =============================================================================
@@ -1086,6 +1087,84 @@ def product ( data , init = 1 ) :
     """
     return  reduce ( operator.mul , data  , init )
 
+# =============================================================================
+## C++ callable types & arities that can/can't be used for C++ vectorised evaluation
+_vct_cpp_types = {}
+# =============================================================================
+## Try to evaluate C++ callable object for numpy arrays with the loop in C++
+#  - all arguments must be numpy arrays (of real numbers) or scalars
+#  - arrays are broadcasted 
+#  - only one python call for the whole array 
+#  @see Ostap::Math::vct_call1
+#  @see Ostap::Math::vct_call2
+#  @see Ostap::Math::vct_call3
+#  @return numpy array or <code>None</code> if C++ evaluation is not possible 
+def vct_cpp_call ( fun , *args ) :
+    """ Try to evaluate C++ callable object for numpy arrays with the loop in C++
+    - all arguments must be numpy arrays (of real numbers) or scalars
+    - arrays are broadcasted 
+    - only one python call for the whole array
+    - see `Ostap.Math.vct_call1`, `Ostap.Math.vct_call2`, `Ostap.Math.vct_call3`
+    - `None` is returned if C++ evaluation is not possible 
+    """
+    narg = len ( args )
+    if not 1 <= narg <= 3 : return None
+
+    ## (1) C++ callable objects only 
+    ftype = type ( fun )
+    key   = ftype , narg 
+    if False is _vct_cpp_types.get ( key , None ) : return None 
+    if not getattr ( ftype , '__cpp_name__' , None ) :
+        _vct_cpp_types [ key ] = False
+        return None 
+    
+    ## (2) check arguments 
+    shapes = []
+    for a in args :
+        if   isinstance ( a , num_types     ) : continue 
+        elif isinstance ( a , numpy.ndarray ) and a.dtype.kind in 'biuf' :
+            if a.ndim : shapes.append ( a.shape )
+        else : return None
+    if not shapes : return None
+    
+    shape = numpy.broadcast_shapes ( *shapes )
+    size  = 1
+    for d in shape : size *= d
+
+    ## (3) prepare contiguous buffers 
+    buffers = []
+    for a in args :
+        if isinstance ( a , numpy.ndarray ) and a.ndim :
+            if a.shape != shape : a = numpy.broadcast_to ( a , shape ) 
+            buffers.append ( ( numpy.ascontiguousarray ( a , dtype = numpy.float64 ).reshape ( -1 ) , 1 ) )
+        else :
+            buffers.append ( ( numpy.full ( 1 , float ( a ) , dtype = numpy.float64 ) , 0 ) )
+    result = numpy.empty ( shape , dtype = numpy.float64 )
+
+    raws  = [ ( np2raw ( b ) [ 0 ] , step ) for b , step in buffers ]
+    out,_ = np2raw ( result.reshape ( -1 ) )
+    
+    if   1 == narg : vcall = lambda n : Ostap.Math.vct_call1 ( fun , raws [ 0 ] [ 0 ] , out , n )
+    elif 2 == narg : vcall = lambda n : Ostap.Math.vct_call2 ( fun , *( raws [ 0 ] + raws [ 1 ] ) , out , n )
+    else           : vcall = lambda n : Ostap.Math.vct_call3 ( fun , *( raws [ 0 ] + raws [ 1 ] + raws [ 2 ] ) , out , n )
+
+    ## (4) the first call for this type: check that C++ evaluation is possible at all
+    if not key in _vct_cpp_types :
+        try :
+            vcall ( 0 )
+            _vct_cpp_types [ key ] = True
+        except Exception :
+            _vct_cpp_types [ key ] = False
+            return None
+        
+    ## (5) the actual evaluation
+    try :
+        vcall ( size )
+    except Exception :
+        return None
+    
+    return result 
+
 # =============================================================================
 ## Call a function of scalar argument with array-like argument
 #  - a kind of straw-man vectorization
@@ -1096,7 +1175,12 @@ def vct1_call ( fun1 , x , *more , **kwargs ) :
     - function signature is `result = fun1 ( x , **kwargs )`
     """    
     assert callable ( fun1 ) , "`fun2` must be callable!"
-    
+
+    ## (0') C++ object and numpy array: loop in C++ 
+    if not more and not kwargs and isinstance ( x , numpy.ndarray ) :
+        result = vct_cpp_call ( fun1 , x )
+        if result is not None : return result
+        
     ## (0) get the actual function, wrap arguments 
     if kwargs : fun = lambda x : fun1 ( x , **kwargs )
     else      : fun = fun1 
@@ -1128,7 +1212,13 @@ def vct2_call ( fun2 , x , y ,  *args , **kwargs ) :
       - function signature is `result = fun2  ( x , y , **kwargs )`
     """    
     assert callable ( fun2 ) , "`fun2` must be callable!"
-    
+
+    ## (0') C++ object and numpy array(s): loop in C++ 
+    if not args and not kwargs and \
+       ( isinstance ( x , numpy.ndarray ) or isinstance ( y , numpy.ndarray ) ) :
+        result = vct_cpp_call ( fun2 , x , y )
+        if result is not None : return result
+        
     ## (0) get the actual function, wrap arguments 
     if args or kwargs : fun = lambda x, y : fun2 ( x , y , *args , **kwargs )
     else              : fun = fun2 
@@ -1167,6 +1257,12 @@ def vct3_call ( fun3 , x , y , z , *args , **kwargs ) :
     """    
     assert callable ( fun3 ) , "`fun3` must be callable!"
     
+    ## (0') C++ object and numpy array(s): loop in C++ 
+    if not args and not kwargs and \
+       ( isinstance ( x , numpy.ndarray ) or isinstance ( y , numpy.ndarray ) or isinstance ( z , numpy.ndarray ) ) :
+        result = vct_cpp_call ( fun3 , x , y , z )
+        if result is not None : return result
+        
     ## (0) get the actual function, wrap arguments 
     if args or kwargs : fun = lambda x, y, z : fun3 ( x , y , z , *args , **kwargs )
     else              : fun = fun3 
@@ -1178,7 +1274,7 @@ def vct3_call ( fun3 , x , y , z , *args , **kwargs ) :
 
     ## (2) treat array-like arguments 
     if   xseq and yseq and zseq : gen = ( fun ( vx , vy , vz ) for vx , vy , vz in zip ( x , y ,          z   ) )
-    elif xseq and yzeq          : gen = ( fun ( vx , vy , vz ) for vx , vy , vz in zip ( x , y , repeat ( z ) ) ) 
+    elif xseq and yseq          : gen = ( fun ( vx , vy , vz ) for vx , vy , vz in zip ( x , y , repeat ( z ) ) ) 
     elif xseq and zseq          : gen = ( fun ( vx , vy , vz ) for vx , vz , vy in zip ( x , z , repeat ( y ) ) )
     elif yseq and zseq          : gen = ( fun ( vx , vy , vz ) for vy , vz , vx in zip ( y , z , repeat ( x ) ) )
     elif xseq                   : gen = ( fun ( vx , vy , vz ) for vx , vy , vz in zip ( x , repeat ( y ) , repeat ( z ) ) )
@@ -1209,6 +1305,10 @@ def vct1_call_method ( method ) :
     """ decorator to enhace call-method for certain class
     """
     def decorated_call1 ( who , x , *args , **kwargs ) :
+        ## C++ object and numpy array: loop in C++ 
+        if not args and not kwargs and isinstance ( x , numpy.ndarray ) :
+            result = vct_cpp_call ( who , x )
+            if result is not None : return result
         fun1 = lambda x : method ( who , x , *args , **kwargs )
         return vct1_call ( fun1 , x )
     decorated_call1.__doc__ = method.__doc__ 
@@ -1220,6 +1320,11 @@ def vct2_call_method ( method ) :
     """ decorator to enhace call-method for certain class
     """
     def decorated_call2 ( who , x , y ,  *args , **kwargs ) :
+        ## C++ object and numpy array(s): loop in C++ 
+        if not args and not kwargs and \
+           ( isinstance ( x , numpy.ndarray ) or isinstance ( y , numpy.ndarray ) ) : 
+            result = vct_cpp_call ( who , x , y )
+            if result is not None : return result
         fun2 = lambda x, y : method ( who , x , y , *args ,  **kwargs  )
         return vct2_call ( fun2 , x , y )
     decorated_call2.__doc__ = method.__doc__ 
@@ -1231,6 +1336,11 @@ def vct3_call_method ( method ) :
     """ decorator to enhance call-method for certain class
     """
     def decorated_call3 ( who , x , y , z , *args , **kwargs ) :
+        ## C++ object and numpy array(s): loop in C++ 
+        if not args and not kwargs and \
+           ( isinstance ( x , numpy.ndarray ) or isinstance ( y , numpy.ndarray ) or isinstance ( z , numpy.ndarray ) ) :
+            result = vct_cpp_call ( who , x , y , z )
+            if result is not None : return result
         fun3 = lambda x, y, z : method ( who , x , y , z , *args , **kwargs )
         return vct3_call ( fun3 , x , y , z )
     decorated_call3.__doc__ = method.__doc__ 
@@ -83,11 +83,35 @@ def test_frexp10 () :
     if ok : logger.info  ( '%s:\n%s' % ( title , table ) )
     else  : logger.error ( '%s:\n%s' % ( title , table ) )
     
+# =============================================================================
+## test for vectorised evaluation with the loop in C++
+def test_vct_call () :
+    """ Test for vectorised evaluation with the loop in C++
+    """
+    import numpy 
+    from   ostap.core.core   import Ostap 
+    from   ostap.utils.timing import timing
+    import ostap.math.models 
+    
+    b  = Ostap.Math.Bernstein ( [ 1 , 2 , 0.5 , 3 , 1 ] , -1 , 2 )
+    x  = numpy.linspace ( -1 , 2 , 100000 )
+
+    with timing ( 'Bernstein: loop in C++'    , logger = logger ) : r1 = b ( x )
+    with timing ( 'Bernstein: loop in python' , logger = logger ) : r2 = numpy.fromiter ( ( b ( float ( v ) ) for v in x ) , dtype = float )
+    assert numpy.array_equal ( r1 , r2 ) , 'Mismatch in vectorised evaluation!'
+
+    g2 = Ostap.Math.Gauss2D ( 0.1 , 0.2 , 1 , 2 , 0.3 )
+    y  = numpy.linspace ( -1 , 2 , 1000 )
+    r1 = g2 ( y , 0.5 )
+    r2 = numpy.fromiter ( ( g2 ( float ( v ) , 0.5 ) for v in y ) , dtype = float )
+    assert numpy.array_equal ( r1 , r2 ) , 'Mismatch in 2D vectorised evaluation!'
+    
 # =============================================================================
 if '__main__' == __name__ :
     
-    test_frexp10 () 
-    test_lomont  () 
+    test_frexp10  () 
+    test_lomont   () 
+    test_vct_call () 
     
 # =============================================================================
 ##                                                                      The END 
@@ -644,6 +644,38 @@ def test_integral_contour ():
     table = T.table ( rows , title = title ,  prefix = '# ' )
     logger.info ( '%s\n%s' % ( title , table ) ) 
 
+# =============================================================================
+def test_integral_cache ():
+
+    logger = getLogger('test_integral_cache')
+    logger.info ( 'Test for bounded/precomputed IntegralCache' )
+
+    import random 
+    from   math import sin, cos 
+
+    exact = lambda x : 1 - cos ( x ) 
+    
+    bounded = IntegralCache ( sin , 0 , maxsize = 100 )
+    grid    = IntegralCache ( sin , 0 , grid    = 500 , xmax = 10 )
+
+    cnt1 , cnt2 = SE () , SE () 
+    for i in progress_bar ( range ( 5000 ) ) :
+        x = random.uniform ( 0 , 10 )
+        cnt1 += abs ( bounded ( x ) - exact ( x ) ) * 1.e+12 
+        cnt2 += abs ( grid    ( x ) - exact ( x ) ) * 1.e+12 
+
+    assert len ( bounded.cache ) <= bounded.maxsize , 'Cache is not bounded!'
+    ## cubic Hermite interpolation: |delta| <= h^4/384 * max|f''''| ~ 4.2e-10 for h = 10/499 
+    assert cnt2.max () < 1.e-9 * 1.e+12 , 'Grid interpolation is not precise: %.3g' % cnt2.max () 
+    
+    rows = [ ( 'Cache' , 'size' , 'hits' , 'misses' , 'max|delta| [10^-12]' ) ] 
+    rows.append ( ( 'bounded' , '%d' % len ( bounded.cache ) , '%d' % bounded.hits , '%d' % bounded.misses , '%.3g' % cnt1.max () ) )
+    rows.append ( ( 'grid'    , '%d' % len ( grid.grid     ) , '%d' % grid.hits    , '%d' % grid.misses    , '%.3g' % cnt2.max () ) )
+    
+    title = 'IntegralCache'
+    table = T.table ( rows , title = title ,  prefix = '# ' )
+    logger.info ( '%s\n%s' % ( title , table ) ) 
+
 # ==============================================================================
 if '__main__' == __name__ :
 
@@ -651,6 +683,7 @@ def test_integral_contour ():
     test_integral_2D      ()
     test_integral_3D      ()
     test_integral_contour ()
+    test_integral_cache   ()
     
     test_integrators      ()
     test_integrators2     ()
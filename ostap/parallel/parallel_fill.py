@@ -51,21 +51,26 @@ def __init__ ( self           ,
         self.name       = name
         self.title      = title         
         self.the_output = ()  
+        ## cache the task in the persistent (warm) workers 
+        self.cache_remote = True 
 
     ## local initialization 
     def initialize_local   ( self ) : self.the_output = () 
 
-    ## the actual processing 
-    def process ( self , jobid , item ) :
-
-        import ROOT
+    ## one-time initialization in the worker 
+    def initialize_worker  ( self ) :
+        """ One-time initialization in the worker
+        """
         from ostap.logger.logger import logWarning
         with logWarning() :
             import ostap.core.pyrouts            
             import ostap.trees.trees
             import ostap.fitting.roofit 
             import ostap.fitting.pyselectors
-        
+
+    ## the actual processing 
+    def process ( self , jobid , item ) :
+
         ## reconstruct chain from the item 
         chain    = item.chain        
         return chain.make_dataset ( variables = self.variables ,
@@ -140,13 +145,7 @@ def __init__ ( self               ,
     ## the actual processing 
     def process ( self , jobid , item ) :
 
-        import ROOT
-        from ostap.logger.logger import logWarning
-        with logWarning() :
-            import ostap.core.pyrouts            
-            import ostap.trees.trees
-            import ostap.fitting.roofit 
-            from   ostap.fitting.pyselectors import SelectorWithVars
+        from   ostap.fitting.pyselectors import SelectorWithVars
             
         ## reconstruct chain from the item 
         chain    = item.chain
@@ -202,13 +201,6 @@ def __init__ ( self               ,
     ## the actual processing 
     def process ( self , jobid , item ) :
 
-        import ROOT
-        from ostap.logger.logger import logWarning
-        with logWarning() :
-            import ostap.core.pyrouts            
-            import ostap.trees.trees
-            import ostap.fitting.roofit 
-        
         ## reconstruct chain from the item 
         chain    = item.chain
         ll       = len ( chain )  
@@ -260,15 +252,18 @@ def parallel_fill ( chain                  ,
                     use_frame    =  20000  ,   ## important 
                     silent       = False   ,
                     job_chunk    = -1      ,
-                    progress     = True    , **kwargs ) :
+                    progress     = True    ,
+                    balanced     = True    ,   ## cluster-aligned & byte-balanced chunks 
+                    **kwargs ) :
     """ Parallel processing of loooong chain/tree 
     >>>chain    = ...
     >>> selector =  ...
     >>> chain.parallel_fill ( selector )
+    - balanced : use cluster-aligned, byte-balanced chunks? see `ostap.trees.utils.balanced_ranges` 
     """
     import ostap.fitting.roofit 
     from   ostap.fitting.pyselectors import SelectorWithVars 
-    from   ostap.trees.trees         import Chain
+    from   ostap.trees.utils         import Chain
     
     assert isinstance ( selector , SelectorWithVars ) , \
            "Invalid type of ``selector'': %s" % type ( selector ) 
@@ -297,7 +292,7 @@ def parallel_fill ( chain                  ,
                        use_frame = use_frame         ) 
     
     wmgr  = WorkManager ( silent     = silent  , progress = True , **kwargs )
-    trees = ch.split    ( chunk_size = chunk_size , max_files = max_files )
+    trees = ch.split    ( chunk_size = chunk_size , max_files = max_files , balanced = balanced )
     wmgr.process ( task , trees , chunk_size = job_chunk )
     del trees
     
@@ -340,15 +335,17 @@ def parallel_fill_dataset  ( chain                  ,
                              use_frame    = 20000   ,   ## important 
                              silent       = True    , 
                              max_files    = 1       ,
-                             job_chunk    = -1      , **kwargs ) :
+                             job_chunk    = -1      ,
+                             merge_arity  = 0       , **kwargs ) :
     """ Create RooDataset from the chain/tree
     >>> tree = ...
     >>> ds , stat = tree.pfill_dataset ( [ 'px , 'py' , 'pz' ] )
+    - merge_arity : arity of the tree-reduction merge of datasets in workers (0: no tree-reduction)
     """
     
     import ostap.fitting.roofit 
     from   ostap.fitting.pyselectors import SelectorWithVars 
-    from   ostap.trees.trees         import Chain
+    from   ostap.trees.utils         import Chain
     
     ch = Chain ( chain ) 
     if ch.nFiles < 2 :
@@ -372,7 +369,7 @@ def parallel_fill_dataset  ( chain                  ,
                          title     = title      ,
                          shortcut  = shortcut   ,
                          use_frame = use_frame  )
-
+    task.merge_arity = merge_arity 
     
     wmgr  = WorkManager ( silent     = silent     , **kwargs )
     trees = ch.split    ( chunk_size = -1 , max_files = max_files )
@@ -420,7 +417,7 @@ def parallel_make_dataset ( chain                ,
     """
     
     import ostap.fitting.roofit 
-    from   ostap.trees.trees         import Chain
+    from   ostap.trees.utils         import Chain
     
     ch = Chain ( chain )
     
@@ -14,6 +14,7 @@
 )
 # =============================================================================
 from   itertools                    import repeat , count, islice 
+from   ostap.core.meta_info         import python_info 
 from   ostap.core.ostap_types       import sized_types
 from   ostap.utils.progress_bar     import progress_bar
 from   ostap.utils.utils            import chunked 
@@ -21,7 +22,7 @@
 from   ostap.io.checker             import PickleChecker as Checker
 from   ostap.parallel.utils         import init_worker_modules 
 import concurrent.futures
-import sys
+import contextlib, sys
 #  =============================================================================
 from   ostap.logger.logger          import getLogger
 logger  = getLogger('ostap.parallel.parallel_futures')
@@ -119,13 +120,54 @@ def _submit_chunk_ ( chunk ) :
         else:
             yield from result
 
+# ==============================================================================
+## Trivial job to warm-up the worker (pickle-safe)
+def _warm_up_ ( item ) :
+  """ Trivial job to warm-up the worker (pickle-safe)
+  """
+  import os
+  return os.getpid () 
+
 # ==============================================================================
 ## @class WorkManager
 #  Class to in charge of managing the tasks and distributing them to
 #  the workers. They can be local (using other cores) or remote
-#  using other nodes in the local cluster """
+#  using other nodes in the local cluster
+#
+#  With <code>persistent=True</code> the pool of warm, pre-initialized workers
+#  is created once and reused across hyper-blocks and across
+#  successive <code>process</code> calls:
+#  @code
+#  with WorkManager ( persistent = True ) as wm : 
+#     r1 = wm.process ( task1 , items1 )
+#     r2 = wm.process ( task2 , items2 )  ## the same workers are used 
+#  @endcode
+#  or with explicit lifecycle control:
+#  @code
+#  wm = WorkManager ( persistent = True )
+#  wm.start ()     ## optional: create and warm up the pool 
+#  r1 = wm.process ( task1 , items1 )
+#  r2 = wm.process ( task2 , items2 ) 
+#  wm.shutdown ()  ## release the workers 
+#  @endcode 
 class WorkManager(TaskManager) :
     """ Class to in charge of managing the tasks and distributing them to the workers.
+    
+    With `persistent=True` the pool of warm, pre-initialized workers 
+    is created once and reused across hyper-blocks and across
+    successive `process` calls:
+    
+    >>> with WorkManager ( persistent = True ) as wm : 
+    ...    r1 = wm.process ( task1 , items1 )
+    ...    r2 = wm.process ( task2 , items2 )  ## the same workers are used 
+
+    or with explicit lifecycle control:
+    
+    >>> wm = WorkManager ( persistent = True )
+    >>> wm.start ()     ## optional: create and warm up the pool 
+    >>> r1 = wm.process ( task1 , items1 )
+    >>> r2 = wm.process ( task2 , items2 ) 
+    >>> wm.shutdown ()  ## release the workers     
     """
     def __init__( self ,
                   ncpus            = 'autodetect', * , 
@@ -135,10 +177,19 @@ def __init__( self ,
                   hyper_block_size = -1          ,                                                       
                   dump_dbase       = None        ,
                   dump_jobs        = 0           ,
-                  dump_freq        = 0           ,  **kwargs ) :
+                  dump_freq        = 0           ,
+                  persistent       = False       , **kwargs ) :
 
         ## 
         if 'ppservers' in kwargs: kwargs.pop ( 'ppservers' )        
+
+        ## persistent pool of warm workers 
+        self.__persistent = True if persistent else False
+        self.__executor   = None
+        self.__imported   = set () 
+        self.__startup    = 0.0 
+        self.__saved      = 0.0
+        
         ## initialize the base class 
         TaskManager.__init__  ( self ,
                                 ncpus            = ncpus      ,
@@ -215,13 +266,13 @@ def iexecute ( self , job , jobs_args , * ,
         done   = 0
         # =====================================================================
         ## create and use executor:
-        with self.make_executor ( max_workers = self.ncpus ) as executor:
+        with self.executor_context ( modules_to_import ) as executor:
 
             # =================================================================
             try : # ===========================================================
               # =============================================================
               
-              if modules_to_import :
+              if modules_to_import and not self.persistent :
                 r = executor.map ( init_worker_modules , [ modules_to_import ] * self.ncpus ) 
                 r = list ( r ) 
                 
@@ -238,6 +289,8 @@ def iexecute ( self , job , jobs_args , * ,
             except KeyboardInterrupt : # =====================================
                 # ============================================================
                 logger.attention ( "%s only #%d jobs are processed" % ( keyboard_interrupt , done ) )
+                ## the warm pool is still busy with abandoned jobs: release it 
+                if self.persistent : self.shutdown ( wait = False , cancel = True ) 
                 # ===========================================================
                 return
                 # ============================================================ 
@@ -251,7 +304,131 @@ def iexecute ( self , job , jobs_args , * ,
     def make_executor ( self , *args , **kwargs ) :
         """ Helper method to creat ethe executor"""
         return concurrent.futures.ProcessPoolExecutor ( *args , **kwargs ) 
-                
+
+    # =========================================================================
+    ## context manager for the executor:
+    #  - for non-persistent mode the new executor is created
+    #  - for persistent mode the warm executor is (created and) reused
+    #  - for persistent mode the warm executor is released in case of exception
+    #    (or interruption), pending jobs are cancelled 
+    def executor_context ( self , imports = () ) :
+        """ Context manager for the executor:
+        - for non-persistent mode the new executor is created
+        - for persistent mode the warm executor is (created and) reused 
+        - for persistent mode the warm executor is released in case of exception
+        (or interruption), pending jobs are cancelled 
+        """
+        if not self.persistent : return self.make_executor ( max_workers = self.ncpus )
+        ## 
+        reused   = self.active 
+        executor = self.start ( imports = imports )
+        if reused : self.__saved += self.__startup
+        ## 
+        return self.__warm_context ( executor ) 
+
+    # =========================================================================
+    ## context manager for the warm executor:
+    #  release it in case of exception (or interruption)
+    @contextlib.contextmanager
+    def __warm_context ( self , executor ) :
+        """ Context manager for the warm executor:
+        release it in case of exception (or interruption)
+        """
+        try :
+            yield executor
+        except BaseException :
+            self.shutdown ( wait = False , cancel = True )
+            raise 
+    
+    # =========================================================================
+    ## Start (create and warm up) the persistent pool of workers
+    #  @code
+    #  wm = WorkManager ( persistent = True )
+    #  wm.start ( imports = [ 'ostap.trees.trees' ] ) 
+    #  @endcode
+    #  @param imports modules to be imported by all workers 
+    #  @return the executor 
+    def start ( self , imports = () ) :
+        """ Start (create and warm up) the persistent pool of workers
+        >>> wm = WorkManager ( persistent = True )
+        >>> wm.start ( imports = [ 'ostap.trees.trees' ] ) 
+        - imports : modules to be imported by all workers 
+        """
+        assert self.persistent , "start: the pool can be started only in `persistent' mode!"
+        
+        if isinstance ( imports , str ) : imports = [ imports ]
+        imports = [ m for m in imports if not m in self.__imported ] 
+
+        ## the pool is broken (e.g. the worker is killed): recreate it 
+        if self.__executor is not None and getattr ( self.__executor , '_broken' , False ) :
+            logger.warning ( 'start: persistent pool is broken, recreate it' ) 
+            self.shutdown ( wait = False , cancel = True )
+            imports = list ( imports ) + [ m for m in self.__imported if not m in imports ] 
+            
+        if self.__executor is None :
+            from timeit import default_timer as _timer
+            start = _timer() 
+            self.__executor = self.make_executor ( max_workers = self.ncpus         ,
+                                                   initializer = init_worker_modules ,
+                                                   initargs    = ( imports , )       )
+            ## warm up all workers 
+            r = list ( self.__executor.map ( _warm_up_ , range ( self.ncpus ) ) )
+            self.__startup  = _timer() - start            
+            logger.debug ( 'Persistent pool of %d workers is started in %.3gs' % ( self.ncpus , self.__startup ) ) 
+        elif imports :
+            r = list ( self.__executor.map ( init_worker_modules , [ imports ] * self.ncpus ) )
+            
+        self.__imported.update ( imports )        
+        return self.__executor 
+    
+    # =========================================================================
+    ## Shutdown the persistent pool of workers
+    #  @code
+    #  wm = WorkManager ( persistent = True )
+    #  ... 
+    #  wm.shutdown () 
+    #  @endcode
+    #  @param wait   wait for the running jobs?
+    #  @param cancel cancel the pending jobs? 
+    def shutdown ( self , wait = True , cancel = False ) :
+        """ Shutdown the persistent pool of workers
+        >>> wm = WorkManager ( persistent = True )
+        >>> ... 
+        >>> wm.shutdown () 
+        - wait   : wait for the running jobs?
+        - cancel : cancel the pending jobs? 
+        """
+        if self.__executor is not None :
+            if cancel and ( 3 , 9 ) <= python_info : self.__executor.shutdown ( wait = wait , cancel_futures = True )
+            else                                   : self.__executor.shutdown ( wait = wait )
+            logger.debug ( 'Persistent pool is shutdown, saved startup time %.3gs' % self.__saved ) 
+        self.__executor = None
+        self.__imported = set ()
+
+    close = shutdown
+    
+    @property
+    def persistent ( self ) :
+        """`persistent` : use the persistent pool of warm workers?
+        - the pool is reused across hyper-blocks and across `process` calls 
+        """
+        return self.__persistent
+    
+    @property
+    def active ( self ) :
+        """`active` : is persistent pool of workers active?"""
+        return self.__executor is not None
+    
+    @property
+    def startup_time ( self ) :
+        """`startup_time` : time needed to start and warm up the persistent pool"""
+        return self.__startup 
+
+    @property
+    def startup_saved ( self ) :
+        """`startup_saved` : total startup time saved by reusing the persistent pool of warm workers"""
+        return self.__saved 
+    
     # =========================================================================
     
     ## get PP-statistics if/when possible 
@@ -272,6 +449,7 @@ def __enter__  ( self ) :
     ## context protocol: EXIT
     def __exit__   ( self , *_ ) :        
         """ Context protocol: EXIT"""
+        self.shutdown () 
         sys.stdout .flush ()
         sys.stderr .flush ()        
 
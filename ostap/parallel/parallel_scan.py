@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file ostap/parallel/parallel_scan.py
+#  Parallel scans of NLL and profile-likelihood (1D and 2D grids)
+#  - scan points are ordered such that each minimisation starts
+#    from the solution for the neighbour point (warm start)
+#  - the ordered points are split into contiguous chunks,
+#    each chunk is processed by the separate job
+#  @see ostap.fitting.pdfbasic.APDF1.graph_nll
+#  @see ostap.fitting.pdfbasic.APDF1.graph_profile
+#  @see ostap.fitting.pdfbasic.APDF1.histo_nll
+#  @see ostap.fitting.pdfbasic.APDF1.histo_profile
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2026-10-17
+# =============================================================================
+""" Parallel scans of NLL and profile-likelihood (1D and 2D grids)
+- scan points are ordered such that each minimisation starts
+  from the solution for the neighbour point (warm start)
+- the ordered points are split into contiguous chunks,
+  each chunk is processed by the separate job
+- see `ostap.fitting.pdfbasic.APDF1.graph_nll`
+- see `ostap.fitting.pdfbasic.APDF1.graph_profile`
+- see `ostap.fitting.pdfbasic.APDF1.histo_nll`
+- see `ostap.fitting.pdfbasic.APDF1.histo_profile`
+"""
+# =============================================================================
+__author__  = 'Vanya BELYAEV  Ivan.Belyaev@itep.ru'
+__date__    = "2026-10-17"
+__version__ = '$Revision$'
+__all__     = (
+    'scan_order'    , ## order the scan points for warm starts
+    'scan_nll'      , ## sequential scan of NLL/profile-likelihood with warm starts
+    'parallel_scan' , ## parallel   scan of NLL/profile-likelihood with warm starts
+    )
+# =============================================================================
+from   ostap.parallel.parallel import Task, WorkManager
+from   ostap.utils.basic       import numcpu
+import ROOT
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'ostap.parallel.scan' )
+else                       : logger = getLogger ( __name__              )
+# =============================================================================
+## default number of jobs
+N_SPLIT = max ( 2 , 2 * numcpu () )
+# =============================================================================
+## Order the scan points for warm starts:
+#  - 1D: points are sorted
+#  - 2D: "snake"-ordering of the grid: the direction in the second
+#        variable is reversed for each next value of the first variable
+#  @code
+#  points = scan_order ( [ 3 , 1 , 2 ] )                    ## 1D
+#  points = scan_order ( [ 1 , 2 , 3 ] , [ 10 , 20 , 30 ] ) ## 2D grid
+#  @endcode
+#  @return list of tuples
+def scan_order ( values1 , values2 = None ) :
+    """ Order the scan points for warm starts:
+    - 1D: points are sorted
+    - 2D: `snake`-ordering of the grid: the direction in the second
+          variable is reversed for each next value of the first variable
+    >>> points = scan_order ( [ 3 , 1 , 2 ] )                    ## 1D
+    >>> points = scan_order ( [ 1 , 2 , 3 ] , [ 10 , 20 , 30 ] ) ## 2D grid
+    """
+    xs = sorted ( float ( v ) for v in values1 )
+    if values2 is None : return [ ( x , ) for x in xs ]
+    ys = sorted ( float ( v ) for v in values2 )
+    points = []
+    for i , x in enumerate ( xs ) :
+        for y in ( ys if 0 == i % 2 else reversed ( ys ) ) : points.append ( ( x , y ) )
+    return points
+
+# =============================================================================
+## Sequential scan of NLL/profile-likelihood with warm starts
+#  - for the profile-likelihood the scan variables (and `fix` variables) are fixed
+#    and all other parameters are minimized, starting from the solution for
+#    the previous point
+#  @code
+#  pdf     = ...
+#  results , sf = scan_nll ( pdf , dataset , [ 'S' ] , scan_order ( values ) , profile = True )
+#  @endcode
+#  @param pdf       (INPUT) the PDF
+#  @param dataset   (INPUT) the dataset
+#  @param variables (INPUT) scan variables (names or RooAbsReal)
+#  @param points    (INPUT) list of points (tuples) in the scan order
+#  @param profile   (INPUT) profile-likelihood ?
+#  @param fix       (INPUT) additional variables to be fixed for the profile-likelihood
+#  @return list of ( point , value ) pairs and the s-factor
+def scan_nll ( pdf              ,
+               dataset          ,
+               variables        ,
+               points           ,
+               profile  = False ,
+               fix      = ()    ,
+               silent   = True  ,
+               args     = ()    , **kwargs ) :
+    """ Sequential scan of NLL/profile-likelihood with warm starts
+    - for the profile-likelihood the scan variables (and `fix` variables) are fixed
+      and all other parameters are minimized, starting from the solution for
+      the previous point
+    >>> pdf     = ...
+    >>> results , sf = scan_nll ( pdf , dataset , [ 'S' ] , scan_order ( values ) , profile = True )
+    """
+    from ostap.fitting.fithelpers import SETPARS
+    from ostap.fitting.variables  import SETVAR, FIXVAR
+    from ostap.fitting.utils      import RangeVar
+    from ostap.core.core          import roo_silent
+    from ostap.utils.basic        import NoContext
+    from ostap.utils.progress_bar import progress_bar
+
+    ## 1) create NLL
+    nLL , sf = pdf.nll ( dataset , silent = True , args = args , **kwargs )
+
+    ## 2) get the variables
+    pars  = pdf.params ( dataset )
+    vars  = [ v if isinstance ( v , ROOT.RooAbsReal ) else pars [ v ] for v in variables ]
+    fixed = [ v if isinstance ( v , ROOT.RooAbsReal ) else pars [ v ] for v in fix       ]
+    del pars
+
+    ## 3) extend the ranges (if needed) for profile-likelihood
+    ranges = []
+    if profile :
+        for i , v in enumerate ( vars ) :
+            if not v.minmax () : continue
+            vals = [ p [ i ] for p in points ]
+            ranges.append ( RangeVar ( v , min ( v.getMin () , min ( vals ) ) , max ( v.getMax () , max ( vals ) ) ) )
+
+    ## 4) minimizer for profile-likelihood
+    if profile :
+        minimizer = ROOT.RooMinimizer ( nLL )
+        minimizer.setPrintLevel ( -1 )
+        minimizer.setStrategy   (  1 )
+        fixvars   = FIXVAR ( vars + fixed )
+    else :
+        minimizer = None
+        fixvars   = NoContext ()
+
+    ## 5) collect the values
+    results = []
+    with SETPARS ( pdf , dataset ) , SETVAR ( *vars ) :
+        for r in ranges : r.__enter__ ()
+        try :
+            with fixvars , roo_silent ( silent ) :
+                for point in progress_bar ( points , silent = silent , description = 'Points:' ) :
+                    for v , x in zip ( vars , point ) : v.setVal ( x )
+                    ## warm start: the parameters are from the previous point
+                    if minimizer : minimizer.migrad ()
+                    results.append ( ( tuple ( point ) , nLL.getVal () ) )
+        finally :
+            for r in reversed ( ranges ) : r.__exit__ ()
+
+    return results , sf
+
+# =============================================================================
+## The task object for parallel scans of NLL/profile-likelihood
+#  @see ostap.parallel.parallel_scan.scan_nll
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2026-10-17
+class ScanTask(Task) :
+    """ The task object for parallel scans of NLL/profile-likelihood
+    - see `ostap.parallel.parallel_scan.scan_nll`
+    """
+    def __init__ ( self             ,
+                   pdf              ,
+                   dataset          ,
+                   variables        ,
+                   profile  = False ,
+                   fix      = ()    ,
+                   args     = ()    ,
+                   config   = {}    ) :
+
+        self.pdf        = pdf
+        self.dataset    = dataset
+        self.variables  = tuple ( variables )
+        self.profile    = profile
+        self.fix        = tuple ( fix )
+        self.args       = args
+        self.config     = config
+        self.__output   = [] , 1.0
+
+    ## initialize the local task, setup/reset initial result
+    def initialize_local ( self ) : self.__output = [] , 1.0
+
+    ## the actual processing of the chunk of points
+    def process ( self , jobid , points ) :
+        """ The actual processing of the chunk of points
+        """
+        import ROOT
+        from ostap.logger.logger import logWarning
+        with logWarning() :
+            import ostap.core.pyrouts
+            import ostap.fitting.roofit
+            import ostap.fitting.dataset
+            import ostap.fitting.variables
+
+        return scan_nll ( self.pdf                   ,
+                          self.dataset               ,
+                          self.variables             ,
+                          points                     ,
+                          profile = self.profile     ,
+                          fix     = self.fix         ,
+                          silent  = True             ,
+                          args    = self.args        , **self.config )
+
+    ## merge results
+    def merge_results ( self , result , jobid = -1 ) :
+        """ Merge results
+        """
+        if not result :
+            logger.error ( "No valid results for merging" )
+            return
+        points , sf = result
+        merged , _  = self.__output
+        merged += points
+        self.__output = merged , sf
+
+    ## get the results
+    def results ( self ) : return self.__output
+
+# =============================================================================
+## Parallel scan of NLL/profile-likelihood with warm starts
+#  - scan points are ordered for warm starts and split into contiguous chunks
+#  - each chunk is processed by the separate job via <code>WorkManager</code>
+#  @code
+#  pdf     = ...
+#  results , sf = parallel_scan ( pdf , dataset , [ 'S' ] , scan_order ( values ) , profile = True )
+#  @endcode
+#  @param pdf       (INPUT) the PDF
+#  @param dataset   (INPUT) the dataset
+#  @param variables (INPUT) scan variables (names)
+#  @param points    (INPUT) list of points (tuples) in the scan order
+#  @param profile   (INPUT) profile-likelihood ?
+#  @param fix       (INPUT) additional variables to be fixed for the profile-likelihood
+#  @param nSplit    (INPUT) number of chunks
+#  @return list of ( point , value ) pairs (in the original order) and the s-factor
+def parallel_scan ( pdf               ,
+                    dataset           ,
+                    variables         ,
+                    points            , * ,
+                    profile  = False   ,
+                    fix      = ()      ,
+                    nSplit   = N_SPLIT ,
+                    silent   = True    ,
+                    progress = True    ,
+                    args     = ()      ,
+                    config   = {}      , **kwargs ) :
+    """ Parallel scan of NLL/profile-likelihood with warm starts
+    - scan points are ordered for warm starts and split into contiguous chunks
+    - each chunk is processed by the separate job via `WorkManager`
+    >>> pdf     = ...
+    >>> results , sf = parallel_scan ( pdf , dataset , [ 'S' ] , scan_order ( values ) , profile = True )
+    """
+    ## variables are transferred by names
+    variables = tuple ( v.name if isinstance ( v , ROOT.RooAbsReal ) else v for v in variables )
+    fix       = tuple ( v.name if isinstance ( v , ROOT.RooAbsReal ) else v for v in fix       )
+
+    points    = [ tuple ( p ) for p in points ]
+    nSplit    = nSplit if isinstance ( nSplit , int ) and 1 <= nSplit else N_SPLIT
+    nSplit    = min ( nSplit , len ( points ) )
+
+    if nSplit < 2 or numcpu () <= 1 :
+        if 1 < nSplit : logger.warning ( "Not enough CPUs for parallelisation" )
+        return scan_nll ( pdf , dataset , variables , points ,
+                          profile = profile , fix = fix , silent = silent , args = args , **config )
+
+    ## contiguous chunks of ordered points
+    from ostap.utils.utils import split_n_range
+    chunks = tuple ( points [ i : j ] for i , j in split_n_range ( 0 , len ( points ) , nSplit ) )
+
+    ## create the task
+    task = ScanTask ( pdf , dataset , variables , profile = profile , fix = fix , args = args , config = config )
+
+    ## create the manager
+    wmgr = WorkManager ( silent = silent and not progress , progress = progress or not silent , **kwargs )
+
+    ## start parallel processing!
+    wmgr.process ( task , chunks )
+
+    results , sf = task.results ()
+
+    ## restore the original order
+    order   = dict ( ( p , i ) for i , p in enumerate ( points ) )
+    results.sort ( key = lambda r : order.get ( r [ 0 ] , len ( order ) ) )
+
+    return results , sf
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+# =============================================================================
+##                                                                      The END
+# =============================================================================
@@ -15,6 +15,7 @@
 __all__     = (
     'parallel_statistic'  ,
     'parallel_get_stat'   ,
+    'parallel_stat_plan'  ,
     'parallel_project'    , 
     'parallel_size'       ,
     'parallel_covariance' ,
@@ -62,6 +63,8 @@ def __init__ ( self , what , cuts = "" , **kwargs ) :
         self.kwargs = {}
         self.kwargs.update ( kwargs )        
         self.__output = None
+        ## cache the task in the persistent (warm) workers 
+        self.cache_remote = True 
         
     ## local initialization (executed once in parent process)
     def initialize_local   ( self ) :
@@ -69,17 +72,21 @@ def initialize_local   ( self ) :
         """
         self.__output = None
 
-    # =============================================================
-    ## the actual processing
-    def process ( self , jobid , item ) :
-        """ The actual processing
+    ## one-time initialization in the worker 
+    def initialize_worker  ( self ) :
+        """ One-time initialization in the worker
         """
         from ostap.logger.utils import logWarning
         with logWarning() :
             import ROOT
             import ostap.core.pyrouts 
             import ostap.trees.trees
-            
+
+    # =============================================================
+    ## the actual processing
+    def process ( self , jobid , item ) :
+        """ The actual processing
+        """
         chain = item.chain 
         first = item.first
         last  = item.last  
@@ -106,14 +113,45 @@ def merge_results ( self , result , jobid = -1 ) :
             assert type ( self.__output ) == type ( result ) , 'Invalid types for merging!'
             if isinstance ( self.__output , dictlike_types ) :
                 for key in result : 
-                    if    key in self.output : self.__output [ key ] += result [ key ]
-                    else                     : self.__output [ key ]  = result [ key ] 
+                    if    key in self.__output : self.__output [ key ] += result [ key ]
+                    else                       : self.__output [ key ]  = result [ key ] 
             else :
                 self.__output += result
                 
     ## get the results 
     def results ( self ) : return self.__output 
 
+# ================================================================================
+## The task object to fill the "statistics plan" for loooooong chains
+#  - the plan is a dictionary { key : ( statobj , expression [, cuts ] ) }
+#  - the results are merged as for <code>StatVarTask</code> 
+#  @see ostap.stats.statvars.data_stat_plan
+class StatPlanTask(StatVarTask) :
+    """ The task object to fill the "statistics plan" for loooooong chains
+    - the plan is a dictionary { key : ( statobj , expression [, cuts ] ) }
+    - the results are merged as for `StatVarTask`
+    - see `ostap.stats.statvars.data_stat_plan`
+    """
+    # =============================================================
+    ## the actual processing
+    def process ( self , jobid , item ) :
+        """ The actual processing
+        """
+        chain = item.chain 
+        first = item.first
+        last  = item.last  
+        
+        from   ostap.stats.statvars import data_stat_plan
+        result = data_stat_plan ( chain             ,
+                                  self.what         ,
+                                  cuts  = self.cuts ,
+                                  first = first     ,
+                                  last  = last      ,
+                                  **self.kwargs     )
+        ## the counters of the plan are reset and refilled in place for each job:
+        #  return their copies (several jobs can be processed by the same task object)
+        return dict ( ( key , type ( statobj ) ( statobj ) ) for key , statobj in result.items () ) 
+    
 # ================================================================================
 ## The simple task object collect statistics for loooooong chains 
 #  @see GaudiMP.Parallel
@@ -132,11 +170,13 @@ def __init__ ( self             ,
         >>> task  = StatVarTask ( 'mass' , 'pt>0') 
         """
         self.what   = expressions
-        self.cuts   = "" 
+        self.cuts   = cuts 
         self.kwargs = {}
         self.kwargs.update ( kwargs )
         self.__target = target
         self.__output = None 
+        ## cache the task in the persistent (warm) workers 
+        self.cache_remote = True 
 
     # =============================================================
     ## the actual processing
@@ -157,11 +197,7 @@ def process ( self , jobid , item ) :
         - the first entry in tree to process
         - number of entries to process
         """
-        from ostap.logger.utils import logWarning
-        with logWarning() :
-            from   ostap.stats.statvars import data_get_stat, target_copy, target_reset 
-            import ostap.trees.trees
-            import ROOT
+        from   ostap.stats.statvars import data_get_stat, target_copy, target_reset 
             
         chain = item.chain 
         first = item.first
@@ -180,6 +216,22 @@ def process ( self , jobid , item ) :
                                         last  = last      , **self.kwargs )
         return self.__output 
     
+    ## local initialization (executed once in parent process)
+    def initialize_local   ( self ) :
+        """ Local initialization (executed once in parent process)
+        """
+        self.__output = None
+
+    ## one-time initialization in the worker 
+    def initialize_worker  ( self ) :
+        """ One-time initialization in the worker
+        """
+        from ostap.logger.utils import logWarning
+        with logWarning() :
+            import ROOT
+            import ostap.stats.statvars
+            import ostap.trees.trees
+
     ## merge results 
     def merge_results ( self , result , jobid = -1 ) :        
         if not self.__output : self.__output  = result
@@ -212,6 +264,8 @@ def __init__ ( self             ,
         self.kwargs.update ( kwargs )
         self.__target = target
         self.__output = None 
+        ## cache the task in the persistent (warm) workers 
+        self.cache_remote = True 
 
     # =============================================================
     ## the actual processing
@@ -232,10 +286,7 @@ def process ( self , jobid , item ) :
         - the first entry in tree to process
         - number of entries to process
         """
-        from ostap.logger.utils import logWarning
-        with logWarning() :
-            from   ostap.stats.statvars import data_project, target_copy, targer_reset
-            import ostap.trees.trees
+        from   ostap.stats.statvars import data_project, target_copy, target_reset
             
         chain = item.chain 
         first = item.first
@@ -255,6 +306,22 @@ def process ( self , jobid , item ) :
                                        **self.kwargs )
         return self.__output 
     
+    ## local initialization (executed once in parent process)
+    def initialize_local   ( self ) :
+        """ Local initialization (executed once in parent process)
+        """
+        self.__output = None
+
+    ## one-time initialization in the worker 
+    def initialize_worker  ( self ) :
+        """ One-time initialization in the worker
+        """
+        from ostap.logger.utils import logWarning
+        with logWarning() :
+            import ROOT
+            import ostap.stats.statvars
+            import ostap.trees.trees
+
     ## merge results 
     def merge_results ( self , result , jobid = -1 ) :        
         if not self.__output : self.__output  = result
@@ -319,6 +386,12 @@ def process ( self , jobid , item ) :
                                     last  = last      , **self.kwargs )
         return self.__output 
     
+    ## local initialization (executed once in parent process)
+    def initialize_local   ( self ) :
+        """ Local initialization (executed once in parent process)
+        """
+        self.__output = 0
+
     ## merge results 
     def merge_results ( self , result , jobid = -1 ) :        
         if not self.__output : self.__output  = result
@@ -385,6 +458,12 @@ def process ( self , jobid , item ) :
                                            last  = last      , **self.kwargs )
         return self.__output 
     
+    ## local initialization (executed once in parent process)
+    def initialize_local   ( self ) :
+        """ Local initialization (executed once in parent process)
+        """
+        self.__output = None
+
     ## merge results 
     def merge_results ( self , result , jobid = -1 ) :        
         if not self.__output : self.__output  = result
@@ -452,6 +531,12 @@ def process ( self , jobid , item ) :
                                      last  = last      , **self.kwargs ) 
         return self.__output 
     
+    ## local initialization (executed once in parent process)
+    def initialize_local   ( self ) :
+        """ Local initialization (executed once in parent process)
+        """
+        self.__output = None
+
     ## merge results 
     def merge_results ( self , result , jobid = -1 ) :        
         if not self.__output : 
@@ -546,6 +631,12 @@ def process ( self , jobid , item ) :
                                           last  = last      , **self.kwargs ) 
         return self.__output 
     
+    ## local initialization (executed once in parent process)
+    def initialize_local   ( self ) :
+        """ Local initialization (executed once in parent process)
+        """
+        self.__output = ()
+
     ## merge results 
     def merge_results ( self , result , jobid = -1 ) :        
         if not self.__output : 
@@ -581,10 +672,16 @@ def parallel_statistic ( chain                    ,
                          progress   = False       ,
                          chunk_size = CHUNK_SIZE  ,
                          max_files  = MAX_FILES   ,
+                         merge_arity = 0          , 
+                         balanced   = True        , 
+                         resume     = False       , 
                          silent     = True        , **kwargs ) :
     """ Parallel processing of loooong chain/tree 
     >>> chain    = ...
     >>> chain.pstatVar( 'mass' , 'pt>1') 
+    - merge_arity : arity of the tree-reduction merge of results in workers (0: no tree-reduction)
+    - balanced    : use cluster-aligned, byte-balanced chunks? see `ostap.trees.utils.balanced_ranges` 
+    - resume      : resume from the checkpoint in `dump_dbase`? (only missing chunks are processed)
     """
     ## few special/trivial cases
 
@@ -614,16 +711,20 @@ def parallel_statistic ( chain                    ,
                            progress  = False      ,
                            use_frame = use_frame  , 
                            parallel   = False     ) 
-
+    task.merge_arity = merge_arity 
+    
     ## Manager 
     wmgr   = WorkManager ( silent = silent , progress = progress or not silent , **kwargs )
 
     ## split data 
     from ostap.trees.utils   import Chain
     ch     = Chain    ( chain , first = first   , last = last )
-    trees  = ch.split ( chunk_size = chunk_size , max_files = max_files )
+    trees  = ch.split ( chunk_size = chunk_size ,
+                        max_files  = max_files  ,
+                        balanced   = balanced   ,
+                        branches   = ( expressions , cuts ) )
 
-    wmgr.process ( task , trees )
+    wmgr.process ( task , trees , resume = resume )
 
     del trees
     del ch    
@@ -756,13 +857,14 @@ def parallel_get_stat ( chain                    ,
     """ Parallel processing of loooong chain/tree 
     >>> chain    = ...
     >>> chain.pstatVar( 'mass' , 'pt>1') 
+    - target counter must be mergeable via `+=`, e.g. `Ostap.Math.TDigest` for quantiles
     """
     ## few special/trivial cases
 
     import ostap.trees.trees
     from   ostap.stats.statvars import data_get_stat 
 
-    first , last = evt_range ( chain , *args[:2]  )
+    first , last = evt_range ( chain , first , last )
     
     nevents = last - first 
     
@@ -770,7 +872,7 @@ def parallel_get_stat ( chain                    ,
         return data_get_stat  ( chain       ,
                                 target      , 
                                 expressions ,
-                                cust        = cuts      ,
+                                cuts        = cuts      ,
                                 first       = first     ,
                                 last        = last      , 
                                 progress    = progress  ,
@@ -802,6 +904,72 @@ def parallel_get_stat ( chain                    ,
     
     return results 
 
+# ===================================================================================
+## parallel processing of the "statistics plan" for loooong chain/tree 
+#  @see ostap.stats.statvars.data_stat_plan
+def parallel_stat_plan ( chain                    ,
+                         plan                     , 
+                         cuts       = ''          , * ,
+                         first      = FIRST_ENTRY ,
+                         last       =  LAST_ENTRY ,                                                                  
+                         progress   = False       ,
+                         use_frame  = True        , 
+                         chunk_size = CHUNK_SIZE  ,
+                         max_files  = MAX_FILES   ,
+                         merge_arity = 0          , 
+                         resume     = False       , 
+                         silent     = True        ,  **kwargs ) :
+    """ Parallel processing of the "statistics plan" for loooong chain/tree 
+    >>> chain  = ...
+    >>> plan   = { 'hmean' : ( Ostap.Math.HarmonicMean() , 'pt' ) , 'min' : ( Ostap.Math.MinValue() , 'pt' , 'y>2' ) }
+    >>> result = parallel_stat_plan ( chain , plan , 'eta>2' )
+    - all counters must be mergeable via `+=`
+    - see `ostap.stats.statvars.data_stat_plan`
+    """
+    ## few special/trivial cases
+
+    import ostap.trees.trees
+    from   ostap.stats.statvars import data_stat_plan 
+
+    first , last = evt_range ( chain , first , last )
+    
+    nevents = last - first 
+    
+    if nevents <= chunk_size :
+        return data_stat_plan ( chain       ,
+                                plan        , 
+                                cuts        = cuts      ,
+                                first       = first     ,
+                                last        = last      , 
+                                progress    = progress  ,
+                                use_frame   = use_frame ,
+                                parallel    = False     )
+    
+    ## The Task
+    task   = StatPlanTask ( plan                  ,
+                            cuts      = cuts      , 
+                            progress  = False     ,
+                            use_frame = use_frame ,
+                            parallel  = False     ) 
+    task.merge_arity = merge_arity 
+
+    ## Manager 
+    wmgr   = WorkManager ( silent = silent , progress = progress or not silent , **kwargs )
+
+    ## split data 
+    from ostap.trees.utils import Chain
+    ch     = Chain    ( chain , first = first , last = last  )
+    trees  = ch.split ( chunk_size = chunk_size , max_files = max_files )
+
+    wmgr.process ( task , trees , resume = resume )
+
+    del trees
+    del ch    
+
+    results = task.results()
+    
+    return results 
+
 # ===================================================================================
 ## parallel processing of loooong chain/tree 
 def parallel_project ( chain                    ,
@@ -815,10 +983,14 @@ def parallel_project ( chain                    ,
                        use_frame  = False       , 
                        chunk_size = 100000      ,
                        max_files  = 1           ,
+                       merge_arity = 0          , 
+                       balanced   = True        , 
                        silent     = True        , **kwargs ) :
     """ Parallel processing of loooong chain/tree 
     >>> chain    = ...
     >>> chain.pstatVar( 'mass' , 'pt>1') 
+    - merge_arity : arity of the tree-reduction merge of results in workers (0: no tree-reduction)
+    - balanced    : use cluster-aligned, byte-balanced chunks? see `ostap.trees.utils.balanced_ranges` 
     """
     ## few special/trivial cases
     
@@ -862,6 +1034,7 @@ def parallel_project ( chain                    ,
                            progress  = False      ,
                            use_frame = use_frame  ,
                            parallel  = False      ) 
+    task.merge_arity = merge_arity 
 
     ## Manager 
     wmgr   = WorkManager ( silent = silent , progress = progress or not silent , **kwargs )
@@ -869,7 +1042,10 @@ def parallel_project ( chain                    ,
     ## split data 
     from ostap.trees.utils import Chain
     ch     = Chain ( chain , first = first , last = last  )    
-    trees  = ch.split ( chunk_size = chunk_size , max_files = max_files )
+    trees  = ch.split ( chunk_size = chunk_size ,
+                        max_files  = max_files  ,
+                        balanced   = balanced   ,
+                        branches   = ( expressions , cuts ) )
     
     wmgr.process ( task , trees )
 
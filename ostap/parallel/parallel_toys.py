@@ -54,10 +54,13 @@ def merge_toys ( previous , result , jobid = -1 ) :
     results  , stat  = result    
     results_ , stat_ = previous 
     
-    rset = set ()
-    for p in results  : rset.add ( p )
-    for p in results_ : rset.add ( p )                
-    for p in rset     : results_ [ p ] += results [ p ]
+    from ostap.fitting.toyresults import ToyResults
+    if isinstance ( results_ , ToyResults ) : results_.merge ( results ) 
+    else :
+        rset = set ()
+        for p in results  : rset.add ( p )
+        for p in results_ : rset.add ( p )                
+        for p in rset     : results_ [ p ] += results [ p ]
     
     sset = set ()
     for p in stat     : sset.add ( p )
@@ -597,6 +600,7 @@ def process ( self , jobid , size  ) :
 # @param fit_fun     fitting   function
 # @param accept_fun  accept    function
 # @param silent      silent toys?
+# @param resume      resume from the checkpoint in <code>dump_dbase</code>?
 # @return dictionary with fit results for the toys and the dictionary of statistics
 #
 #  - If <code>gen_fun</code>    is not specified <code>generate_data</code> is used 
@@ -618,6 +622,7 @@ def parallel_toys (
         silent      = True    ,
         progress    = True    ,
         frequency   = 0       ,
+        resume      = False   ,     ## resume from the checkpoint in `dump_dbase`?
         logger      = logger  , **kwargs ):
     """ Make `ntoys` pseudoexperiments, splitting them into `nSplit` subjobs
     to be executed in parallel
@@ -653,6 +658,7 @@ def parallel_toys (
     - `accept_fun`   : accept    function ( fit-result, pdf, dataset     )
     - `silent`       : silent toys?
     - `progress`     : show progress bar? 
+    - `resume`       : resume from the checkpoint in `dump_dbase`? (only missing subjobs are processed)
     
     It returns a dictionary with fit results for the toys and a dictionary of statistics
     
@@ -742,7 +748,7 @@ def parallel_toys (
     params = tuple ( i[1]-i[0] for i in split_n_range ( 0 , nToys , nSplit ) )
     
     ## start parallel processing! 
-    wmgr.process( task , params )
+    wmgr.process( task , params , resume = resume )
 
     results , stats = task.results () 
     if progress or not silent : Toys.print_stats ( stats , nToys ) 
@@ -813,6 +819,7 @@ def parallel_toys (
 # @param fit_fun     fitting   function
 # @param accept_fun  accept    function
 # @param silent      silent toys?
+# @param resume      resume from the checkpoint in <code>dump_dbase</code>?
 # @return dictionary with fit results for the toys and the dictionary of statistics
 #
 #  - If <code>gen_fun</code>    is not specified <code>generate_data</code> is used 
@@ -836,6 +843,7 @@ def parallel_toys2 (
         silent     = True     ,
         progress   = True     ,
         frequency  = 0        ,
+        resume     = False    ,     ## resume from the checkpoint in `dump_dbase`?
         logger     = logger   , **kwargs ) :
     """ Make `nToys` pseudoexperiments, splitting them into `nSplit` subjobs
     to be executed in parallel
@@ -872,6 +880,7 @@ def parallel_toys2 (
     - `accept_fun`  : accept    function ( fit-result, pdf, dataset     )
     - `silent`      : silent toys?
     - `progress`    : show progress bar? 
+    - `resume`      : resume from the checkpoint in `dump_dbase`? (only missing subjobs are processed)
     
     It returns a dictionary with fit results for the toys and a dictionary of statistics
     
@@ -964,7 +973,7 @@ def parallel_toys2 (
     params = tuple ( i[1]-i[0] for i in split_n_range ( 0 , nToys , nSplit ) )
 
     ## start parallel processing! 
-    wmgr.process( task , params  )
+    wmgr.process( task , params , resume = resume )
 
     ## get results from the task
     results , stats = task.results () 
@@ -1037,6 +1046,7 @@ def parallel_toys2 (
 # @param fit_fun     fitting   function
 # @param accept_fun  accept    function
 # @param silent      silent toys?
+# @param resume      resume from the checkpoint in <code>dump_dbase</code>?
 # @return dictionary with fit results for the toys and the dictionary of statistics
 #
 #  - If <code>gen_fun</code>    is not specified <code>generate_data</code> is used 
@@ -1059,6 +1069,7 @@ def parallel_toys3 (
         silent      = True    ,
         progress    = True    ,
         frequency   = 0       ,
+        resume      = False   ,     ## resume from the checkpoint in `dump_dbase`?
         logger      = logger  , **kwargs ) :
     """ Make `nToys` pseudoexperiments, splitting them into `nSplit` subjobs
     to be executed in parallel
@@ -1097,6 +1108,7 @@ def parallel_toys3 (
     - `accept_fun`  : accept    function ( fit-result, pdf, dataset     )
     - `silent`      : silent toys?
     - `progress`    : show progress bar? 
+    - `resume`      : resume from the checkpoint in `dump_dbase`? (only missing subjobs are processed)
     
     It returns a dictionary with fit results for the toys and a dictionary of statistics
     
@@ -1184,7 +1196,7 @@ def parallel_toys3 (
     params = tuple ( i[1]-i[0] for i in split_n_range ( 0 , nToys , nSplit ) )
 
     ## start parallel processing! 
-    wmgr.process( task , params  )
+    wmgr.process( task , params , resume = resume )
 
     ## get results from the task
     results , stats = task.results () 
@@ -42,6 +42,9 @@
     'StatMerger'    , ## helper class to merge   statistics
     'TaskMerger'    , ## simple merger for task results
     'task_executor' , ## helper function to execute Task  
+    'warm_task_executor' , ## helper function to execute Task in persistent (warm) workers 
+    'reduce_task_executor' , ## helper function to execute and pre-merge the group of jobs 
+    'merge_task_executor'  , ## helper function to merge the results in workers 
     'func_executor' , ## helper function to execute callable
     )
 # =============================================================================
@@ -87,6 +90,7 @@ class ManagerBase(object)  :
 #  that is going to be porcessed in parallel.
 #  User class much inherit from it and implement the methods:
 #  - <code>initialize_local</code>
+#  - <code>initialize_worker</code> (optional)
 #  - <code>initialize_remote</code>
 #  - <code>process</code>
 #  - <code>finalize</code>
@@ -103,6 +107,7 @@ class Task(TaskBase) :
     going to be processed in parallel.
     User class must inherit from it and implement the methods
     - initialize_local
+    - initialize_worker (optional) 
     - initialize_remote
     - process
     - finalize.
@@ -135,6 +140,9 @@ def __new__( cls , *args , **kwargs):
         obj.__implicitMT_set = False 
         ## 
         obj.__cleanup        = True
+        ##
+        obj.__cache_remote   = False 
+        obj.__merge_arity    = 0 
         ## 
         return obj
 
@@ -144,6 +152,21 @@ def initialize_local  ( self )          :
         """ Local initialization:  invoked once on localhost for the main task"""
         pass
     
+    # =========================================================================
+    ## One-time (job-independent) initialization on remote host
+    #  - for tasks with <code>cache_remote=True</code> it is invoked only once
+    #    per persistent (warm) worker and per <code>process</code> call
+    #  - otherwise it is invoked for each secondary task, before <code>initialize_remote</code>
+    #  @see Task.cache_remote 
+    def initialize_worker ( self ) :
+        """ One-time (job-independent) initialization on remote host
+        - for tasks with `cache_remote=True` it is invoked only once
+        per persistent (warm) worker and per `process` call
+        - otherwise it is invoked for each secondary task, before `initialize_remote`
+        - see Task.cache_remote 
+        """
+        pass 
+    
     # =========================================================================
     ## Remote initialization: invoked for each secondary task on remote host
     def initialize_remote ( self , jobid = -1 )  :
@@ -298,6 +321,36 @@ def cleanup ( self ) :
     @cleanup.setter
     def cleanup ( self , value ) :
         self.__cleanup     = True if value else False
+
+    # =========================================================================
+    ## cache the remotely initialized task in the persistent (warm) workers?
+    #  - <code>initialize_worker</code> is invoked only once per worker and per <code>process</code> call
+    #  - <code>initialize_remote</code> is invoked for each job 
+    @property
+    def cache_remote ( self ) :
+        """`cache_remote' : cache the remotely initialized task in the persistent (warm) workers?
+        - `initialize_worker` is invoked only once per worker and per `process` call
+        - `initialize_remote` is invoked for each job 
+        """
+        return self.__cache_remote
+    @cache_remote.setter
+    def cache_remote ( self , value ) :
+        self.__cache_remote = True if value else False
+
+    # =========================================================================
+    ## arity of the tree-reduction merge of results in workers (0 or 1 : no tree-reduction)
+    @property
+    def merge_arity ( self ) :
+        """`merge_arity' : arity of the tree-reduction merge of results in workers (0 or 1 : no tree-reduction)
+        - each worker processes `merge_arity` sibling jobs and pre-merges their results
+        - the pre-merged results are merged by master one-by-one, as they arrive 
+        - `initialize_local` must reset the merged output 
+        """
+        return self.__merge_arity
+    @merge_arity.setter
+    def merge_arity ( self , value ) :
+        assert isinstance ( value , int ) and 0 <= value , "Invalid `merge_arity': %s" % value 
+        self.__merge_arity = value 
         
 # =============================================================================
 ## @class GenericTask
@@ -512,8 +565,10 @@ def __init__ ( self , host = None ) :
         else :
             self.__host = host 
         self.__start = time.time ( )
-        self.time  = 0.0
-        self.njobs = 0
+        self.time    = 0.0
+        self.njobs   = 0
+        self.saved   = 0.0 ## startup/initialization time, saved by the warm workers 
+        self.nmerged = 0   ## number of results merged in the worker 
         
     def stop ( self ) :
         import time
@@ -556,6 +611,8 @@ def __iadd__ ( self , stat ) :
         se  = self.__merged [ stat.host ]
         se.time  += stat.time
         se.njobs += stat.njobs 
+        se.saved   += getattr ( stat , 'saved'   , 0.0 ) 
+        se.nmerged += getattr ( stat , 'nmerged' , 0   ) 
         
         return self
 
@@ -581,16 +638,25 @@ def merged ( self ) :
         """`merged' : get the full merged statistic"""
         return self.__merged 
 
+    @property
+    def saved ( self ) :
+        """`saved' : total startup/initialization time saved by the warm workers"""
+        return sum ( s.saved for s in self.__merged.values() ) 
+
     # =========================================================================
     ## Print the job execution statistics
     #  @code 
     #  merged = ...
     #  merged.print_stat ()
     #  @endcode 
-    def print_stats ( self , prefix = '' , cputime = None ) :
+    #  @param prefix  prefix for the title 
+    #  @param cputime total wall-clock time of processing 
+    #  @param saved   additional startup time saved by the persistent pool 
+    def print_stats ( self , prefix = '' , cputime = None , saved = 0.0 ) :
         """ Print job execution sstatistics
         >>> merged = ...
         >>> merged.print_stats () 
+        - saved : additional startup time saved by the persistent pool 
         """
         suffix = ''
 
@@ -629,6 +695,9 @@ def print_stats ( self , prefix = '' , cputime = None ) :
                 gain = float ( sumtime ) / cputime
                 suffix += ' (Gain: %.1f)'   % gain
 
+        ## startup/initialization time, saved by the warm workers 
+        saved = self.saved + ( saved if saved and 0 < saved else 0.0 )
+        if 0 < saved : suffix += ' (Saved startup: %.3gs)' % saved 
                 
         title = prefix + 'Job execution statistics' + suffix
         logger.info ( title + "\n%s" % self.table ( title = title , prefix = "# " ) )
@@ -640,6 +709,10 @@ def table  ( self , title = 'Jobs execution statistics' , prefix = '' ) :
         
         njobs = self.njobs        
         keys  = self.__merged.keys()
+
+        ## results are merged in workers? 
+        merged = 0 < self.nmerged 
+        if merged : text [ 0 ] = text [ 0 ] [ :-1 ] + ( '#merged' , ) + text [ 0 ] [ -1: ]
         
         for host in sorted ( keys ) :
             se   = self.__merged [ host ]
@@ -657,6 +730,8 @@ def table  ( self , title = 'Jobs execution statistics' , prefix = '' ) :
             else :
                 line = "%6d "% nj , '', '' , '' , " %-s" % host
 
+            if merged : line = line [ :-1 ] + ( " %6d " % se.nmerged , ) + line [ -1: ]
+            
             text.append ( line )
             
         import ostap.logger.table as T
@@ -670,6 +745,11 @@ def __str__  ( self ) :
     def njobs ( self ) :
         """`njobs' : total number of jobs"""
         return sum ( s.njobs for s in self.__merged.values() ) 
+
+    @property 
+    def nmerged ( self ) :
+        """`nmerged' : total number of results, merged in workers"""
+        return sum ( s.nmerged for s in self.__merged.values() ) 
     
     __repr__ = __str__
 
@@ -776,12 +856,47 @@ def task_executor ( item ) :
     use python decorators here :-(
     - see Task 
     """
-
     ## unpack
     task  = item [ 0  ]
     jobid = item [ 1  ] 
     args  = item [ 2: ] 
+    ## 
+    return _execute_task_ ( task , jobid , args ) 
+
+# =============================================================================
+## Remotely initialized tasks, cached in the persistent (warm) worker
+#  @see warm_task_executor
+_remote_tasks = {}
+# =============================================================================
+## helper function to execute the task in the persistent (warm) worker 
+#  - for tasks with <code>cache_remote=True</code>, <code>initialize_worker</code>
+#    is invoked only once per worker for the given task key
+#  @see task_executor 
+#  @see Task.cache_remote 
+def warm_task_executor ( item ) :
+    """ Helper function to execute the task in the persistent (warm) worker 
+    - for tasks with `cache_remote=True`, `initialize_worker` is invoked 
+    only once per worker for the given task key 
+    - see task_executor 
+    - see Task.cache_remote 
+    """
+    ## unpack
+    key   = item [ 0  ]
+    task  = item [ 1  ]
+    jobid = item [ 2  ] 
+    args  = item [ 3: ] 
+    ## 
+    return _execute_task_ ( task , jobid , args , cache_key = key if task.cache_remote else None ) 
 
+# =============================================================================
+## the actual execution of the task
+#  @see task_executor
+#  @see warm_task_executor
+def _execute_task_ ( task , jobid , args , cache_key = None ) :
+    """ The actual execution of the task
+    - see task_executor
+    - see warm_task_executor
+    """
     import os, re, sys  
 
     what      =  r'(?<!\\)\$[A-Za-z_][A-Za-z0-9_]*' 
@@ -841,10 +956,26 @@ def task_executor ( item ) :
     cleanup_context    = CleanUpPID () 
     
     ## use clean, build & batch context 
-    with cleanup_context , implicitMT_context , build_context , batch_context :         
-        ## perform remote  initialization (if needed) 
-        task.initialize_remote ( jobid )         
+    with cleanup_context , implicitMT_context , build_context , batch_context :
+
+        saved = 0.0
+        if cache_key is None : task.initialize_worker ()
+        elif cache_key in _remote_tasks :
+            ## use the cached task, initialized in this worker 
+            task , saved = _remote_tasks [ cache_key ]
+        else :
+            ## perform one-time initialization and cache the task 
+            from timeit import default_timer as _timer
+            start = _timer () 
+            task.initialize_worker ()
+            _remote_tasks.clear ()
+            _remote_tasks [ cache_key ] = task , _timer () - start 
+
+        ## per-job initialization (e.g. seeding, reset of the output) 
+        task.initialize_remote ( jobid )
+            
         with Statistics ()  as stat :
+            stat.saved = saved 
             # ================================================================
             signal_sigint () 
             # ================================================================
@@ -860,6 +991,65 @@ def task_executor ( item ) :
         
             return jobid , result , stat
         
+# =============================================================================
+## helper function to execute the group of sibling jobs and pre-merge their
+#  results in the worker (the first level of tree-reduction)
+#  @see Task.merge_arity 
+def reduce_task_executor ( item ) :
+    """ Helper function to execute the group of sibling jobs and pre-merge their
+    results in the worker (the first level of tree-reduction)
+    - see Task.merge_arity 
+    """
+    ## unpack
+    key   = item [ 0 ] 
+    task  = item [ 1 ]
+    group = item [ 2 ] ## group of (jobid,argument) pairs 
+    jobid = group [ 0 ] [ 0 ] 
+    ## 
+    if key is not None and not task.cache_remote : key = None
+    
+    stat    = Statistics ()
+    results = [] 
+    for jid , args in group :
+        _ , result , st = _execute_task_ ( task , jid , ( args , ) , cache_key = key ) 
+        results.append ( ( jid , result ) )
+        stat.time  += st.time
+        stat.njobs += st.njobs
+        stat.saved += st.saved
+        
+    _ , merged , st = merge_task_executor ( ( task , results ) )
+    stat.time    += st.time
+    stat.nmerged += st.nmerged 
+    ## 
+    return jobid , merged , stat 
+
+# =============================================================================
+## helper function to merge the results in the worker
+#  @param item ( task , results ) with the sequence of (jobid,result) pairs 
+#  @return jobid of the first merged result, merged result and statistics 
+#  @see Task.merge_arity 
+def merge_task_executor ( item ) :
+    """ Helper function to merge the results in the worker
+    - item : ( task , results ) with the sequence of (jobid,result) pairs
+    - returns jobid of the first merged result, merged result and statistics 
+    - see Task.merge_arity 
+    """
+    ## unpack
+    task    = item [ 0 ]
+    results = item [ 1 ]
+    ## 
+    with Statistics () as stat :
+        ## reset the output
+        task.initialize_local () 
+        for jobid , result in results :
+            task.merge_results ( result , jobid )
+        merged = task.results ()
+        
+    stat.njobs   = 0 
+    stat.nmerged = len ( results )
+    ## 
+    return ( results [ 0 ] [ 0 ] if results else -1 ) , merged , stat 
+
 # =============================================================================
 ## helper function to execute the function and collect statistics
 #  (unfornately due to limitation of <code>parallel python</code> one cannot
@@ -931,7 +1121,7 @@ def __init__  ( self             ,
         
         if not self.dump_dbase and ( self.dump_jobs or self.dump_freq ) :
             from ostap.utils.cleanup import CleanUp 
-            self.__dump_dbase = CleanUP.tempfile ( suffix = '.db' ) 
+            self.__dump_dbase = CleanUp.tempfile ( suffix = '.db' ) 
             logger.info ( 'Temporary DBASE will be used: %s' % dump_dbase )
 
         ## check that dbase can be created/used
@@ -975,6 +1165,13 @@ def __init__  ( self             ,
     #  ## get sum of them 
     #  result2 =  wm.process ( my_fun , items , merger = TaskMerger () )    
     #  @endcode
+    #  - resume the (killed) job from the checkpoint in <code>dump_dbase</code>
+    #  @code
+    #  wm = WorkManager ( dump_dbase = 'checkpoint.db' , dump_freq = 10 )
+    #  result = wm.process ( my_task , items , resume = True ) 
+    #  @endcode
+    #  Only the jobs, missing in the checkpoint, are processed, the arguments
+    #  must be the same as for the original run 
     def process ( self , task , args , **kwargs ) :
         """ Process callable object or Task :
         
@@ -992,7 +1189,14 @@ def process ( self , task , args , **kwargs ) :
         >>> items = range ( 10 )
         >>> result1 =  wm.process ( my_fun , items , merger = TaskMerger ( lambda  a,b : a+[b] , init = [] ) )
         >>> result2 =  wm.process ( my_fun , items , merger = TaskMerger () )    
+
+        - resume the (killed) job from the checkpoint in `dump_dbase`
         
+        >>> wm = WorkManager ( dump_dbase = 'checkpoint.db' , dump_freq = 10 )
+        >>> result = wm.process ( my_task , items , resume = True ) 
+
+        Only the jobs, missing in the checkpoint, are processed, the arguments
+        must be the same as for the original run 
         """
 
         if isinstance ( args , sized_types ) : kwargs [ 'njobs' ] = len ( args )
@@ -1014,6 +1218,7 @@ def __process_func ( self , task , args , **kwargs ) :
         
         from timeit import default_timer as _timer
         start = _timer()
+        saved = self.startup_saved
         
         from ostap.utils.cidict import cidict
         myargs = cidict ( self.params )
@@ -1026,6 +1231,8 @@ def __process_func ( self , task , args , **kwargs ) :
         progress   = myargs.pop ( 'progress'   , self.progress )    
         progress   = True if progress else False
 
+        resume     = myargs.pop ( 'resume'     , False )
+        
         ## mergers for statistics & results
         if   not merger and not collector : logger.warning ( "Neither `merger' nor `collector' are specified for merging!")
         elif     merger and     collector : logger.warning ( "Both    `merger' and `collector' are specified for merging!")
@@ -1040,6 +1247,12 @@ def __process_func ( self , task , args , **kwargs ) :
         ## initialize the results 
         results = init
 
+        ## resume from the checkpoint? 
+        done    = set () 
+        if resume :
+            done , merged = self.load_checkpoint ()
+            if done : results = merged 
+
         myargs [ 'progress' ] = False
         barconf = dict ( description = 'Jobs:' , silent = not progress )
         
@@ -1051,6 +1264,7 @@ def __process_func ( self , task , args , **kwargs ) :
                       ( len ( args ) if isinstance ( args , sized_types ) else None ) ) 
         
         max_value = max_value if isinstance ( max_value , int ) and 1 <= max_value else None 
+        if max_value and done : max_value = max_value - len ( done ) if len ( done ) < max_value else None 
         
         if max_value is None :
             from ostap.utils.progress_bar import RunningBar
@@ -1065,10 +1279,14 @@ def __process_func ( self , task , args , **kwargs ) :
             hyper_block_size = myargs.pop ( 'hyper_block_size' , self.hyper_block_size  )
             if not isinstance ( hyper_block_size , int ) or hyper_block_size <= 1 : hyper_block_size = self.hyper_block_size
                         
+            ## (jobid,argument) pairs, skip the jobs, already processed 
+            jobs = enumerate ( args )
+            if done : jobs = ( ( j , a ) for ( j , a ) in jobs if not j in done )
+            
             from ostap.utils.utils        import batched            
-            for hyper_block  in batched ( args , hyper_block_size ) :
+            for hyper_block  in batched ( jobs , hyper_block_size ) :
 
-                jobs_args = zip ( repeat ( task ) , count ( index ) , hyper_block )
+                jobs_args = ( ( task , j , a ) for ( j , a ) in hyper_block ) 
 
                 ## call for the actual jobs handling method 
                 for jobid , result , stat in self.iexecute ( func_executor , jobs_args , njobs = len ( hyper_block ) , **myargs ) :
@@ -1083,10 +1301,12 @@ def __process_func ( self , task , args , **kwargs ) :
                     ## merge results if merger or collector are provided 
                     if   merger    : results = merger    ( results , result ) 
                     elif collector : results = collector ( results , result , jobid )
-
+                    done.add ( jobid ) 
+                    
                     if 0 < self.dump_freq and 0 == index % self.dump_freq :
                         with DBASE.open ( self.dump_dbase ) as db :
-                            db [ 'merged' ] = index , results
+                            db [ 'merged'     ] = index , results
+                            db [ 'checkpoint' ] = done  , results 
                             
                     ## advance progress bar & job counter 
                     bar   += 1 
@@ -1098,16 +1318,17 @@ def __process_func ( self , task , args , **kwargs ) :
                 ## dump merged results at the end of each chunk 
                 if 0 < self.dump_freq :  
                     with DBASE.open ( self.dump_dbase ) as db :
-                        db [ 'merged' ] = index , results 
+                        db [ 'merged'     ] = index , results 
+                        db [ 'checkpoint' ] = done  , results 
                                                 
         ## final results at the end of each chunk 
         if 0 < self.dump_freq :  
             with DBASE.open ( self.dump_dbase ) as db :
-                db [ 'TOTAL_jobs'    ] = index 
+                db [ 'TOTAL_jobs'    ] = len ( done ) 
                 db [ 'FINAL_results' ] = results
 
         ## print statistics 
-        self.print_statistics ( merged_stat_pp , merged_stat , _timer() - start )
+        self.print_statistics ( merged_stat_pp , merged_stat , _timer() - start , saved = self.startup_saved - saved )
         ##
         return results 
 
@@ -1119,9 +1340,22 @@ def __process_task  ( self , task , args , **kwargs ) :
 
         from timeit import  default_timer as _timer
         start = _timer()
-
+        saved = self.startup_saved 
+        
         ## inialize the task
         task.initialize_local ()
+
+        ## persistent (warm) workers: use the unique key for the task to cache its remote initialization 
+        if self.persistent :
+            import uuid
+            executor = warm_task_executor
+            task_key = uuid.uuid4().hex 
+        else :
+            executor = task_executor
+            task_key = None
+
+        ## tree-reduction of the results? 
+        arity = task.merge_arity 
         
         ## mergers for statistics 
         merged_stat    = StatMerger ()
@@ -1137,6 +1371,13 @@ def __process_task  ( self , task , args , **kwargs ) :
                 
         block_size = myargs.pop ( 'block_size' , self.block_size  )
         if block_size < 1 : block_size = 100 * ( numcpu() + 1 ) 
+
+        ## resume from the checkpoint? 
+        resume     = myargs.pop ( 'resume'     , False )
+        done       = set () 
+        if resume :
+            done , merged = self.load_checkpoint ()
+            if done : task.merge_results ( merged , -1 ) 
                 
         myargs [ 'progress'] = False 
         barconf = dict ( description = 'Jobs:' , silent = not progress )
@@ -1152,6 +1393,7 @@ def __process_task  ( self , task , args , **kwargs ) :
                       ( len ( args ) if isinstance ( args , sized_types ) else None ) ) 
         
         max_value = max_value if isinstance ( max_value , int ) and 1 <= max_value else None 
+        if max_value and done : max_value = max_value - len ( done ) if len ( done ) < max_value else None 
 
         if max_value is None :
             from ostap.utils.progress_bar import RunningBar
@@ -1166,32 +1408,53 @@ def __process_task  ( self , task , args , **kwargs ) :
             hyper_block_size = myargs.pop ( 'hyper_block_size' , self.hyper_block_size  )
             if not isinstance ( hyper_block_size , int ) or hyper_block_size <= 1 : hyper_block_size = self.hyper_block_size
 
+            ## (jobid,argument) pairs, skip the jobs, already processed 
+            jobs = enumerate ( args )
+            if done : jobs = ( ( j , a ) for ( j , a ) in jobs if not j in done )
+            
             from ostap.utils.utils        import batched    
-            for hyper_block in batched ( args , hyper_block_size ) : 
-                
-                jobs_args = zip ( repeat ( task ) , count ( index ) , hyper_block )
-                
-                for jobid , result , stat in self.iexecute ( task_executor , jobs_args , njobs = len ( hyper_block ) , **myargs ) : 
+            for hyper_block in batched ( jobs , hyper_block_size ) : 
 
-                    ## merge statistics 
-                    merged_stat += stat
+                ## tree-reduction: merge the results in workers 
+                if 2 <= arity :
+                    
+                    for jobid , result in self.__tree_reduce ( task , task_key , hyper_block ,
+                                                               arity , merged_stat , bar , **myargs ) :
+                        ## merge/collect the pre-merged results
+                        task.merge_results ( result , jobid )
+                        
+                    done.update ( j for ( j , a ) in hyper_block ) 
+                    index += len ( hyper_block ) 
+                    
+                else :
+                    
+                    if self.persistent : jobs_args = ( ( task_key , task , j , a ) for ( j , a ) in hyper_block ) 
+                    else               : jobs_args = ( (            task , j , a ) for ( j , a ) in hyper_block ) 
 
-                    ## dump individual results if requested 
-                    if self.dump_jobs < 0  or ( index < self.dump_jobs ) :
-                        with DBASE.open ( self.dump_dbase ) as db :
-                            key = 'results_%d' % index 
-                            db [ key ] = jobid , result
-           
-                    ## merge/collect resuls
-                    task.merge_results ( result , jobid )
+                    ## individual results are merged in the master 
+                    for jobid , result , stat in self.iexecute ( executor , jobs_args , njobs = len ( hyper_block ) , **myargs ) : 
 
-                    ## dump merged results , if requested 
-                    if 0 < self.dump_freq and 0 == index % self.dump_freq :
-                        with DBASE.open ( self.dump_dbase ) as db :
-                            db [ 'merged_%d'  % index ] = task.results() 
+                        ## merge statistics 
+                        merged_stat += stat
+
+                        ## dump individual results if requested 
+                        if self.dump_jobs < 0  or ( index < self.dump_jobs ) :
+                            with DBASE.open ( self.dump_dbase ) as db :
+                                key = 'results_%d' % index 
+                                db [ key ] = jobid , result
+           
+                        ## merge/collect resuls
+                        task.merge_results ( result , jobid )
+                        done.add ( jobid ) 
+
+                        ## dump merged results , if requested 
+                        if 0 < self.dump_freq and 0 == index % self.dump_freq :
+                            with DBASE.open ( self.dump_dbase ) as db :
+                                db [ 'merged_%d'  % index ] = task.results() 
+                                db [ 'checkpoint'         ] = done , task.results ()
                             
-                    bar   += 1 
-                    index += 1 
+                        bar   += 1 
+                        index += 1 
 
                 pp_stat = self.get_pp_stat() 
                 if pp_stat : merged_stat_pp  += pp_stat 
@@ -1200,6 +1463,7 @@ def __process_task  ( self , task , args , **kwargs ) :
                 if 0 < self.dump_freq :  
                     with DBASE.open ( self.dump_dbase ) as db :
                         db [ 'merged_%d'  % index ] = task.results() 
+                        db [ 'checkpoint'         ] = done , task.results ()
 
         ## finalize the task 
         task.finalize ()
@@ -1207,12 +1471,74 @@ def __process_task  ( self , task , args , **kwargs ) :
         ## final results at the end of each chunk 
         if 0 < self.dump_freq :  
             with DBASE.open ( self.dump_dbase ) as db :
-                db [ 'FINAL_results' ] = task.result()
+                db [ 'TOTAL_jobs'    ] = len ( done ) 
+                db [ 'FINAL_results' ] = task.results()
 
-        self.print_statistics ( merged_stat_pp , merged_stat , _timer() - start )
+        self.print_statistics ( merged_stat_pp , merged_stat , _timer() - start , saved = self.startup_saved - saved )
         ## 
         return task.results ()
 
+    # ===================================================================================
+    ## Load the checkpoint from <code>dump_dbase</code>:
+    #  the set of already processed jobids and the corresponding merged result
+    #  @code
+    #  wm = WorkManager ( dump_dbase = 'checkpoint.db' , dump_freq = 10 ) 
+    #  done , merged = wm.load_checkpoint ()
+    #  @endcode
+    #  @return (set of processed jobids, merged result) 
+    def load_checkpoint ( self ) :
+        """ Load the checkpoint from `dump_dbase`: 
+        the set of already processed jobids and the corresponding merged result
+        >>> wm = WorkManager ( dump_dbase = 'checkpoint.db' , dump_freq = 10 ) 
+        >>> done , merged = wm.load_checkpoint ()
+        """
+        if not self.dump_dbase :
+            logger.warning ( "load_checkpoint: `dump_dbase' is not specified, nothing to resume" )
+            return set () , None
+        # =====================================================================
+        try : # ===============================================================
+            # =================================================================
+            with DBASE.open ( self.dump_dbase , 'r' ) as db :
+                if not 'checkpoint' in db :
+                    logger.warning ( "load_checkpoint: no checkpoint in `%s', nothing to resume" % self.dump_dbase )
+                    return set () , None 
+                done , merged = db [ 'checkpoint' ]
+            # =================================================================
+        except Exception : # ==================================================
+            # =================================================================
+            logger.warning ( "load_checkpoint: cannot read checkpoint from `%s', nothing to resume" % self.dump_dbase , exc_info = True )
+            return set () , None
+        
+        done = set ( done )
+        logger.info ( "Resume from `%s': #%d jobs are already processed" % ( self.dump_dbase , len ( done ) ) )
+        return done , merged
+    
+    # ===================================================================================
+    ## helper internal method for the tree-reduction of the task results:
+    #  - each worker processes <code>arity</code> sibling jobs and pre-merges their results
+    #  - the pre-merged results are yielded as they arrive, to be merged by master
+    #    one-by-one (at most one incoming result is held by master)
+    #  @return generator of (jobid,result) pairs to be merged by master 
+    #  @see Task.merge_arity
+    #  @attention individual job results are not dumped into <code>dump_dbase</code>
+    def __tree_reduce ( self , task , task_key , hyper_block , arity , merged_stat , bar , **kwargs ) :
+        """ Helper internal method for the tree-reduction of the task results:
+        - each worker processes `arity` sibling jobs and pre-merges their results
+        - the pre-merged results are yielded as they arrive, to be merged by master
+        one-by-one (at most one incoming result is held by master)
+        - individual job results are not dumped into `dump_dbase`
+        - see Task.merge_arity
+        """
+        from ostap.utils.utils import batched
+        
+        ## process and pre-merge the groups of sibling jobs 
+        groups    = tuple ( batched ( hyper_block , arity ) )
+        jobs_args = zip ( repeat ( task_key ) , repeat ( task ) , groups )
+        for jobid , result , stat in self.iexecute ( reduce_task_executor , jobs_args , njobs = len ( groups ) , **kwargs ) :
+            merged_stat += stat
+            bar         += stat.njobs
+            yield jobid , result 
+    
     @property
     def config ( self ) :
         """`config`: full configuration """
@@ -1227,6 +1553,7 @@ def config ( self ) :
         conf [ 'dump_dbase'       ] = self.dump_dbase 
         conf [ 'dump_jobs'        ] = self.dump_jobs
         conf [ 'dump_freq'        ] = self.dump_freq
+        conf [ 'persistent'       ] = self.persistent 
         return conf
     
     # =========================================================================
@@ -1296,6 +1623,18 @@ def dump_freq ( self ) :
     def params ( self ) :
         """`params`: additional parameters for actual work-manager """
         return self.__params
+
+    @property
+    def persistent ( self ) :
+        """`persistent` : use the persistent pool of warm workers?
+        - the pool is reused across hyper-blocks and across `process` calls 
+        """
+        return False
+
+    @property
+    def startup_saved ( self ) :
+        """`startup_saved` : total startup time saved by reusing the persistent pool of warm workers"""
+        return 0.0 
     
     # =========================================================================
     ## get PP-statistics if/when posssible  
@@ -1340,15 +1679,15 @@ def iexecute ( self , job , jobs_args , progress = False , **kwargs ) :
     
     # =========================================================================
     ## print the job execution statistics 
-    def print_statistics ( self , stat_pp , stat_loc , cputime = None ) :
+    def print_statistics ( self , stat_pp , stat_loc , cputime = None , saved = 0.0 ) :
         """ Print the job execution statistics 
         """        
         if self.silent : return
 
         if stat_pp.njobs == stat_loc.njobs : 
-            stat_pp .print_stats ( 'pp-' , cputime )
+            stat_pp .print_stats ( 'pp-' , cputime , saved = saved )
         else : 
-            stat_loc.print_stats ( 'qq-' , cputime )
+            stat_loc.print_stats ( 'qq-' , cputime , saved = saved )
 
     # =========================================================================
     ## report extra/unused arguments 
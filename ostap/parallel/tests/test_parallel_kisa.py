@@ -242,10 +242,40 @@ def test_kisa3 () :
         del selector 
     logger.info ( 'Dataset (paralell):\n%s' % ds.table ( prefix = '# ' ) )
         
+# =============================================================================
+def test_kisa_split () :
+
+    logger = getLogger ( 'test_parallel_kisa_split' )
+
+    from ostap.trees.utils import Chain
+    
+    chain = data.chain
+    ch    = Chain ( chain , first = 1000 , last = len ( chain ) - 1000 )
+
+    simple   = list ( ch.split ( chunk_size = 500 ) ) 
+    balanced = list ( ch.split ( chunk_size = 500 , balanced = True , branches = ( 'mass' , 'c2dtf<5' ) ) )
+    
+    ## both splits cover the same entries 
+    assert sum ( t.nevents for t in simple ) == ch.nevents , 'Invalid simple split!'
+    assert sum ( t.nevents for t in balanced ) == ch.nevents , 'Invalid balanced split!'
+    
+    logger.info ( 'Split %d entries: %d simple and %d cluster-aligned/balanced chunks' % ( ch.nevents , len ( simple ) , len ( balanced ) ) )
+
+    h1 = ROOT.TH1D ( 'h1' , '' , 200 , 3 , 3.2 )
+    h2 = h1.clone ()
+    
+    from ostap.parallel.parallel_statvar import parallel_project
+    with timing ( 'Simple   chunks' , logger ) :
+        parallel_project ( chain , h1 , 'mass' , 'c2dtf<5' , chunk_size = 500 , balanced = False )
+    with timing ( 'Balanced chunks' , logger ) :
+        parallel_project ( chain , h2 , 'mass' , 'c2dtf<5' , chunk_size = 500 , balanced = True  )
+    assert h1.GetEntries () == h2.GetEntries () , 'Mismatch in projections!'
+    
 # =============================================================================
 if '__main__' == __name__ :
 
     test_kisa  ()
+    test_kisa_split ()
     ## test_kisa2 ()    
     ## test_kisa3 ()
     
@@ -190,6 +190,159 @@ def test_parallel_futures_generic ( ) :
 
     return result
 
+# ==============================================================================
+## simple task to check the cached initialization in the warm workers:
+#  for each worker count one-time and per-job initializations 
+class CTask(Task) :
+    """ Simple task to check the cached initialization in the warm workers:
+    for each worker count one-time and per-job initializations 
+    """
+    def __init__ (  self ) :
+        self.cache_remote = True 
+        self.nworker      = 0
+        self.jobid        = None 
+        self.__result     = None
+    def initialize_local  ( self )             : self.__result = None
+    def initialize_worker ( self )             : self.nworker += 1 
+    def initialize_remote ( self , jobid = -1 ) :
+        self.jobid = jobid
+        self.initialize_local () 
+    def process  ( self  , jobid , n ) :
+        import os
+        assert self.jobid == jobid , 'Per-job initialization is not invoked!'
+        return { os.getpid () : ( self.nworker , 1 ) } 
+    def merge_results ( self , result , jobid = -1 ) :
+        if not self.__result : self.__result = {}
+        for pid , ( nw , nj ) in result.items () :
+            nw_ , nj_ = self.__result.get ( pid , ( 0 , 0 ) )
+            self.__result [ pid ] = max ( nw , nw_ ) , nj + nj_ 
+    def results ( self ) :
+        return self.__result
+
+# =============================================================================
+## test parallel processing with parallel_futures (persistent pool of warm workers)
+def test_parallel_futures_persistent ( ) :
+    """ Test parallel processnig with parallel_futures (persistent pool of warm workers)
+    """
+    logger  = getLogger ("test_parallel_futures_persistent")
+    if not WorkManager :
+        logger.error ("Failure to import WorkManager")
+        return
+    
+    logger.info ('Test job submission with %s' % WorkManager  ) 
+
+    ## create the manager with the persistent pool of workers 
+    with WorkManager ( silent = False , persistent = True , hyper_block_size = 5 ) as manager :
+
+        ## create the task 
+        task     = HTask()
+        
+        ## process the task twice with the same pool 
+        result1  = manager.process ( task ,  inputs )
+        result2  = manager.process ( task ,  inputs )
+
+        assert manager.active , "Persistent pool must be active!"
+        
+        logger.info ( "Entries  %s/%s" % ( result2.GetEntries() , sum ( inputs ) ) ) 
+        logger.info ( "Startup time %.3gs, saved time %.3gs" % ( manager.startup_time , manager.startup_saved ) ) 
+
+    assert not manager.active , "Persistent pool must be shutdown!"
+    
+    with use_canvas ( 'test_parallel_futures_persistent' , wait = 1 ) : 
+        result2.draw (   ) 
+
+    return result2
+
+# =============================================================================
+## test parallel processing with parallel_futures (cached initialization in warm workers)
+def test_parallel_futures_cached ( ) :
+    """ Test parallel processnig with parallel_futures (cached initialization in warm workers)
+    """
+    logger  = getLogger ("test_parallel_futures_cached")
+    if not WorkManager :
+        logger.error ("Failure to import WorkManager")
+        return
+    
+    logger.info ('Test job submission with %s' % WorkManager  ) 
+
+    with WorkManager ( silent = False , persistent = True , hyper_block_size = 5 ) as manager :
+
+        ## process the task twice with the same pool 
+        for i in range ( 2 ) : 
+            result = manager.process ( CTask () ,  inputs )
+            logger.info ( 'Initializations per worker (one-time,per-job): %s' % result )
+            assert NN == sum ( nj for nw , nj in result.values () ) , 'Invalid number of jobs!'
+            assert all ( 1 == nw for nw , nj in result.values () )  , 'One-time initialization is not cached!'
+            
+        assert manager.active , "Persistent pool must be active!"
+
+    return result
+
+# =============================================================================
+## test parallel processing with parallel_futures (tree-reduction of results)
+def test_parallel_futures_reduce ( ) :
+    """ Test parallel processnig with parallel_futures (tree-reduction of results)
+    """
+    logger  = getLogger ("test_parallel_futures_reduce")
+    if not WorkManager :
+        logger.error ("Failure to import WorkManager")
+        return
+    
+    logger.info ('Test job submission with %s' % WorkManager  ) 
+
+    ## create the manager 
+    manager = WorkManager ( silent = False  )
+
+    ## create the task with pairwise tree-reduction 
+    task             = HTask()
+    task.merge_arity = 2 
+    
+    ## process the task 
+    result   = manager.process ( task ,  inputs ) 
+    
+    logger.info ( "Histogram is %s" % result.dump ( 80 , 10 )  )
+    logger.info ( "Entries  %s/%s" % ( result.GetEntries() , sum ( inputs ) ) ) 
+    assert result.GetEntries() == sum ( inputs ) , "Invalid number of entries!"
+    
+    with use_canvas ( 'test_parallel_futures_reduce' , wait = 1 ) : 
+        result.draw (   ) 
+
+    return result
+
+# =============================================================================
+## test parallel processing with parallel_futures (resume from the checkpoint)
+def test_parallel_futures_resume ( ) :
+    """ Test parallel processnig with parallel_futures (resume from the checkpoint)
+    """
+    logger  = getLogger ("test_parallel_futures_resume")
+    if not WorkManager :
+        logger.error ("Failure to import WorkManager")
+        return
+    
+    logger.info ('Test job submission with %s' % WorkManager  ) 
+
+    from ostap.utils.cleanup import CleanUp
+    dbase = CleanUp.tempfile ( suffix = '.db' ) 
+    
+    ## create the manager with checkpointing 
+    manager = WorkManager ( silent = False , dump_dbase = dbase , dump_freq = 1 )
+
+    ## process the first half of jobs 
+    task     = HTask()
+    result   = manager.process ( task , inputs [ : NN // 2 ] )
+    
+    ## resume: only the second half of jobs is processed 
+    task     = HTask()
+    result   = manager.process ( task , inputs , resume = True ) 
+    
+    logger.info ( "Entries  %s/%s" % ( result.GetEntries() , sum ( inputs ) ) ) 
+    assert result.GetEntries() == sum ( inputs ) , "Invalid number of entries!"
+    
+    with use_canvas ( 'test_parallel_futures_resume' , wait = 1 ) : 
+        result.draw (   ) 
+
+    return result
+
 # =============================================================================
 if '__main__' == __name__ :
 
@@ -204,6 +357,18 @@ def test_parallel_futures_generic ( ) :
     
     ## use generic task 
     test_parallel_futures_generic ()
+
+    ## persistent pool of warm workers  
+    test_parallel_futures_persistent ()
+
+    ## cached initialization in warm workers 
+    test_parallel_futures_cached     ()
+
+    ## tree-reduction of results 
+    test_parallel_futures_reduce     ()
+
+    ## resume from the checkpoint 
+    test_parallel_futures_resume     ()
             
 # =============================================================================
 ##                                                                      The END 
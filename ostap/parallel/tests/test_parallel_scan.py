@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developers.
+# =============================================================================
+# @file test_parallel_scan.py
+# Test module for ostap/parallel/parallel_scan.py
+# - parallel scans of NLL and profile-likelihood
+# =============================================================================
+""" Test module for ostap/parallel/parallel_scan.py
+- parallel scans of NLL and profile-likelihood
+"""
+# =============================================================================
+__author__ = "Ostap developers"
+__all__    = () ## nothing to import
+# =============================================================================
+from   ostap.utils.timing             import timing
+from   ostap.core.core                import dsID
+from   ostap.utils.root_utils         import batch_env
+from   ostap.utils.ranges             import vrange
+from   ostap.parallel.parallel_scan   import scan_order
+import ostap.fitting.models           as     Models
+import ostap.fitting.roofit
+import ROOT, math
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' == __name__  :
+    logger = getLogger ( 'ostap.test_parallel_scan' )
+else :
+    logger = getLogger ( __name__ )
+# =============================================================================
+batch_env ( logger )
+# =============================================================================
+
+mass        = ROOT.RooRealVar ( 'mass' , '', 0 , 1 )
+gauss       = Models.Gauss_pdf ( 'G' , xvar = mass , mean = ( 0.4 , 0.2 , 0.6 ) , sigma = ( 0.1 , 0.05 , 0.2 ) )
+model       = Models.Fit1D     ( signal = gauss , background = 'flat' )
+model.S     = 1000
+model.B     = 100
+
+dataset     = model.generate ( 1100 )
+result , _  = model.fitTo ( dataset , silent = True )
+
+# =============================================================================
+## test the ordering of the scan points
+def test_parallel_scan_order () :
+    """ Test the ordering of the scan points
+    """
+    assert scan_order ( [ 3 , 1 , 2 ] ) == [ ( 1. , ) , ( 2. , ) , ( 3. , ) ]
+    points = scan_order ( [ 1 , 2 ] , [ 10 , 20 , 30 ] )
+    assert points == [ ( 1. , 10. ) , ( 1. , 20. ) , ( 1. , 30. ) ,
+                       ( 2. , 30. ) , ( 2. , 20. ) , ( 2. , 10. ) ]
+
+# =============================================================================
+## compare sequential and parallel 1D scans
+def test_parallel_scan_1D () :
+    """ Compare sequential and parallel 1D scans
+    """
+    S     = result.S.value
+    vals  = vrange ( S - 100 , S + 100 , 20 )
+
+    with timing ( 'Sequential NLL     scan' , logger = logger ) :
+        g1 = model.graph_nll     ( 'S' , vals , dataset , silent = True )
+    with timing ( 'Parallel   NLL     scan' , logger = logger ) :
+        g2 = model.graph_nll     ( 'S' , vals , dataset , silent = True , parallel = True )
+
+    for p1 , p2 in zip ( g1.items() , g2.items () ) :
+        _ , x1 , y1 = p1
+        _ , x2 , y2 = p2
+        assert math.isclose ( x1 , x2 ) and math.isclose ( y1 , y2 , rel_tol = 1.e-6 , abs_tol = 1.e-6 ), \
+               'Mismatch in NLL scan: %s vs %s' % ( p1 , p2 )
+
+    with timing ( 'Sequential profile scan' , logger = logger ) :
+        p1 = model.graph_profile ( 'S' , vals , dataset , silent = True )
+    with timing ( 'Parallel   profile scan' , logger = logger ) :
+        p2 = model.graph_profile ( 'S' , vals , dataset , silent = True , parallel = True )
+
+    for q1 , q2 in zip ( p1.items() , p2.items () ) :
+        _ , x1 , y1 = q1
+        _ , x2 , y2 = q2
+        assert math.isclose ( x1 , x2 ) and abs ( y1 - y2 ) < 1.e-2 , \
+               'Mismatch in profile scan: %s vs %s' % ( q1 , q2 )
+
+# =============================================================================
+## 2D profile scan
+def test_parallel_scan_2D () :
+    """ 2D profile scan
+    """
+    S     = result.S.value
+    B     = result.B.value
+    vs    = vrange ( S - 100 , S + 100 , 6 )
+    vb    = vrange ( B -  30 , B +  30 , 6 )
+
+    with timing ( 'Parallel 2D profile scan' , logger = logger ) :
+        h = model.histo_profile ( 'S' , 'B' , vs , vb , dataset , silent = True , parallel = True )
+
+    assert 7 == h.GetNbinsX() and 7 == h.GetNbinsY() , 'Invalid 2D scan histogram'
+    assert 0 <= h.GetMinimum () , 'Invalid minimum for 2D profile scan'
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_parallel_scan_order ()
+    test_parallel_scan_1D    ()
+    test_parallel_scan_2D    ()
+
+# =============================================================================
+##                                                                      The END
+# =============================================================================
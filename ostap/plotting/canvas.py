@@ -31,6 +31,8 @@
     'use_canvas'         , ## context manager to create currect scanvas
     'keepCanvas'         , ## context manager to keep the current ROOT canvas
     'invisibleCanvas'    , ## context manager to use the invisible current ROOT canvas
+    'AsyncExport'        , ## context manager for asynchronous export of canvases 
+    'async_export'       , ## context manager for asynchronous export of canvases
     ##
     )
 # =============================================================================
@@ -46,6 +48,8 @@
                                           margin_top   , margin_bottom , 
                                           set_style    )
 from   ostap.plotting.style      import UseStyle 
+from   ostap.plotting.export     import ( export_queue , make_archive  , archive_types ,
+                                          AsyncExport  , async_export  , all_extensions ) 
 import ostap.core.core         
 import ROOT, os, tempfile, math   
 # =============================================================================
@@ -331,16 +335,6 @@ def clean_canvases () :
         ROOT.SetOwnership ( c , False )
         del c 
     
-# =============================================================================
-all_extensions = (
-    'pdf'  , 'png'  , 'gif' ,
-    'eps'  , 'ps'   ,
-    'cxx'  , 'c'    , 
-    'jpg'  , 'jpeg' , 'svg' , 
-    'root' , 'xml'  , 'xpm' , 
-    'tiff' , 'tex'  , 
-    'json'
-    )
 
 # =============================================================================
 ## Define simplified print for TCanvas
@@ -359,6 +353,8 @@ def _cnv_print_ ( cnv , fname , exts = ( 'pdf'  , 'png' , 'eps'  , 'C'   ,
     It allows to create several output file types  at once
     - if extension is equal to `tar` or `tgz`, single (gzipped) tar-files is created
     - if extension is equal to `zip`, single zip-archive is created 
+    - within `AsyncExport` context the files are produced asynchronously,
+      see `ostap.plotting.export.AsyncExport`
     >>> canvas.print_ ( 'A' )
     >>> canvas.save   ( 'A' ) ## ditto
     >>> canvas >> 'fig'       ## ditto
@@ -371,6 +367,12 @@ def _cnv_print_ ( cnv , fname , exts = ( 'pdf'  , 'png' , 'eps'  , 'C'   ,
         dirname = os.path.abspath ( dirname ) 
         logger.debug ( "create directory %s" % os.path.abspath ( dirname ) ) 
         os.makedirs ( dirname , exist_ok = True ) 
+
+    ## asynchronous export ? 
+    queue = export_queue () 
+    if queue : 
+        queue.submit ( cnv , fname , exts )
+        return cnv
     
     n , e  = os.path.splitext ( fname )
 
@@ -384,10 +386,7 @@ def _cnv_print_ ( cnv , fname , exts = ( 'pdf'  , 'png' , 'eps'  , 'C'   ,
             logger.debug ( 'Canvas --> %s' % fname )
             return cnv
         
-    if n and el in ( 'tgz' , 'gztar' , 'targz' , 'tar' ,
-                     'zip' ,
-                     'tbz' , 'tbz2'  , 'tarbz' , 'tarbz2' , 'bztar' , 'bz2tar' ,                     
-                     'txz' , 'tlz'   , 'tarxz' , 'tarlz'  , 'xztar' , 'lztar'  ) :            
+    if n and el in archive_types :
         files = [] 
         for ext in exts :
             with rootWarning () :
@@ -396,50 +395,9 @@ def _cnv_print_ ( cnv , fname , exts = ( 'pdf'  , 'png' , 'eps'  , 'C'   ,
                 logger.debug ( 'Canvas --> %s' % name )
                 if os.path.exists ( name ) and os.path.isfile ( name ) : 
                     files.append ( name )
-                    
-        if   files and el in  ( 'tgz' , 'targz'  , 'gztar' ) : 
-            import tarfile
-            with tarfile.open ( fname , "w:gz" ) as output :
-                for f in files : output.add   ( f )
-            if os.path.exists ( fname ) :
-                logger.debug  ( 'tgz-archive created %s' % fname )
-                
-        elif files and el in  ( 'tar' , ) : 
-            import tarfile
-            with tarfile.open ( fname , "w" ) as output :
-                for f in files : output.add   ( f )
-            if os.path.exists ( fname ) :
-                logger.debug  ( 'tar-archive created %s' % fname )
-                
-        elif files and el in  ( 'tbz' , 'tarbz' , 'tarbz2' , 'tbz2' , 'bztar' , 'bz2tar' ) : 
-            import tarfile
-            with tarfile.open ( fname , "w:bz2" ) as output :
-                for f in files : output.add   ( f )
-            if os.path.exists ( fname ) :
-                logger.debug  ( 'tbz-archive created %s' % fname )
-
-        elif files and el in  ( 'txz'   , 'tlz'   ,
-                                'tarxz' , 'tarlz' ,
-                                'xztar' , 'lztar' ) : 
-            import tarfile
-            with tarfile.open ( fname , "w:xz" ) as output :
-                for f in files : output.add   ( f )
-            if os.path.exists ( fname ) :
-                logger.debug  ( 'txz-archive created %s' % fname )
-                            
-        elif files and el in  ( 'zip' , ) : 
-            import zipfile
-            with zipfile.ZipFile( fname , "w"  ) as output :
-                for f in files : output.write ( f )
-            if os.path.exists ( fname ) :
-                logger.debug  ( 'zip-archive created %s' % fname )
-
-        for f in files :
-            try :
-                os.remove ( f )
-            except OSError :
-                pass
 
+        ## create archive and remove the files 
+        make_archive ( fname , files , el ) 
         return cnv
     
     for ext in exts :
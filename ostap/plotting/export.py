@@ -0,0 +1,360 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file ostap/plotting/export.py
+#  Asynchronous export of canvases into graphics files
+#  - the canvas is saved ("snapshot") into the temporary ROOT file
+#  - the formats are rendered in the background process pool
+#  - <code>flush</code> is the barrier: it waits for all submitted exports
+#    and reports errors
+#  @code
+#  with AsyncExport () :
+#      for h in histos :
+#          h.draw()
+#          canvas >> h.GetName()  ## asynchronous
+#  ## here all files are produced
+#  @endcode
+#  @see ostap.plotting.canvas
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2026-10-17
+# =============================================================================
+""" Asynchronous export of canvases into graphics files
+- the canvas is saved (`snapshot`) into the temporary ROOT file
+- the formats are rendered in the background process pool
+- `flush` is the barrier: it waits for all submitted exports and reports errors
+>>> with AsyncExport () :
+...     for h in histos :
+...         h.draw()
+...         canvas >> h.GetName()  ## asynchronous
+>>> ## here all files are produced
+- see `ostap.plotting.canvas`
+"""
+# =============================================================================
+__author__  = 'Vanya BELYAEV Ivan.Belyaev@itep.ru'
+__date__    = "2026-10-17"
+__version__ = '$Revision$'
+__all__     = (
+    'AsyncExport'    , ## context manager for asynchronous export of canvases
+    'async_export'   , ## ditto, as function
+    'export_queue'   , ## get the active export queue (if any)
+    'make_archive'   , ## make (tar/zip)-archive from the list of files
+    'archive_types'  , ## known archive types
+    )
+# =============================================================================
+import os
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger( 'ostap.plotting.export' )
+else                       : logger = getLogger( __name__ )
+# =============================================================================
+## known graphics extensions 
+all_extensions = (
+    'pdf'  , 'png'  , 'gif' ,
+    'eps'  , 'ps'   ,
+    'cxx'  , 'c'    , 
+    'jpg'  , 'jpeg' , 'svg' , 
+    'root' , 'xml'  , 'xpm' , 
+    'tiff' , 'tex'  , 
+    'json'
+    )
+# =============================================================================
+## known archive types: extension -> mode
+archive_types = {
+    'tgz'    : 'w:gz'  , 'gztar'  : 'w:gz'  , 'targz'  : 'w:gz'  ,
+    'tar'    : 'w'     ,
+    'zip'    : 'zip'   ,
+    'tbz'    : 'w:bz2' , 'tbz2'   : 'w:bz2' , 'tarbz'  : 'w:bz2' ,
+    'tarbz2' : 'w:bz2' , 'bztar'  : 'w:bz2' , 'bz2tar' : 'w:bz2' ,
+    'txz'    : 'w:xz'  , 'tlz'    : 'w:xz'  , 'tarxz'  : 'w:xz'  ,
+    'tarlz'  : 'w:xz'  , 'xztar'  : 'w:xz'  , 'lztar'  : 'w:xz'  ,
+    }
+# =============================================================================
+## Make (tar/zip)-archive from the list of files
+#  The files are removed after archiving
+#  @param fname    the name of archive
+#  @param files    the list of files
+#  @param el       archive type (extension)
+#  @param arcnames the names of files in archive
+def make_archive ( fname , files , el , arcnames = None ) :
+    """ Make (tar/zip)-archive from the list of files
+    The files are removed after archiving
+    """
+    mode     = archive_types [ el ]
+    arcnames = arcnames if arcnames else files
+
+    if files and 'zip' == mode :
+        import zipfile
+        with zipfile.ZipFile ( fname , "w" ) as output :
+            for f , a in zip ( files , arcnames ) : output.write ( f , a )
+    elif files :
+        import tarfile
+        with tarfile.open ( fname , mode ) as output :
+            for f , a in zip ( files , arcnames ) : output.add   ( f , a )
+
+    if files and os.path.exists ( fname ) :
+        logger.debug  ( '%s-archive created %s' % ( el , fname ) )
+
+    for f in files :
+        try :
+            os.remove ( f )
+        except OSError :
+            pass
+
+# =============================================================================
+## Initialize the worker process
+def _init_worker_ () :
+    """ Initialize the worker process
+    """
+    import ROOT
+    ROOT.gROOT.SetBatch ( True )
+    ROOT.gErrorIgnoreLevel = ROOT.kWarning
+
+# =============================================================================
+## Render the canvas from the snapshot file into the graphics files
+#  @param snapshot  the snapshot (ROOT) file
+#  @param fname     the output file name
+#  @param exts      the extensions
+#  @param arcname   the base name of files in archive
+#  @return list of produced files
+def _render_ ( snapshot , fname , exts , arcname = '' ) :
+    """ Render the canvas from the snapshot file into the graphics files
+    """
+    import ROOT
+    tfile = None 
+    try :
+
+        tfile = ROOT.TFile.Open ( snapshot , 'READ' )
+        if not tfile or tfile.IsZombie () :
+            raise IOError ( "Cannot open snapshot file '%s'" % snapshot )
+
+        cnv = tfile.Get ( 'canvas' )
+        if not cnv :
+            raise IOError ( "No canvas in snapshot file '%s'" % snapshot )
+
+        cnv.Draw   ()
+        cnv.Update ()
+
+        n , e  = os.path.splitext ( fname )
+        el     = e.lower()
+        if el.startswith('.') : el = el[1:]
+
+        ## single file
+        if n and el and ( el in all_extensions ) :
+            cnv.Print ( fname )
+            return [ fname ]
+
+        if n and el in archive_types :
+            files , names = [] , []
+            an = os.path.splitext ( arcname ) [ 0 ] if arcname else n
+            for ext in exts :
+                name = n + '.' + ext
+                cnv.Print ( name )
+                if os.path.exists ( name ) and os.path.isfile ( name ) :
+                    files.append ( name )
+                    names.append ( an + '.' + ext )
+            make_archive ( fname , files , el , names )
+            return [ fname ] if os.path.exists ( fname ) else []
+
+        result = []
+        for ext in exts :
+            name = fname + '.' + ext
+            cnv.Print ( name )
+            result.append ( name )
+        return result
+
+    finally :
+
+        if tfile : tfile.Close ()
+        try :
+            os.remove ( snapshot )
+        except OSError :
+            pass
+
+# =============================================================================
+## the stack of active export queues
+_queues = []
+# =============================================================================
+## Get the active export queue (if any)
+def export_queue () :
+    """ Get the active export queue (if any)
+    """
+    return _queues [ -1 ] if _queues else None
+
+# =============================================================================
+## @class AsyncExport
+#  Asynchronous export of canvases into graphics files
+#  - the canvas is saved ("snapshot") into the temporary ROOT file
+#  - the formats are rendered in the background process pool
+#  - <code>flush</code> is the barrier: it waits for all submitted exports
+#    and reports errors
+#  - the context manager activates the asynchronous export
+#    for <code>canvas >> 'name'</code> and <code>AutoPlots</code>;
+#    all exports are flushed at exit
+#  @code
+#  with AsyncExport ( ncpus = 4 ) as queue :
+#      for h in histos :
+#          h.draw()
+#          canvas >> h.GetName()  ## asynchronous
+#  ## here all files are produced
+#  @endcode
+class AsyncExport(object) :
+    """ Asynchronous export of canvases into graphics files
+    - the canvas is saved (`snapshot`) into the temporary ROOT file
+    - the formats are rendered in the background process pool
+    - `flush` is the barrier: it waits for all submitted exports and reports errors
+    - the context manager activates the asynchronous export
+      for `canvas >> 'name'` and `AutoPlots`; all exports are flushed at exit
+    >>> with AsyncExport ( ncpus = 4 ) as queue :
+    ...     for h in histos :
+    ...         h.draw()
+    ...         canvas >> h.GetName()  ## asynchronous
+    >>> ## here all files are produced
+    """
+    def __init__ ( self , ncpus = -1 , raise_errors = False ) :
+
+        if ncpus is None or ncpus < 1 :
+            from ostap.utils.basic import numcpu
+            ncpus = max ( 1 , min ( 8 , numcpu () ) )
+
+        self.__ncpus        = ncpus
+        self.__raise_errors = True if raise_errors else False
+        self.__pool         = None
+        self.__futures      = []
+        self.__errors       = []
+        self.__produced     = []
+
+    @property
+    def ncpus ( self ) :
+        """`ncpus` : number of processes in the pool"""
+        return self.__ncpus
+
+    @property
+    def errors ( self ) :
+        """`errors` : list of ( file , error ) pairs for failed exports"""
+        return tuple ( self.__errors )
+
+    @property
+    def produced ( self ) :
+        """`produced` : list of produced files"""
+        return tuple ( self.__produced )
+
+    @property
+    def pending ( self ) :
+        """`pending` : number of pending exports"""
+        return sum ( 1 for f , _ in self.__futures if not f.done () )
+
+    # =========================================================================
+    ## get the process pool
+    def pool ( self ) :
+        """ Get the process pool
+        """
+        if self.__pool is None :
+            import multiprocessing
+            from   concurrent.futures import ProcessPoolExecutor
+            self.__pool = ProcessPoolExecutor ( max_workers = self.__ncpus ,
+                                                mp_context  = multiprocessing.get_context ( 'spawn' ) ,
+                                                initializer = _init_worker_ )
+        return self.__pool
+
+    # =========================================================================
+    ## Submit the canvas for export
+    #  @param cnv   the canvas
+    #  @param fname the output file name
+    #  @param exts  the extensions
+    def submit ( self , cnv , fname , exts ) :
+        """ Submit the canvas for export
+        """
+        import ROOT
+        from   ostap.utils.cleanup  import CleanUp
+        from   ostap.io.root_file   import ROOTCWD
+
+        ## (1) snapshot
+        snapshot = CleanUp.tempfile ( prefix = 'ostap-canvas-' , suffix = '.root' )
+        cnv.Update ()
+        with ROOTCWD () :
+            tfile = ROOT.TFile.Open ( snapshot , 'RECREATE' )
+            tfile.WriteTObject ( cnv , 'canvas' )
+            tfile.Close ()
+
+        ## (2) submit
+        afname = os.path.abspath ( fname )
+        future = self.pool ().submit ( _render_ , snapshot , afname , tuple ( exts ) , fname )
+        self.__futures.append ( ( future , fname ) )
+        logger.debug ( 'Canvas --> %s (submitted)' % fname )
+
+        return future
+
+    # =========================================================================
+    ## The barrier: wait for all submitted exports and reports errors
+    #  @return list of ( file , error ) pairs for failed exports
+    def flush ( self ) :
+        """ The barrier: wait for all submitted exports and reports errors
+        - return list of ( file , error ) pairs for failed exports
+        """
+        futures , self.__futures = self.__futures , []
+        errors  = []
+        for future , fname in futures :
+            try :
+                self.__produced += future.result ()
+            except Exception as error :
+                logger.error ( "Export of canvas into '%s' failed: %s" % ( fname , error ) )
+                errors.append ( ( fname , error ) )
+        self.__errors += errors
+        if errors and self.__raise_errors :
+            raise RuntimeError ( "Export failed for %d files: %s" % ( len ( errors ) , ', '.join ( e [ 0 ] for e in errors ) ) )
+        return errors
+
+    # =========================================================================
+    ## flush and shutdown the process pool
+    def close ( self ) :
+        """ Flush and shutdown the process pool
+        """
+        try :
+            self.flush ()
+        finally :
+            if self.__pool is not None : self.__pool.shutdown ( wait = True )
+            self.__pool = None
+
+    ## context manager: ENTER
+    def __enter__ ( self ) :
+        _queues.append ( self )
+        return self
+
+    ## context manager: EXIT
+    def __exit__ ( self , *_ ) :
+        if _queues and self is _queues [ -1 ] : _queues.pop ()
+        self.close ()
+
+    def __del__ ( self ) :
+        if self.__pool is not None : self.__pool.shutdown ( wait = False )
+
+# =============================================================================
+## Context manager for asynchronous export of canvases into graphics files
+#  @code
+#  with async_export () :
+#      for h in histos :
+#          h.draw()
+#          canvas >> h.GetName()  ## asynchronous
+#  ## here all files are produced
+#  @endcode
+def async_export ( ncpus = -1 , raise_errors = False ) :
+    """ Context manager for asynchronous export of canvases into graphics files
+    >>> with async_export () :
+    ...     for h in histos :
+    ...         h.draw()
+    ...         canvas >> h.GetName()  ## asynchronous
+    >>> ## here all files are produced
+    """
+    return AsyncExport ( ncpus = ncpus , raise_errors = raise_errors )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+# =============================================================================
+##                                                                      The END
+# =============================================================================
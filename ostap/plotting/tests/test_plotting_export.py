@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developers.
+# =============================================================================
+# @file test_plotting_export.py
+# Test asynchronous export of canvases
+# =============================================================================
+""" Test asynchronous export of canvases
+"""
+# =============================================================================
+__author__ = "Ostap developers"
+__all__    = () ## nothing to import
+# =============================================================================
+from   ostap.core.pyrouts       import hID
+from   ostap.plotting.canvas    import getCanvas
+from   ostap.plotting.export    import AsyncExport
+from   ostap.utils.root_utils   import batch_env
+from   ostap.utils.timing       import timing
+from   ostap.utils.cleanup      import CleanUp
+import ROOT, os
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' == __name__  :
+    logger = getLogger ( 'test_plotting_export' )
+else :
+    logger = getLogger ( __name__ )
+# =============================================================================
+batch_env ( logger )
+# =============================================================================
+def test_plotting_export () :
+    """ Test asynchronous export of canvases
+    """
+    tmpdir = CleanUp.tempdir ( prefix = 'ostap-test-export-' )
+
+    histos = []
+    for i in range ( 10 ) :
+        h = ROOT.TH1D ( hID () , 'histo #%d' % i , 50 , -5 , 5 )
+        h.FillRandom ( 'gaus' , 1000 )
+        histos.append ( h )
+
+    cnv   = getCanvas ()
+    exts  = ( 'pdf' , 'png' , 'C' )
+
+    with timing ( 'Synchronous  export' , logger = logger ) :
+        for i , h in enumerate ( histos ) :
+            h.Draw ()
+            cnv.print_ ( os.path.join ( tmpdir , 'sync_%d' % i ) , exts )
+
+    with timing ( 'Asynchronous export' , logger = logger ) :
+        with AsyncExport () as queue :
+            for i , h in enumerate ( histos ) :
+                h.Draw ()
+                cnv.print_ ( os.path.join ( tmpdir , 'async_%d' % i ) , exts )
+            cnv >> os.path.join ( tmpdir , 'async.tgz' )
+
+    assert not queue.errors , 'Export errors: %s' % str ( queue.errors )
+
+    for i in range ( len ( histos ) ) :
+        for ext in exts :
+            name = os.path.join ( tmpdir , 'async_%d.%s' % ( i , ext ) )
+            assert os.path.exists ( name ) , 'Missing file %s' % name
+    assert os.path.exists ( os.path.join ( tmpdir , 'async.tgz' ) ) , 'Missing archive'
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_plotting_export ()
+
+# =============================================================================
+##                                                                      The END
+# =============================================================================
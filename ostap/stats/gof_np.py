@@ -65,6 +65,9 @@
 # =============================================================================
 logger.debug ( 'Simple utilities for goodness-of-fit studies for multidimensional fits' )
 # =============================================================================
+## maximal size of temporary arrays (distances, labels, ...)
+MAXSIZE = 10000000
+# =============================================================================
 ## @class GoFnp 
 #  A base class for numpy-related family of methods to probe goodness-of-fit
 class GoFnp (AGoFnp,Config) :
@@ -400,6 +403,40 @@ def draw  ( self , option = '' , * , tvalue = None , **kwargs ) :
         ##
         return result, vline, hline   
 
+    # ========================================================================
+    ## Can permutations be evaluated as label reshuffles of precomputed pooled sample?
+    #  @see GoFnp.pooled_setup
+    #  @see GoFnp.pooled_tvalues 
+    @property
+    def pooled_permutations ( self ) :
+        """`pooled_permutations` : can permutations be evaluated as label reshuffles of the precomputed pooled sample?
+        - see `GoFnp.pooled_setup`
+        - see `GoFnp.pooled_tvalues`
+        """
+        return False
+    
+    # ========================================================================
+    ## Precompute the permutation-invariant part for the pooled sample
+    #  @param data    (pooled) 2D-array 
+    #  @param weights (pooled) weights or None 
+    def pooled_setup ( self , data , weights = None ) :
+        """ Precompute the permutation-invariant part for the pooled sample
+        - data    : pooled 2D-array 
+        - weights : pooled weights or None 
+        """
+        raise NotImplementedError ( "%s: pooled permutations are not supported!" % typename ( self ) )
+    
+    # ========================================================================
+    ## Calculate t-values for many permutations at once
+    #  @param setup  the result of <code>pooled_setup</code>
+    #  @param labels boolean 2D-array (#permutations, #pooled): True for the first sample 
+    def pooled_tvalues ( self , setup , labels ) :
+        """ Calculate t-values for many permutations at once
+        - setup  : the result of `pooled_setup`
+        - labels : boolean 2D-array (#permutations, #pooled): True for the first sample 
+        """
+        raise NotImplementedError ( "%s: pooled permutations are not supported!" % typename ( self ) )
+    
     # ========================================================================
     ## Normalize/standartize two numpy arrays such that mean and rms for the pooled sample
     #  are equal to 0 and 1 correspondinly
@@ -479,14 +516,16 @@ def __init__ ( self ,
                    parallel    = False , 
                    silent      = False ,
                    progress    = True  ,
-                   n_neighbors = 10    , **params ) : 
+                   n_neighbors = 10    ,
+                   pooled      = True  , **params ) : 
         
         ## Attention!
         assert isinstance ( n_neighbors , int ) and 2 <= n_neighbors , \
             "Invalid `n_neighbors`: %s" % n_neighbors 
 
         ## store it
-        self._k_max = n_neighbors 
+        self._k_max   = n_neighbors 
+        self.__pooled = True if pooled else False 
         ##
         
         # =================================================================================
@@ -507,6 +546,14 @@ def __init__ ( self ,
                          n_neighbors  = self.k_max     ,
                          n_jobs       = n_jobs         , **params )
 
+    # ==================================================================================
+    @property
+    def config ( self ) :
+        """`config` : get all configuration parameters"""
+        conf = super().config 
+        conf [ 'pooled'           ] = self.pooled_permutations 
+        return conf 
+            
     # =========================================================================
     ## Are weights supported by this estimator?
     @property
@@ -539,6 +586,53 @@ def k_max ( self ) :
         """`k_max` : number of nearest neighbors to test
         """
         return self._k_max 
+
+    # =========================================================================
+    ## Evaluate permutations as label reshuffles of the pooled kNN-graph?
+    @property
+    def pooled_permutations ( self ) :
+        """`pooled_permutations` : evaluate permutations as label reshuffles of the pooled kNN-graph?
+        """
+        return self.__pooled
+    
+    # =========================================================================
+    ## Precompute kNN-graph (and pair weights) for the pooled sample
+    #  - the graph is invariant under permutations, only labels change 
+    def pooled_setup ( self , data , weights = None ) :
+        """ Precompute kNN-graph (and pair weights) for the pooled sample
+        - the graph is invariant under permutations, only labels change 
+        """
+        neighbors    = nearest_neighbors ( data , **self.params ) # (N, K)
+        pair_weights = None
+        if not weights is None :
+            weights      = numpy.asarray ( weights , dtype = float ) 
+            pair_weights = weights [ : , numpy.newaxis ] * weights [ neighbors ] 
+        return neighbors , pair_weights 
+    
+    # =========================================================================
+    ## Calculate t-values for many permutations at once
+    #  @param setup  the result of <code>pooled_setup</code>
+    #  @param labels boolean 2D-array (#permutations, #pooled): True for the first sample 
+    def pooled_tvalues ( self , setup , labels ) :
+        """ Calculate t-values for many permutations at once
+        - setup  : the result of `pooled_setup`
+        - labels : boolean 2D-array (#permutations, #pooled): True for the first sample 
+        """
+        neighbors , pair_weights = setup
+        N , K   = neighbors.shape
+        
+        ## process permutations in chunks to limit the memory usage  
+        nchunk  = max ( 1 , MAXSIZE // ( N * K ) )
+        results = [] 
+        for f in range ( 0 , len ( labels ) , nchunk ) :
+            L    = labels [ f : f + nchunk ]                               ## (M, N) 
+            I_ik = L [ : , : , numpy.newaxis ] == L [ : , neighbors ]      ## (M, N, K)
+            if pair_weights is None :
+                results.append ( numpy.sum ( I_ik , axis = ( 1 , 2 ) ) / ( 1.0 * K * N ) )
+            else :
+                results.append ( numpy.sum ( I_ik * pair_weights , axis = ( 1 , 2 ) ) / numpy.sum ( pair_weights ) )
+                
+        return numpy.concatenate ( results )
     
     # =========================================================================
     # calculate t-value for (non-structured) 2D arrays
@@ -664,7 +758,8 @@ def __init__ ( self                   ,
                    parallel  = False      , 
                    silent    = False      ,
                    progress  = True       , 
-                   maxsize   = 10000000   , **params ) :
+                   maxsize   = MAXSIZE    ,
+                   pooled    = True       , **params ) :
 
         
         # =================================================================================
@@ -674,7 +769,8 @@ def __init__ ( self                   ,
                     
         n_jobs = 1 if parallel else num_jobs ( params , numcpu() - 1 )
         
-        self.__mc2mc     = True if mc2mc else False
+        self.__mc2mc     = True if mc2mc  else False
+        self.__pooled    = True if pooled else False 
         self.__transform = None
         self.__sigma     = sigma
         self.__psi       = psi
@@ -704,6 +800,7 @@ def config ( self ) :
         conf [ 'psi'              ] = self.__psi        
         conf [ 'sigma'            ] = self.sigma
         conf [ 'maxsize'          ] = self.__maxsize 
+        conf [ 'pooled'           ] = self.pooled_permutations 
         return conf 
             
     # =========================================================================
@@ -780,6 +877,90 @@ def sum_distances ( self, data1 , data2 ) :
         if transform : distances  = transform ( distances )        
         ##
         return numpy.sum ( distances )
+
+    # =========================================================================
+    ## Calculate the block of (transformed) distances between elements of data1 & data2
+    #  - zero distances are excluded (as in <code>sum_distances</code>)
+    def kernel_block ( self , data1 , data2 ) :
+        """ Calculate the block of (transformed) distances between elements of data1 & data2
+        - zero distances are excluded (as in `sum_distances`)
+        """
+        scale = -0.5 / ( self.sigma ** 2 ) 
+        distance_type , transform , _ = psi_conf ( self.psi , scale )
+        ##
+        distances = pairwise_distances ( data1 , data2 , metric = distance_type , **self.params )
+        distances = distances.reshape  ( len ( data1 ) , len ( data2 ) )
+        positive  = distances > 0
+        block     = numpy.zeros_like ( distances , dtype = float )
+        block [ positive ] = transform ( distances [ positive ] ) if transform else distances [ positive ]
+        return block
+    
+    # =========================================================================
+    ## Evaluate permutations as label reshuffles of the pooled distance matrix?
+    @property
+    def pooled_permutations ( self ) :
+        """`pooled_permutations` : evaluate permutations as label reshuffles of the pooled distance matrix?
+        """
+        return self.__pooled
+    
+    # =========================================================================
+    ## Precompute the (transformed) distance matrix for the pooled sample
+    #  - the matrix is invariant under permutations, only labels change
+    #  - if the matrix is too large (see <code>maxsize</code>), its blocks
+    #    are recalculated for each batch of permutations
+    def pooled_setup ( self , data , weights = None ) :
+        """ Precompute the (transformed) distance matrix for the pooled sample
+        - the matrix is invariant under permutations, only labels change
+        - if the matrix is too large (see `maxsize`), its blocks
+          are recalculated for each batch of permutations
+        """
+        assert weights is None , "Weights are not supported!"
+        N = len ( data ) 
+        kernel = self.kernel_block ( data , data ) if N * N <= self.__maxsize else None 
+        return data , kernel 
+
+    # =========================================================================
+    ## Calculate t-values for many permutations at once
+    #  \f$ S_{11} = a^TKa, S_{12} = a^TKb, S_{22} = b^TKb \f$, 
+    #  where \f$a\f$ and \f$b\f$ are the indicator vectors for two samples 
+    #  @param setup  the result of <code>pooled_setup</code>
+    #  @param labels boolean 2D-array (#permutations, #pooled): True for the first sample 
+    def pooled_tvalues ( self , setup , labels ) :
+        """ Calculate t-values for many permutations at once
+        - S11 = a^T K a, S12 = a^T K b, S22 = b^T K b, 
+        where a and b are the indicator vectors for two samples 
+        - setup  : the result of `pooled_setup`
+        - labels : boolean 2D-array (#permutations, #pooled): True for the first sample 
+        """
+        data , kernel = setup
+        N   = len ( data ) 
+        A   = numpy.asarray ( labels , dtype = float )         ## (M, N)
+        n1  = int ( numpy.sum ( labels [ 0 ] ) )
+        n2  = N - n1
+        
+        if not kernel is None :
+            KA     = A @ kernel                                ## (M, N) 
+            total  = numpy.sum ( kernel )
+        else :
+            ## the matrix is too large: accumulate it by blocks 
+            KA     = numpy.zeros_like ( A )
+            total  = 0.0 
+            nrows  = max ( 1 , self.__maxsize // N )
+            for f , l in split_n_range ( 0 , N , ( N + nrows - 1 ) // nrows ) :
+                block  = self.kernel_block ( data [ f : l ] , data ) 
+                KA    += A [ : , f : l ] @ block
+                total += numpy.sum ( block ) 
+                
+        S11 = numpy.sum ( KA * A , axis = 1 ) 
+        S12 = numpy.sum ( KA     , axis = 1 ) - S11 
+        
+        result  = S11 / ( n1 * ( n1 - 1 ) )
+        result -= S12 / ( n1 *   n2       )
+        if self.mc2mc :
+            S22     = total - S11 - 2 * S12  
+            result += S22 / ( n2 * ( n2 - 1 ) )
+            
+        return result 
     
     # =========================================================================
     ## Calculate the t-value for 2D arrays
@@ -33,11 +33,11 @@
 __all__     = ()
 # =============================================================================
 from   ostap.core.ostap_types import integer_types, num_types
-from   ostap.math.math_base   import isfinite, isequal
+from   ostap.math.math_base   import isfinite, isequal, doubles
 from   ostap.core.core        import Ostap, VE
 from   ostap.logger.pretty    import pretty_float
 from   ostap.logger.symbols   import times, sum_symbol 
-import ROOT 
+import ROOT, array 
 # =============================================================================
 # logging 
 # =============================================================================
@@ -945,6 +945,30 @@ def _lm_reduce_ ( cnt ) :
 Ostap.Math.LehmerMean   . __reduce__ = _lm_reduce_
 Ostap.Math.WLehmerMean  . __reduce__ = _lm_reduce_
 
+# =============================================================================
+## factory for deserialization of t-digest
+#  @see Ostap::Math::TDigest
+def _td_factory_ ( klass , compression , means , weights , counter ) :
+    """ Factory for deserialization of t-digest
+    - see Ostap::Math::TDigest
+    """
+    return klass ( compression , doubles ( means ) , doubles ( weights ) , counter )
+
+# =============================================================================
+## serialization of t-digest
+#  @see Ostap::Math::TDigest
+def _td_reduce_ ( cnt ) :
+    """ Serialization of t-digest
+    - see Ostap::Math::TDigest
+    """
+    return _td_factory_ , ( type ( cnt )                          ,
+                            cnt.compression ()                    ,
+                            array.array ( 'd' , cnt.means   () )  ,
+                            array.array ( 'd' , cnt.weights () )  ,
+                            cnt.counter () )
+
+Ostap.Math.TDigest . __reduce__ = _td_reduce_
+
 
 # ==============================================================================
 ## equality for the mean
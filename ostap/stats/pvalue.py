@@ -38,6 +38,9 @@
 # =============================================================================
 logger.debug ( 'Utilities to get p-values for Two-Samples & Goodness-of-Fit tests' ) 
 # =============================================================================
+## number of permutations to be processed together for pooled permutations
+BATCH_SIZE = 64
+# =============================================================================
 ## Sampling without replacement (Permutations)
 def _permutations ( rng , n1 , n2  ) :
     """ Sampling without replacement (Permutations)
@@ -52,6 +55,36 @@ def _bootstrap   ( rng , n1 , n2 ) :
     idx2 = rng.integers ( 0, n1 + n2 , size = n2 )
     return idx1 , idx2
 # ============================================================================
+## Pooled weights for resampling
+#  @attention: weights are renormalized such that mean-weights are equal for two samples 
+#  @return pooled weights or None for trivial weights 
+def pooled_weights ( n1 , n2 , weight1 = None , weight2 = None ) :
+    """ Pooled weights for resampling
+    - ATTENTION:  weights are renormalized such that mean-weights are equal for two samples! 
+    - return pooled weights or None for trivial weights 
+    """
+    w1_trivial = weight_trivial ( weight1 )
+    w2_trivial = weight_trivial ( weight2 )
+    
+    if w1_trivial and w2_trivial : return None
+
+    w1mean = 1 if w1_trivial else numpy.mean ( weight1 , dtype = numpy.float64 )
+    w2mean = 1 if w2_trivial else numpy.mean ( weight2 , dtype = numpy.float64 )
+    scale  = numpy.float32 ( w1mean / w2mean ) 
+    
+    if   w1_trivial :
+        w1_arr   = numpy.ones        ( n1       , dtype = numpy.float32 )
+        w2_arr   = numpy.asarray     ( weight2  , dtype = numpy.float32 ) * scale 
+    elif w2_trivial :
+        w1_arr   = numpy.asarray     ( weight1  ,                      dtype = numpy.float32 )        
+        w2_arr   = numpy.full        ( n2       , fill_value = scale , dtype = numpy.float32 )
+    else :
+        w1_arr   = numpy.asarray     ( weight1  , dtype = numpy.float32 )
+        w2_arr   = numpy.asarray     ( weight2  , dtype = numpy.float32 ) * scale 
+            
+    return numpy.concatenate ( [ w1_arr , w2_arr ] , axis = 0 )
+
+# ============================================================================
 ## Resampling generator for datasets (and associated weights)
 #  @attention: weights are renormalized such that mean-weights are equal for two samples 
 def make_resampling ( sampler     ,
@@ -75,29 +108,7 @@ def make_resampling ( sampler     ,
     n_total  = n1 + n2
 
     pooled_x = numpy.concatenate ( [ data1 , data2 ] , axis = 0 )
-    pooled_w = None
-
-    w1_trivial = weight_trivial ( weight1 )
-    w2_trivial = weight_trivial ( weight2 )
-    
-    if   w1_trivial and w2_trivial : pass
-    else :
-
-        w1mean = 1 if w1_trivial else numpy.mean ( weight1 , dtype = numpy.float64 )
-        w2mean = 1 if w2_trivial else numpy.mean ( weight2 , dtype = numpy.float64 )
-        scale  = numpy.float32 ( w1mean / w2mean ) 
-                
-        if   w1_trivial :
-            w1_arr   = numpy.ones        ( n1       , dtype = numpy.float32 )
-            w2_arr   = numpy.asarray     ( weight2  , dtype = numpy.float32 ) * scale 
-        elif w2_trivial :
-            w1_arr   = numpy.asarray     ( weight1  ,                      dtype = numpy.float32 )        
-            w2_arr   = numpy.full        ( n2       , fill_value = scale , dtype = numpy.float32 )
-        else :
-            w1_arr   = numpy.asarray     ( weight1  , dtype = numpy.float32 )
-            w2_arr   = numpy.asarray     ( weight2  , dtype = numpy.float32 ) * scale 
-
-        pooled_w = numpy.concatenate ( [ w1_arr , w2_arr ] , axis = 0 )
+    pooled_w = pooled_weights    ( n1 , n2 , weight1 , weight2 )
         
     rng = numpy.random.default_rng ( random_seed )
 
@@ -336,7 +347,11 @@ def __init__ ( self        ,
     ## Run N permutations 
     def run_toys ( self, N , silent = True , progress = False ) :
         """ Run N permutations 
-        """        
+        """
+        ## permutation-invariant precomputation is available?
+        if getattr ( self.gof , 'pooled_permutations' , False ) :
+            return self.run_pooled ( N , silent = silent , progress = progress )
+        
         counter = EffCounter()
         tvalues = []
 
@@ -361,6 +376,48 @@ def run_toys ( self, N , silent = True , progress = False ) :
             
         return counter , numpy.asarray ( tvalues , dtype = float )
 
+    # =========================================================================
+    ## Run N permutations as label reshuffles of the pooled sample
+    #  - the pooled geometry (kNN graph, distance matrix, ...) is
+    #    permutation-invariant and it is precomputed only once by GoF-object
+    #  - permutations are processed in batches 
+    #  @see GoFnp.pooled_setup
+    #  @see GoFnp.pooled_tvalues
+    def run_pooled ( self , N , silent = True , progress = False ) :
+        """ Run N permutations as label reshuffles of the pooled sample
+        - the pooled geometry (kNN graph, distance matrix, ...) is
+          permutation-invariant and it is precomputed only once by GoF-object
+        - permutations are processed in batches 
+        - see `GoFnp.pooled_setup`
+        - see `GoFnp.pooled_tvalues`
+        """
+        n1       = len ( self.ds1 )
+        n2       = len ( self.ds2 )
+        pooled_x = numpy.concatenate ( [ self.ds1 , self.ds2 ] , axis = 0 )
+        pooled_w = pooled_weights    ( n1 , n2 , self.weight1 , self.weight2 )
+
+        ## precompute the pooled geometry 
+        setup    = self.gof.pooled_setup ( pooled_x , weights = pooled_w )
+        
+        ## labels: True for the first sample 
+        labels   = numpy.zeros ( n1 + n2 , dtype = bool )
+        labels [ : n1 ] = True
+        
+        rng      = numpy.random.default_rng ( self.random_seed )
+        
+        tvalues  = []
+        batches  = [ ( i , min ( i + BATCH_SIZE , N ) ) for i in range ( 0 , N , BATCH_SIZE ) ]
+        for first , last in progress_bar ( batches ,
+                                           silent      = silent and not progress , 
+                                           description = self.description       ) :
+            permuted = rng.permuted ( numpy.tile ( labels , ( last - first , 1 ) ) , axis = 1 )
+            tvalues.extend ( float ( tv ) for tv in self.gof.pooled_tvalues ( setup , permuted ) )
+            
+        counter = EffCounter()
+        for tv in tvalues : counter += bool ( self.t_value <= tv )
+        
+        return counter , numpy.asarray ( tvalues , dtype = float )
+    
 # =============================================================================
 ## @class BOOTSTRAPPER
 #  Helper class to run bootstrap tests in parallel
@@ -8,6 +8,7 @@
 # =============================================================================
 """ Functions to collect statistics for trees and  datasets
 - data_get_stat        - generic statistics 
+- data_stat_plan       - many counters in a single loop 
 - data_the_moment      - get colleciton of moment  
 - data_moment          - get the moment  (with uncertainty) 
 - data_ECDF            - get the emptipical cumulative distribution function 
@@ -47,6 +48,7 @@
 __date__    = "2014-06-06"
 __all__     = (
     'data_get_stat'        , ## generic statistics 
+    'data_stat_plan'       , ## many counters in a single loop 
     'data_the_moment'      , ## get colleciton of moment  
     'data_ECDF'            , ## get the emptipical cumulative distribution function 
     'data_statistic'       , ## get statistic ast StatEntity/WStatEntity objects 
@@ -210,6 +212,16 @@ def target_copy ( self , obj ) :
     T = type ( obj )
     return T ( obj )
 # =============================================================================
+## Can the counter be used for frame/parallel processing?
+#  - the partial results must be merged via <code>+=</code>
+#  @see Ostap::Math::TDigest
+def mergeable ( statobj ) :
+    """ Can the counter be used for frame/parallel processing?
+    - the partial results must be merged via `+=`
+    - see Ostap.Math.TDigest
+    """
+    return hasattr ( type ( statobj ) , '__iadd__' ) 
+# =============================================================================
 _s1D = Ostap.Math.Statistic  , Ostap.Math.WStatistic
 _s2D = Ostap.Math.Statistic2 , Ostap.Math.WStatistic2
 _s3D = Ostap.Math.Statistic3 , Ostap.Math.WStatistic3
@@ -297,18 +309,18 @@ def data_get_stat ( data               ,
         assert sc.isSuccess() , 'Error %s from StatVar::get_stat' % sc 
         return statobj
 
-    ## Use frame processing ?
-    if   use_frame and good_for_frame ( data , first , last ) : 
-        return F.frame_project ( data                   ,
-                                 model       = statobj  ,
-                                 expressions = var_lst  ,
-                                 cuts        = cuts     ,
-                                 progress    = progress ,
-                                 report      = progress ,
-                                 lazy        = False    )
-    ## Use parallel processon 
-    elif parallel and good_for_parallel ( data , first , last ) : 
-        from ostap.parallel.parallel_stavar import parallel_get_stat        
+    ## Use frame processing ? (only for mergeable 1D counters)
+    if   use_frame and 1 == nvars and mergeable ( statobj ) and good_for_frame ( data , first , last ) : 
+        return F.frame_statistic ( data                   ,
+                                   var_lst [ 0 ]          , 
+                                   cuts        = cuts     ,
+                                   progress    = progress ,
+                                   report      = progress ,
+                                   lazy        = False    ,
+                                   model       = statobj  )
+    ## Use parallel processing ? (only for mergeable counters)
+    elif parallel and mergeable ( statobj ) and good_for_parallel ( data , first , last ) : 
+        from ostap.parallel.parallel_statvar import parallel_get_stat        
         return parallel_get_stat ( data        ,
                                    statobj     ,
                                    expressions ,
@@ -331,6 +343,167 @@ def data_get_stat ( data               ,
         assert sc.isSuccess() , 'Error %s from StatVar::the_moment' % sc 
         return statobj
     
+# =============================================================================
+## Decode the "statistics plan"
+#  - dictionary { key : ( statobj , expression [, cuts ] ) }
+#  @return list of ( key , statobj , expression , cuts ) 
+def decode_plan ( plan ) :
+    """ Decode the "statistics plan"
+    - dictionary { key : ( statobj , expression [, cuts ] ) }
+    - return list of ( key , statobj , expression , cuts ) 
+    """
+    if not isinstance ( plan , dictlike_types ) :
+        raise TypeError ( "Invalid type of `plan`: %s" % typename ( plan ) )
+    
+    items = []
+    for key , request in plan.items () :
+        
+        if not isinstance ( request , sequence_types ) or not 2 <= len ( request ) <= 3 :
+            raise TypeError ( "Invalid request for key %s: %s" % ( key , str ( request ) ) )
+        
+        statobj , expression = request [ 0 ] , request [ 1 ]
+        cuts                 = request [ 2 ] if 3 == len ( request ) else '' 
+        
+        if not isinstance ( statobj , _s1D ) :
+            raise TypeError ( "Invalid statobj for key %s: %s" % ( key , typename ( statobj ) ) )
+        
+        var_lst , cuts , _ = vars_and_cuts ( expression , cuts )
+        if 1 != len ( var_lst ) :
+            raise TypeError ( "Invalid expression for key %s: %s" % ( key , str ( var_lst ) ) ) 
+        
+        items.append ( ( key , statobj , var_lst [ 0 ] , cuts ) )
+        
+    return items 
+
+# =============================================================================
+## Fill many (Statistic/WStatistic-based) counters in a single loop over data 
+#  The plan is a dictionary  <code>{ key : ( statobj , expression [, cuts ] ) }</code>
+#  @code
+#  data = ...
+#  plan = { 'hmean' : ( Ostap.Math.HarmonicMean () , 'pt'          ) ,
+#           'gmean' : ( Ostap.Math.GeometricMean() , 'pt' , 'y>2' ) ,
+#           'ptmin' : ( Ostap.Math.MinValue     () , 'pt' , 'y<2' ) } 
+#  result = data_stat_plan ( data , plan , 'eta>2' )
+#  print ( result [ 'hmean' ] ) 
+#  @endcode
+#  - each expression and each selection is evaluated only once per entry
+#  - the common selection <code>cuts</code> is applied to all requests
+#  - for Ostap::Math::Statistic  counters selections are treated as boolean 
+#  - for Ostap::Math::WStatistic counters selections are treated as weights 
+#  - counters are reset and filled in place
+#  @see Ostap::StatPlan
+#  @see Ostap::StatVar::get_stats 
+def data_stat_plan ( data               ,
+                     plan               ,
+                     cuts       = ""    , *   ,
+                     first      = FIRST_ENTRY ,
+                     last       =  LAST_ENTRY ,                     
+                     cut_range  = ""    ,
+                     progress   = False , 
+                     use_frame  = False ,
+                     parallel   = False ) :
+    """ Fill many (Statistic/WStatistic-based) counters in a single loop over data 
+    The plan is a dictionary  `{ key : ( statobj , expression [, cuts ] ) }`
+    >>> data   = ...
+    >>> plan   = { 'hmean' : ( Ostap.Math.HarmonicMean () , 'pt'          ) ,
+    ...            'gmean' : ( Ostap.Math.GeometricMean() , 'pt' , 'y>2' ) ,
+    ...            'ptmin' : ( Ostap.Math.MinValue     () , 'pt' , 'y<2' ) } 
+    >>> result = data.stat_plan ( plan , 'eta>2' )
+    >>> print ( result [ 'hmean' ] )
+    - each expression and each selection is evaluated only once per entry
+    - the common selection `cuts` is applied to all requests
+    - for Ostap.Math.Statistic  counters selections are treated as boolean 
+    - for Ostap.Math.WStatistic counters selections are treated as weights 
+    - counters are reset and filled in place
+    - see Ostap.StatPlan
+    - see Ostap.StatVar.get_stats 
+    """
+
+    ## (1) decode the plan 
+    items = decode_plan ( plan )
+    
+    ## (2) decode common cuts 
+    _ , cuts , _ = vars_and_cuts ( '1' , cuts ) 
+
+    ## (3) cut_range defined *only* for RooFit datasets 
+    if cut_range and not isinstance ( data , ROOT.RooAbsData ) : 
+        raise TypeError ( "Invalid use of `cut_range':%s" % cut_range  ) 
+
+    result = dict ( ( key , statobj ) for key , statobj , _ , _ in items ) 
+    for statobj in result.values () : statobj.reset ()
+    
+    ## check first/last 
+    first , last = evt_range ( data , first , last )
+    if last <= first or not items : return result 
+    
+    ## (4) display progress ? 
+    progress = progress_conf ( progress )
+    
+    ## (5) frame processing? (only for mergeable unweighted counters)
+    if use_frame and good_for_frame ( data , first , last ) and \
+       all ( mergeable ( s ) and isinstance ( s , Ostap.Math.Statistic ) for s in result.values () ) :
+        
+        node = F.DataFrame ( data , progress = progress )
+        
+        ## book all actions at the same node: single event loop 
+        booked = {}
+        for key , statobj , expr , icuts in items :
+            the_cuts = '(%s)&&(%s)' % ( cuts , icuts ) if cuts and icuts else ( cuts or icuts )
+            booked [ key ] , _ = F.frame_statistic ( node , expr , cuts = the_cuts , lazy = True , model = statobj )
+            
+        for key , res in booked.items () : result [ key ] += res.GetValue () 
+        return result
+    
+    ## (6) parallel processing ? (only for mergeable counters) 
+    if parallel and good_for_parallel ( data , first , last ) and \
+       all ( mergeable ( s ) for s in result.values () ) : 
+        from ostap.parallel.parallel_statvar import parallel_stat_plan 
+        presult = parallel_stat_plan ( data        ,
+                                       plan        ,
+                                       cuts        ,
+                                       first       = first         ,
+                                       last        = last          , 
+                                       progress    = progress      ,
+                                       use_frame   = False         , ## NB!!
+                                       chunk_size  = 2 * LARGE     ,
+                                       max_files   = 1             ,
+                                       silent      = not progress  )
+        for key , res in presult.items () :
+            if not res is result [ key ] : result [ key ] += res
+        return result 
+
+    ## (7) the plan for C++
+    the_plan = Ostap.StatPlan ()
+    for key , statobj , expr , icuts in items :
+        the_plan.add ( statobj , expr , icuts )
+        
+    ## (8) create the driver 
+    sv = StatVar ( progress )
+    
+    ## (9) RooFit ?
+    if isinstance ( data , ROOT.RooAbsData ) :
+        
+        weighted          = data.isWeighted ()
+        store_errors      = weighted and data.store_errors      ()
+        store_asym_errors = weighted and data.store_asym_errors ()         
+        if store_errors or store_asym_errors :
+            logger.warning ( "Weight uncertainties are defined, but will be ignored!" ) 
+            
+        with rootException() :
+            sc = sv.get_stats ( data , the_plan , cuts , cut_range , first , last )
+            assert sc.isSuccess() , 'Error %s from StatVar::get_stats' % sc 
+        return result 
+
+    assert isinstance ( data , ROOT.TTree ) , "Here data must be TTree: %s" % typename ( data ) 
+    
+    ## Branches to be activated
+    all_vars = [ expr for _ , _ , expr , _ in items ] + [ icuts for _ , _ , _ , icuts in items if icuts ]
+    from ostap.trees.trees import ActiveBranches
+    with rootException() , ActiveBranches ( data , cuts , *all_vars ) :
+        sc = sv.get_stats ( data , the_plan , cuts , first , last )
+        assert sc.isSuccess() , 'Error %s from StatVar::get_stats' % sc 
+    return result 
+    
 # =============================================================================
 ## get the moment of order 'order' relative to 'center'
 #  @code
@@ -1563,6 +1736,9 @@ def data_kurtosis ( data               ,
 #  @see https://aakinshin.net/posts/p2-quantile-estimator-rounding-issue/
 #
 #  @see https://www.cse.wustl.edu/~jain/papers/ftp/psqr.pdf
+#  @attention P2-estimators are not mergeable: for frame/parallel processing
+#             the mergeable t-digest is used instead
+#  @see Ostap::Math::TDigest 
 def  data_quantiles ( data               ,
                       p                  , 
                       expression         ,
@@ -1582,12 +1758,23 @@ def  data_quantiles ( data               ,
     - see https://aakinshin.net/posts/p2-quantile-estimator-initialization/
     - see https://aakinshin.net/posts/p2-quantile-estimator-rounding-issue/
     - see https://www.cse.wustl.edu/~jain/papers/ftp/psqr.pdf
+    - attention: P2-estimators are not mergeable: for frame/parallel processing
+      the mergeable t-digest is used instead, see `Ostap.Math.TDigest`
     """
 
-    if   isinstance ( p , integer_types  ) and 1 <= p     : qq = Ostap.Math.Quantiles_[p] ()
-    elif isinstance ( p , float          ) and 0 <  p < 1 : qq = Ostap.Math.Quantile  ( p  )    
+    ## P2-estimators can't be merged: use mergeable t-digest for frame/parallel processing
+    sketch = ( use_frame and good_for_frame    ( data , first , last ) ) or \
+             ( parallel  and good_for_parallel ( data , first , last ) )
+    
+    if   isinstance ( p , integer_types  ) and 1 <= p     :
+        qq = Ostap.Math.TDigest () if sketch else Ostap.Math.Quantiles_[p] ()
+        qp = p 
+    elif isinstance ( p , float          ) and 0 <  p < 1 :
+        qq = Ostap.Math.TDigest () if sketch else Ostap.Math.Quantile  ( p  )    
+        qp = doubles ( p )
     elif isinstance ( p , sequence_types ) and all ( isinstance ( v , float ) and 0 < v < 1 for v in p ) :
-        qq = Ostap.Math.Quantiles ( doubles ( sorted ( float ( v ) for v in p ) ) ) 
+        qp = doubles ( sorted ( float ( v ) for v in p ) )
+        qq = Ostap.Math.TDigest () if sketch else Ostap.Math.Quantiles ( qp ) 
     else :
         raise TypeError ( 'Invalid probabilities: %s/%s' % ( typename ( p ) , str ( p ) ) ) 
     
@@ -1599,10 +1786,10 @@ def  data_quantiles ( data               ,
                              last      = last      , 
                              cut_range = cut_range ,
                              progress  = progress  ,              
-                             use_frame = False     ,  ## ATTENTION!
-                             parallel  = False     )  ## ATTENTION!
+                             use_frame = sketch and use_frame , 
+                             parallel  = sketch and parallel  )
 
-    qq = result.quantiles()
+    qq = result.quantiles ( qp ) if sketch else result.quantiles ()
     nq = len ( qq ) 
     return tuple ( qq [ i ] for i in range ( nq ) ) 
 
@@ -1646,8 +1833,8 @@ def data_median ( data       ,
                           last       = last      , 
                           cut_range  = cut_range , 
                           progress   = progress  ,  
-                          use_frame  = False     ,
-                          parallel   = False     ) 
+                          use_frame  = use_frame ,
+                          parallel   = parallel  ) 
     return qs [ 1 ]
 
 # =============================================================================
@@ -1682,8 +1869,8 @@ def data_terciles ( data       ,
                             last      = last      , 
                             cut_range  = cut_range , 
                             progress   = progress  ,  
-                            use_frame  = False     ,
-                            parallel   = False     ) 
+                            use_frame  = use_frame ,
+                            parallel   = parallel  ) 
 
 # =============================================================================
 ## Get the (approximate) quartiles  for the data using P2-algorithm
@@ -1717,8 +1904,8 @@ def data_quartiles  ( data       ,
                             last       = last      , 
                             cut_range  = cut_range , 
                             progress   = progress  ,  
-                            use_frame  = False     ,
-                            parallel   = False     ) 
+                            use_frame  = use_frame ,
+                            parallel   = parallel  ) 
     
 # =============================================================================
 ## Get the (approximate) quintiles for the data using P2-algorithm
@@ -1751,8 +1938,8 @@ def data_quintiles  ( data       ,
                             first      = first     ,
                             last       = last      , 
                             progress   = progress  ,  
-                            use_frame  = False     ,
-                            parallel   = False     ) 
+                            use_frame  = use_frame ,
+                            parallel   = parallel  ) 
     
 
 # =============================================================================
@@ -1787,8 +1974,8 @@ def data_sextiles   ( data       ,
                             last       = last      , 
                             cut_range  = cut_range , 
                             progress   = progress  ,  
-                            use_frame  = False     ,
-                            parallel   = False     ) 
+                            use_frame  = use_frame ,
+                            parallel   = parallel  ) 
     
 # =============================================================================
 ## Get the (approximate) septiles  for the data using P2-algorithm
@@ -1822,8 +2009,8 @@ def data_septiles   ( data       ,
                             last       = last      , 
                             cut_range  = cut_range , 
                             progress   = progress  ,  
-                            use_frame  = False     ,
-                            parallel   = False     ) 
+                            use_frame  = use_frame ,
+                            parallel   = parallel  ) 
     
 
 # =============================================================================
@@ -1856,8 +2043,8 @@ def data_octiles    ( data       ,
                             last       = last      , 
                             cut_range  = cut_range , 
                             progress   = progress  ,  
-                            use_frame  = False     ,
-                            parallel   = False     ) 
+                            use_frame  = use_frame ,
+                            parallel   = parallel  ) 
     
 
 # =============================================================================
@@ -1892,8 +2079,8 @@ def data_deciles    ( data       ,
                             last       = last      , 
                             cut_range  = cut_range , 
                             progress   = progress  ,  
-                            use_frame  = False     ,
-                            parallel   = False     ) 
+                            use_frame  = use_frame ,
+                            parallel   = parallel  ) 
     
 # =============================================================================
 ## Get the (approximate) ventiles for the data using P2-algorithm
@@ -1927,8 +2114,8 @@ def data_ventiles   ( data       ,
                             last       = last      , 
                             cut_range  = cut_range , 
                             progress   = progress  ,  
-                            use_frame  = False     ,
-                            parallel   = False     ) 
+                            use_frame  = use_frame ,
+                            parallel   = parallel  ) 
     
 
 # =============================================================================
@@ -1963,8 +2150,8 @@ def data_percentiles ( data       ,
                             last       = last      , 
                             cut_range  = cut_range , 
                             progress   = progress  ,  
-                            use_frame  = False     ,
-                            parallel   = False     ) 
+                            use_frame  = use_frame ,
+                            parallel   = parallel  ) 
     
 # =============================================================================
 ## Get "center" for data  using Pragmastat toolkit 
@@ -2697,7 +2884,10 @@ def data_decorate ( klass ) :
     if hasattr ( klass , 'efficiency'     ) : klass.orig_efficiency     = klass.efficiency 
 
     
+    if hasattr ( klass , 'stat_plan'      ) : klass.orig_stat_plan      = klass.stat_plan
+    
     klass.get_moment      = data_the_moment
+    klass.stat_plan       = data_stat_plan 
     klass.the_moment      = data_the_moment
 
     klass.hasEntry        = data_hasEntry 
@@ -2787,6 +2977,7 @@ def data_decorate ( klass ) :
              klass.sumVars         ,             
              klass.statCov         ,
              klass.statCovs        ,
+             klass.stat_plan       ,
              ##
              klass.harmonic_mean   , 
              klass.geometric_mean  , 
@@ -8,14 +8,14 @@
 """ 2-samples test
 """
 # ==============================================================================
-from   ostap.stats.twosamples import TSTest, TSToys 
+from   ostap.stats.twosamples import TSTest, TSToys, permutation_statistics 
 from   ostap.plotting.canvas  import use_canvas
 from   ostap.logger.pretty    import pretty_float
 from   ostap.utils.ranges     import vrange
 from   ostap.utils.root_utils import batch_env 
 from   ostap.math.math_ve     import significance
 import ostap.logger.table     as     T
-import ROOT, random, array    
+import ROOT, random, array, numpy 
 # ==============================================================================
 from   ostap.logger.logger import getLogger 
 if '__main__' ==  __name__ : logger = getLogger ( 'tests_stats_2samples' )
@@ -120,6 +120,36 @@ def test_2samples_bad2 () :
     with use_canvas ( 'test_2samples_bad2/toys Zhang ZA'           , wait = 1 ) : toys.draw ('ZA') 
     with use_canvas ( 'test_2samples_bad2/toys Zhang ZC'           , wait = 1 ) : toys.draw ('ZC') 
 
+# =============================================================================
+def test_2samples_batch () :
+    
+    logger = getLogger ( 'test_2samples_batch'  ) 
+
+    test   = TSTest ( ds1 , ds3 )
+    
+    ## labels for the actual (non-permuted) samples
+    data   = numpy.asarray ( test.ecdf.data () , dtype = float )
+    labels = numpy.isin    ( data , numpy.asarray ( ds1 , dtype = float ) )
+    result = permutation_statistics ( test.ecdf , labels )
+
+    rows = [ ( 'Statistics' , 'direct' , 'batched' ) ]
+    for key , value in test.estimators.items () :
+        batched = float ( result [ key ] [ 0 ] )
+        rows.append ( ( key , '%+.6g' % value , '%+.6g' % batched ) )
+        assert abs ( value - batched ) <= 1.e-8 * max ( 1.0 , abs ( value ) ) , \
+               'Mismatch for %s: %s vs %s' % ( key , value , batched )
+        
+    title = 'Direct vs batched'
+    logger.info ( '%s:\n%s' % ( title , T.table ( rows , title = title , prefix = '# ' , alignment = 'lcc' ) ) )
+
+    ## many permutations per call 
+    rng      = numpy.random.default_rng ()
+    permuted = rng.permuted ( numpy.tile ( labels , ( 1000 , 1 ) ) , axis = 1 )
+    from ostap.utils.timing import timing 
+    with timing ( 'Batched statistics for 1000 permutations' , logger = logger ) :
+        result = permutation_statistics ( test.ecdf , permuted )
+    for key , values in result.items () : assert 1000 == len ( values ) , 'Invalid size for %s' % key 
+    
 # ===============================================================================
 if '__main__' == __name__ :
 
@@ -127,6 +157,7 @@ def test_2samples_bad2 () :
     test_2samples_same ()
     test_2samples_bad1 ()
     test_2samples_bad2 ()
+    test_2samples_batch ()
     
 # ===============================================================================
 ##                                                                        The END 
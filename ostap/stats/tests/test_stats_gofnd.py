@@ -335,9 +335,38 @@ def test_GOF () :
         table = T.table ( rows , title = title , prefix = '# ')
         logger.info ( '%s:\n%s' % ( title , table ) )
         
+# ===============================================================================
+## pooled permutations must reproduce t-values of the direct calculation 
+def test_pooled_permutations () :
+
+    logger = getLogger ("test_pooled_permutations" )
+    
+    import numpy
+    import ostap.stats.gof_np as GNP
+
+    rng    = numpy.random.default_rng ( 12345 )
+    pooled = rng.normal ( size = ( 300 , 2 ) )
+    labels = numpy.zeros ( len ( pooled ) , dtype = bool )
+    labels [ : 100 ] = True
+    labels = rng.permuted ( numpy.tile ( labels , ( 5 , 1 ) ) , axis = 1 )
+
+    for gof in ( GNP.MIXnp ( n_neighbors = 5 ) ,
+                 GNP.PPDnp ( mc2mc = False   ) ,
+                 GNP.PPDnp ( mc2mc = True    ) ) :
+
+        setup   = gof.pooled_setup   ( pooled )
+        tvalues = gof.pooled_tvalues ( setup , labels )
+        for L , tv in zip ( labels , tvalues ) :
+            direct = gof.tvalue ( pooled [ L ] , pooled [ ~L ] , normalize = False ) 
+            assert abs ( direct - tv ) <= 1.e-8 * max ( 1 , abs ( direct ) ) , \
+                   '%s: mismatch in t-values %s vs %s' % ( typename ( gof ) , direct , tv )
+            
+        logger.info ( '%s: pooled t-values are OK' % typename ( gof ) )
+        
 # ===============================================================================
 if '__main__' == __name__ :
 
+    test_pooled_permutations ()
     test_GOF  ()    
 
 # ===============================================================================
@@ -162,6 +162,44 @@ def test_moment4() :
     logger.info ( '%s:\n%s' % ( title , table  ) ) 
 
 
+# =============================================================================
+def test_moment5() :
+
+    logger = getLogger ( 'test_moment5' )
+
+    t1 = Ostap.Math.TDigest ()
+    t2 = Ostap.Math.TDigest ()
+    tt = Ostap.Math.TDigest ()
+
+    values = [] 
+    for i in range ( 100000 ) :
+        v = random.gauss ( 0 , 1 )
+        values.append ( v )
+        if i % 2 : t1 += v
+        else     : t2 += v
+        tt += v 
+
+    ## merge two digests 
+    t1 += t2
+    
+    ## serialization 
+    import pickle 
+    tp = pickle.loads ( pickle.dumps ( t1 ) )
+    
+    values.sort ()
+    
+    rows = [ ( 'p' , 'Exact' , 'Merged' , 'Single' , 'Pickled' ) ]
+    for p in ( 0.01 , 0.1 , 0.25 , 0.5 , 0.75 , 0.9 , 0.99 ) :
+        exact = values [ int ( p * len ( values ) ) ]
+        row   = '%.2f' % p , '%+.4f' % exact , '%+.4f' % t1.quantile ( p ) , '%+.4f' % tt.quantile ( p ) , '%+.4f' % tp.quantile ( p )
+        rows.append ( row )
+        assert abs ( t1.quantile ( p ) - exact ) < 0.05 , 'Invalid merged quantile for p=%s' % p 
+        assert abs ( tp.quantile ( p ) - t1.quantile ( p ) ) < 1.e-8 , 'Invalid pickled quantile for p=%s' % p 
+
+    title = 'T-digest quantiles'
+    table = T.table ( rows , title = title , prefix = '# ' , alignment = 'rrrrr' )  
+    logger.info ( '%s:\n%s' % ( title , table  ) ) 
+
 # =============================================================================
 if '__main__' == __name__ :
 
@@ -169,6 +207,7 @@ def test_moment4() :
     test_moment2 ()
     test_moment3 ()
     test_moment4 ()
+    test_moment5 ()
         
 # =============================================================================
 ##                                                                      The END 
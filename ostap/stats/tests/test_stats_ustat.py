@@ -138,11 +138,54 @@ def test_stats_ustat_G3D () :
             
 
 
+# =============================================================================
+## benchmark: scaling of U-statistics with the number of events
+#  - the nearest neighbours are found using k-d tree: O(N log N)
+#  - extend the list of sizes up to 10**7 for the full benchmark 
+def test_stats_ustat_scaling ( sizes = ( 10**4 , 10**5 , 10**6 ) ) :
+
+    logger = getLogger ( "test_stats_ustat_scaling" )
+    
+    x   = ROOT.RooRealVar ( 'x' , 'x-variable' , 0 , 10 )
+    y   = ROOT.RooRealVar ( 'y' , 'y-variable' , 0 , 10 )
+    
+    pdf = Models.Gauss2D_pdf ( 'G2S' , x , y ,
+                               muX    = 5 , 
+                               muY    = 5 , 
+                               sigmaX = 1 , 
+                               sigmaY = 2 , 
+                               theta  = math.pi/4 )
+    
+    import ostap.logger.table as T
+    rows = [ ( '#events' , 'T-value' , '1 thread [s]' , 'all threads [s]' ) ]
+    for n in sizes :
+        
+        data = pdf.generate ( n )
+
+        with timing ( "uStat 2D: N=%d/1"   % n , logger = logger ) as t1 :
+            ts1 , _ = uStat.uCalc ( pdf , data , silent = True , nthreads = 1 )
+        with timing ( "uStat 2D: N=%d/all" % n , logger = logger ) as tn :
+            tsn , _ = uStat.uCalc ( pdf , data , silent = True , nthreads = 0 )
+
+        assert abs ( ts1 - tsn ) <= 1.e-8 * max ( 1 , abs ( ts1 ) ) , \
+               'T-value depends on number of threads: %s vs %s' % ( ts1 , tsn ) 
+            
+        rows.append ( ( '%d' % n , '%+.3f' % ts1 , '%.2f' % t1.delta , '%.2f' % tn.delta ) )
+
+        if isinstance ( data , ROOT.RooAbsData ) :
+            ROOT.SetOwnership ( data , True ) 
+        del data
+
+    title = 'Scaling of U-statistics'
+    table = T.table ( rows , title = title , prefix = '# ' , alignment = 'rrrr' )
+    logger.info ( '%s:\n%s' % ( title , table ) )
+    
 # =============================================================================
 if '__main__' == __name__ :
 
     test_stats_ustat_G2D ()
     test_stats_ustat_G3D ()
+    test_stats_ustat_scaling ()
     
 # =============================================================================
 ##                                                                      The END 
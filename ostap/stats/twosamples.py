@@ -29,6 +29,7 @@
 from   ostap.math.math_ve     import significance
 from   ostap.math.ve          import fmt_pretty_ve
 from   ostap.stats.counters   import SE, ECDF
+from   ostap.stats.pvalue     import BATCH_SIZE
 from   ostap.logger.symbols   import plus_minus, times, greek_lower_sigma
 from   collections            import defaultdict, namedtuple 
 import ostap.logger.table     as     T
@@ -129,18 +130,137 @@ def prepare_data2 ( data1 , data2 , pooled = None , ranks1 = None , ranks2 = Non
     n2 = len ( ecdf2 )
     ## 
     ok1 = isinstance ( ranks1 , listlike_types ) and n1 + n2 == len ( ranks1 )
-    if not ok1 :
-        r1     = ecdf1.ranks ( ecdf )            
-        ranks1 = numpy.asarray  ( r1 , dtype = numpy.dtype ( 'uint16' ) ) if numpy else array.array ( 'I' , r1 )
-        ## 
+    if not ok1 : ranks1 = ecdf_ranks ( ecdf1 , ecdf )            
+    ## 
     ok2 = isinstance ( ranks2 , listlike_types ) and n1 + n2 == len ( ranks2 )
-    if not ok2 :
-        r2     = ecdf2.ranks ( ecdf )            
-        ranks2 = numpy.asarray  ( r2 , dtype = numpy.dtype ( 'uint16' ) ) if numpy else array.array ( 'I' , r2 )
+    if not ok2 : ranks2 = ecdf_ranks ( ecdf2 , ecdf )            
     ## 
     return ecdf1, ecdf2, ecdf, ranks1 , ranks2
 
 # =============================================================================
+## @class _Ranks
+#  Helper class: numpy view of ranks that keeps the underlying vector alive
+class _Ranks(numpy.ndarray) :
+    """ Helper class: numpy view of ranks that keeps the underlying vector alive
+    """
+    pass 
+# =============================================================================
+## Get ranks of the elements from the sample in the ECDF as numpy array
+#  - no copy: the array is a view of the <code>std::vector</code>
+#    returned by <code>Ostap::Math::ECDF::ranks</code>
+#  @code
+#  ecdf1 = ...
+#  ecdf  = ...
+#  ranks = ecdf_ranks ( ecdf1 , ecdf ) 
+#  @endcode
+#  @param ecdf   the empirical CDF 
+#  @param sample the sample (empirical CDF) 
+#  @return numpy array of ranks 
+#  @see Ostap::Math::ECDF::ranks
+def ecdf_ranks ( ecdf , sample ) :
+    """ Get ranks of the elements from the sample in the ECDF as numpy array
+    - no copy: the array is a view of `std::vector` returned by `Ostap.Math.ECDF.ranks`
+    >>> ecdf1 = ...
+    >>> ecdf  = ...
+    >>> ranks = ecdf_ranks ( ecdf1 , ecdf ) 
+    """
+    vct    = ecdf.ranks ( sample )
+    result = numpy.frombuffer ( vct.data () , count = len ( vct ) , dtype = numpy.uintp ).view ( _Ranks )
+    result._vct = vct ## keep the underlying vector alive 
+    return result
+# =============================================================================
+## get the data from ECDF as numpy array (no copy)
+def _ecdf_data ( ecdf ) :
+    """ Get data from ECDF as numpy array (no copy) 
+    """
+    data = ecdf.data ()
+    return numpy.frombuffer ( data.data () , count = len ( data ) , dtype = float )
+# =============================================================================
+## Vectorised kernels 
+#  - all kernels accept arrays of ranks, the last axis runs over the elements,
+#    the leading axes (if any) run over the permutations 
+#  - <code>r1</code>,<code>r2</code> are ranks of the elements
+#     from the pooled sample in the 1st and 2nd samples
+#  - <code>q1</code>,<code>q2</code> are ranks of the elements
+#     from the 1st and 2nd samples in the pooled sample
+# =============================================================================
+## Kolmogorov-Smirnov & Kuiper kernel 
+def _ks_k_ ( r1 , r2 , n1 , n2 ) :
+    """ Kolmogorov-Smirnov & Kuiper kernel
+    """
+    delta = r1 / n1 - r2 / n2
+    dmax  = delta.max ( axis = -1 )
+    dmin  = delta.min ( axis = -1 )
+    return numpy.maximum ( dmax , -dmin ) , dmax - dmin 
+# =============================================================================
+## Anderson-Darling kernel 
+def _ad_ ( r1 , r2 , n1 , n2 ) :
+    """ Anderson-Darling kernel
+    """
+    n  = n1 + n2
+    j  = numpy.arange ( n , dtype = float ) 
+    d  = ( j + 1 ) * ( n - j )
+    s1 = ( ( n * r1 - j * n1 ) ** 2 / d ).sum ( axis = -1 ) / n1
+    s2 = ( ( n * r2 - j * n2 ) ** 2 / d ).sum ( axis = -1 ) / n2 
+    return ( s1 + s2 ) / n 
+# =============================================================================
+## Cramer-von Mises kernel 
+def _cm_ ( q1 , q2 , n1 , n2 ) :
+    """ Cramer-von Mises kernel
+    """
+    n  = n1 + n2 
+    u  = n1 * ( ( q1 - numpy.arange ( n1 , dtype = float ) ) ** 2 ).sum ( axis = -1 )
+    u += n2 * ( ( q2 - numpy.arange ( n2 , dtype = float ) ) ** 2 ).sum ( axis = -1 )
+    return u / ( n1 * n2 * n ) - ( 4 * n1 * n2 - 1 ) / ( 6.0 * n ) 
+# =============================================================================
+## helper function for Zhang's statistics 
+def _zhang_f_ ( r1 , r2 , n1 , n2 ) :
+    """ Helper function for Zhang's statistics
+    """
+    n     = n1 + n2
+    k     = numpy.arange ( n , dtype = float )
+    fk    = k / n
+    fk[0] = 0.5 / n 
+    f1    = numpy.clip ( r1 , 0.5 , n1 - 0.5 ) / n1 
+    f2    = numpy.clip ( r2 , 0.5 , n2 - 0.5 ) / n2
+    return k , fk , f1 , f2 
+# =============================================================================
+## ZK kernel 
+def _zk_ ( r1 , r2 , n1 , n2 ) :
+    """ ZK kernel
+    """
+    k , fk , f1 , f2 = _zhang_f_ ( r1 , r2 , n1 , n2 )
+    rr  = n1 * ( f1 * numpy.log ( f1 / fk ) + ( 1 - f1 ) * numpy.log ( ( 1 - f1 ) / ( 1 - fk ) ) )
+    rr += n2 * ( f2 * numpy.log ( f2 / fk ) + ( 1 - f2 ) * numpy.log ( ( 1 - f2 ) / ( 1 - fk ) ) ) 
+    return rr.max ( axis = -1 )
+# =============================================================================
+## ZA kernel 
+def _za_ ( r1 , r2 , n1 , n2 ) :
+    """ ZA kernel
+    """
+    n   = n1 + n2 
+    k , fk , f1 , f2 = _zhang_f_ ( r1 , r2 , n1 , n2 )
+    rr  = n1 * ( f1 * numpy.log ( f1 ) + ( 1 - f1 ) * numpy.log ( 1 - f1 ) )
+    rr += n2 * ( f2 * numpy.log ( f2 ) + ( 1 - f2 ) * numpy.log ( 1 - f2 ) )
+    return ( rr / ( ( k + 0.5 ) * ( n - k - 0.5 ) ) ).sum ( axis = -1 )
+# =============================================================================
+## ZC kernel 
+def _zc_ ( r1 , r2 , n1 , n2 ) :
+    """ ZC kernel
+    """
+    n   = n1 + n2 
+    j1  = numpy.arange ( n1 , dtype = float )
+    j2  = numpy.arange ( n2 , dtype = float )
+    t1  = ( numpy.log ( n1 / ( j1 + 0.5 ) - 1 ) * numpy.log ( n / ( r1 [ ... , : n1 ] + 0.5 ) - 1 ) ).sum ( axis = -1 )
+    t2  = ( numpy.log ( n2 / ( j2 + 0.5 ) - 1 ) * numpy.log ( n / ( r2 [ ... , : n2 ] + 0.5 ) - 1 ) ).sum ( axis = -1 )
+    return ( t1 + t2 ) / n 
+# =============================================================================
+## convert ranks to the float array 
+def _franks ( ranks ) :
+    """ Convert ranks to the float array
+    """
+    return numpy.asarray ( ranks , dtype = float )
+# =============================================================================
 ## Get Kolmogorov-Smirnov statistics KS
 #  @code
 #  ecdf1 =...
@@ -150,15 +270,20 @@ def prepare_data2 ( data1 , data2 , pooled = None , ranks1 = None , ranks2 = Non
 #  @param data1  the 1st dataset or empirical CDF
 #  @param data2  the 2nd dataset or empirical CDF 
 #  @param pooled (optional) pooled dataset or empirical CDF
+#  @param ranks1 (optional) ranks of the elements from the pooled data in the 1st dataset
+#  @param ranks2 (optional) ranks of the elements from the pooled data in the 2nd dataset
 #  @return Kolmogorov-Smirnov statistics KS
-def kolmogorov_smirnov ( data1 , data2 , pooled = None ) :
+def kolmogorov_smirnov ( data1 , data2 , pooled = None , ranks1 = None , ranks2 = None ) :
     """ Get Kolmogorov-Smirnov statistics  KS
     - data1  : the 1st dataset or empirical CDF 
     - data2  : the 2nd dataset or empirical CDF 
     - pooled : (optional) pooled dataset or CDF
+    - ranks1 : (optional) ranks of the elements from the pooled data in the 1st dataset
+    - ranks2 : (optional) ranks of the elements from the pooled data in the 2nd dataset
     """
-    ecdf1, ecdf2, ecdf = prepare_data1 ( data1 , data2 , pooled ) 
-    return max ( abs ( ecdf1 ( x ) - ecdf2 ( x ) ) for x in ecdf )
+    ecdf1, ecdf2, ecdf, ranks1, ranks2 = prepare_data2 ( data1 , data2 , pooled , ranks1 , ranks2 ) 
+    ks , _ = _ks_k_ ( _franks ( ranks1 ) , _franks ( ranks2 ) , len ( ecdf1 ) , len ( ecdf2 ) )
+    return float ( ks ) 
 # ================================================================================
 ## Get Kuiper statistics K
 #  @code
@@ -169,15 +294,20 @@ def kolmogorov_smirnov ( data1 , data2 , pooled = None ) :
 #  @param data1  the 1st dataset or empirical CDF
 #  @param data2  the 2nd dataset or empirical CDF 
 #  @param pooled (optional) pooled dataset or empirical CDF
+#  @param ranks1 (optional) ranks of the elements from the pooled data in the 1st dataset
+#  @param ranks2 (optional) ranks of the elements from the pooled data in the 2nd dataset
 #  @return Kuiper statistics K
-def kuiper ( data1 , data2 , pooled = None  ) :
+def kuiper ( data1 , data2 , pooled = None , ranks1 = None , ranks2 = None ) :
     """ Get kuiper statistics K
     - data1  : the 1st dataset or empirical CDF 
     - data2  : the 2nd dataset or empirical CDF 
     - pooled : (optional) pooled dataset or CDF
+    - ranks1 : (optional) ranks of the elements from the pooled data in the 1st dataset
+    - ranks2 : (optional) ranks of the elements from the pooled data in the 2nd dataset
     """
-    ecdf1, ecdf2, ecdf = prepare_data1 ( data1 , data2 , pooled ) 
-    return max ( ecdf1 ( x ) - ecdf2 ( x ) for x in ecdf ) - min ( ecdf1 ( x ) - ecdf2 ( x ) for x in ecdf )
+    ecdf1, ecdf2, ecdf, ranks1, ranks2 = prepare_data2 ( data1 , data2 , pooled , ranks1 , ranks2 ) 
+    _ , k = _ks_k_ ( _franks ( ranks1 ) , _franks ( ranks2 ) , len ( ecdf1 ) , len ( ecdf2 ) )
+    return float ( k ) 
 # =============================================================================
 ## Get Anderson-Darling statistics AD
 #  @code
@@ -202,21 +332,7 @@ def anderson_darling  ( data1 , data2 , pooled = None , ranks1 = None  , ranks2
     ## transform input (if needed) 
     ecdf1, ecdf2, ecdf, ranks1, ranks2 = prepare_data2 ( data1 , data2 , pooled , ranks1 , ranks2 ) 
     
-    n1   = len ( ecdf1 )
-    n2   = len ( ecdf2 )
-    n    = n1 + n2
-
-    def term1 ( j ) :
-        r1  = int ( ranks1 [ j ] ) 
-        return ( n * r1 - j * n1 ) ** 2  / ( ( j + 1 ) *  ( n - j ) )
-    def term2 ( j ) :
-        r2  = int ( ranks2 [ j ] ) 
-        return ( n * r2 - j * n2 ) ** 2  / ( ( j + 1 ) *  ( n - j ) )
-        
-    s1 = sum ( term1 ( j ) for j in range ( n ) ) / n1
-    s2 = sum ( term2 ( j ) for j in range ( n ) ) / n2
-    
-    return ( s1 + s2 ) / n 
+    return float ( _ad_ ( _franks ( ranks1 ) , _franks ( ranks2 ) , len ( ecdf1 ) , len ( ecdf2 ) ) )
 
 # =============================================================================
 ## Get Cramers-von Mises statistics CM
@@ -238,17 +354,10 @@ def cramer_von_mises ( data1 , data2 , pooled = None  ) :
     ## transform input (if needed) 
     ecdf1, ecdf2, ecdf = prepare_data1 ( data1 , data2 , pooled ) 
     
-    n1   = len ( ecdf1 )
-    n2   = len ( ecdf2 )
-    n    = n1 + n2
-    
-    ranks1 = ecdf.ranks ( ecdf1 )
-    ranks2 = ecdf.ranks ( ecdf2 )
+    q1 = ecdf_ranks ( ecdf , ecdf1 )
+    q2 = ecdf_ranks ( ecdf , ecdf2 )
     
-    u  = n1 * sum ( ( int ( ranks1 [ i ] ) - i ) ** 2 for i in range ( n1 ) ) 
-    u += n2 * sum ( ( int ( ranks2 [ i ] ) - i ) ** 2 for i in range ( n2 ) ) 
-    
-    return u / ( n1 * n2 * n ) - ( 4 * n1 * n2 - 1 ) / ( 6.0 * n ) 
+    return float ( _cm_ ( _franks ( q1 ) , _franks ( q2 ) , len ( ecdf1 ) , len ( ecdf2 ) ) )
 
 # =============================================================================
 ## Get ZK statistics ZK
@@ -276,30 +385,7 @@ def ZK  ( data1 , data2 , pooled = None , ranks1 = None  , ranks2 = None  ) :
     ## transform input (if needed) 
     ecdf1, ecdf2, ecdf, ranks1, ranks2 = prepare_data2 ( data1 , data2 , pooled , ranks1 , ranks2 ) 
     
-    n1   = len ( ecdf1 )
-    n2   = len ( ecdf2 )
-    n    = n1 + n2
-
-    flog = math.log 
-    def term ( k ) :
-
-        r1  = int ( ranks1 [ k ] ) 
-        r2  = int ( ranks2 [ k ] ) 
-        
-        r1  = max ( 0.5 , min ( n1 - 0.5 , r1 ) ) ## r1 + 0.5 ??
-        r2  = max ( 0.5 , min ( n2 - 0.5 , r2 ) ) ## r2 + 0.5 ?? 
-        
-        fk  = 0.5 / n if not k else float ( k ) / n
-        
-        f1k = float ( r1 ) / n1
-        f2k = float ( r2 ) / n2
-        
-        rr  = n1 * ( f1k * flog ( f1k / fk ) + ( 1 - f1k ) * flog ( ( 1. - f1k ) / ( 1. - fk ) ) )
-        rr += n2 * ( f2k * flog ( f2k / fk ) + ( 1 - f2k ) * flog ( ( 1. - f2k ) / ( 1. - fk ) ) ) 
-        
-        return rr
-    
-    return max ( term ( k ) for k in range ( n ) )
+    return float ( _zk_ ( _franks ( ranks1 ) , _franks ( ranks2 ) , len ( ecdf1 ) , len ( ecdf2 ) ) )
 
 # =============================================================================
 ## Get ZA statistics ZA
@@ -327,29 +413,7 @@ def ZA ( data1 , data2 , pooled = None , ranks1 = None , ranks2 = None ) :
     ## transform input (if needed) 
     ecdf1, ecdf2, ecdf, ranks1, ranks2 = prepare_data2 ( data1 , data2 , pooled , ranks1 , ranks2 ) 
 
-    n1   = len ( ecdf1 )
-    n2   = len ( ecdf2 )
-    n    = n1 + n2
-    
-    flog = math.log 
-    def term ( k ) :
-
-        r1  = int ( ranks1 [ k ] ) 
-        r2  = int ( ranks2 [ k ] ) 
-        
-        r1  = max ( 0.5 , min ( n1 - 0.5 , r1 ) ) ## r1 + 0.5 ??
-        r2  = max ( 0.5 , min ( n2 - 0.5 , r2 ) ) ## r2 + 0.5 ?? 
-        
-        fk  = 0.5 / n if not k else float ( k ) / n  
-        f1k = float ( r1 ) / n1
-        f2k = float ( r2 ) / n2
-
-        rr  = n1 * ( f1k * flog ( f1k ) + ( 1 - f1k ) * flog ( 1. - f1k ) ) / ( ( k + 0.5 ) * ( n - k - 0.5 ) )
-        rr += n2 * ( f2k * flog ( f2k ) + ( 1 - f2k ) * flog ( 1. - f2k ) ) / ( ( k + 0.5 ) * ( n - k - 0.5 ) )
-        
-        return rr
-    
-    return sum ( term ( k ) for k in range ( n ) )
+    return float ( _za_ ( _franks ( ranks1 ) , _franks ( ranks2 ) , len ( ecdf1 ) , len ( ecdf2 ) ) )
 
 # =============================================================================
 ## Get ZC statistics ZC
@@ -377,23 +441,80 @@ def ZC ( data1 , data2 , pooled = None , ranks1 = None , ranks2 = None ) :
     ## transform input (if needed) 
     ecdf1, ecdf2, ecdf, ranks1, ranks2 = prepare_data2 ( data1 , data2 , pooled , ranks1 , ranks2 ) 
 
-    n1  = len ( ecdf1 )
-    n2  = len ( ecdf2 )
-    n   = n1 + n2
+    return float ( _zc_ ( _franks ( ranks1 ) , _franks ( ranks2 ) , len ( ecdf1 ) , len ( ecdf2 ) ) )
+
+# =============================================================================
+## Evaluate all two-sample statistics for many label assignments
+#  of the pooled sample at once (e.g. for permutation tests)
+#  - the pooled sample is sorted only once,
+#    all ranks are obtained from the cumulative sums of labels 
+#  - all statistics are evaluated with vectorised kernels
+#  @code
+#  ecdf   = ...                                   ## pooled sample 
+#  labels = numpy.zeros ( len ( ecdf ) , dtype = bool )
+#  labels [ : n1 ] = True 
+#  rng    = numpy.random.default_rng () 
+#  labels = rng.permuted ( numpy.tile ( labels , ( 100 , 1 ) ) , axis = 1 )
+#  result = permutation_statistics ( ecdf , labels )
+#  ad     = result [ 'AD' ]                       ## array of 100 values 
+#  @endcode
+#  @param pooled pooled dataset or empirical CDF 
+#  @param labels boolean array of shape (N,) or (M,N):
+#         <code>True</code> for elements of the 1st sample
+#  @return dictionary { statistics : array of values }
+def permutation_statistics ( pooled , labels ) :
+    """ Evaluate all two-sample statistics for many label assignments
+    of the pooled sample at once (e.g. for permutation tests)
+    - the pooled sample is sorted only once,
+      all ranks are obtained from the cumulative sums of labels 
+    - all statistics are evaluated with vectorised kernels
+    - pooled : pooled dataset or empirical CDF 
+    - labels : boolean array of shape (N,) or (M,N): `True` for elements of the 1st sample
+    - return dictionary { statistics : array of values }
+    >>> ecdf   = ...                                   ## pooled sample 
+    >>> labels = numpy.zeros ( len ( ecdf ) , dtype = bool )
+    >>> labels [ : n1 ] = True 
+    >>> rng    = numpy.random.default_rng () 
+    >>> labels = rng.permuted ( numpy.tile ( labels , ( 100 , 1 ) ) , axis = 1 )
+    >>> result = permutation_statistics ( ecdf , labels )
+    >>> ad     = result [ 'AD' ]                       ## array of 100 values 
+    """
+    ecdf   = ecdf_from_data ( pooled )
+    data   = _ecdf_data     ( ecdf   ) ## sorted! 
+    n      = len ( data )
     
-    flog = math.log 
-    def term1 ( j ) :
-        r1  = int ( ranks1 [ j ] ) 
-        return flog ( n1 / ( j + 0.5 ) - 1 ) * flog ( n / ( r1 + 0.5 ) - 1 )
+    labels = numpy.asarray ( labels , dtype = bool )
+    if 1 == labels.ndim : labels = labels.reshape ( 1 , -1 )
+    assert 2 == labels.ndim and n == labels.shape [ 1 ] , \
+           "permutation_statistics: invalid shape of `labels` %s" % str ( labels.shape ) 
+
+    M      = labels.shape [ 0 ]
+    sizes  = labels.sum ( axis = 1 )
+    n1     = int ( sizes [ 0 ] ) if M else 0 
+    n2     = n - n1
+    assert numpy.all ( sizes == n1 ) and 0 < n1 < n , \
+           "permutation_statistics: invalid/inconsistent sizes of samples!"
+
+    ## number of elements in the pooled sample that are less or equal to x[j] 
+    ub     = numpy.searchsorted ( data , data , side = 'right' )
     
-    def term2 ( j ) :
-        r2  = int ( ranks2 [ j ] ) 
-        return flog ( n2 / ( j + 0.5 ) - 1 ) * flog ( n / ( r2 + 0.5 ) - 1 )
+    ## r1, r2: ranks of the elements from the pooled data in the 1st/2nd samples 
+    r1     = numpy.cumsum ( labels , axis = 1 , dtype = float ) [ : , ub - 1 ]
+    r2     = ub - r1
     
-    t1 = sum ( term1 ( j ) for j in range ( n1 ) )
-    t2 = sum ( term2 ( j ) for j in range ( n2 ) )
-
-    return ( t1 + t2 ) / n 
+    ## q1, q2: ranks of elements from the 1st/2nd samples in the pooled data 
+    ubs    = numpy.broadcast_to ( ub.astype ( float ) , labels.shape ) 
+    q1     = ubs [  labels ].reshape ( M , n1 )
+    q2     = ubs [ ~labels ].reshape ( M , n2 )
+    
+    ks , k = _ks_k_ ( r1 , r2 , n1 , n2 ) 
+    return { 'KS' : ks , 
+             'K'  : k  , 
+             'AD' : _ad_ ( r1 , r2 , n1 , n2 ) , 
+             'CM' : _cm_ ( q1 , q2 , n1 , n2 ) , 
+             'ZK' : _zk_ ( r1 , r2 , n1 , n2 ) , 
+             'ZA' : _za_ ( r1 , r2 , n1 , n2 ) , 
+             'ZC' : _zc_ ( r1 , r2 , n1 , n2 ) }
 
 # =============================================================================
 ## @class TSTest
@@ -415,8 +536,8 @@ def __init__ ( self  ,
         self.__ranks2 = ranks2 
         
         self.__estimators = {            
-            'KS' : kolmogorov_smirnov ( self.ecdf1 , self.ecdf2 , self.ecdf ) , 
-            'K'  : kuiper             ( self.ecdf1 , self.ecdf2 , self.ecdf ) , 
+            'KS' : kolmogorov_smirnov ( self.ecdf1 , self.ecdf2 , self.ecdf , self.ranks1 , self.ranks2 ) , 
+            'K'  : kuiper             ( self.ecdf1 , self.ecdf2 , self.ecdf , self.ranks1 , self.ranks2 ) , 
             'AD' : anderson_darling   ( self.ecdf1 , self.ecdf2 , self.ecdf , self.ranks1 , self.ranks2 ) , 
             'CM' : cramer_von_mises   ( self.ecdf1 , self.ecdf2 , self.ecdf ) , 
             'ZK' : ZK                 ( self.ecdf1 , self.ecdf2 , self.ecdf , self.ranks1 , self.ranks2 ) , 
@@ -630,47 +751,30 @@ def run ( self , nToys = 1000 , silent = False ) :
         """ 
         assert isinstance ( nToys , int ) and 0 < nToys , "Invalid `nToys` argument!"
 
-        n1   = len ( self.ecdf1 )
-        n2   = len ( self.ecdf1 )
+        n1       = len ( self.ecdf1 )
+        n2       = len ( self.ecdf2 )
+        
+        ## labels: True for the first sample 
+        labels   = numpy.zeros ( n1 + n2 , dtype = bool )
+        labels [ : n1 ] = True
         
-        data = numpy.asarray ( self.ecdf.data () , dtype = float )
+        rng      = numpy.random.default_rng ()
         
         results  = defaultdict(list)
         counters = self.counters
         
+        batches  = [ ( i , min ( i + BATCH_SIZE , nToys ) ) for i in range ( 0 , nToys , BATCH_SIZE ) ]
+        
         from ostap.utils.progress_bar import progress_bar 
-        for i in progress_bar ( nToys , silent = silent , description = 'Permutations:') :
-
-            numpy.random.shuffle ( data )
-            data1 = data [    : n1 ]
-            data2 = data [ n1 :    ] 
-            
-            ## transform input data 
-            ecdf1, ecdf2, ecdf, ranks1, ranks2 = prepare_data2 ( data1 , data2 ) 
-            
-            ks = kolmogorov_smirnov ( ecdf1 , ecdf2 , ecdf )
-            k  = kuiper             ( ecdf1 , ecdf2 , ecdf )
-            ad = anderson_darling   ( ecdf1 , ecdf2 , ecdf , ranks1 , ranks2 )            
-            cm = cramer_von_mises   ( ecdf1 , ecdf2 , ecdf )             
-            zk = ZK                 ( ecdf1 , ecdf2 , ecdf , ranks1 , ranks2 )
-            za = ZA                 ( ecdf1 , ecdf2 , ecdf , ranks1 , ranks2 )
-            zc = ZC                 ( ecdf1 , ecdf2 , ecdf , ranks1 , ranks2 )
+        for first , last in progress_bar ( batches , silent = silent , description = 'Permutations:') :
             
-            counters [ 'KS'  ] += ks 
-            counters [ 'K'   ] += k 
-            counters [ 'AD'  ] += ad
-            counters [ 'CM'  ] += cm
-            counters [ 'ZK'  ] += zk
-            counters [ 'ZA'  ] += za
-            counters [ 'ZC'  ] += zc
+            permuted = rng.permuted ( numpy.tile ( labels , ( last - first , 1 ) ) , axis = 1 )
+            values   = permutation_statistics ( self.ecdf , permuted )
             
-            results  [ 'KS'  ] .append ( ks )    
-            results  [ 'K'   ] .append ( k  ) 
-            results  [ 'AD'  ] .append ( ad ) 
-            results  [ 'CM'  ] .append ( cm ) 
-            results  [ 'ZK'  ] .append ( zk ) 
-            results  [ 'ZA'  ] .append ( za ) 
-            results  [ 'ZC'  ] .append ( zc ) 
+            for key , vals in values.items () :
+                vals = [ float ( v ) for v in vals ]
+                for v in vals : counters [ key ] += v 
+                results [ key ].extend ( vals ) 
             
         ## accumulate number of toys 
         self.__nToys += nToys 
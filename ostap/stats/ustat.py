@@ -98,8 +98,10 @@ def uCalc ( pdf       ,
             args      = None        , 
             histo     = None        ,
             silent    = False       , 
-            algorithm = 'Greenwood' ) :
+            algorithm = 'Greenwood' ,
+            nthreads  = 1           ) :
     """ Calculate U-statistics 
+    - nthreads : number of threads for nearest neighbour search (0: all hardware threads)
     """
     if isinstance ( algorithm , string_types ) :
         algo  = cidict_fun ( algorithm )
@@ -124,6 +126,9 @@ def uCalc ( pdf       ,
     if not args  : args  = pdf.getObservables ( data )  
     if not histo : histo = ROOT.nullptr
 
+    if not isinstance ( nthreads , integer_types ) or nthreads < 0 :
+        raise ValueError ( "Invalid `nthreads` value: %s" % nthreads )
+    
     ##
     tStat = ctypes.c_double ( -1 )
     if silent : 
@@ -132,7 +137,8 @@ def uCalc ( pdf       ,
                                      tStat     ,
                                      histo     ,
                                      args      ,
-                                     algorithm )
+                                     algorithm ,
+                                     nthreads  )
     else :
         from ostap.utils.progress_conf import progress_conf
         sc = Ostap.UStat.calculate ( progress_conf ( description = 'Entries:') ,
@@ -141,7 +147,8 @@ def uCalc ( pdf       ,
                                      tStat     ,
                                      histo     ,
                                      args      ,
-                                     algorithm )
+                                     algorithm ,
+                                     nthreads  )
     
     if sc.isFailure() : logger.error ( "Error from Ostap::UStat::calculate %s" % sc )
 
@@ -178,7 +185,8 @@ def uPlot ( pdf       ,
             histo     = None        ,
             args      = None        ,
             silent    = False       , 
-            algorithm = 'Greenwood' ) :
+            algorithm = 'Greenwood' ,
+            nthreads  = 1           ) :
     """ Make the plot of U-statistics 
     
     >>> pdf  = ...               ## pdf
@@ -219,7 +227,8 @@ def uPlot ( pdf       ,
                          args      =  args     ,
                          histo     = histo     ,
                          silent    = silent    ,
-                         algorithm = algorithm )    
+                         algorithm = algorithm ,
+                         nthreads  = nthreads  )    
     
     res  = histo.Fit         ( 'pol0' , 'SLQ0+' )
     func = histo.GetFunction ( 'pol0' )
@@ -298,7 +307,8 @@ def __init__ ( self             , * ,
                    parallel  = False , 
                    silent    = False ,
                    progress  = True  ,
-                   algorithm = "Greenwood" ) :
+                   algorithm = "Greenwood" ,
+                   nthreads  = 1     ) :
         
         self.__sample   = True if sample else False 
         self.__histo    = None 
@@ -316,6 +326,7 @@ def __init__ ( self             , * ,
         self.__ecdf      = None
         self.__counter   = None
         self.__algorithm = algorithm
+        self.__nthreads  = nthreads 
         
         Config.__init__ ( self , silent = silent or progress ) 
 
@@ -353,6 +364,7 @@ def config ( self ) :
         conf [ 'histo'     ] = self.__histo
         conf [ 'progress'  ] = self.__progress 
         conf [ 'algorithm' ] = self.__algorithm
+        conf [ 'nthreads'  ] = self.__nthreads 
         conf [ 'weights_supported'         ] = self.weights_supported
         conf [ 'negatve_weights_supported' ] = self.negative_weights_supported
         return conf
@@ -397,7 +409,8 @@ def tvalue   ( self , pdf , data ) :
                                       data      , 
                                       histo     = self.__bins , 
                                       silent    = self.silent or self.progress ,
-                                      algorithm = self.algorithm ) 
+                                      algorithm = self.algorithm ,
+                                      nthreads  = self.nthreads  ) 
 
         if histo and not self.__histo :
             self.__histo = histo.clone()
@@ -478,6 +491,11 @@ def algorithm( self )  :
         """`algorithm` : algorithm to test uniformity of u-values"""
         return self.__algorithm
 
+    @property
+    def nthreads ( self ) :
+        """`nthreads` : number of threads for nearest neighbour search (0: all hardware threads)"""
+        return self.__nthreads
+    
     @property
     def ecdf ( self ) :
         """`ecdf` : empirical cumulative distirbution function (from toys)
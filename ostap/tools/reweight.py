@@ -25,7 +25,7 @@
 # =============================================================================
 from   ostap.core.meta_info   import root_info 
 from   ostap.core.pyrouts     import VE, SE, Ostap, hID  
-from   ostap.math.math_base   import iszero, axis_range 
+from   ostap.math.math_base   import iszero, axis_range, strings 
 from   ostap.utils.strings    import split_string 
 from   ostap.core.ostap_types import string_types, list_types, num_types, sized_types, sequence_types    
 from   ostap.math.operations  import Mul  as MULT       ## needed for proper abstract multiplication
@@ -42,7 +42,7 @@
 import ostap.io.zipshelve     as     DBASE              ## needed to store the weights&histos
 import ostap.logger.table     as     T 
 import ostap.core.core 
-import ostap.histos.histos 
+from   ostap.histos.histos    import profile_types 
 import ostap.histos.compare 
 import ostap.trees.trees
 import ostap.fitting.dataset
@@ -233,8 +233,9 @@ def __init__ ( self                   ,
         #
         ## make some statistic
         #
-        self.__counter = SE ()
-        self.__nzeroes = 0 
+        self.__counter  = SE ()
+        self.__nzeroes  = 0 
+        self.__compiled = None 
 
         self.__vars    = [] 
         if not factors : return
@@ -247,6 +248,9 @@ def __init__ ( self                   ,
         self.__table = [ ( 'Reweighting' , 'accessor' , number , 'merged?' , 'skip') ] 
         rows = []
 
+        ## ingredients for the compiled version: ( expressions , histograms ) 
+        compiled = [] 
+
         # =============================================================================
         try : # =======================================================================
             with DBASE.open ( dbase , 'r' ) as db : pass
@@ -322,6 +326,9 @@ def __init__ ( self                   ,
                 _functions.reverse() 
                 functions = _functions
 
+                ## ingredients for the compiled version 
+                compiled.append ( ( wvar.expressions , tuple ( functions ) ) ) 
+
                 row.append  ( checked_yes if merge else checked_no )
                 if skip : row.append  ( '%s' % skip )
                 
@@ -346,6 +353,90 @@ def __init__ ( self                   ,
         self.__table = T.remove_empty_columns ( self.__table )
         self.__vars = tuple ( self.__vars ) 
 
+        ## try to build the compiled version 
+        self.__compiled = self.make_compiled ( compiled ) 
+        if self.__compiled : logger.debug ( 'Weight: compiled version is available' )
+        
+    # =========================================================================
+    ## Build the compiled version of the weight: C++ lookup tables 
+    #  - it is possible only if all accessors are expressions and 
+    #    all reweighting objects are (1D,2D,3D) histograms
+    #  @see Ostap::Functions::HistoWeight 
+    #  @param items list of ( expressions , histograms ) pairs 
+    #  @return <code>Ostap.Functions.HistoWeight</code> object or <code>None</code>
+    @staticmethod
+    def make_compiled ( items ) :
+        """ Build the compiled version of the weight: C++ lookup tables 
+        - it is possible only if all accessors are expressions and 
+          all reweighting objects are (1D,2D,3D) histograms
+        - see `Ostap.Functions.HistoWeight`
+        """
+        compiled = Ostap.Functions.HistoWeight ()
+        for expressions , functions in items :
+            
+            if not expressions or 3 < len ( expressions ) : return None 
+            if not functions : return None
+            
+            dim = len ( expressions ) 
+            for f in functions :
+                if not isinstance ( f , ROOT.TH1 ) or isinstance ( f , profile_types ) : return None
+                if dim != f.GetDimension ()                                            : return None
+
+            index = compiled.add_factor ( strings ( *expressions ) )
+            for f in functions : compiled.add_histo ( index , f )
+
+        return compiled 
+
+    # =========================================================================
+    ## compiled version of the weight, if available
+    #  @see Ostap::Functions::HistoWeight 
+    @property
+    def compiled ( self ) :
+        """`compiled` : compiled version of the weight (C++ lookup tables), if available
+        - see `Ostap.Functions.HistoWeight`
+        """
+        return self.__compiled 
+
+    # =========================================================================
+    ## Calculate the weights for the range of entries in TTree/RooAbsData
+    #  - the compiled version is used (if available), no python per-entry calls
+    #  @code
+    #  weight  = Weight ( ... )
+    #  tree    = ... 
+    #  weights = weight.weights ( tree , 0 , 1000 ) 
+    #  @endcode
+    #  @return numpy array of weights 
+    def weights ( self , data , first = 0 , last = -1 ) :
+        """ Calculate the weights for the range of entries in TTree/RooAbsData
+        - the compiled version is used (if available), no python per-entry calls 
+        >>> weight  = Weight ( ... )
+        >>> tree    = ... 
+        >>> weights = weight.weights ( tree , 0 , 1000 ) 
+        """
+        import numpy 
+        n = len ( data )
+        if last < 0 or n < last : last = n
+        
+        if self.compiled :
+            result = self.compiled.weights ( data , first , last )
+            result = numpy.array ( result , dtype = float ) 
+        else :
+            result = numpy.zeros ( max ( last - first , 0 ) , dtype = float ) 
+            for i , entry in enumerate ( range ( first , last ) ) :
+                if isinstance ( data , ROOT.TTree ) :
+                    data.GetEntry ( entry )
+                    result [ i ] = self ( data )
+                else : 
+                    result [ i ] = self ( data.get ( entry ) )
+            return result
+
+        ## keep the statistics 
+        for vw in result :
+            self.__counter += vw
+            if iszero ( vw ) : self.__nzeroes += 1
+            
+        return result 
+
     @property
     def dbase ( self ) :
         """'dbase' : the name of the database for storage of reweigting information
@@ -568,6 +659,13 @@ def __init__ ( self ,
                 accessor = split_string ( accessor , strip = True , respect_groups = True )
                 if 1 == len ( accessor ) : accessor = accessor [ 0 ]
 
+            ## keep expressions (needed for the compiled version) 
+            if   isinstance ( accessor , string_types ) : self.__expressions = accessor , 
+            elif isinstance ( accessor , sequence_types ) and \
+                     all ( isinstance ( i , string_types ) for i in accessor ) :
+                self.__expressions = tuple ( accessor )
+            else : self.__expressions = ()
+
             if   accessor and isinstance ( accessor , string_types ) and is_formula ( accessor ) :
                 ## use exporession here (suitable both for for TTree/RooAbsData)
                 accessor = Ostap.Functions.Expression ( accessor )
@@ -614,6 +712,12 @@ def accessor ( self ) :
             """
             return self.__accessor[0]
         
+        @property
+        def expressions ( self ) :
+            """`expressions' - the expressions for the variable(s), if accessor is defined via expressions
+            """
+            return self.__expressions 
+        
         @property
         def address  ( self ) :
             """`address'  - the address in DB with the reweighting information
@@ -1468,7 +1572,8 @@ def tree_add_reweighting ( tree                 ,
                            name      = 'weight' ,
                            progress  = True     ,
                            report    = True     ,
-                           parallel  = False    ) :
+                           parallel  = False    ,
+                           compiled  = True     ) :
     """ Add specific re-weighting information into ROOT.TTree
     
     >>> w    = Weight ( ... ) ## weighting object ostap.tools.reweight.Weight 
@@ -1477,6 +1582,9 @@ def tree_add_reweighting ( tree                 ,
     - see ostap.tools.reweight
     - see ostap.tools.reweight.Weight 
     - see ostap.tools.reweight.W2Tree 
+    - if `compiled` is True and compiled version of the weight is available, 
+      it is used for sequential processing (no python per-entry calls)
+    - see `Ostap.Functions.HistoWeight`
     """
     assert isinstance ( weighter , Weight     ), "Invalid type of `weighter'!"  
     assert isinstance ( tree     , ROOT.TTree ), "Invalid type of `tree`!"
@@ -1498,6 +1606,11 @@ def tree_add_reweighting ( tree                 ,
             import ostap.parallel.parallel_add_branch
             return tree.padd_new_branch ( wfun , name = name  , progress = progress , report = report ) 
     
+    ## compiled version of the weight (no python per-entry calls)
+    if compiled and weighter.compiled :
+        wfun = weighter.compiled 
+        logger.debug ( 'tree_add_reweighting: use compiled version of the weight' )
+        
     ## regular sequential processing 
     return tree.add_new_branch ( wfun , name = name , progress = progress , report = report ) 
 
@@ -1518,7 +1631,8 @@ def data_add_reweighting ( data                ,
                            name     = 'weight' ,
                            progress = False    ,
                            report   = True     ,
-                           parallel = False    ) :
+                           parallel = False    ,
+                           compiled = True     ) :
     """ Add specific re-weighting information into dataset
     
     >>> w    = Weight ( ... ) ## weighting object ostap.tools.reweight.Weight 
@@ -1527,6 +1641,9 @@ def data_add_reweighting ( data                ,
     - see ostap.tools.reweight
     - see ostap.tools.reweight.Weight 
     - see ostap.tools.reweight.W2Data 
+    - if `compiled` is True and compiled version of the weight is available, 
+      it is used for sequential processing (no python per-entry calls)
+    - see `Ostap.Functions.HistoWeight`
     """
 
     assert isinstance ( weighter , Weight          ), "Invalid type of `weighter'!"
@@ -1549,6 +1666,11 @@ def data_add_reweighting ( data                ,
     ## create the weighting function 
     wfun = W2Data ( weighter )
 
+    ## compiled version of the weight (no python per-entry calls)
+    if compiled and weighter.compiled :
+        wfun = weighter.compiled 
+        logger.debug ( 'data_add_reweighting: use compiled version of the weight' )
+        
     ## regular sequential processing 
     return data.add_new_var ( name , wfun , progress = progress , report = report ) 
 
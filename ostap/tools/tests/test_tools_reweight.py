@@ -251,6 +251,16 @@
         mctree = mctree.add_reweighting ( weighter , name = 'weight' )
     title = 'MC-tree with weights'
     logger.info ( '%s:\n%s' % ( title , mctree.table ( title = title , prefix = '# ') ) ) 
+
+    ## compare the compiled and python weights 
+    if weighter.compiled :
+        with timing ( "Compiled weights" , logger = logger ) :
+            wc = weighter.weights ( mctree , 0 , 5000 )
+        for i , w in enumerate ( wc ) :
+            mctree.GetEntry ( i )
+            assert abs ( w - weighter ( mctree ) ) <= 1.e-12 * max ( 1.0 , abs ( w ) ) , \
+                   'Mismatch between compiled and python weights!'
+        logger.info ( 'Compiled and python weights are the same' ) 
         
 # =============================================================================
 with DBASE.open   ( dbname , 'r' ) as db :
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file ostap/trees/data_cache.py
+#  Persistent validation cache for collections of ROOT files
+#  - for each (file,chain) pair it keeps the validity flag,
+#    number of entries and the branch/leaf schema
+#  - the key is (absolute path, size, modification time, chain name),
+#    therefore any modification of the file invalidates the entry
+#  - the cache is the SQLite database, it is safe to share it
+#    between parallel processes
+#  @code
+#  cache  = DataCache ()
+#  record = cache.get ( 'a.root' , 'MyTree' )
+#  @endcode
+#  @see ostap.trees.data_utils.Data
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2026-10-17
+# =============================================================================
+""" Persistent validation cache for collections of ROOT files
+- for each (file,chain) pair it keeps the validity flag,
+  number of entries and the branch/leaf schema
+- the key is (absolute path, size, modification time, chain name),
+  therefore any modification of the file invalidates the entry
+- the cache is the SQLite database, it is safe to share it
+  between parallel processes
+>>> cache  = DataCache ()
+>>> record = cache.get ( 'a.root' , 'MyTree' )
+- see `ostap.trees.data_utils.Data`
+"""
+# =============================================================================
+__version__ = "$Revision$"
+__author__  = "Vanya BELYAEV Ivan.Belyaev@itep.ru"
+__date__    = "2026-10-17"
+__all__     = (
+    'DataCache'    , ## persistent validation cache for collections of ROOT files
+    'file_record'  , ## build the validation record for (file,chain) pair
+    )
+# =============================================================================
+from   collections import namedtuple
+import os, json, sqlite3
+# =============================================================================
+# logging
+# =============================================================================
+from   ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'ostap.trees.data_cache' )
+else                       : logger = getLogger ( __name__                 )
+# =============================================================================
+## Validation record for (file,chain) pair
+Record = namedtuple ( 'Record' , ( 'valid' , 'entries' , 'branches' , 'leaves' ) )
+# =============================================================================
+## Build the validation record for (file,chain) pair, using ROOT I/O
+#  @code
+#  record = file_record ( 'a.root' , 'MyTree' )
+#  @endcode
+def file_record ( the_file , cname ) :
+    """ Build the validation record for (file,chain) pair, using ROOT I/O
+    >>> record = file_record ( 'a.root' , 'MyTree' )
+    """
+    import ROOT
+    import ostap.trees.trees
+    from   ostap.core.core import rootError
+    ## suppress Warning/Error messages from ROOT
+    with rootError() :
+        tree = ROOT.TChain ( cname )
+        tree.Add ( the_file )
+        branches = tuple ( sorted ( tree.branches () ) ) if tree else ()
+        if not branches : return Record ( False , 0 , () , () )
+        leaves   = tuple ( sorted ( tree.leaves   () ) )
+        entries  = tree.GetEntries ()
+        del tree
+    return Record ( True , entries , branches , leaves )
+
+# =============================================================================
+## @class DataCache
+#  Persistent validation cache for collections of ROOT files
+#  - the key is (absolute path, size, modification time, chain name)
+#  - the cache is the SQLite database, it is safe to share it
+#    between parallel processes
+#  @code
+#  cache  = DataCache ()
+#  record = cache.get ( 'a.root' , 'MyTree' )
+#  if record is None :
+#     record = file_record ( 'a.root' , 'MyTree' )
+#     cache.put ( 'a.root' , 'MyTree' , record )
+#  @endcode
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2026-10-17
+class DataCache(object) :
+    """ Persistent validation cache for collections of ROOT files
+    - the key is (absolute path, size, modification time, chain name)
+    - the cache is the SQLite database, it is safe to share it
+      between parallel processes
+    >>> cache  = DataCache ()
+    >>> record = cache.get ( 'a.root' , 'MyTree' )
+    >>> if record is None :
+    ...    record = file_record ( 'a.root' , 'MyTree' )
+    ...    cache.put ( 'a.root' , 'MyTree' , record )
+    """
+    TABLE = 'DataCache'
+
+    def __init__ ( self , dbname = None , timeout = 60 ) :
+
+        if not dbname :
+            from ostap.core.cache_dir import cache_dir
+            dbname = os.path.join ( cache_dir , 'ostap_data_cache.sqlite' )
+
+        self.__dbname  = dbname
+        self.__timeout = timeout
+        self.__conn    = None
+        self.__pid     = None
+
+        with self.connection () as conn :
+            conn.execute ( 'CREATE TABLE IF NOT EXISTS "%s" (key TEXT PRIMARY KEY, value TEXT)' % self.TABLE )
+
+    # =========================================================================
+    ## pickling: connection is not transferred
+    def __getstate__ ( self ) :
+        return { 'dbname' : self.__dbname , 'timeout' : self.__timeout }
+    ## unpickling
+    def __setstate__ ( self , state ) :
+        self.__dbname  = state [ 'dbname'  ]
+        self.__timeout = state [ 'timeout' ]
+        self.__conn    = None
+        self.__pid     = None
+
+    @property
+    def dbname ( self ) :
+        """`dbname` : the name of the database file"""
+        return self.__dbname
+
+    # =========================================================================
+    ## get the (per-process) connection to the database
+    def connection ( self ) :
+        """ Get the (per-process) connection to the database
+        """
+        pid = os.getpid ()
+        if self.__conn is None or pid != self.__pid :
+            self.__conn = sqlite3.connect ( self.__dbname , timeout = self.__timeout )
+            self.__pid  = pid
+        return self.__conn
+
+    # =========================================================================
+    ## Get the key for (file,chain) pair
+    #  @return the key or None for remote/non-existing files
+    @staticmethod
+    def key ( the_file , cname ) :
+        """ Get the key for (file,chain) pair
+        - return the key or None for remote/non-existing files
+        """
+        from ostap.io.rootfiles import RootFiles
+        if RootFiles.has_protocol ( the_file ) : return None
+        try :
+            path = os.path.abspath ( the_file )
+            st   = os.stat ( path )
+        except OSError :
+            return None
+        return '%s|%d|%d|%s' % ( path , st.st_size , st.st_mtime_ns , cname )
+
+    # =========================================================================
+    ## Get the record for (file,chain) pair
+    #  @return the record or None if there is no valid entry
+    def get ( self , the_file , cname ) :
+        """ Get the record for (file,chain) pair
+        - return the record or None if there is no valid entry
+        """
+        key = self.key ( the_file , cname )
+        if key is None : return None
+        try :
+            row = self.connection ().execute ( 'SELECT value FROM "%s" WHERE key = ?' % self.TABLE , ( key , ) ).fetchone ()
+        except sqlite3.Error :
+            logger.debug ( "Cannot read the cache entry for '%s'" % the_file , exc_info = True )
+            return None
+        if not row : return None
+        valid , entries , branches , leaves = json.loads ( row [ 0 ] )
+        return Record ( valid , entries , tuple ( branches ) , tuple ( leaves ) )
+
+    # =========================================================================
+    ## Put the record for (file,chain) pair into the cache
+    def put ( self , the_file , cname , record ) :
+        """ Put the record for (file,chain) pair into the cache
+        """
+        key = self.key ( the_file , cname )
+        if key is None : return False
+        value = json.dumps ( tuple ( record ) )
+        try :
+            with self.connection () as conn :
+                conn.execute ( 'INSERT OR REPLACE INTO "%s" (key, value) VALUES (?, ?)' % self.TABLE , ( key , value ) )
+        except sqlite3.Error :
+            logger.debug ( "Cannot write the cache entry for '%s'" % the_file , exc_info = True )
+            return False
+        return True
+
+    # =========================================================================
+    ## Get the record for (file,chain) pair: from the cache or using ROOT I/O
+    def record ( self , the_file , cname ) :
+        """ Get the record for (file,chain) pair: from the cache or using ROOT I/O
+        """
+        result = self.get ( the_file , cname )
+        if result is None :
+            result = file_record ( the_file , cname )
+            self.put ( the_file , cname , result )
+        return result
+
+    # =========================================================================
+    ## Remove all entries from the cache
+    def clear ( self ) :
+        """ Remove all entries from the cache
+        """
+        with self.connection () as conn :
+            conn.execute ( 'DELETE FROM "%s"' % self.TABLE )
+
+    ## number of entries in the cache
+    def __len__ ( self ) :
+        row = self.connection ().execute ( 'SELECT COUNT(*) FROM "%s"' % self.TABLE ).fetchone ()
+        return row [ 0 ] if row else 0
+
+    ## the cache is valid even if it is empty
+    def __bool__ ( self ) : return True
+    __nonzero__ = __bool__
+
+    def __str__  ( self ) : return "DataCache('%s')" % self.__dbname
+    __repr__ = __str__
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+# =============================================================================
+##                                                                      The END
+# =============================================================================
@@ -53,6 +53,7 @@
 from   ostap.core.core        import rootError, rootWarning
 from   ostap.io.files         import Files, fsize_unit 
 from   ostap.io.rootfiles     import RootFiles
+from   ostap.trees.data_cache import DataCache, file_record 
 from   ostap.utils.core       import typename 
 from   ostap.logger.symbols   import chain          as chain_symbol
 from   ostap.logger.symbols   import tree           as tree_symbol
@@ -77,11 +78,16 @@
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @author Alexander BARANOV a.baranov@cern.ch
 #  @date   2014-06-08  
+#  - validity and schema of trees are kept in the persistent cache,
+#    unchanged files do not require ROOT I/O, see ostap.trees.data_cache.DataCache 
 class Data(RootFiles):
     """ Simple utility to access to certain chain in the set of ROOT-files
     >>> data  = Data('Bc/MyTree', '*.root' )
     >>> chain = data.chain
     >>> flist = data.files 
+    - validity and schema of trees are kept in the persistent cache,
+      unchanged files do not require ROOT I/O, see `ostap.trees.data_cache.DataCache`
+    - `cache` : True (default cache) , False/None (no cache), the name of cache file or `DataCache` 
     """
     def __init__( self                 ,
                   files                , / , 
@@ -90,7 +96,8 @@ def __init__( self                 ,
                   maxfiles     = -1    ,
                   check        = True  , 
                   silent       = False ,
-                  parallel     = False ) : 
+                  parallel     = False ,
+                  cache        = True  ) : 
 
         ## we will need Ostap machinery for trees&chains here
         import ostap.trees.trees
@@ -102,6 +109,20 @@ def __init__( self                 ,
             "Invald type of `chains` %s" % str ( chains )
 
         self.__check = True if check else False
+
+        ## persistent validation cache
+        if   isinstance ( cache , DataCache ) : pass
+        elif isinstance ( cache , string_types ) : cache = DataCache ( cache )
+        elif cache :
+            try :
+                cache = DataCache ()
+            except Exception :
+                logger.warning ( "Cannot open the validation cache, skip it" , exc_info = True )
+                cache = None 
+        self.__cache = cache if isinstance ( cache , DataCache ) else None 
+
+        ## schemas of the last valid trees { chain : ( branches , leaves ) } 
+        self.__schemas = {}
         
         ## chain names
         self.__chain_names = tuple ( ( c.path if isinstance ( c , ROOT.TTree ) else c ) for c in chains ) 
@@ -128,6 +149,14 @@ def validate ( self ) :
         """
         return self.__check
 
+    # ========================================================================
+    @property
+    def cache ( self ) :
+        """'cache' : persistent validation cache (or None)
+        - see `ostap.trees.data_cache.DataCache`
+        """
+        return self.__cache
+    
     # ========================================================================
     @property
     def chain_names ( self ) :
@@ -225,63 +254,63 @@ def __getattr__ ( self , name ) :
     def check_trees ( tree1 , tree2 , the_file = '' ) :
 
         if tree1 and tree2 :
-            
-            branches1 = set ( tree1.branches () )                
-            leaves1   = set ( tree1.leaves   () )
-            
-            branches2 = set ( tree2.branches () )                
-            leaves2   = set ( tree2.leaves   () )
-
-            if branches1 != branches2 :
-                missing = sorted ( branches1 - branches2 ) 
-                extra   = sorted ( branches2 - branches1 )
-                if missing : logger.warning ( "TTree('%s'): %3d missing branches: {%s} in %s" % ( tree1.GetName() , len ( missing ) , ', '.join ( missing ) , the_file ) )
-                if extra   : logger.warning ( "TTree('%s'): %3d extra   branches: {%s} in %s" % ( tree1.GetName() , len ( extra   ) , ', '.join ( extra   ) , the_file ) )
+            Data.check_schemas ( tree1.GetName () ,
+                                 ( tree1.branches () , tree1.leaves () ) ,
+                                 ( tree2.branches () , tree2.leaves () ) , the_file )
+
+    # =======================================================================================
+    ## check the schemas ( branches , leaves ) of the two trees
+    @staticmethod 
+    def check_schemas ( name , schema1 , schema2 , the_file = '' ) :
+        
+        branches1 , leaves1 = set ( schema1 [ 0 ] ) , set ( schema1 [ 1 ] ) 
+        branches2 , leaves2 = set ( schema2 [ 0 ] ) , set ( schema2 [ 1 ] ) 
+
+        if branches1 != branches2 :
+            missing = sorted ( branches1 - branches2 ) 
+            extra   = sorted ( branches2 - branches1 )
+            if missing : logger.warning ( "TTree('%s'): %3d missing branches: {%s} in %s" % ( name , len ( missing ) , ', '.join ( missing ) , the_file ) )
+            if extra   : logger.warning ( "TTree('%s'): %3d extra   branches: {%s} in %s" % ( name , len ( extra   ) , ', '.join ( extra   ) , the_file ) )
                 
-            if ( ( branches1 != leaves1 ) or ( branches2 != leaves2 ) ) and leaves1 != leaves2 :
-                missing = sorted ( leaves1 - leaves2 ) 
-                extra   = sorted ( leaves2 - leaves1 ) 
-                if missing : logger.warning ( "TTree('%s'): %3d missing leaves:   {%s} in %s" % ( tree1.GetName() , len ( missing ) , ', '.join ( missing ) , the_file ) )
-                if extra   : logger.warning ( "TTree('%s'): %3d extra   leaves:   {%s} in %s" % ( tree1.GetName() , len ( extra   ) , ', '.join ( extra   ) , the_file ) )
+        if ( ( branches1 != leaves1 ) or ( branches2 != leaves2 ) ) and leaves1 != leaves2 :
+            missing = sorted ( leaves1 - leaves2 ) 
+            extra   = sorted ( leaves2 - leaves1 ) 
+            if missing : logger.warning ( "TTree('%s'): %3d missing leaves:   {%s} in %s" % ( name , len ( missing ) , ', '.join ( missing ) , the_file ) )
+            if extra   : logger.warning ( "TTree('%s'): %3d extra   leaves:   {%s} in %s" % ( name , len ( extra   ) , ', '.join ( extra   ) , the_file ) )
                 
     # ===================================================================================================
-    ## the specific action for each file 
+    ## the specific action for each file
+    #  - the validity and the schema of trees are taken from the persistent cache (if available),
+    #    unchanged files do not require ROOT I/O
+    #  @see ostap.trees.data_cache.DataCache 
     def treatFile ( self, the_file ) :
         """ Add the file to TChain
+        - the validity and the schema of trees are taken from the persistent cache (if available),
+          unchanged files do not require ROOT I/O
+        - see `ostap.trees.data_cache.DataCache` 
         """
         
-        files    = self.files
         has_tree = False ## has at leas opne valid tree ?
         
         for i, cname in enumerate ( self.chain_names ) :
 
             bad_files = self.bad_files[cname]
-            
-            ## (1) suppress Warning/Error messages from ROOT
-            with rootError() :
-            
-                ## new temporary chain/tree for this file 
-                tree  = ROOT.TChain ( cname )
-                tree.Add ( the_file )
-
-                if not tree or 0 == len ( tree.branches () ) :
-                    bad_files.add ( the_file )
-                    if not self.silent : logger.warning ( "No/empty chain '%s' in file '%s'" % ( cname , the_file ) )
-                    continue
+
+            record = self.__cache.record ( the_file , cname ) if self.__cache is not None else file_record ( the_file , cname )
+
+            if not record.valid :
+                bad_files.add ( the_file )
+                if not self.silent : logger.warning ( "No/empty chain '%s' in file '%s'" % ( cname , the_file ) )
+                continue
                 
-                has_tree = True 
-                if self.check and files :
-                    last_file = '' 
-                    if cname in self.bad_files : 
-                        for f in reversed ( files ) :
-                            if f in bad_files : continue 
-                    if last_file :
-                        chain = ROOT.TChain ( cname )
-                        chain.Add ( last_file ) 
-                        self.check_trees ( tree , chain , the_file )
-                        del chain
-
-                del tree
+            has_tree = True
+            schema   = record.branches , record.leaves 
+            
+            ## compare with the previous valid tree 
+            if self.check and cname in self.__schemas : 
+                self.check_schemas ( cname , schema , self.__schemas [ cname ] , the_file )
+
+            self.__schemas [ cname ] = schema 
                 
         if has_tree : Files.treatFile ( self , the_file )
     
@@ -354,6 +383,9 @@ def table ( self , title = '' , prefix = '' ) :
                 row.append ( '???' )
 
             for cname in self.chain_names :
+                if self.cache is not None :
+                    row.append ( str ( self.cache.record ( f , cname ).entries ) )
+                    continue 
                 ch = ROOT.TChain ( cname )
                 ch.Add ( f )
                 row.append ( str ( len ( ch ) ) ) 
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# @file ostap/trees/tests/test_trees_data_cache.py
+# Test for persistent validation cache for Data
+# Copyright (c) Ostap developers.
+# =============================================================================
+""" Test for persistent validation cache for Data
+"""
+# =============================================================================
+from   ostap.trees.data         import Data
+from   ostap.trees.data_cache   import DataCache
+from   ostap.utils.timing       import timing
+from   ostap.utils.cleanup      import CleanUp
+from   ostap.utils.root_utils   import batch_env
+import ostap.trees.trees
+import ROOT, random
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_trees_data_cache' )
+else                       : logger = getLogger ( __name__                )
+# =============================================================================
+batch_env ( logger )
+# =============================================================================
+## create a file with tree
+def create_tree ( fname , nentries = 1000 ) :
+    """ Create a file with a tree
+    >>> create_tree ( 'file.root' ,  1000 )
+    """
+    from array import array
+    var1 = array ( 'd', [ 0 ] )
+    var2 = array ( 'd', [ 0 ] )
+
+    from ostap.io.root_file import ROOTCWD
+    with ROOTCWD() , ROOT.TFile.Open( fname , 'new' ) as root_file:
+        root_file.cd ()
+        tree = ROOT.TTree ( 'S','tree' )
+        tree.SetDirectory ( root_file  )
+        tree.Branch ( 'mass'  , var1 , 'mass/D'  )
+        tree.Branch ( 'pt'    , var2 , 'pt/D'    )
+        for i in range ( nentries ) :
+            var1 [ 0 ] = random.gauss   ( 3.1 ,  0.015 )
+            var2 [ 0 ] = random.uniform ( 0   , 10     )
+            tree.Fill()
+        root_file.Write()
+
+# =============================================================================
+def test_data_cache () :
+
+    files = [ CleanUp.tempfile ( prefix = 'ostap-test-trees-data-cache-%d-' % i , suffix = '.root' ) for i in range ( 10 ) ]
+    for f in files : create_tree ( f , 100 )
+
+    dbname = CleanUp.tempfile ( prefix = 'ostap-test-data-cache-' , suffix = '.sqlite' )
+    cache  = DataCache ( dbname )
+
+    with timing ( 'Data: no cache'    , logger = logger ) :
+        data0 = Data ( files , 'S' , cache = False )
+    with timing ( 'Data: empty cache' , logger = logger ) :
+        data1 = Data ( files , 'S' , cache = cache )
+    with timing ( 'Data: full cache'  , logger = logger ) :
+        data2 = Data ( files , 'S' , cache = dbname )
+
+    assert len ( cache ) == len ( files ) , 'Invalid number of cache entries'
+    assert data0.files == data1.files == data2.files , 'Mismatch in files!'
+    assert len ( data0.chain ) == len ( data2.chain ) , 'Mismatch in entries!'
+
+    record = cache.get ( files [ 0 ] , 'S' )
+    assert record and record.valid and 100 == record.entries , 'Invalid cache record'
+    assert 'mass' in record.branches and 'pt' in record.branches , 'Invalid schema in cache record'
+
+    ## missing tree: invalid record is cached too
+    data3 = Data ( files , 'T' , cache = cache )
+    assert not data3.files , 'No valid files are expected!'
+    assert not cache.get ( files [ 0 ] , 'T' ).valid , 'Invalid record is expected!'
+
+    logger.info ( 'Data:\n%s' % data2.table ( prefix = '# ' ) )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_data_cache ()
+
+# =============================================================================
+##                                                                      The END
+# =============================================================================
@@ -343,6 +343,83 @@ def _tt_rows_ ( tree                   ,
             
 ROOT.TTree .rows  = _tt_rows_ 
 
+# =============================================================================
+##  Iterate over tree entries in batches:
+#   get a 2D-array of values ( batch_size x #variables ) and 1D-array of weights
+#   for each block of good entries
+#   @code
+#   tree = ...
+#   for values, weights in tree.batches ( 'a a+b/c sin(d)' , 'd>0' , batch_size = 10000 ) :
+#      print ( values.shape , weights.sum() ) 
+#   @code 
+#   @attention selection/cut is treated as weight!
+#   @attention with <code>copy=False</code> the same buffers are reused for all batches 
+def _tt_batches_ ( tree                    , 
+                   variables               , 
+                   cuts       = ''         , 
+                   first      = FIRST_ENTRY , 
+                   last       = LAST_ENTRY  ,
+                   batch_size = 10000       , 
+                   copy       = True        , 
+                   active     = ()          ) :
+    """ Iterate over tree entries in batches:
+    get a 2D-array of values ( batch_size x #variables ) and 1D-array of weights
+    for each block of good entries
+    >>> tree = ...
+    >>> for values, weights in tree.batches ( 'a a+b/c sin(d)' , 'd>0' , batch_size = 10000 ) :
+    >>>    print ( values.shape , weights.sum() ) 
+    - attention: selection/cut is treated as weight!
+    - attention: with `copy=False` the same buffers are reused for all batches 
+    """
+    assert isinstance ( batch_size , integer_types ) and 0 < batch_size , \
+        "BATCHES: Invalid `batch_size`: %s" % batch_size 
+    
+    ## redefine first/last 
+    first, last = evt_range ( tree , first , last ) 
+    
+    vars , cuts, _ = vars_and_cuts ( variables , cuts )
+    
+    if active : context = ActiveBranches  ( tree , *active  )
+    else      : context = NoContext () 
+        
+    vars  = strings ( vars ) 
+    nvars = len ( vars )
+    
+    ## preallocated buffers 
+    values  = numpy.empty ( ( batch_size , nvars ) , dtype = float )
+    weights = numpy.empty (   batch_size           , dtype = float )
+    
+    raw_values  , _ = np2raw ( values  )
+    raw_weights , _ = np2raw ( weights ) 
+    
+    with context :
+        
+        entry = first 
+        while entry < last :
+            
+            result      = Ostap.Utils.fill_batch ( tree        ,
+                                                   vars        ,
+                                                   cuts        ,
+                                                   raw_values  ,
+                                                   raw_weights ,
+                                                   batch_size  ,
+                                                   entry       ,
+                                                   last        ) 
+            nrows , nxt = result.first , result.second
+            if nxt <= entry : break 
+            entry = nxt 
+            
+            if not nrows : continue
+
+            if copy : yield values [ : nrows ].copy () , weights [ : nrows ].copy ()
+            else    : yield values [ : nrows ]         , weights [ : nrows ] 
+
+    ## set the tree at the initial position 
+    ievt = tree.GetEntryNumber ( 0 )
+    if 0 <= ievt : tree.GetEntry ( ievt )
+            
+ROOT.TTree .batches = _tt_batches_ 
+
 # =============================================================================
 ## help project method for ROOT-trees and chains 
 #
@@ -2658,6 +2735,7 @@ def use_aliases ( tree , **aliases ) :
     ROOT.TChain.withCuts  ,
     #
     ROOT.TTree. rows      ,
+    ROOT.TTree. batches   ,
     #
     ROOT.TTree .__call__  ,
     ROOT.TChain.__call__  ,
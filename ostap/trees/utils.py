@@ -53,6 +53,151 @@ def fullfn ( f ) :
         if os.path.samefile  ( ff , f ) : return ff
     return f
 # =============================================================================
+## Get the cluster boundaries for the tree in the range [first,last)
+#  - the boundaries are obtained from <code>TTree::GetClusterIterator</code>
+#  - the first and last clusters are clipped to the range
+#  @code
+#  tree     = ...
+#  clusters = tree_clusters ( tree , 0 , len ( tree ) )
+#  @endcode
+#  @param tree  the tree
+#  @param first the first entry
+#  @param last  the last entry (not inclusive) 
+#  @return list of (begin,end) pairs 
+def tree_clusters ( tree , first , last ) :
+    """ Get the cluster boundaries for the tree in the range [first,last)
+    - the boundaries are obtained from `TTree.GetClusterIterator`
+    - the first and last clusters are clipped to the range
+    >>> tree     = ...
+    >>> clusters = tree_clusters ( tree , 0 , len ( tree ) )
+    """
+    clusters = []
+    if last <= first : return clusters                       ## RETURN 
+    ##
+    iclu  = tree.GetClusterIterator ( first )
+    begin = iclu.Next () 
+    while begin < last :
+        end = iclu.GetNextEntry ()
+        if end <= begin : break                              ## protection 
+        clusters.append ( ( max ( begin , first ) , min ( end , last ) ) )
+        begin = iclu.Next ()
+    ## 
+    if not clusters : clusters.append ( ( first , last ) )
+    return clusters
+# =============================================================================
+## Get the estimated (compressed) number of bytes per entry to be read 
+#  for the given active branches/expressions
+#  @code
+#  tree = ...
+#  bpe  = bytes_per_entry ( tree , 'pt' , 'mass>3' ) 
+#  @endcode
+#  @param tree the tree
+#  @param branches active branches/expressions (empty: all branches)
+#  @return estimated number of (compressed) bytes per entry 
+def bytes_per_entry ( tree , *branches ) :
+    """ Get the estimated (compressed) number of bytes per entry to be read 
+    for the given active branches/expressions
+    >>> tree = ...
+    >>> bpe  = bytes_per_entry ( tree , 'pt' , 'mass>3' ) 
+    """
+    nentries = tree.GetEntries ()
+    if nentries <= 0 : return 0.0                            ## RETURN 
+    ##
+    branches = tuple ( b for b in branches if b ) 
+    nbytes   = 0 
+    if branches :
+        from ostap.trees.trees import the_variables 
+        try : 
+            vars = the_variables ( tree , *branches ) 
+        except Exception :
+            logger.debug ( 'bytes_per_entry: cannot deduce active branches, use all of them' ) 
+            vars = () 
+        brs  = set () 
+        for v in ( vars if vars and not vars is True else () ) :
+            leaf = tree.GetLeaf ( v )
+            if not leaf : continue
+            branch = leaf.GetBranch ()
+            if not branch or branch.GetName () in brs : continue
+            brs.add ( branch.GetName () )
+            nbytes += branch.GetZipBytes ( '*' )
+    ##
+    if nbytes <= 0 : nbytes = tree.GetZipBytes ()
+    ##
+    return float ( nbytes ) / nentries 
+# =============================================================================
+## Split the chain into cluster-aligned, byte-balanced ranges
+#  - edges of all ranges are aligned to the cluster (basket) boundaries,
+#    therefore no basket is read/decompressed by two workers
+#  - ranges are balanced by the estimated (compressed) number of bytes
+#    to be read for the active branches: the target size of the range
+#    corresponds to <code>chunk_size</code> entries of the "average" width
+#  @code
+#  chain  = Chain ( ... )
+#  for item, first, last in balanced_ranges ( chain , 100000 , 'pt' , 'mass>3' ) :
+#  ...
+#  @endcode 
+#  @param chain      the Chain 
+#  @param chunk_size nominal number of entries per range
+#  @param branches   active branches/expressions (empty: all branches) 
+#  @return list of (file-item, first, last) triplets 
+def balanced_ranges ( chain , chunk_size , *branches ) :
+    """ Split the chain into cluster-aligned, byte-balanced ranges
+    - edges of all ranges are aligned to the cluster (basket) boundaries,
+      therefore no basket is read/decompressed by two workers
+    - ranges are balanced by the estimated (compressed) number of bytes
+      to be read for the active branches: the target size of the range
+      corresponds to `chunk_size` entries of the `average` width
+    >>> chain  = Chain ( ... )
+    >>> for item, first, last in balanced_ranges ( chain , 100000 , 'pt' , 'mass>3' ) :
+    ... 
+    """
+    ## (1) collect cluster & size information for all files 
+    infos  = []
+    start  = 0
+    for item in chain.items :
+        
+        ## the range of entries in this file 
+        first = max ( chain.first - start , 0         )
+        last  = min ( chain.last  - start , item.size )
+        start += item.size
+        if last <= first : continue 
+        
+        rfile = ROOT.TFile.Open ( item.file_name , 'READ' )
+        if not rfile or rfile.IsZombie () :
+            logger.warning ( 'balanced_ranges: cannot open the file %s' % item.file_name )
+            infos.append ( ( item , [ ( first , last ) ] , 1.0 ) )
+            continue
+        
+        tree = rfile.Get ( chain.name )
+        if valid_pointer ( tree ) and isinstance ( tree , ROOT.TTree ) : 
+            infos.append ( ( item                                   ,
+                             tree_clusters   ( tree , first , last ) ,
+                             bytes_per_entry ( tree , *branches    ) ) )
+        else :
+            infos.append ( ( item , [ ( first , last ) ] , 1.0 ) )
+        rfile.Close ()
+
+    if not infos : return []                                  ## RETURN
+    
+    ## (2) target number of bytes per range
+    nentries = sum ( l - f for _ , clusters , _ in infos for f , l in clusters )
+    nbytes   = sum ( ( l - f ) * bpe for _ , clusters , bpe in infos for f , l in clusters )
+    target   = nbytes * chunk_size / max ( nentries , 1 )
+
+    ## (3) merge clusters into the ranges 
+    ranges = []
+    for item , clusters , bpe in infos :
+        begin , acc = None , 0.0 
+        for f , l in clusters :
+            if begin is None : begin = f
+            acc += ( l - f ) * bpe
+            if target <= acc :
+                ranges.append ( ( item , begin , l ) )
+                begin , acc = None , 0.0 
+        if not begin is None : ranges.append ( ( item , begin , clusters [ -1 ] [ 1 ] ) )
+        
+    return ranges 
+# =============================================================================
 ## @class Chain
 #  Simple class to make TChain suitable for multiprocessing:
 # - pickling
@@ -314,18 +459,39 @@ def accumulated_sizes ( self ) :
     #  chain = Chain ( ... )
     #  for i in chain.split ( chunk_size = 1000 ) :
     #  ... 
-    #  @endcode 
-    def split ( self , chunk_size = -1 , max_files = -1  ) :
+    #  @endcode
+    #  - for <code>balanced=True</code> the edges of chunks are aligned to 
+    #    the cluster boundaries and chunks are balanced by the estimated number 
+    #    of (compressed) bytes to be read for the active branches
+    #  @code
+    #  chain = Chain ( ... )
+    #  for i in chain.split ( chunk_size = 1000 , balanced = True , branches = ( 'pt' , 'mass>3' ) ) :
+    #  ... 
+    #  @endcode
+    #  @see balanced_ranges 
+    def split ( self , chunk_size = -1 , max_files = -1 , * , balanced = False , branches = () ) :
         """ GENERATOR Split the tree for several trees 
         with at most  `chunk_size` entries
         >>> chain  = Chain ( .... ) 
         >>> for t in tree.split ( chunk_size = 1000000 )  : 
         >>> ...
+        - for `balanced=True` the edges of chunks are aligned to the 
+          cluster boundaries and chunks are balanced by the estimated number 
+          of (compressed) bytes to be read for the active branches
+        >>> for t in tree.split ( chunk_size = 1000000 , balanced = True , branches = ( 'pt' , 'mass>3' ) ) :
+        >>> ...
+        - see `balanced_ranges`
         """
         assert isinstance ( chunk_size , integer_types ) , \
             'Chain.split : invalid chunk_size %s' % chunk_size
 
         if not self.nFiles  : return                                   ## RETURN 
+
+        if balanced and 0 < chunk_size :
+            if isinstance ( branches , string_types ) : branches = branches , 
+            for item , first , last in balanced_ranges ( self , chunk_size , *branches ) :
+                yield Tree ( name = self.name , file = item , first = first , last = last ) 
+            return                                                     ## RETURN 
         
         if 1 == self.nFiles : 
             tree = Tree ( name  = self.name        ,
@@ -474,12 +640,14 @@ def __init__      ( self                   ,
     #  for i in tree.split ( chunk_size = 1000 ) :
     #  ... 
     #  @endcode 
-    def split ( self , chunk_size = -1 , max_files = -1  ) :
+    #  @see Chain.split
+    def split ( self , chunk_size = -1 , max_files = -1 , * , balanced = False , branches = () ) :
         """ *GENERATOR* split the tree into smaller Tree objects 
         with at most  `chunk_size` entries
         >>> tree  = Tree ( .... ) 
         >>> for t in tree.split ( chunk_size = 1000000 )  : 
         >>> ...
+        - see `Chain.split`
         """        
         assert isinstance ( chunk_size , integer_types ) , \
             'Tree.split: invalid chunk_size %s' % chunk_size
@@ -488,6 +656,11 @@ def split ( self , chunk_size = -1 , max_files = -1  ) :
         if chunk_size <= 0 :
             yield self                     ## YIELD            
             return                         ## RETUN
+
+        ## cluster-aligned & byte-balanced split 
+        if balanced :
+            for t in Chain.split ( self , chunk_size , max_files , balanced = True , branches = branches ) : yield t 
+            return                         ## RETURN 
         
         for first, last in split_range ( self.first , self.last , chunk_size ) :
             yield Tree ( name  = self.name        ,
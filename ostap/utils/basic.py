@@ -39,6 +39,7 @@
     ##
     'counted'              , ## helper to count function calls 
     'memoize'              , ## lightweight cache
+    'LRUCache'             , ## size/memory-bounded LRU cache with hit/miss counters
     ##
     # =========================================================================
 ) # ===========================================================================
@@ -279,6 +280,135 @@ def memoize ( user_function ):
         """
         return functools.lru_cache(maxsize=None)(user_function)
 
+# =============================================================================
+## @class LRUCache
+#  Size- and memory-bounded cache with LRU eviction and hit/miss counters
+#  @code
+#  cache = LRUCache ( maxsize = 1000 , maxbytes = 2**20 )
+#  cache [ key ] = value
+#  value = cache.get ( key , None ) 
+#  print ( cache.hits , cache.misses , cache.evictions ) 
+#  @endcode
+#  - `maxsize`  : maximal number of entries (`None` or non-positive: unbounded)
+#  - `maxbytes` : maximal (approximate) memory footprint of keys and values, 
+#                 estimated via `sys.getsizeof` (`None` or non-positive: unbounded)
+class LRUCache(object) :
+    """ Size- and memory-bounded cache with LRU eviction and hit/miss counters
+    >>> cache = LRUCache ( maxsize = 1000 , maxbytes = 2**20 )
+    >>> cache [ key ] = value
+    >>> value = cache.get ( key , None ) 
+    >>> print ( cache.hits , cache.misses , cache.evictions ) 
+    - `maxsize`  : maximal number of entries (`None` or non-positive: unbounded)
+    - `maxbytes` : maximal (approximate) memory footprint of keys and values, 
+                   estimated via `sys.getsizeof` (`None` or non-positive: unbounded)
+    """
+    def __init__ ( self , maxsize = 1024 , maxbytes = None ) :
+        
+        from collections import OrderedDict
+        
+        self.__maxsize   = maxsize  if maxsize  and 0 < maxsize  else 0 
+        self.__maxbytes  = maxbytes if maxbytes and 0 < maxbytes else 0
+        self.__data      = OrderedDict ()
+        self.__nbytes    = 0
+        self.__hits      = 0
+        self.__misses    = 0
+        self.__evictions = 0
+        self.__lock      = threading.RLock () 
+
+    ## (approximate) size of the entry 
+    @staticmethod
+    def _sizeof ( key , value ) :
+        return sys.getsizeof ( key ) + sys.getsizeof ( value )
+    
+    ## get the value from the cache
+    def get ( self , key , default = None ) :
+        """ Get the value from the cache
+        """
+        with self.__lock :
+            entry = self.__data.get ( key , None )
+            if entry is None :
+                self.__misses += 1
+                return default
+            self.__hits += 1 
+            self.__data.move_to_end ( key )
+            return entry [ 0 ] 
+
+    ## put the value into the cache 
+    def put ( self , key , value ) :
+        """ Put the value into the cache
+        """
+        size = self._sizeof ( key , value ) if self.__maxbytes else 0 
+        with self.__lock :
+            old = self.__data.pop ( key , None )
+            if old is not None : self.__nbytes -= old [ 1 ]
+            self.__data [ key ] = value , size 
+            self.__nbytes += size
+            self.__evict () 
+
+    ## evict the least recently used entries 
+    def __evict ( self ) :
+        data = self.__data 
+        while data and ( ( self.__maxsize  and self.__maxsize  < len ( data    ) ) or 
+                         ( self.__maxbytes and self.__maxbytes < self.__nbytes ) ) :
+            _ , entry = data.popitem ( last = False )
+            self.__nbytes    -= entry [ 1 ]
+            self.__evictions += 1 
+
+    def __getitem__  ( self , key ) :
+        with self.__lock :
+            if not key in self.__data :
+                self.__misses += 1 
+                raise KeyError ( key )
+            return self.get ( key ) 
+        
+    def __setitem__  ( self , key , value ) : self.put ( key , value )
+    def __contains__ ( self , key ) : return key in self.__data
+    def __len__      ( self       ) : return len ( self.__data )
+    
+    ## remove all entries and reset the counters 
+    def clear ( self ) :
+        """ Remove all entries and reset the counters
+        """
+        with self.__lock :
+            self.__data.clear ()
+            self.__nbytes    = 0
+            self.__hits      = 0
+            self.__misses    = 0
+            self.__evictions = 0
+
+    @property
+    def maxsize ( self ) :
+        """`maxsize` : maximal number of entries (0: unbounded)"""
+        return self.__maxsize
+    @property
+    def maxbytes ( self ) :
+        """`maxbytes` : maximal (approximate) memory footprint (0: unbounded)"""
+        return self.__maxbytes
+    @property
+    def nbytes ( self ) :
+        """`nbytes` : (approximate) memory footprint (only when `maxbytes` is specified)"""
+        return self.__nbytes
+    @property
+    def hits ( self ) :
+        """`hits` : number of cache hits"""
+        return self.__hits
+    @property
+    def misses ( self ) :
+        """`misses` : number of cache misses"""
+        return self.__misses
+    @property
+    def evictions ( self ) :
+        """`evictions` : number of evicted entries"""
+        return self.__evictions
+    
+    ## pickling: only the configuration is transferred 
+    def __reduce__ ( self ) :
+        return LRUCache , ( self.__maxsize , self.__maxbytes ) 
+
+    def __str__ ( self ) :
+        return 'LRUCache(size=%d,hits=%d,misses=%d,evictions=%d)' % ( len ( self ) , self.hits , self.misses , self.evictions )
+    __repr__ = __str__
+
 # =============================================================================
 ## Print/format warning message in one line
 #  @see warnings.WarnigMessage 
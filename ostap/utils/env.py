@@ -45,6 +45,7 @@
     'OSTAP_NCPUS'        , ## max number of paralell workers 
     'OSTAP_IMPLICITMT'   , ## Enable Implicit MT?
     'OSTAP_PROFILE'      , ## Profiel the processing? 
+    'OSTAP_LAZY'         , ## lazy loading of decorations? 
     ## 
     'OSTAP_TABLE'        , ## Ostap table style
     ## 
@@ -82,6 +83,7 @@
 OSTAP_NCPUS         = 'OSTAP_NCPUS'        ## Max number of parallel workers
 OSTAP_IMPLICITMT    = 'OSTAP_IMPLICITMT'   ## Enable  ImplicitMT ?
 OSTAP_PROFILE       = 'OSTAP_PROFILE'      ## Profile the execution ? 
+OSTAP_LAZY          = 'OSTAP_LAZY'         ## lazy loading of decorations ? 
 ##
 OSTAP_TABLE         = 'OSTAP_TABLE'        ## table style
 ##
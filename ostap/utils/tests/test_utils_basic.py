@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+## @file ostap/utils/tests/test_utils_basic.py
+#  Test module for the file ostap/utils/basic.py
+# =============================================================================
+""" Test module for ostap/utils/basic.py
+"""
+# =============================================================================
+from   ostap.utils.basic      import LRUCache
+import pickle
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_utils_basic' )
+else                       : logger = getLogger ( __name__  )
+# =============================================================================
+
+# =============================================================================
+## LRU cache bounded in size
+def test_lru_size () :
+    """ LRU cache bounded in size
+    """
+    cache = LRUCache ( maxsize = 3 )
+
+    for i in range ( 3 ) : cache [ i ] = i * i
+    assert 3 == len ( cache ) and 0 == cache.evictions , 'Invalid size/evictions!'
+
+    ## use the oldest entry: now it is the most recently used one
+    assert 0 == cache [ 0 ] , 'Invalid value!'
+
+    ## the least recently used entry (1) is evicted
+    cache [ 3 ] = 9
+    assert 3 == len ( cache ) and 1 == cache.evictions , 'Invalid size/evictions!'
+    assert not 1 in cache and 0 in cache and 3 in cache , 'Invalid LRU eviction!'
+
+    ## update of the existing entry: no eviction
+    cache [ 3 ] = 10
+    assert 3 == len ( cache ) and 1 == cache.evictions , 'Invalid size/evictions!'
+    assert 10 == cache.get ( 3 ) , 'Invalid updated value!'
+
+    ## hits & misses
+    assert cache.get ( 1 , None ) is None , 'Evicted value is returned!'
+    try :
+        cache [ 1 ]
+        assert False , 'KeyError is expected!'
+    except KeyError :
+        pass
+    assert 2 == cache.hits   , 'Invalid number of hits: %s'   % cache.hits
+    assert 2 == cache.misses , 'Invalid number of misses: %s' % cache.misses
+
+    logger.info ( 'Cache: %s' % cache )
+
+    cache.clear ()
+    assert 0 == len ( cache ) and 0 == cache.hits and 0 == cache.misses and 0 == cache.evictions , 'Invalid clear!'
+
+# =============================================================================
+## LRU cache bounded in memory
+def test_lru_bytes () :
+    """ LRU cache bounded in memory
+    """
+    item  = 'x' * 1000
+    size  = LRUCache._sizeof ( 0 , item )
+    cache = LRUCache ( maxsize = 0 , maxbytes = 5 * size )
+
+    for i in range ( 10 ) : cache [ i ] = item
+    assert 5 == len ( cache ) and 5 == cache.evictions , 'Invalid size/evictions!'
+    assert cache.nbytes <= cache.maxbytes , 'Memory bound is violated!'
+    assert all ( i in cache for i in range ( 5 , 10 ) ) , 'Invalid LRU eviction!'
+
+    ## the entry larger than the bound is not kept
+    cache [ 'big' ] = 'x' * ( 10 * size )
+    assert not 'big' in cache and 0 == cache.nbytes , 'Invalid eviction of the large entry!'
+
+    logger.info ( 'Cache: %s' % cache )
+
+    ## pickling: only configuration is transferred
+    cache [ 0 ] = item
+    cache2 = pickle.loads ( pickle.dumps ( cache ) )
+    assert 0 == len ( cache2 ) and cache2.maxbytes == cache.maxbytes , 'Invalid pickling!'
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_lru_size  ()
+    test_lru_bytes ()
+
+# =============================================================================
+##                                                                      The END
+# =============================================================================
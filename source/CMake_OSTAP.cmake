@@ -6,6 +6,7 @@ add_library(ostap SHARED src/format.cpp
                          src/AddBuffer.cpp
                          src/AddVars.cpp
                          src/AdHocShapes.cpp
+                         src/Batches.cpp
                          src/BLOB.cpp
                          src/BSpline.cpp
                          src/Bernstein.cpp
@@ -56,10 +57,12 @@ add_library(ostap SHARED src/format.cpp
                          src/HistoInterpolators.cpp
                          src/HistoMake.cpp
                          src/HistoStat.cpp
+                         src/HistoWeight.cpp
                          src/IFuncs.cpp
                          src/Integrator.cpp
                          src/Interpolation.cpp
                          src/Iterator.cpp
+                         src/KDTree.cpp
                          src/Kinematics.cpp
                          src/KolmogorovSmirnovDist.cpp
                          src/KramersKronig.cpp
@@ -125,9 +128,11 @@ add_library(ostap SHARED src/format.cpp
                          src/SPLOT.cpp
                          src/Spectra.cpp
                          src/StatEntity.cpp
+                         src/StatPlan.cpp
                          src/Statistic.cpp
                          src/StatVar.cpp
                          src/StatusCode.cpp
+                         src/TDigest.cpp
                          src/Tails.cpp
                          src/Tee.cpp
                          src/Tensors.cpp
@@ -0,0 +1,100 @@
+// ============================================================================
+#ifndef OSTAP_BATCHES_H
+#define OSTAP_BATCHES_H 1
+// ============================================================================
+// Include files
+// ============================================================================
+// STD&STL
+// ============================================================================
+#include <string>
+#include <vector>
+#include <utility>
+// ============================================================================
+// Ostap
+// ============================================================================
+#include "Ostap/Types.h"
+// ============================================================================
+// Forward declarations
+// ============================================================================
+class TTree      ; // ROOT
+class RooAbsData ; // RooFit
+// ============================================================================
+/** @file Ostap/Batches.h
+ *  Helper functions for batched (columnar) iteration over TTree/RooAbsData
+ *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+ *  @date 2026-10-17
+ */
+// ============================================================================
+namespace Ostap
+{
+  // ==========================================================================
+  namespace Utils
+  {
+    // ========================================================================
+    /** fill the batch of rows from the tree:
+     *  - the buffer <code>values</code> is filled in row-major order
+     *    ( <code>capacity x expressions.size()</code> )
+     *  - the buffer <code>weights</code> is filled with the values of
+     *    selection/cut (treated as weight!), entries with zero weight are skipped
+     *  - the loop stops when <code>capacity</code> rows are filled
+     *    or <code>last</code> entry is reached
+     *  @param data        (INPUT)  input tree/chain
+     *  @param expressions (INPUT)  list of expressions
+     *  @param selection   (INPUT)  selection/cut (treated as weight!)
+     *  @param values      (OUTPUT) row-major buffer ( capacity x #expressions )
+     *  @param weights     (OUTPUT) buffer of weights ( capacity )
+     *  @param capacity    (INPUT)  maximal number of rows
+     *  @param first       (INPUT)  the first entry to process (inclusive)
+     *  @param last        (INPUT)  the last entry to process (exclusive)
+     *  @return pair ( number of filled rows , next entry to process )
+     */
+    std::pair<std::size_t,Ostap::EventIndex>
+    fill_batch
+    ( TTree*                          data                            ,
+      const std::vector<std::string>& expressions                     ,
+      const std::string&              selection                       ,
+      double*                         values                          ,
+      double*                         weights                         ,
+      const std::size_t               capacity                        ,
+      const Ostap::EventIndex         first       = Ostap::FirstEvent ,
+      const Ostap::EventIndex         last        = Ostap::LastEvent  ) ;
+    // ========================================================================
+    /** fill the batch of rows from the dataset:
+     *  - the buffer <code>values</code> is filled in row-major order
+     *    ( <code>capacity x expressions.size()</code> )
+     *  - the buffer <code>weights</code> is filled with the product
+     *    of data weight and selection/cut (treated as weight!),
+     *    entries with zero weight are skipped
+     *  - the loop stops when <code>capacity</code> rows are filled
+     *    or <code>last</code> entry is reached
+     *  @param data        (INPUT)  input dataset
+     *  @param expressions (INPUT)  list of expressions
+     *  @param selection   (INPUT)  selection/cut (treated as weight!)
+     *  @param cut_range   (INPUT)  if non empty: use events only from this cut-range
+     *  @param values      (OUTPUT) row-major buffer ( capacity x #expressions )
+     *  @param weights     (OUTPUT) buffer of weights ( capacity )
+     *  @param capacity    (INPUT)  maximal number of rows
+     *  @param first       (INPUT)  the first entry to process (inclusive)
+     *  @param last        (INPUT)  the last entry to process (exclusive)
+     *  @return pair ( number of filled rows , next entry to process )
+     */
+    std::pair<std::size_t,Ostap::EventIndex>
+    fill_batch
+    ( const RooAbsData*               data                            ,
+      const std::vector<std::string>& expressions                     ,
+      const std::string&              selection                       ,
+      const std::string&              cut_range                       ,
+      double*                         values                          ,
+      double*                         weights                         ,
+      const std::size_t               capacity                        ,
+      const Ostap::EventIndex         first       = Ostap::FirstEvent ,
+      const Ostap::EventIndex         last        = Ostap::LastEvent  ) ;
+    // ========================================================================
+  } //                                        The end of namespace Ostap::Utils
+  // ==========================================================================
+} //                                                 The end of namespace Ostap
+// ============================================================================
+#endif // OSTAP_BATCHES_H
+// ============================================================================
+//                                                                      The END
+// ============================================================================
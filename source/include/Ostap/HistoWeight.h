@@ -0,0 +1,151 @@
+// ============================================================================
+#ifndef OSTAP_HISTOWEIGHT_H
+#define OSTAP_HISTOWEIGHT_H 1
+// ============================================================================
+// Include files
+// ============================================================================
+// STD&STL
+// ============================================================================
+#include <string>
+#include <vector>
+// ============================================================================
+// Ostap
+// ============================================================================
+#include "Ostap/IFuncs.h"
+#include "Ostap/Funcs.h"
+#include "Ostap/HistoInterpolators.h"
+// ============================================================================
+// Forward declarations
+// ============================================================================
+class TH1 ; // ROOT
+// ============================================================================
+namespace Ostap
+{
+  // ==========================================================================
+  namespace Functions
+  {
+    // ========================================================================
+    /** @class HistoWeight Ostap/HistoWeight.h
+     *  "Compiled" version of the event weight for (iterative) reweighting:
+     *  \f$ w = \prod_i \prod_j h_{ij} ( \vec{x}_i ) \f$,
+     *  where \f$ \vec{x}_i \f$ are 1,2 or 3 expressions for the i-th factor
+     *  and  \f$ h_{ij}\f$ are the 1D,2D or 3D histograms (with the default
+     *  interpolation) from the sequence of reweighting iterations
+     *  - it is simultaneously Ostap::IFuncTree and Ostap::IFuncData
+     *  - batch evaluation for the range of entries is supported
+     *  @see Ostap::Math::Histo1D
+     *  @see Ostap::Math::Histo2D
+     *  @see Ostap::Math::Histo3D
+     *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+     *  @date 2026-10-17
+     */
+    class HistoWeight : public Ostap::IFuncTree , public Ostap::IFuncData
+    {
+    public:
+      // ======================================================================
+      /// default (empty) weight: w = 1
+      HistoWeight () = default ;
+      /// copy constructor
+      HistoWeight ( const HistoWeight& right ) = default ;
+      /// destructor
+      virtual ~HistoWeight () ;
+      // ======================================================================
+    public:
+      // ======================================================================
+      /// IFuncTree::clone, IFuncData::clone
+      HistoWeight* clone ( const char* newname = "" ) const override ;
+      // ======================================================================
+    public:
+      // ======================================================================
+      /** add new factor
+       *  @param vars (INPUT) the expressions for the factor ( 1, 2 or 3 )
+       *  @return the index of the factor
+       */
+      std::size_t add_factor ( const std::vector<std::string>& vars ) ;
+      // ======================================================================
+      /** add the histogram to the factor
+       *  - the histogram dimension must be equal to the number of expressions
+       *  @param factor (INPUT) the index of the factor
+       *  @param histo  (INPUT) the histogram
+       */
+      void add_histo
+      ( const std::size_t factor ,
+        const TH1&        histo  ) ;
+      // ======================================================================
+    public:
+      // ======================================================================
+      /// evaluate the weight for the current entry of TTree
+      double operator () ( const TTree*      tree ) const override ;
+      /// evaluate the weight for the current entry of RooAbsData
+      double operator () ( const RooAbsData* data ) const override ;
+      // ======================================================================
+    public:
+      // ======================================================================
+      /** evaluate the weights for the range of entries in TTree
+       *  @param tree  (INPUT) the tree
+       *  @param first (INPUT) the first entry
+       *  @param last  (INPUT) the last entry (not inclusive)
+       *  @return vector of weights
+       */
+      std::vector<double> weights
+      ( const TTree*            tree  ,
+        const unsigned long     first ,
+        const unsigned long     last  ) const ;
+      // ======================================================================
+      /** evaluate the weights for the range of entries in RooAbsData
+       *  @param data  (INPUT) the dataset
+       *  @param first (INPUT) the first entry
+       *  @param last  (INPUT) the last entry (not inclusive)
+       *  @return vector of weights
+       */
+      std::vector<double> weights
+      ( const RooAbsData*       data  ,
+        const unsigned long     first ,
+        const unsigned long     last  ) const ;
+      // ======================================================================
+    public:
+      // ======================================================================
+      /// number of factors
+      inline std::size_t nFactors () const { return m_factors.size () ; }
+      /// number of histograms in the factor
+      std::size_t        nHistos  ( const std::size_t factor ) const ;
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// single factor
+      struct Factor
+      {
+        /// the first variable
+        std::size_t                       first { 0 } ;
+        /// number of variables
+        unsigned short                    dim   { 1 } ;
+        /// 1D-histograms
+        std::vector<Ostap::Math::Histo1D> h1    {   } ;
+        /// 2D-histograms
+        std::vector<Ostap::Math::Histo2D> h2    {   } ;
+        /// 3D-histograms
+        std::vector<Ostap::Math::Histo3D> h3    {   } ;
+      } ;
+      // ======================================================================
+      /// evaluate the weight from the values of variables
+      double weight ( const std::vector<double>& values ) const ;
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// all variables
+      std::vector<Ostap::Functions::Expression> m_vars    {} ;
+      /// all factors
+      std::vector<Factor>                       m_factors {} ;
+      /// values of variables (helper)
+      mutable std::vector<double>               m_values  {} ;
+      // ======================================================================
+    } ;
+    // ========================================================================
+  } //                                   The end of namespace Ostap::Functions
+  // ==========================================================================
+} //                                                 The end of namespace Ostap
+// ============================================================================
+#endif // OSTAP_HISTOWEIGHT_H
+// ============================================================================
+//                                                                      The END
+// ============================================================================
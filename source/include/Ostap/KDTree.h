@@ -0,0 +1,137 @@
+// ============================================================================
+#ifndef OSTAP_KDTREE_H
+#define OSTAP_KDTREE_H 1
+// ============================================================================
+// Include files
+// ============================================================================
+// STD&STL
+// ============================================================================
+#include <vector>
+#include <limits>
+#include <utility>
+#include <cstddef>
+// ============================================================================
+namespace Ostap
+{
+  // ==========================================================================
+  namespace Math
+  {
+    // ========================================================================
+    /** @class KDTree Ostap/KDTree.h
+     *  Simple static k-d tree for (Euclidean) nearest neighbour search
+     *  - the tree is balanced (median split) and implicit:
+     *    it is stored as permutation of point indices
+     *  - the split dimension for each node is the dimension
+     *    of the largest spread of points
+     *  - construction is  \f$ \mathcal{O}(N\log N)\f$,
+     *    query is  \f$ \mathcal{O}(\log N)\f$ for well-behaved data
+     *  @see J.L.Bentley, "Multidimensional binary search trees used for associative searching",
+     *       Communications of the ACM 18 (1975) 509
+     *  @see https://doi.org/10.1145/361002.361007
+     *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+     *  @date 2026-10-17
+     */
+    class KDTree
+    {
+    public:
+      // ======================================================================
+      /// the special value for "no point"
+      static constexpr std::size_t npos = std::numeric_limits<std::size_t>::max () ;
+      // ======================================================================
+    public:
+      // ======================================================================
+      /** constructor from the dimension and the flat (row-major) array of points
+       *  @param dim    (INPUT) dimension of the space
+       *  @param points (INPUT) flat (row-major) array of points ( N x dim )
+       */
+      KDTree
+      ( const unsigned short       dim    ,
+        const std::vector<double>& points ) ;
+      /** constructor from the dimension and the flat (row-major) array of points
+       *  @param dim    (INPUT) dimension of the space
+       *  @param points (INPUT) flat (row-major) array of points ( N x dim )
+       */
+      KDTree
+      ( const unsigned short       dim    ,
+        std::vector<double>&&      points ) ;
+      // ======================================================================
+    public:
+      // ======================================================================
+      /// dimension of the space
+      inline unsigned short dim   () const { return m_dim ; }
+      /// number of points
+      inline std::size_t    size  () const { return m_index.size () ; }
+      /// empty tree ?
+      inline bool           empty () const { return m_index.empty () ; }
+      /// get the point
+      inline const double*  point ( const std::size_t index ) const
+      { return m_points.data () + index * m_dim ; }
+      // ======================================================================
+    public:
+      // ======================================================================
+      /** find the nearest neighbour for the given point
+       *  @param x       (INPUT) the point (dim values)
+       *  @param exclude (INPUT) the index of point to be excluded from search
+       *  @return pair ( index , distance ), index is npos for empty tree
+       */
+      std::pair<std::size_t,double> nearest
+      ( const double*              x                ,
+        const std::size_t          exclude  = npos  ) const ;
+      /** find the nearest neighbour for the given point
+       *  @param x       (INPUT) the point
+       *  @return pair ( index , distance ), index is npos for empty tree
+       */
+      std::pair<std::size_t,double> nearest
+      ( const std::vector<double>& x                ) const ;
+      // ======================================================================
+      /** get distances to the nearest (other) neighbour for all points in the tree
+       *  @param nthreads (INPUT) number of threads for the query phase
+       *                  ( 0: use all available hardware threads )
+       *  @return vector of distances
+       */
+      std::vector<double> nearest_distances
+      ( const unsigned short nthreads = 1 ) const ;
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// build the (sub)tree for the range of indices
+      void build  ( const std::size_t first , const std::size_t last ) ;
+      /// search in the (sub)tree
+      void search
+      ( const std::size_t first   ,
+        const std::size_t last    ,
+        const double*     x       ,
+        const std::size_t exclude ,
+        std::size_t&      best    ,
+        double&           dist2   ) const ;
+      /// squared distance between points
+      inline double distance2 ( const double* x , const std::size_t index ) const
+      {
+        const double* p = point ( index ) ;
+        double result   = 0 ;
+        for ( unsigned short d = 0 ; d < m_dim ; ++d )
+          { const double delta = x [ d ] - p [ d ] ; result += delta * delta ; }
+        return result ;
+      }
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// dimension
+      unsigned short             m_dim    { 1 } ;
+      /// points (row-major)
+      std::vector<double>        m_points {   } ;
+      /// the tree: permutation of point indices
+      std::vector<std::size_t>   m_index  {   } ;
+      /// split dimensions for the nodes
+      std::vector<unsigned short> m_split {   } ;
+      // ======================================================================
+    } ;
+    // ========================================================================
+  } //                                         The end of namespace Ostap::Math
+  // ==========================================================================
+} //                                                 The end of namespace Ostap
+// ============================================================================
+#endif // OSTAP_KDTREE_H
+// ============================================================================
+//                                                                      The END
+// ============================================================================
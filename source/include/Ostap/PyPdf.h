@@ -4,6 +4,14 @@
 // ============================================================================
 // Include files
 // ============================================================================
+// STD&STL
+// ============================================================================
+#include <vector>
+// ============================================================================
+// ROOT 
+// ============================================================================
+#include "RVersion.h"
+// ============================================================================
 // RooFit 
 // ============================================================================
 #include "RooAbsPdf.h"
@@ -93,6 +101,28 @@ namespace Ostap
       // the actual evaluation of function
       Double_t evaluate() const override;
       // ======================================================================
+#if ROOT_VERSION(6,32,0)<=ROOT_VERSION_CODE
+      // ======================================================================
+      /** vectorised evaluation of function for RooFit CPU backend
+       *  - the contiguous buffer with values of all variables is prepared 
+       *    and <code>evaluate_buffers</code> is invoked. 
+       *  - if it returns false, the default scalar evaluation is used 
+       *  @see Ostap::Models::PyPdf::evaluate_buffers
+       */
+      void doEval ( RooFit::EvalContext& context ) const override ;
+      // ======================================================================
+#endif
+      // ======================================================================
+      /** helper function to be redefined in python for vectorised evaluation 
+       *  @param inputs (INPUT)  the values of all variables,
+       *                 (nvars x size) matrix, row-by-row 
+       *  @param output (UPDATE) the output buffer of size `size` 
+       *  @return true if the output is filled 
+       */
+      virtual bool evaluate_buffers 
+      ( const std::vector<double>& inputs ,
+        std::vector<double>&       output ) const ;
+      // ======================================================================
     public: // analytical integrals 
       // ======================================================================
       Int_t    getAnalyticalIntegral
@@ -133,6 +163,13 @@ namespace Ostap
       mutable const char*       m_rangeName { nullptr } ;
       mutable Int_t             m_intCode   { 0       } ; 
       // ======================================================================  
+    private: // helper buffers for vectorised evaluation 
+      // ======================================================================  
+      /// the values of all variables 
+      mutable std::vector<double> m_inputs  {} ; //! 
+      /// the output values
+      mutable std::vector<double> m_outputs {} ; //! 
+      // ======================================================================  
     } ;
     // ========================================================================
     /** @class PyPdfLite Ostap/PyPdf.h
@@ -212,10 +249,39 @@ namespace Ostap
       // the actual evaluation of function
       Double_t evaluate() const override;
       // ======================================================================
+#if ROOT_VERSION(6,32,0)<=ROOT_VERSION_CODE
+      // ======================================================================
+      /** vectorised evaluation of function for RooFit CPU backend
+       *  - if the batch function is defined, it is invoked as 
+       *    <code>batch ( inputs , output )</code>, where
+       *    <code>inputs</code> is a read-only memoryview for 
+       *    (nvars x size) matrix of values of all variables and 
+       *    <code>output</code> is a writable memoryview for the result
+       *  - otherwise the default scalar evaluation is used 
+       */
+      void doEval ( RooFit::EvalContext& context ) const override ;
+      // ======================================================================
+#endif
+      // ======================================================================
+    public:
+      // ======================================================================
+      /** set the batch function for vectorised evaluation
+       *  @see Ostap::Models::PyPdfLite::doEval 
+       */
+      void            set_batch  ( PyObject* batch ) ;
+      /** get the batch function for vectorised evaluation (if any) 
+       *  @attention reference count is incremented!
+       */
+      const PyObject* batch      () const ;
+      // ======================================================================
     private:
       // ======================================================================
       // python partner
       PyObject*    m_function  { nullptr } ; //! python partner
+      /// python function for vectorised evaluation 
+      PyObject*    m_batch     { nullptr } ; //! batch function 
+      /// the values of all variables
+      mutable std::vector<double> m_inputs {} ; //! 
       /// all variables as list of variables 
       RooListProxy m_varlist   {} ; // all variables as list of variables 
       // ======================================================================  
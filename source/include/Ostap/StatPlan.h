@@ -0,0 +1,111 @@
+// ============================================================================
+#ifndef OSTAP_STATPLAN_H
+#define OSTAP_STATPLAN_H 1
+// ============================================================================
+// Include files
+// ============================================================================
+// STD&STL
+// ============================================================================
+#include <string>
+#include <vector>
+// ============================================================================
+// Forward declarations
+// ============================================================================
+namespace Ostap { namespace Math { class  Statistic ; } }
+namespace Ostap { namespace Math { class WStatistic ; } }
+// ============================================================================
+namespace Ostap
+{
+  // ==========================================================================
+  /** @class StatPlan Ostap/StatPlan.h
+   *  "Statistics plan": the list of (counter, expression, selection) requests
+   *  to be filled in one event loop
+   *  - for Ostap::Math::Statistic   counters the selection is treated as boolean
+   *  - for Ostap::Math::WStatistic  counters the selection is treated as weight
+   *  @attention the plan does not own the counters!
+   *  @see Ostap::StatVar::get_stats
+   *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+   *  @date 2026-10-17
+   */
+  class StatPlan
+  {
+  public:
+    // ========================================================================
+    /// single request
+    struct Item
+    {
+      /// unweighted counter
+      Ostap::Math::Statistic*  stat       { nullptr } ;
+      /// weighted counter
+      Ostap::Math::WStatistic* wstat      { nullptr } ;
+      /// expression to be used
+      std::string              expression {         } ;
+      /// selection/cut (empty: no cut)
+      std::string              selection  {         } ;
+    } ;
+    // ========================================================================
+    typedef std::vector<Item>     Items    ;
+    typedef Items::const_iterator iterator ;
+    // ========================================================================
+  public:
+    // ========================================================================
+    /// default (empty) plan
+    StatPlan () = default ;
+    // ========================================================================
+  public:
+    // ========================================================================
+    /** add unweighted counter to the plan
+     *  @param stat       (UPDATE) the counter
+     *  @param expression (INPUT)  the expression
+     *  @param selection  (INPUT)  selection/cut (treated as boolean!)
+     *  @return the index of the request
+     */
+    std::size_t add
+    ( Ostap::Math::Statistic&  stat             ,
+      const std::string&       expression       ,
+      const std::string&       selection  = ""  ) ;
+    // ========================================================================
+    /** add weighted counter to the plan
+     *  @param stat       (UPDATE) the counter
+     *  @param expression (INPUT)  the expression
+     *  @param selection  (INPUT)  selection/cut (treated as weight!)
+     *  @return the index of the request
+     */
+    std::size_t add
+    ( Ostap::Math::WStatistic& stat             ,
+      const std::string&       expression       ,
+      const std::string&       selection  = ""  ) ;
+    // ========================================================================
+  public:
+    // ========================================================================
+    /// reset all counters
+    void reset () ;
+    /// remove all requests
+    void clear () { m_items.clear () ; }
+    // ========================================================================
+  public:
+    // ========================================================================
+    /// number of requests
+    inline std::size_t  size  () const { return m_items.size  () ; }
+    /// empty plan ?
+    inline bool         empty () const { return m_items.empty () ; }
+    /// all requests
+    inline const Items& items () const { return m_items ; }
+    /// begin-iterator
+    inline iterator     begin () const { return m_items.begin () ; }
+    /// end-iterator
+    inline iterator     end   () const { return m_items.end   () ; }
+    // ========================================================================
+  private:
+    // ========================================================================
+    /// list of requests
+    Items m_items {} ;
+    // ========================================================================
+  } ;
+  // ==========================================================================
+} //                                                 The end of namespace Ostap
+// ============================================================================
+#endif // OSTAP_STATPLAN_H
+// ============================================================================
+//                                                                      The END
+// ============================================================================
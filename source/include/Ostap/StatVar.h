@@ -22,6 +22,7 @@ class RooAbsData ; // RooFit
 #include "Ostap/WStatEntity.h"
 #include "Ostap/StatusCode.h"
 #include "Ostap/ProgressConf.h"
+#include "Ostap/StatPlan.h"
 // ============================================================================
 // forward declarations 
 // ============================================================================
@@ -602,6 +603,46 @@ namespace Ostap
       const Ostap::DataType     tmin       = Ostap::MinValue   ,
       const Ostap::DataType     tmax       = Ostap::MaxValue   ) const ;
     // ========================================================================
+  public:  // statistics plan: many counters in one go 
+    // ========================================================================
+    /** Fill/update all counters from the statistics plan in one event loop 
+     *  @param data       (input)  data 
+     *  @param plan       (UPDATE) the plan: list of (counter, expression, selection) 
+     *  @param selection  (INPUT)  common selection/cut (applied to all requests)
+     *  @param first      (INPUT)  the first event to process (inclusive) 
+     *  @param last       (INPUT)  the last event to process (exclusive) 
+     *  @return status code 
+     *  @see Ostap::StatPlan
+     *  @attention for Ostap::Math::Statistic  counters selections are treated as boolean!
+     *  @attention for Ostap::Math::WStatistic counters selections are treated as weights!
+     */
+    Ostap::StatusCode get_stats
+    ( TTree*                    data                           ,
+      Ostap::StatPlan&          plan                           ,
+      const std::string&        selection  = ""                ,
+      const Ostap::EventIndex   first      = Ostap::FirstEvent ,
+      const Ostap::EventIndex   last       = Ostap::LastEvent  ) const ;
+    // ========================================================================
+    /** Fill/update all counters from the statistics plan in one event loop 
+     *  @param data       (input)  data 
+     *  @param plan       (UPDATE) the plan: list of (counter, expression, selection) 
+     *  @param selection  (INPUT)  common selection/cut (applied to all requests)
+     *  @param cut_range  (INPUT)  if non empty: use events only from this range 
+     *  @param first      (INPUT)  the first event to process (inclusive) 
+     *  @param last       (INPUT)  the last event to process (exclusive) 
+     *  @return status code 
+     *  @see Ostap::StatPlan
+     *  @attention for Ostap::Math::Statistic  counters selections and weights are treated as boolean!
+     *  @attention for Ostap::Math::WStatistic counters selections are treated as weights!
+     */
+    Ostap::StatusCode get_stats
+    ( const RooAbsData*         data                           ,
+      Ostap::StatPlan&          plan                           ,
+      const std::string&        selection  = ""                ,
+      const std::string&        cut_range  = ""                ,
+      const Ostap::EventIndex   first      = Ostap::FirstEvent ,
+      const Ostap::EventIndex   last       = Ostap::LastEvent  ) const ;
+    // ========================================================================
   public: /// statistc for single variable
     // =========================================================================
     /** Is there at leats one good entry in dataset ?
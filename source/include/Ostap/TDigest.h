@@ -0,0 +1,187 @@
+// ============================================================================
+#ifndef OSTAP_TDIGEST_H
+#define OSTAP_TDIGEST_H 1
+// ============================================================================
+// STD&STL
+// ============================================================================
+#include <vector>
+#include <utility>
+#include <iterator>
+#include <type_traits>
+// ============================================================================
+// Ostap
+// =============================================================================
+#include "Ostap/Statistic.h"
+#include "Ostap/StatEntity.h"
+// =============================================================================
+namespace Ostap
+{
+  // ==========================================================================
+  namespace  Math
+  {
+    // ========================================================================
+    /** @class TDigest
+     *  Mergeable sketch for (approximate) quantile estimation:
+     *  the merging t-digest with \f$ k_1\f$ scale function
+     *  - unlike P2-estimators, two digests can be merged:
+     *    it allows to use it for parallel and multithreaded processing
+     *  - any quantile can be obtained from the same digest
+     *  - accuracy is the best for the tails
+     *
+     *  @see T.Dunning and O.Ertl,
+     *       "Computing Extremely Accurate Quantiles Using t-Digests",
+     *       arXiv:1902.04023
+     *  @see https://arxiv.org/abs/1902.04023
+     *  @see Ostap::Math::Quantile
+     *  @see Ostap::Math::Quantiles
+     *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+     *  @date 2026-10-17
+     */
+    class TDigest : public Ostap::Math::Statistic
+    {
+    public :
+      // =======================================================================
+      /// the type of helper counter
+      typedef typename Ostap::StatEntity  Counter   ;
+      /// #of entries
+      typedef typename Counter::size_type size_type ;
+      /// centroid: ( mean , weight )
+      typedef std::pair<double,double>    Centroid  ;
+      // =======================================================================
+    public :
+      // =======================================================================
+      /** constructor from the compression parameter
+       *  @param compression (INPUT) compression parameter \f$ \delta \f$:
+       *         the number of centroids is \f$ \mathcal{O}(\delta)\f$
+       */
+      TDigest ( const double compression = 100 ) ;
+      // ======================================================================
+      /** full constructor (e.g. for deserialization)
+       *  @param compression (INPUT) compression parameter
+       *  @param means       (INPUT) means of centroids
+       *  @param weights     (INPUT) weights of centroids
+       *  @param counter     (INPUT) helper counter
+       */
+      TDigest
+      ( const double               compression ,
+        const std::vector<double>& means       ,
+        const std::vector<double>& weights     ,
+        const Counter&             counter     ) ;
+      // ======================================================================
+    public: // Ostap::Math::Statistic
+      // =====================================================================
+      // Generic counter interface
+      void update ( const double value ) override { add  ( value ) ; }
+      // reset the digest
+      void reset  ()                     override ;
+      // ======================================================================
+    public :
+      // ======================================================================
+      /// add one more value (with weight)
+      TDigest& add ( const double value , const double weight = 1 ) ;
+      /// merge two digests
+      TDigest& add ( const TDigest& right ) ;
+      /// add a range of values
+      template <class ITERATOR,
+                typename value_type = typename std::iterator_traits<ITERATOR>::value_type,
+                typename std::enable_if<std::is_convertible<value_type,double>::value,bool>::type = true >
+      TDigest& add
+      ( ITERATOR first ,
+        ITERATOR last  )
+      { for ( ; first != last ; ++first ) { add ( *first ) ; } ; return *this ; }
+      // ======================================================================
+    public :
+      // ======================================================================
+      inline TDigest& operator+= ( const double   value ) { return add ( value ) ; }
+      inline TDigest& operator+= ( const TDigest& right ) { return add ( right ) ; }
+      // ======================================================================
+    public:
+      // ======================================================================
+      /// sample size
+      inline size_type N           () const { return m_counter.n () ; }
+      /// sample size
+      inline size_type size        () const { return N () ; }
+      /// valid counter?
+      inline bool      valid       () const { return 0 < N () ; }
+      /// valid counter?
+      inline bool      ok          () const { return 0 < N () ; }
+      /// compression parameter
+      inline double    compression () const { return m_compression ; }
+      /// total weight
+      double           weight      () const ;
+      // ======================================================================
+    public:
+      // ======================================================================
+      /// minimal value ( == quantile for  p = 0 )
+      inline double min () const { return m_counter.min () ; }
+      /// maximal value ( == quantile for  p = 1 )
+      inline double max () const { return m_counter.max () ; }
+      // ======================================================================
+    public:
+      // ======================================================================
+      /// get the quantile value for probability p
+      double quantile ( const double p = 0.5 ) const ;
+      /// get the quantile value for probability p
+      inline double operator() ( const double p ) const { return quantile ( p ) ; }
+      /** get quantiles for (sorted) probabilities
+       *  - { min , q(p1) , q(p2) , ... , q(pn) , max }
+       */
+      std::vector<double> quantiles ( const std::vector<double>& ps ) const ;
+      /** get N equidistant quantiles (same convention as Ostap::Math::Quantiles)
+       *  - { min , q(1/(N+1)) , q(2/(N+1)) , ... , q(N/(N+1)) , max }
+       */
+      std::vector<double> quantiles ( const unsigned short N ) const ;
+      /// get the (approximate) cumulative distribution function
+      double cdf ( const double x ) const ;
+      // ======================================================================
+    public:
+      // ======================================================================
+      /// number of centroids (compressed)
+      std::size_t         ncentroids () const ;
+      /// means of centroids (compressed)
+      std::vector<double> means      () const ;
+      /// weights of centroids (compressed)
+      std::vector<double> weights    () const ;
+      /// helper counter
+      inline const Counter& counter  () const { return m_counter ; }
+      // ======================================================================
+    public:
+      // ======================================================================
+      /// swap two objects
+      void swap ( TDigest& right ) ;
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// merge buffered points into centroids
+      void compress () const ;
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// compression parameter
+      double                        m_compression { 100 } ;
+      /// size of the buffer
+      std::size_t                   m_capacity    { 500 } ;
+      /// compressed centroids
+      mutable std::vector<Centroid> m_centroids   {     } ;
+      /// buffer for not-yet compressed points
+      mutable std::vector<Centroid> m_buffer      {     } ;
+      /// helper counter
+      Counter                       m_counter     {     } ;
+      // ======================================================================
+    } ;
+    // ========================================================================
+    // swap two objects
+    inline void swap ( TDigest& a , TDigest& b ) { a.swap ( b ) ; }
+    // ========================================================================
+    /// merge two digests
+    inline TDigest operator+ ( const TDigest& a , const TDigest& b )
+    { TDigest c { a } ; c += b ; return c ; }
+    // ========================================================================
+  } //                                         The end of namespace Ostap::Math
+  // ==========================================================================
+} //                                                 The end of namespace Ostap
+// ============================================================================
+#endif // OSTAP_TDIGEST_H
+// ============================================================================
+//                                                                      The END
+// ============================================================================
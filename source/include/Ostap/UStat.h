@@ -25,6 +25,9 @@ namespace Ostap
 {
   // ==========================================================================
   /** @class UStat Ostap/UStat.h
+   *  U-statistics for the Distance-to-Nearest-Neighbour GoF-test
+   *  - the nearest neighbours are found using k-d tree
+   *  @see Ostap::Math::KDTree 
    *  @author Vanya Belyaev
    *  @date   2011-09-27
    */
@@ -54,14 +57,18 @@ namespace Ostap
      *  @param hist  (update) the histogram with U-statistics 
      *  @param tStat (update) value for T-statistics 
      *  @param args  (input)  the arguments
+     *  @param algo  (input)  the uniformity criterion 
+     *  @param nthreads (input) number of threads for the nearest neighbour search
+     *                  (0: use all available hardware threads) 
      */
     static Ostap::StatusCode calculate
-    ( const RooAbsPdf&  pdf               , 
-      const RooDataSet& data              ,  
-      double&           tStat             ,
-      TH1*              hist  = nullptr   ,
-      const RooArgSet*  args  = nullptr   ,
-      const Uniformity  algo  = Uniformity::Greenwood ) ;
+    ( const RooAbsPdf&     pdf                 , 
+      const RooDataSet&    data                ,  
+      double&              tStat               ,
+      TH1*                 hist     = nullptr  ,
+      const RooArgSet*     args     = nullptr  ,
+      const Uniformity     algo     = Uniformity::Greenwood , 
+      const unsigned short nthreads = 1        ) ;
     // ========================================================================
     /** calculate U-statistics 
      *  @param pdf   (input) PDF
@@ -69,15 +76,19 @@ namespace Ostap
      *  @param hist  (update) the histogram with U-statistics 
      *  @param tStat (update) value for T-statistics 
      *  @param args  (input)  the arguments
+     *  @param algo  (input)  the uniformity criterion 
+     *  @param nthreads (input) number of threads for the nearest neighbour search
+     *                  (0: use all available hardware threads) 
      */
     static Ostap::StatusCode calculate
     ( const Ostap::Utils::ProgressConf& conf  , 
-      const RooAbsPdf&  pdf               , 
-      const RooDataSet& data              ,  
-      double&           tStat             ,
-      TH1*              hist  = nullptr   ,
-      const RooArgSet*  args  = nullptr   , 
-      const Uniformity  algo  = Uniformity::Greenwood ) ;
+      const RooAbsPdf&     pdf                 , 
+      const RooDataSet&    data                ,  
+      double&              tStat               ,
+      TH1*                 hist     = nullptr  ,
+      const RooArgSet*     args     = nullptr  , 
+      const Uniformity     algo     = Uniformity::Greenwood , 
+      const unsigned short nthreads = 1        ) ;
     // ========================================================================
   };
   // ==========================================================================
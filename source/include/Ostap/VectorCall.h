@@ -0,0 +1,114 @@
+// ============================================================================
+#ifndef OSTAP_VECTORCALL_H
+#define OSTAP_VECTORCALL_H 1
+// ============================================================================
+// Include files
+// ============================================================================
+// STD&STL
+// ============================================================================
+#include <cstddef>
+// ============================================================================
+/** @file Ostap/VectorCall.h
+ *  Helper functions for "vectorised" evaluation of (any) functions
+ *  on the contiguous buffers: the loop is performed in C++,
+ *  and only one python call is needed for the whole array
+ *  - the step for each argument is either 1 (array) or 0 (scalar)
+ *  @see ostap.math.math_base.vct1_call
+ *  @see ostap.math.math_base.vct2_call
+ *  @see ostap.math.math_base.vct3_call
+ *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+ *  @date 2026-10-17
+ */
+// ============================================================================
+namespace Ostap
+{
+  // ==========================================================================
+  namespace Math
+  {
+    // ========================================================================
+    /** evaluate the function of one variable for the buffer
+     *  \f$ r_i = f ( x_i ) \f$
+     *  @param fun    (INPUT)  the function
+     *  @param x      (INPUT)  the buffer of x-values
+     *  @param result (OUTPUT) the output buffer
+     *  @param n      (INPUT)  the size of buffers
+     *  @return number of evaluated points
+     */
+    template <class FUNCTION>
+    inline std::size_t
+    vct_call1
+    ( const FUNCTION&   fun    ,
+      const double*     x      ,
+      double*           result ,
+      const std::size_t n      )
+    {
+      for ( std::size_t i = 0 ; i < n ; ++i ) { result [ i ] = fun ( x [ i ] ) ; }
+      return n ;
+    }
+    // ========================================================================
+    /** evaluate the function of two variables for the buffers
+     *  \f$ r_i = f ( x_{i s_x} , y_{i s_y} ) \f$
+     *  @param fun    (INPUT)  the function
+     *  @param x      (INPUT)  the buffer of x-values
+     *  @param sx     (INPUT)  the step for x-buffer ( 0 or 1 )
+     *  @param y      (INPUT)  the buffer of y-values
+     *  @param sy     (INPUT)  the step for y-buffer ( 0 or 1 )
+     *  @param result (OUTPUT) the output buffer
+     *  @param n      (INPUT)  the size of the output buffer
+     *  @return number of evaluated points
+     */
+    template <class FUNCTION>
+    inline std::size_t
+    vct_call2
+    ( const FUNCTION&   fun    ,
+      const double*     x      ,
+      const std::size_t sx     ,
+      const double*     y      ,
+      const std::size_t sy     ,
+      double*           result ,
+      const std::size_t n      )
+    {
+      for ( std::size_t i = 0 ; i < n ; ++i )
+        { result [ i ] = fun ( x [ i * sx ] , y [ i * sy ] ) ; }
+      return n ;
+    }
+    // ========================================================================
+    /** evaluate the function of three variables for the buffers
+     *  \f$ r_i = f ( x_{i s_x} , y_{i s_y} , z_{i s_z} ) \f$
+     *  @param fun    (INPUT)  the function
+     *  @param x      (INPUT)  the buffer of x-values
+     *  @param sx     (INPUT)  the step for x-buffer ( 0 or 1 )
+     *  @param y      (INPUT)  the buffer of y-values
+     *  @param sy     (INPUT)  the step for y-buffer ( 0 or 1 )
+     *  @param z      (INPUT)  the buffer of z-values
+     *  @param sz     (INPUT)  the step for z-buffer ( 0 or 1 )
+     *  @param result (OUTPUT) the output buffer
+     *  @param n      (INPUT)  the size of the output buffer
+     *  @return number of evaluated points
+     */
+    template <class FUNCTION>
+    inline std::size_t
+    vct_call3
+    ( const FUNCTION&   fun    ,
+      const double*     x      ,
+      const std::size_t sx     ,
+      const double*     y      ,
+      const std::size_t sy     ,
+      const double*     z      ,
+      const std::size_t sz     ,
+      double*           result ,
+      const std::size_t n      )
+    {
+      for ( std::size_t i = 0 ; i < n ; ++i )
+        { result [ i ] = fun ( x [ i * sx ] , y [ i * sy ] , z [ i * sz ] ) ; }
+      return n ;
+    }
+    // ========================================================================
+  } //                                         The end of namespace Ostap::Math
+  // ==========================================================================
+} //                                                 The end of namespace Ostap
+// ============================================================================
+#endif // OSTAP_VECTORCALL_H
+// ============================================================================
+//                                                                      The END
+// ============================================================================
@@ -0,0 +1,186 @@
+// ============================================================================
+// Include files
+// ============================================================================
+// STD&STL
+// ============================================================================
+#include <cmath>
+#include <memory>
+#include <algorithm>
+// ============================================================================
+// ROOT/RooFit
+// ============================================================================
+#include "TTree.h"
+#include "RooAbsData.h"
+#include "RooArgSet.h"
+// ============================================================================
+// Ostap
+// ============================================================================
+#include "Ostap/StatusCode.h"
+#include "Ostap/Formula.h"
+#include "Ostap/FormulaVar.h"
+#include "Ostap/Notifier.h"
+#include "Ostap/Batches.h"
+// ============================================================================
+// local
+// ============================================================================
+#include "Formulae.h"
+#include "status_codes.h"
+// ============================================================================
+/** @file
+ *  Implementation of helper functions for batched (columnar) iteration
+ *  @see Ostap/Batches.h
+ *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+ *  @date 2026-10-17
+ */
+// ============================================================================
+/*  fill the batch of rows from the tree:
+ *  @param data        (INPUT)  input tree/chain
+ *  @param expressions (INPUT)  list of expressions
+ *  @param selection   (INPUT)  selection/cut (treated as weight!)
+ *  @param values      (OUTPUT) row-major buffer ( capacity x #expressions )
+ *  @param weights     (OUTPUT) buffer of weights ( capacity )
+ *  @param capacity    (INPUT)  maximal number of rows
+ *  @param first       (INPUT)  the first entry to process (inclusive)
+ *  @param last        (INPUT)  the last entry to process (exclusive)
+ *  @return pair ( number of filled rows , next entry to process )
+ */
+// ============================================================================
+std::pair<std::size_t,Ostap::EventIndex>
+Ostap::Utils::fill_batch
+( TTree*                          data        ,
+  const std::vector<std::string>& expressions ,
+  const std::string&              selection   ,
+  double*                         values      ,
+  double*                         weights     ,
+  const std::size_t               capacity    ,
+  const Ostap::EventIndex         first       ,
+  const Ostap::EventIndex         last        )
+{
+  Ostap::Assert ( nullptr != data                     ,
+                  "Invalid TTree!"                    ,
+                  "Ostap::Utils::fill_batch"          ,
+                  INVALID_TREE , __FILE__ , __LINE__  ) ;
+  Ostap::Assert ( 0 == capacity || ( nullptr != values && nullptr != weights ) ,
+                  "Invalid buffers!"                  ,
+                  "Ostap::Utils::fill_batch"          ,
+                  INVALID_DATA , __FILE__ , __LINE__  ) ;
+  //
+  const Ostap::EventIndex num_entries = data -> GetEntries () ;
+  const Ostap::EventIndex the_last    = std::min ( last , num_entries ) ;
+  if ( the_last <= first || 0 == capacity ) { return std::make_pair ( 0 , the_last ) ; }
+  //
+  const Ostap::Formulae formulae ( data , expressions ) ;
+  const std::size_t     nvars = formulae.size () ;
+  //
+  const std::unique_ptr<Ostap::Formula> cuts { Ostap::makeFormula ( selection , data , true ) } ;
+  const bool            with_cuts = cuts && cuts->ok () ;
+  //
+  Ostap::Utils::Notifier notify ( formulae.begin() , formulae.end() , cuts.get() , data ) ;
+  //
+  std::size_t       nrows = 0     ;
+  Ostap::EventIndex entry = first ;
+  for ( ; entry < the_last && nrows < capacity ; ++entry )
+    {
+      //
+      const long ievent = data -> GetEntryNumber ( entry ) ;
+      Ostap::Assert ( 0 <= ievent                         ,
+                      "Invalid entry!"                    ,
+                      "Ostap::Utils::fill_batch"          ,
+                      INVALID_ENTRY , __FILE__ , __LINE__ ) ;
+      Ostap::Assert ( 0 <= data -> LoadTree ( ievent )    ,
+                      "Invalid event!"                    ,
+                      "Ostap::Utils::fill_batch"          ,
+                      INVALID_EVENT , __FILE__ , __LINE__ ) ;
+      //
+      const double weight = with_cuts ? cuts -> evaluate () : 1.0 ;
+      if ( !weight || !std::isfinite ( weight ) ) { continue ; } // CONTINUE
+      //
+      double* row = values + nrows * nvars ;
+      std::size_t index = 0 ;
+      for ( const auto& formula : formulae ) { row [ index++ ] = formula -> evaluate () ; }
+      //
+      weights [ nrows ] = weight ;
+      ++nrows ;
+    }
+  //
+  return std::make_pair ( nrows , entry ) ;
+}
+// ============================================================================
+/*  fill the batch of rows from the dataset:
+ *  @param data        (INPUT)  input dataset
+ *  @param expressions (INPUT)  list of expressions
+ *  @param selection   (INPUT)  selection/cut (treated as weight!)
+ *  @param cut_range   (INPUT)  if non empty: use events only from this cut-range
+ *  @param values      (OUTPUT) row-major buffer ( capacity x #expressions )
+ *  @param weights     (OUTPUT) buffer of weights ( capacity )
+ *  @param capacity    (INPUT)  maximal number of rows
+ *  @param first       (INPUT)  the first entry to process (inclusive)
+ *  @param last        (INPUT)  the last entry to process (exclusive)
+ *  @return pair ( number of filled rows , next entry to process )
+ */
+// ============================================================================
+std::pair<std::size_t,Ostap::EventIndex>
+Ostap::Utils::fill_batch
+( const RooAbsData*               data        ,
+  const std::vector<std::string>& expressions ,
+  const std::string&              selection   ,
+  const std::string&              cut_range   ,
+  double*                         values      ,
+  double*                         weights     ,
+  const std::size_t               capacity    ,
+  const Ostap::EventIndex         first       ,
+  const Ostap::EventIndex         last        )
+{
+  Ostap::Assert ( nullptr != data                     ,
+                  "Invalid RooAbsData!"               ,
+                  "Ostap::Utils::fill_batch"          ,
+                  INVALID_DATA , __FILE__ , __LINE__  ) ;
+  Ostap::Assert ( 0 == capacity || ( nullptr != values && nullptr != weights ) ,
+                  "Invalid buffers!"                  ,
+                  "Ostap::Utils::fill_batch"          ,
+                  INVALID_DATA , __FILE__ , __LINE__  ) ;
+  //
+  const Ostap::EventIndex num_entries = data -> numEntries () ;
+  const Ostap::EventIndex the_last    = std::min ( last , num_entries ) ;
+  if ( the_last <= first || 0 == capacity ) { return std::make_pair ( 0 , the_last ) ; }
+  //
+  const Ostap::FormulaVars formulae ( data , expressions ) ;
+  const std::size_t        nvars = formulae.size () ;
+  //
+  const std::unique_ptr<Ostap::FormulaVar> cuts { Ostap::makeFormula ( selection , data , true ) } ;
+  const bool               with_cuts = cuts && cuts->ok () ;
+  //
+  const bool  weighted = data -> isWeighted () ;
+  const char* cutrange = cut_range.empty() ? nullptr : cut_range.c_str() ;
+  //
+  std::size_t       nrows = 0     ;
+  Ostap::EventIndex entry = first ;
+  for ( ; entry < the_last && nrows < capacity ; ++entry )
+    {
+      const RooArgSet* vars = data -> get ( entry ) ;
+      if ( nullptr == vars ) { entry = the_last ; break ; }            // BREAK
+      //
+      if ( cutrange && !vars->allInRange ( cutrange ) )  { continue ; } // CONTINUE
+      // data weight:
+      const double wd = weighted  ? data -> weight () : 1.0 ;
+      if ( !wd ) { continue ; }                                         // CONTINUE
+      // cuts:
+      const double wc = with_cuts ? cuts -> getVal () : 1.0 ;
+      if ( !wc ) { continue ; }                                         // CONTINUE
+      // Total: cuts & weight:
+      const double weight = wd * wc ;
+      if ( !weight || !std::isfinite ( weight ) ) { continue ; }        // CONTINUE
+      //
+      double* row = values + nrows * nvars ;
+      for ( std::size_t index = 0 ; index < nvars ; ++index )
+        { row [ index ] = formulae.evaluate ( index ) ; }
+      //
+      weights [ nrows ] = weight ;
+      ++nrows ;
+    }
+  //
+  return std::make_pair ( nrows , entry ) ;
+}
+// ============================================================================
+//                                                                      The END
+// ============================================================================
@@ -0,0 +1,218 @@
+// ============================================================================
+// Include files
+// ============================================================================
+// STD&STL
+// ============================================================================
+#include <algorithm>
+// ============================================================================
+// ROOT&RooFit
+// ============================================================================
+#include "TTree.h"
+#include "TH1.h"
+#include "TH2.h"
+#include "TH3.h"
+#include "RooAbsData.h"
+// ============================================================================
+// Ostap
+// ============================================================================
+#include "Ostap/HistoWeight.h"
+#include "Ostap/StatusCode.h"
+// ============================================================================
+// local
+// ============================================================================
+#include "status_codes.h"
+// ============================================================================
+/** @file
+ *  Implementation file for class Ostap::Functions::HistoWeight
+ *  @see Ostap::Functions::HistoWeight
+ *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+ *  @date 2026-10-17
+ */
+// ============================================================================
+// destructor
+// ============================================================================
+Ostap::Functions::HistoWeight::~HistoWeight(){}
+// ============================================================================
+// clone
+// ============================================================================
+Ostap::Functions::HistoWeight*
+Ostap::Functions::HistoWeight::clone ( const char* /* newname */ ) const
+{ return new Ostap::Functions::HistoWeight ( *this ) ; }
+// ============================================================================
+/*  add new factor
+ *  @param vars (INPUT) the expressions for the factor ( 1, 2 or 3 )
+ *  @return the index of the factor
+ */
+// ============================================================================
+std::size_t Ostap::Functions::HistoWeight::add_factor
+( const std::vector<std::string>& vars )
+{
+  Ostap::Assert ( 1 <= vars.size () && vars.size () <= 3   ,
+                  "Invalid number of variables!"            ,
+                  "Ostap::Functions::HistoWeight"           ,
+                  INVALID_PARAMETER , __FILE__ , __LINE__   ) ;
+  //
+  Factor factor {} ;
+  factor.first = m_vars.size () ;
+  factor.dim   = vars.size () ;
+  for ( const auto& v : vars ) { m_vars.emplace_back ( v ) ; }
+  m_factors.push_back ( factor ) ;
+  //
+  m_values.resize ( m_vars.size () , 0.0 ) ;
+  return m_factors.size () - 1 ;
+}
+// ============================================================================
+/*  add the histogram to the factor
+ *  - the histogram dimension must be equal to the number of expressions
+ *  @param factor (INPUT) the index of the factor
+ *  @param histo  (INPUT) the histogram
+ */
+// ============================================================================
+void Ostap::Functions::HistoWeight::add_histo
+( const std::size_t factor ,
+  const TH1&        histo  )
+{
+  Ostap::Assert ( factor < m_factors.size ()              ,
+                  "Invalid factor index!"                 ,
+                  "Ostap::Functions::HistoWeight"         ,
+                  INVALID_PARAMETER , __FILE__ , __LINE__ ) ;
+  //
+  Factor& f = m_factors [ factor ] ;
+  Ostap::Assert ( histo.GetDimension () == f.dim          ,
+                  "Mismatch in histogram dimension!"      ,
+                  "Ostap::Functions::HistoWeight"         ,
+                  INVALID_PARAMETER , __FILE__ , __LINE__ ) ;
+  //
+  switch ( f.dim )
+    {
+    case 1  : f.h1.emplace_back (                     histo   ) ; break ;
+    case 2  : f.h2.emplace_back ( dynamic_cast<const TH2&> ( histo ) ) ; break ;
+    default : f.h3.emplace_back ( dynamic_cast<const TH3&> ( histo ) ) ; break ;
+    }
+}
+// ============================================================================
+// number of histograms in the factor
+// ============================================================================
+std::size_t Ostap::Functions::HistoWeight::nHistos
+( const std::size_t factor ) const
+{
+  if ( m_factors.size () <= factor ) { return 0 ; }
+  const Factor& f = m_factors [ factor ] ;
+  return f.h1.size () + f.h2.size () + f.h3.size () ;
+}
+// ============================================================================
+// evaluate the weight from the values of variables
+// - the order of multiplications is the same as for the python version:
+//   w = ( 1 * h_11 * h_12 * ... ) * ( 1 * h_21 * h_22 * ... ) * ...
+// ============================================================================
+double Ostap::Functions::HistoWeight::weight
+( const std::vector<double>& values ) const
+{
+  double result = 1.0 ;
+  for ( const Factor& f : m_factors )
+    {
+      const double* x = values.data () + f.first ;
+      double ww = 1.0 ;
+      for ( const auto& h : f.h1 ) { ww *= h ( x [ 0 ] )                 ; }
+      for ( const auto& h : f.h2 ) { ww *= h ( x [ 0 ] , x [ 1 ] )         ; }
+      for ( const auto& h : f.h3 ) { ww *= h ( x [ 0 ] , x [ 1 ] , x [ 2 ] ) ; }
+      result *= ww ;
+    }
+  return result ;
+}
+// ============================================================================
+// evaluate the weight for the current entry of TTree
+// ============================================================================
+double Ostap::Functions::HistoWeight::operator()
+  ( const TTree* tree ) const
+{
+  const std::size_t N = m_vars.size () ;
+  for ( std::size_t i = 0 ; i < N ; ++i ) { m_values [ i ] = m_vars [ i ] ( tree ) ; }
+  return weight ( m_values ) ;
+}
+// ============================================================================
+// evaluate the weight for the current entry of RooAbsData
+// ============================================================================
+double Ostap::Functions::HistoWeight::operator()
+  ( const RooAbsData* data ) const
+{
+  const std::size_t N = m_vars.size () ;
+  for ( std::size_t i = 0 ; i < N ; ++i ) { m_values [ i ] = m_vars [ i ] ( data ) ; }
+  return weight ( m_values ) ;
+}
+// ============================================================================
+/*  evaluate the weights for the range of entries in TTree
+ *  @param tree  (INPUT) the tree
+ *  @param first (INPUT) the first entry
+ *  @param last  (INPUT) the last entry (not inclusive)
+ *  @return vector of weights
+ */
+// ============================================================================
+std::vector<double>
+Ostap::Functions::HistoWeight::weights
+( const TTree*            tree  ,
+  const unsigned long     first ,
+  const unsigned long     last  ) const
+{
+  Ostap::Assert ( nullptr != tree                         ,
+                  "Invalid TTree!"                        ,
+                  "Ostap::Functions::HistoWeight"         ,
+                  INVALID_TREE , __FILE__ , __LINE__      ) ;
+  //
+  TTree* t = const_cast<TTree*> ( tree ) ;
+  const unsigned long nEntries = t->GetEntries () ;
+  const unsigned long the_last = std::min ( last , nEntries ) ;
+  //
+  std::vector<double> result {} ;
+  if ( the_last <= first ) { return result ; }                      // RETURN
+  result.reserve ( the_last - first ) ;
+  //
+  for ( unsigned long entry = first ; entry < the_last ; ++entry )
+    {
+      // for TChain: switch to the current tree
+      const Long64_t local = t->LoadTree ( entry ) ;
+      if ( local < 0 ) { break ; }
+      TTree* current = t->GetTree () ;
+      if ( current->GetEntry ( local ) < 0 ) { break ; }
+      result.push_back ( (*this) ( current ) ) ;
+    }
+  //
+  return result ;
+}
+// ============================================================================
+/*  evaluate the weights for the range of entries in RooAbsData
+ *  @param data  (INPUT) the dataset
+ *  @param first (INPUT) the first entry
+ *  @param last  (INPUT) the last entry (not inclusive)
+ *  @return vector of weights
+ */
+// ============================================================================
+std::vector<double>
+Ostap::Functions::HistoWeight::weights
+( const RooAbsData*       data  ,
+  const unsigned long     first ,
+  const unsigned long     last  ) const
+{
+  Ostap::Assert ( nullptr != data                         ,
+                  "Invalid RooAbsData!"                   ,
+                  "Ostap::Functions::HistoWeight"         ,
+                  INVALID_DATA , __FILE__ , __LINE__      ) ;
+  //
+  const unsigned long nEntries = data->numEntries () ;
+  const unsigned long the_last = std::min ( last , nEntries ) ;
+  //
+  std::vector<double> result {} ;
+  if ( the_last <= first ) { return result ; }                      // RETURN
+  result.reserve ( the_last - first ) ;
+  //
+  for ( unsigned long entry = first ; entry < the_last ; ++entry )
+    {
+      if ( nullptr == data->get ( entry ) ) { break ; }
+      result.push_back ( (*this) ( data ) ) ;
+    }
+  //
+  return result ;
+}
+// ============================================================================
+//                                                                      The END
+// ============================================================================
@@ -0,0 +1,222 @@
+// ============================================================================
+// Include files
+// ============================================================================
+// STD&STL
+// ============================================================================
+#include <cmath>
+#include <numeric>
+#include <algorithm>
+#include <thread>
+// ============================================================================
+// Ostap
+// ============================================================================
+#include "Ostap/KDTree.h"
+#include "Ostap/StatusCode.h"
+// ============================================================================
+// local
+// ============================================================================
+#include "status_codes.h"
+// ============================================================================
+/** @file
+ *  Implementation file for class Ostap::Math::KDTree
+ *  @see Ostap::Math::KDTree
+ *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+ *  @date 2026-10-17
+ */
+// ============================================================================
+namespace
+{
+  // ==========================================================================
+  /// maximal number of points in the leaf (brute-force search)
+  const std::size_t s_LEAF = 8 ;
+  // ==========================================================================
+}
+// ============================================================================
+// constructor from the dimension and the flat (row-major) array of points
+// ============================================================================
+Ostap::Math::KDTree::KDTree
+( const unsigned short       dim    ,
+  const std::vector<double>& points )
+  : KDTree ( dim , std::vector<double> ( points ) )
+{}
+// ============================================================================
+// constructor from the dimension and the flat (row-major) array of points
+// ============================================================================
+Ostap::Math::KDTree::KDTree
+( const unsigned short       dim    ,
+  std::vector<double>&&      points )
+  : m_dim    ( dim                 )
+  , m_points ( std::move ( points ) )
+{
+  Ostap::Assert ( 1 <= m_dim                            ,
+                  "Invalid dimension!"                  ,
+                  "Ostap::Math::KDTree"                 ,
+                  INVALID_PARAMETER , __FILE__ , __LINE__ ) ;
+  Ostap::Assert ( 0 == m_points.size () % m_dim         ,
+                  "Invalid size of the array of points!" ,
+                  "Ostap::Math::KDTree"                 ,
+                  INVALID_SIZE      , __FILE__ , __LINE__ ) ;
+  //
+  const std::size_t N = m_points.size () / m_dim ;
+  m_index.resize ( N ) ;
+  std::iota      ( m_index.begin () , m_index.end () , 0 ) ;
+  m_split.resize ( N , 0 ) ;
+  //
+  build ( 0 , N ) ;
+}
+// ============================================================================
+// build the (sub)tree for the range of indices
+// ============================================================================
+void Ostap::Math::KDTree::build
+( const std::size_t first ,
+  const std::size_t last  )
+{
+  if ( last <= first + s_LEAF ) { return ; }                         // RETURN
+  //
+  // (1) find the dimension with the largest spread
+  unsigned short axis   = 0 ;
+  double         spread = -1 ;
+  for ( unsigned short d = 0 ; d < m_dim ; ++d )
+    {
+      double vmin =  std::numeric_limits<double>::max () ;
+      double vmax = -std::numeric_limits<double>::max () ;
+      for ( std::size_t i = first ; i < last ; ++i )
+        {
+          const double v = point ( m_index [ i ] ) [ d ] ;
+          vmin = std::min ( vmin , v ) ;
+          vmax = std::max ( vmax , v ) ;
+        }
+      if ( spread < vmax - vmin ) { spread = vmax - vmin ; axis = d ; }
+    }
+  //
+  // (2) median split
+  const std::size_t middle = first + ( last - first ) / 2 ;
+  std::nth_element ( m_index.begin () + first  ,
+                     m_index.begin () + middle ,
+                     m_index.begin () + last   ,
+                     [this,axis] ( const std::size_t a , const std::size_t b ) -> bool
+                     { return point ( a ) [ axis ] < point ( b ) [ axis ] ; } ) ;
+  m_split [ middle ] = axis ;
+  //
+  // (3) build subtrees
+  build ( first      , middle ) ;
+  build ( middle + 1 , last   ) ;
+}
+// ============================================================================
+// search in the (sub)tree
+// ============================================================================
+void Ostap::Math::KDTree::search
+( const std::size_t first   ,
+  const std::size_t last    ,
+  const double*     x       ,
+  const std::size_t exclude ,
+  std::size_t&      best    ,
+  double&           dist2   ) const
+{
+  if ( last <= first ) { return ; }                                  // RETURN
+  //
+  // leaf: brute force
+  if ( last <= first + s_LEAF )
+    {
+      for ( std::size_t i = first ; i < last ; ++i )
+        {
+          const std::size_t index = m_index [ i ] ;
+          if ( index == exclude ) { continue ; }
+          const double d2 = distance2 ( x , index ) ;
+          if ( d2 < dist2 ) { dist2 = d2 ; best = index ; }
+        }
+      return ;                                                       // RETURN
+    }
+  //
+  const std::size_t middle = first + ( last - first ) / 2 ;
+  const std::size_t index  = m_index [ middle ] ;
+  if ( index != exclude )
+    {
+      const double d2 = distance2 ( x , index ) ;
+      if ( d2 < dist2 ) { dist2 = d2 ; best = index ; }
+    }
+  //
+  const unsigned short axis  = m_split [ middle ] ;
+  const double         delta = x [ axis ] - point ( index ) [ axis ] ;
+  //
+  // the nearest side first
+  if ( delta < 0 )
+    {
+      search ( first , middle , x , exclude , best , dist2 ) ;
+      if ( delta * delta < dist2 ) { search ( middle + 1 , last , x , exclude , best , dist2 ) ; }
+    }
+  else
+    {
+      search ( middle + 1 , last , x , exclude , best , dist2 ) ;
+      if ( delta * delta < dist2 ) { search ( first , middle , x , exclude , best , dist2 ) ; }
+    }
+}
+// ============================================================================
+/*  find the nearest neighbour for the given point
+ *  @param x       (INPUT) the point (dim values)
+ *  @param exclude (INPUT) the index of point to be excluded from search
+ *  @return pair ( index , distance ), index is npos for empty tree
+ */
+// ============================================================================
+std::pair<std::size_t,double>
+Ostap::Math::KDTree::nearest
+( const double*     x       ,
+  const std::size_t exclude ) const
+{
+  std::size_t best  = npos ;
+  double      dist2 = std::numeric_limits<double>::max () ;
+  search ( 0 , m_index.size () , x , exclude , best , dist2 ) ;
+  return npos == best ?
+    std::make_pair ( best , std::numeric_limits<double>::max () ) :
+    std::make_pair ( best , std::sqrt ( dist2 ) ) ;
+}
+// ============================================================================
+/*  find the nearest neighbour for the given point
+ *  @param x       (INPUT) the point
+ *  @return pair ( index , distance ), index is npos for empty tree
+ */
+// ============================================================================
+std::pair<std::size_t,double>
+Ostap::Math::KDTree::nearest
+( const std::vector<double>& x ) const
+{
+  Ostap::Assert ( x.size () == m_dim                    ,
+                  "Invalid dimension of the point!"     ,
+                  "Ostap::Math::KDTree::nearest"        ,
+                  INVALID_SIZE      , __FILE__ , __LINE__ ) ;
+  return nearest ( x.data () ) ;
+}
+// ============================================================================
+/*  get distances to the nearest (other) neighbour for all points in the tree
+ *  @param nthreads (INPUT) number of threads for the query phase
+ *                  ( 0: use all available hardware threads )
+ *  @return vector of distances
+ */
+// ============================================================================
+std::vector<double>
+Ostap::Math::KDTree::nearest_distances
+( const unsigned short nthreads ) const
+{
+  const std::size_t N = size () ;
+  std::vector<double> result ( N , std::numeric_limits<double>::max () ) ;
+  //
+  auto query = [this,&result] ( const std::size_t first , const std::size_t last ) -> void
+  { for ( std::size_t i = first ; i < last ; ++i ) { result [ i ] = nearest ( point ( i ) , i ).second ; } } ;
+  //
+  std::size_t nt = nthreads ? nthreads : std::max ( 1u , std::thread::hardware_concurrency () ) ;
+  nt = std::min ( nt , std::max<std::size_t> ( 1 , N / 1000 ) ) ;
+  //
+  if ( nt <= 1 ) { query ( 0 , N ) ; return result ; }               // RETURN
+  //
+  std::vector<std::thread> workers {} ;
+  workers.reserve ( nt ) ;
+  const std::size_t chunk = ( N + nt - 1 ) / nt ;
+  for ( std::size_t first = 0 ; first < N ; first += chunk )
+    { workers.emplace_back ( query , first , std::min ( first + chunk , N ) ) ; }
+  for ( auto& w : workers ) { w.join () ; }
+  //
+  return result ;
+}
+// ============================================================================
+//                                                                      The END
+// ============================================================================
@@ -8,12 +8,17 @@
 // STD&STL
 // ============================================================================
 #include <cstring>
+#include <algorithm>
 // ============================================================================
 // ROOT 
 // ============================================================================
 #include "TPython.h"
 #include "RVersion.h"
 // ============================================================================
+#if ROOT_VERSION(6,32,0)<=ROOT_VERSION_CODE
+#include "RooFit/EvalContext.h"
+#endif
+// ============================================================================
 // Ostap
 // ============================================================================
 #include "Ostap/PyPdf.h"
@@ -44,6 +49,42 @@ namespace
   /// defautl (invalid) value 
   const double s_DEFAULT {-1000 } ;   /// default (invalid) value 
   // ==========================================================================
+#if ROOT_VERSION(6,32,0)<=ROOT_VERSION_CODE
+  // ==========================================================================
+  /** fill the contiguous buffer with values of all variables 
+   *  - (nvars x size) matrix, row-by-row
+   *  - scalar variables (e.g. parameters) are broadcasted 
+   *  @param context (INPUT) evaluation context 
+   *  @param vars    (INPUT) list of variables 
+   *  @param size    (INPUT) batch size 
+   *  @param buffer  (UPDATE) the buffer 
+   */
+  void fill_inputs
+  ( RooFit::EvalContext& context ,
+    const RooListProxy&  vars    ,
+    const std::size_t    size    , 
+    std::vector<double>& buffer  )
+  {
+    buffer.resize ( vars.size () * size ) ;
+    double* b = buffer.data () ;
+    for ( const RooAbsArg* a : vars )
+      {
+        const std::span<const double> values = context.at ( a ) ;
+        if ( 1 == values.size () ) { std::fill ( b , b + size , values [ 0 ] ) ; }
+        else
+          {
+            Ostap::Assert ( size <= values.size ()                 ,
+                            "Invalid size of the input span"       ,
+                            "Ostap::Models::PyPdf::doEval"         ,
+                            INVALID_SIZE , __FILE__ , __LINE__     ) ;
+            std::copy ( values.begin () , values.begin () + size , b ) ;
+          }
+        b += size ;
+      }
+  }
+  // ==========================================================================
+#endif
+  // ==========================================================================
 }
 // ============================================================================
 /*  Standard constructor
@@ -215,6 +256,38 @@ Double_t Ostap::Models::PyPdf::evaluate() const
   return s_DEFAULT ;
 }
 // ============================================================================
+/*  helper function to be redefined in python for vectorised evaluation 
+ *  @param inputs (INPUT)  the values of all variables,
+ *                 (nvars x size) matrix, row-by-row 
+ *  @param output (UPDATE) the output buffer of size `size` 
+ *  @return true if the output is filled 
+ */
+// ============================================================================
+bool Ostap::Models::PyPdf::evaluate_buffers
+( const std::vector<double>& /* inputs */ ,
+  std::vector<double>&       /* output */ ) const 
+{ return false ; }
+// ============================================================================
+#if ROOT_VERSION(6,32,0)<=ROOT_VERSION_CODE
+// ============================================================================
+// vectorised evaluation of function for RooFit CPU backend
+// ============================================================================
+void Ostap::Models::PyPdf::doEval ( RooFit::EvalContext& context ) const 
+{
+  std::span<double> output = context.output () ;
+  const std::size_t size   = output.size   () ;
+  //
+  ::fill_inputs ( context , m_varlist , size , m_inputs ) ;
+  m_outputs.resize ( size ) ;
+  //
+  // python-side evaluation is not defined: use the default scalar evaluation 
+  if ( !evaluate_buffers ( m_inputs , m_outputs ) ) { RooAbsPdf::doEval ( context ) ; return ; }
+  //
+  std::copy ( m_outputs.begin () , m_outputs.end () , output.begin () ) ;
+}
+// ============================================================================
+#endif
+// ============================================================================
 // get a variable with index 
 // ============================================================================
 double Ostap::Models::PyPdf::value ( const unsigned short index ) const 
@@ -327,9 +400,11 @@ Ostap::Models::PyPdfLite::PyPdfLite
   : RooAbsPdf  ( right , name     ) 
     //
   , m_function ( right.m_function ) 
+  , m_batch    ( right.m_batch    ) 
   , m_varlist  ( "!varlist" , this , right.m_varlist ) 
 {
   if ( m_function ) { Py_XINCREF ( m_function  ) ; }
+  if ( m_batch    ) { Py_XINCREF ( m_batch     ) ; }
 }
 // ============================================================================
 // virtual destructor 
@@ -337,6 +412,7 @@ Ostap::Models::PyPdfLite::PyPdfLite
 Ostap::Models::PyPdfLite::~PyPdfLite() 
 {
   if ( m_function ) { Py_DECREF ( m_function  ) ; m_function  = nullptr ; }
+  if ( m_batch    ) { Py_DECREF ( m_batch     ) ; m_batch     = nullptr ; }
 }
 // ============================================================================
 std::size_t Ostap::Models::PyPdfLite::numrefs   () const
@@ -352,6 +428,35 @@ Ostap::Models::PyPdfLite::function  () const
   if ( m_function ) { Py_XINCREF ( m_function  ) ; }  
   return m_function ;
 }
+// ============================================================================
+/*  set the batch function for vectorised evaluation
+ *  @see Ostap::Models::PyPdfLite::doEval 
+ */
+// ============================================================================
+void Ostap::Models::PyPdfLite::set_batch ( PyObject* batch ) 
+{
+  if ( batch == m_batch ) { return ; }
+  //
+  Ostap::Assert ( nullptr == batch || PyCallable_Check ( batch ) , 
+                  "Invalid batch py-function"                    , 
+                  "Ostap::Models::PyPdfLite"                     ,
+                  INVALID_CALLABLE , __FILE__ , __LINE__         ) ;
+  //
+  if ( batch   ) { Py_XINCREF ( batch   ) ; }
+  if ( m_batch ) { Py_DECREF  ( m_batch ) ; }
+  m_batch = batch ;
+}
+// ============================================================================
+/*  get the batch function for vectorised evaluation (if any) 
+ *  @attention reference count is incremented!
+ */
+// ============================================================================
+const PyObject*
+Ostap::Models::PyPdfLite::batch () const
+{
+  if ( m_batch ) { Py_XINCREF ( m_batch ) ; }  
+  return m_batch ;
+}
 // =============================================================================
 Ostap::Models::PyPdfLite* 
 Ostap::Models::PyPdfLite::clone ( const char* name ) const 
@@ -419,6 +524,58 @@ Double_t Ostap::Models::PyPdfLite::evaluate() const
   return result_to_double ( result , "PyPdfLite::evaluate" ) ;
   }
 // ============================================================================
+#if ROOT_VERSION(6,32,0)<=ROOT_VERSION_CODE
+// ============================================================================
+// vectorised evaluation of function for RooFit CPU backend
+// ============================================================================
+void Ostap::Models::PyPdfLite::doEval ( RooFit::EvalContext& context ) const 
+{
+  // batch function is not defined: use the default scalar evaluation 
+  if ( nullptr == m_batch ) { RooAbsPdf::doEval ( context ) ; return ; }
+  //
+  std::span<double> output = context.output () ;
+  const std::size_t size   = output.size   () ;
+  //
+  ::fill_inputs ( context , m_varlist , size , m_inputs ) ;
+  //
+  PyObject* inputs = PyMemoryView_FromMemory
+    ( reinterpret_cast<char*> ( m_inputs.data () ) , m_inputs.size () * sizeof ( double ) , PyBUF_READ  ) ;
+  PyObject* result = PyMemoryView_FromMemory
+    ( reinterpret_cast<char*> ( output.data   () ) , size             * sizeof ( double ) , PyBUF_WRITE ) ;
+  if ( !inputs || !result )
+    {
+      PyErr_Print () ;
+      Py_XDECREF ( inputs ) ;
+      Py_XDECREF ( result ) ;
+      Ostap::Assert ( false                                ,
+                      "Can't create memoryview"            ,
+                      "Ostap::Models::PyPdfLite::doEval"   ,
+                      ERROR_PYTHON , __FILE__ , __LINE__   ) ;
+    }
+  //
+  PyObject* ok = PyObject_CallFunctionObjArgs ( m_batch , inputs , result , nullptr ) ;
+  //
+  Py_XDECREF ( inputs ) ;
+  Py_XDECREF ( result ) ;
+  //
+  if ( !ok )
+    {
+      PyErr_Print () ;
+      Ostap::Assert ( false                                ,
+                      "Error in the batch function"        ,
+                      "Ostap::Models::PyPdfLite::doEval"   ,
+                      ERROR_PYTHON , __FILE__ , __LINE__   ) ;
+    }
+  //
+  const int filled = PyObject_IsTrue ( ok ) ;
+  Py_DECREF ( ok ) ;
+  //
+  // the output is not filled: use the default scalar evaluation 
+  if ( 1 != filled ) { PyErr_Clear () ; RooAbsPdf::doEval ( context ) ; }
+}
+// ============================================================================
+#endif
+// ============================================================================
 std::vector<double>
 Ostap::Models::PyPdfLite::get_values() const
 {
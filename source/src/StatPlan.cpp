@@ -0,0 +1,58 @@
+// ============================================================================
+// Include files
+// ============================================================================
+// Ostap
+// ============================================================================
+#include "Ostap/Statistic.h"
+#include "Ostap/StatPlan.h"
+// ============================================================================
+/** @file
+ *  Implementation of class Ostap::StatPlan
+ *  @see Ostap::StatPlan
+ *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+ *  @date 2026-10-17
+ */
+// ============================================================================
+// add unweighted counter to the plan
+// ============================================================================
+std::size_t Ostap::StatPlan::add
+( Ostap::Math::Statistic&  stat       ,
+  const std::string&       expression ,
+  const std::string&       selection  )
+{
+  Item item {} ;
+  item.stat       = &stat      ;
+  item.expression = expression ;
+  item.selection  = selection  ;
+  m_items.push_back ( item ) ;
+  return m_items.size () - 1 ;
+}
+// ============================================================================
+// add weighted counter to the plan
+// ============================================================================
+std::size_t Ostap::StatPlan::add
+( Ostap::Math::WStatistic& stat       ,
+  const std::string&       expression ,
+  const std::string&       selection  )
+{
+  Item item {} ;
+  item.wstat      = &stat      ;
+  item.expression = expression ;
+  item.selection  = selection  ;
+  m_items.push_back ( item ) ;
+  return m_items.size () - 1 ;
+}
+// ============================================================================
+// reset all counters
+// ============================================================================
+void Ostap::StatPlan::reset ()
+{
+  for ( auto& item : m_items )
+    {
+      if ( item.stat  ) { item.stat  -> reset () ; }
+      if ( item.wstat ) { item.wstat -> reset () ; }
+    }
+}
+// ============================================================================
+//                                                                      The END
+// ============================================================================
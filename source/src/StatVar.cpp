@@ -9,6 +9,7 @@
 #include <set>
 #include <random>
 #include <tuple>
+#include <limits>
 // ============================================================================
 // ROOT
 // ============================================================================
@@ -1568,6 +1569,249 @@ Ostap::StatVar::statVars
 }
 // ==========================================================================
 
+// =========================================================================
+// Statistics plan: many counters in one go
+// =========================================================================
+namespace
+{
+  // ==========================================================================
+  /// index of the string in the list of unique strings (add it, if needed)
+  inline std::size_t index_of
+  ( std::vector<std::string>& items ,
+    const std::string&        item  )
+  {
+    auto found = std::find ( items.begin () , items.end () , item ) ;
+    if ( items.end () != found ) { return found - items.begin () ; }
+    items.push_back ( item ) ;
+    return items.size () - 1 ;
+  }
+  // ==========================================================================
+  /// the special index for "no selection" 
+  const std::size_t s_NOCUT = std::numeric_limits<std::size_t>::max () ;
+  // ==========================================================================
+  /// decode the plan into the unique expressions & selections
+  inline void decode_plan
+  ( const Ostap::StatPlan&    plan        ,
+    std::vector<std::string>& expressions , 
+    std::vector<std::string>& selections  , 
+    std::vector<std::size_t>& iexprs      , 
+    std::vector<std::size_t>& icuts       )
+  {
+    iexprs.reserve ( plan.size () ) ;
+    icuts .reserve ( plan.size () ) ;
+    for ( const auto& item : plan )
+      {
+        iexprs.push_back ( index_of ( expressions , item.expression ) ) ;
+        icuts .push_back ( item.selection.empty () ? s_NOCUT : index_of ( selections , item.selection ) ) ;
+      }
+  }
+  // ==========================================================================
+} //                                             The end of anonymous namespace 
+// =========================================================================
+/*  Fill/update all counters from the statistics plan in one event loop 
+ *  @param data       (input)  data 
+ *  @param plan       (UPDATE) the plan: list of (counter, expression, selection) 
+ *  @param selection  (INPUT)  common selection/cut (applied to all requests)
+ *  @param first      (INPUT)  the first event to process (inclusive) 
+ *  @param last       (INPUT)  the last event to process (exclusive) 
+ *  @return status code 
+ *  @see Ostap::StatPlan
+ *  @attention for Ostap::Math::Statistic  counters selections are treated as boolean!
+ *  @attention for Ostap::Math::WStatistic counters selections are treated as weights!
+ */
+// =========================================================================
+Ostap::StatusCode Ostap::StatVar::get_stats
+( TTree*                    data       ,
+  Ostap::StatPlan&          plan       ,
+  const std::string&        selection  ,
+  const Ostap::EventIndex   first      ,
+  const Ostap::EventIndex   last       ) const 
+{
+  /// reset all counters 
+  plan.reset () ;
+  //
+  if ( plan.empty ()      ) { return Ostap::StatusCode::SUCCESS ; }
+  if ( last <= first      ) { return Ostap::StatusCode::SUCCESS ; }
+  if ( nullptr == data    ) { return INVALID_DATA    ; }
+  //
+  const Ostap::EventIndex  num_entries = data -> GetEntries () ;
+  const Ostap::EventIndex  the_last    = std::min ( last , num_entries ) ;
+  if ( the_last <= first ) { return Ostap::StatusCode::SUCCESS ; }
+  //
+  // (1) unique expressions and selections 
+  std::vector<std::string> expressions {} , selections {} ;
+  std::vector<std::size_t> iexprs      {} , icuts      {} ;
+  decode_plan ( plan , expressions , selections , iexprs , icuts ) ;
+  //
+  // (2) all formulae are created only once
+  const Ostap::Formulae exprs ( data , expressions ) ;
+  const Ostap::Formulae cutfs ( data , selections  ) ;
+  //
+  const std::unique_ptr<Ostap::Formula> cuts { Ostap::makeFormula ( selection , data , true ) } ;
+  const bool                with_cuts   = cuts && cuts->ok () ;
+  //
+  Ostap::Utils::ProgressBar bar    ( the_last - first , m_progress ) ;
+  Ostap::Utils::Notifier    notify ( exprs.begin () , exprs.end () , cuts.get () , data ) ;
+  for ( const auto& f : cutfs ) { notify.add ( f ) ; }
+  //
+  // (3) the caches: each expression and selection is evaluated at most once per entry  
+  std::vector<std::vector<double> > values ( expressions.size () ) ;
+  std::vector<double>               wcuts  ( selections .size () , 0.0 ) ;
+  std::vector<char>                 vdone  ( expressions.size () , 0   ) ;
+  std::vector<char>                 cdone  ( selections .size () , 0   ) ;
+  //
+  const std::size_t N = plan.size () ;
+  for ( Ostap::EventIndex   entry = first ; entry < the_last  ; ++entry , ++bar )
+    {
+      //
+      const long ievent = data -> GetEntryNumber ( entry ) ;
+      if ( 0 > ievent )                      { return INVALID_ENTRY ; }  // RETURN 
+      if ( 0 > data -> LoadTree ( ievent ) ) { return INVALID_EVENT ; }  // RETURN 
+      //
+      const double wc = with_cuts ? cuts->evaluate() : 1.0  ;
+      if ( !wc || !std::isfinite ( wc ) ) { continue ; }                 // CONTINUE
+      //
+      std::fill ( vdone.begin () , vdone.end () , 0 ) ;
+      std::fill ( cdone.begin () , cdone.end () , 0 ) ;
+      //
+      for ( std::size_t i = 0 ; i < N ; ++i )
+        {
+          double weight = wc ;
+          const std::size_t ic = icuts [ i ] ;
+          if ( s_NOCUT != ic )
+            {
+              if ( !cdone [ ic ] )
+                {
+                  wcuts [ ic ] = ( *( cutfs.begin () + ic ) ) -> evaluate () ;
+                  cdone [ ic ] = 1 ;
+                }
+              weight *= wcuts [ ic ] ;
+            }
+          if ( !weight || !std::isfinite ( weight ) ) { continue ; }     // CONTINUE
+          //
+          const std::size_t ie = iexprs [ i ] ;
+          if ( !vdone [ ie ] )
+            {
+              exprs.evaluate ( ie , values [ ie ] ) ;
+              vdone [ ie ] = 1 ;
+            }
+          //
+          const Ostap::StatPlan::Item& item = plan.items () [ i ] ;
+          if      ( item.wstat )
+            { for ( const double v : values [ ie ] ) { if ( std::isfinite ( v ) ) { item.wstat -> update ( v , weight ) ; } } }
+          else if ( item.stat  )
+            { for ( const double v : values [ ie ] ) { if ( std::isfinite ( v ) ) { item.stat  -> update ( v          ) ; } } }
+        }
+    }
+  //
+  return Ostap::StatusCode::SUCCESS ;
+}
+// =========================================================================
+/*  Fill/update all counters from the statistics plan in one event loop 
+ *  @param data       (input)  data 
+ *  @param plan       (UPDATE) the plan: list of (counter, expression, selection) 
+ *  @param selection  (INPUT)  common selection/cut (applied to all requests)
+ *  @param cut_range  (INPUT)  if non empty: use events only from this range 
+ *  @param first      (INPUT)  the first event to process (inclusive) 
+ *  @param last       (INPUT)  the last event to process (exclusive) 
+ *  @return status code 
+ *  @see Ostap::StatPlan
+ *  @attention for Ostap::Math::Statistic  counters selections and weights are treated as boolean!
+ *  @attention for Ostap::Math::WStatistic counters selections are treated as weights!
+ */
+// =========================================================================
+Ostap::StatusCode Ostap::StatVar::get_stats
+( const RooAbsData*         data       ,
+  Ostap::StatPlan&          plan       ,
+  const std::string&        selection  ,
+  const std::string&        cut_range  ,
+  const Ostap::EventIndex   first      ,
+  const Ostap::EventIndex   last       ) const 
+{
+  /// reset all counters 
+  plan.reset () ;
+  //
+  if ( plan.empty ()      ) { return Ostap::StatusCode::SUCCESS ; }
+  if ( last <= first      ) { return Ostap::StatusCode::SUCCESS ; }
+  if ( nullptr == data    ) { return INVALID_DATA    ; }
+  //
+  const Ostap::EventIndex num_entries = data -> numEntries() ;
+  const Ostap::EventIndex the_last    = std::min ( num_entries , last ) ;
+  if ( the_last <= first  ) { return Ostap::StatusCode::SUCCESS ; }
+  //
+  // (1) unique expressions and selections 
+  std::vector<std::string> expressions {} , selections {} ;
+  std::vector<std::size_t> iexprs      {} , icuts      {} ;
+  decode_plan ( plan , expressions , selections , iexprs , icuts ) ;
+  //
+  // (2) all formulae are created only once
+  const Ostap::FormulaVars exprs ( data , expressions ) ;
+  const Ostap::FormulaVars cutfs ( data , selections  ) ;
+  //
+  const std::unique_ptr<Ostap::FormulaVar> cuts { Ostap::makeFormula ( selection , data , true ) } ;
+  const bool  with_cuts = cuts && cuts->ok () ;
+  const bool  weighted  = data -> isWeighted() ;
+  const char* cutrange  = cut_range.empty() ? nullptr : cut_range.c_str() ;
+  //
+  // (3) the caches: each expression and selection is evaluated at most once per entry  
+  std::vector<double> values ( expressions.size () , 0.0 ) ;
+  std::vector<double> wcuts  ( selections .size () , 0.0 ) ;
+  std::vector<char>   vdone  ( expressions.size () , 0   ) ;
+  std::vector<char>   cdone  ( selections .size () , 0   ) ;
+  //
+  const std::size_t N = plan.size () ;
+  Ostap::Utils::ProgressBar bar { the_last - first , m_progress } ; 
+  for ( Ostap::EventIndex entry = first ; entry < the_last ; ++entry , ++bar )
+    {
+      const RooArgSet* vars = data -> get ( entry ) ;
+      if ( nullptr == vars )                             { break    ; } // BREAK 
+      //
+      if ( cutrange && !vars->allInRange ( cutrange ) )  { continue ; } // CONTINUE    
+      // apply weight:
+      const double wd = weighted  ? data -> weight () : 1.0 ;
+      if ( !wd ) { continue ; }                                         // CONTINUE    
+      // apply cuts:
+      const double wc = with_cuts ? cuts -> getVal () : 1.0 ;
+      if ( !wc ) { continue ; }                                         // CONTINUE  
+      //
+      std::fill ( vdone.begin () , vdone.end () , 0 ) ;
+      std::fill ( cdone.begin () , cdone.end () , 0 ) ;
+      //
+      for ( std::size_t i = 0 ; i < N ; ++i )
+        {
+          double weight = wd * wc ;
+          const std::size_t ic = icuts [ i ] ;
+          if ( s_NOCUT != ic )
+            {
+              if ( !cdone [ ic ] )
+                {
+                  wcuts [ ic ] = cutfs.evaluate ( ic ) ;
+                  cdone [ ic ] = 1 ;
+                }
+              weight *= wcuts [ ic ] ;
+            }
+          if ( !weight || !std::isfinite ( weight ) ) { continue ; }     // CONTINUE
+          //
+          const std::size_t ie = iexprs [ i ] ;
+          if ( !vdone [ ie ] )
+            {
+              values [ ie ] = exprs.evaluate ( ie ) ;
+              vdone  [ ie ] = 1 ;
+            }
+          //
+          const double value = values [ ie ] ;
+          if ( !std::isfinite ( value ) ) { continue ; }                 // CONTINUE
+          //
+          const Ostap::StatPlan::Item& item = plan.items () [ i ] ;
+          if      ( item.wstat ) { item.wstat -> update ( value , weight ) ; }
+          else if ( item.stat  ) { item.stat  -> update ( value          ) ; }
+        }
+    }
+  //
+  return Ostap::StatusCode::SUCCESS ; 
+}
+// ==========================================================================
+
 // =========================================================================
 /// Is there at leats one good entry in dataset ?
 // =========================================================================
@@ -0,0 +1,361 @@
+// ============================================================================
+// Include files
+// ============================================================================
+//  STD&STL
+// ============================================================================
+#include <algorithm>
+#include <numeric>
+#include <limits>
+#include <cmath>
+// ============================================================================
+// Ostap
+// ============================================================================
+#include "Ostap/TDigest.h"
+#include "Ostap/StatusCode.h"
+// ============================================================================
+// local
+// ============================================================================
+#include "status_codes.h"
+// ============================================================================
+/** @file
+ *  Implementation file for class Ostap::Math::TDigest
+ *  @see https://arxiv.org/abs/1902.04023
+ *  @date 2026-10-17
+ *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+ */
+// ============================================================================
+namespace
+{
+  // ==========================================================================
+  /// \f$ k_1\f$ scale function: \f$ k(q) = \frac{\delta}{2\pi} \asin ( 2q - 1 ) \f$
+  inline double k_scale
+  ( const double q     ,
+    const double delta )
+  { return delta * std::asin ( 2 * q - 1 ) / ( 2 * M_PI ) ; }
+  // ==========================================================================
+  /// inverse \f$ k_1\f$ scale function
+  inline double k_inverse
+  ( const double k     ,
+    const double delta )
+  {
+    const double kk = k * 2 * M_PI / delta ;
+    return kk >= M_PI_2 ? 1.0 : ( std::sin ( kk ) + 1 ) / 2 ;
+  }
+  // ==========================================================================
+  /// ordering of centroids
+  inline bool by_mean
+  ( const Ostap::Math::TDigest::Centroid& a ,
+    const Ostap::Math::TDigest::Centroid& b )
+  { return a.first < b.first ; }
+  // ==========================================================================
+}
+// ============================================================================
+// constructor from the compression parameter
+// ============================================================================
+Ostap::Math::TDigest::TDigest
+( const double compression )
+  : m_compression ( compression )
+  , m_capacity    ( 500 )
+  , m_centroids   (     )
+  , m_buffer      (     )
+  , m_counter     (     )
+{
+  Ostap::Assert ( 10 <= compression && std::isfinite ( compression ) ,
+                  "Invalid compression parameter"               ,
+                  "Ostap::Math::TDigest"                        ,
+                  INVALID_PARAMETER , __FILE__ , __LINE__       ) ;
+  //
+  m_capacity = static_cast<std::size_t> ( 5 * m_compression ) ;
+  m_centroids.reserve ( static_cast<std::size_t> ( 2 * m_compression ) ) ;
+  m_buffer   .reserve ( m_capacity ) ;
+}
+// ============================================================================
+// full constructor (e.g. for deserialization)
+// ============================================================================
+Ostap::Math::TDigest::TDigest
+( const double               compression ,
+  const std::vector<double>& means       ,
+  const std::vector<double>& weights     ,
+  const Counter&             counter     )
+  : TDigest ( compression )
+{
+  Ostap::Assert ( means.size() == weights.size()                ,
+                  "Mismatch in means/weights sizes"             ,
+                  "Ostap::Math::TDigest"                        ,
+                  INVALID_SIZE , __FILE__ , __LINE__            ) ;
+  //
+  m_centroids.reserve ( means.size() ) ;
+  for ( std::size_t i = 0 ; i < means.size() ; ++i )
+    { m_centroids.emplace_back ( means [ i ] , weights [ i ] ) ; }
+  std::sort ( m_centroids.begin () , m_centroids.end () , by_mean ) ;
+  //
+  m_counter = counter ;
+}
+// ============================================================================
+// reset the digest
+// ============================================================================
+void Ostap::Math::TDigest::reset ()
+{
+  m_centroids.clear () ;
+  m_buffer   .clear () ;
+  m_counter  .reset () ;
+}
+// ============================================================================
+// add one more value (with weight)
+// ============================================================================
+Ostap::Math::TDigest&
+Ostap::Math::TDigest::add
+( const double value  ,
+  const double weight )
+{
+  /// (1) skip non-finite values & non-positive weights
+  if ( !std::isfinite ( value  )                ) { return *this ; }
+  if ( !std::isfinite ( weight ) || weight <= 0 ) { return *this ; }
+  /// (2) update the helper counter
+  m_counter.add ( value ) ;
+  /// (3) add to buffer
+  m_buffer.emplace_back ( value , weight ) ;
+  if ( m_capacity <= m_buffer.size() ) { compress () ; }
+  //
+  return *this ;
+}
+// ============================================================================
+// merge two digests
+// ============================================================================
+Ostap::Math::TDigest&
+Ostap::Math::TDigest::add
+( const Ostap::Math::TDigest& right )
+{
+  if ( !right.ok () ) { return *this ; }
+  if ( this == &right )
+    {
+      const TDigest copy { right } ;
+      return add ( copy ) ;
+    }
+  //
+  m_buffer.insert ( m_buffer.end () , right.m_centroids.begin () , right.m_centroids.end () ) ;
+  m_buffer.insert ( m_buffer.end () , right.m_buffer   .begin () , right.m_buffer   .end () ) ;
+  m_counter += right.m_counter ;
+  //
+  compress () ;
+  return *this ;
+}
+// ============================================================================
+// merge buffered points into centroids
+// ============================================================================
+void Ostap::Math::TDigest::compress () const
+{
+  if ( m_buffer.empty () ) { return ; }
+  //
+  m_buffer.insert ( m_buffer.end () , m_centroids.begin () , m_centroids.end () ) ;
+  std::sort ( m_buffer.begin () , m_buffer.end () , by_mean ) ;
+  //
+  const double total = std::accumulate
+    ( m_buffer.begin () , m_buffer.end () , 0.0 ,
+      [] ( const double s , const Centroid& c ) { return s + c.second ; } ) ;
+  //
+  m_centroids.clear () ;
+  //
+  double   wsofar = 0 ;
+  double   qlimit = k_inverse ( k_scale ( 0.0 , m_compression ) + 1 , m_compression ) ;
+  Centroid current = m_buffer.front () ;
+  for ( auto it = m_buffer.begin () + 1 ; m_buffer.end () != it ; ++it )
+    {
+      const double q = ( wsofar + current.second + it->second ) / total ;
+      if ( q <= qlimit )
+        {
+          // merge into the current centroid
+          current.second += it->second ;
+          current.first  += ( it->first - current.first ) * it->second / current.second ;
+        }
+      else
+        {
+          // close the current centroid & start new one
+          m_centroids.push_back ( current ) ;
+          wsofar  += current.second ;
+          qlimit   = k_inverse ( k_scale ( wsofar / total , m_compression ) + 1 , m_compression ) ;
+          current  = *it ;
+        }
+    }
+  m_centroids.push_back ( current ) ;
+  //
+  m_buffer.clear () ;
+}
+// ============================================================================
+// total weight
+// ============================================================================
+double Ostap::Math::TDigest::weight () const
+{
+  compress () ;
+  return std::accumulate
+    ( m_centroids.begin () , m_centroids.end () , 0.0 ,
+      [] ( const double s , const Centroid& c ) { return s + c.second ; } ) ;
+}
+// ============================================================================
+// number of centroids (compressed)
+// ============================================================================
+std::size_t Ostap::Math::TDigest::ncentroids () const
+{
+  compress () ;
+  return m_centroids.size () ;
+}
+// ============================================================================
+// means of centroids (compressed)
+// ============================================================================
+std::vector<double> Ostap::Math::TDigest::means () const
+{
+  compress () ;
+  std::vector<double> result ( m_centroids.size () ) ;
+  std::transform ( m_centroids.begin () , m_centroids.end () , result.begin () ,
+                   [] ( const Centroid& c ) { return c.first ; } ) ;
+  return result ;
+}
+// ============================================================================
+// weights of centroids (compressed)
+// ============================================================================
+std::vector<double> Ostap::Math::TDigest::weights () const
+{
+  compress () ;
+  std::vector<double> result ( m_centroids.size () ) ;
+  std::transform ( m_centroids.begin () , m_centroids.end () , result.begin () ,
+                   [] ( const Centroid& c ) { return c.second ; } ) ;
+  return result ;
+}
+// ============================================================================
+// get the quantile value for probability p
+// ============================================================================
+double Ostap::Math::TDigest::quantile
+( const double p ) const
+{
+  Ostap::Assert ( 0 <= p && p <= 1                              ,
+                  "Invalid probability"                         ,
+                  "Ostap::Math::TDigest"                        ,
+                  INVALID_QUANTILE , __FILE__ , __LINE__        ) ;
+  //
+  if ( !ok () ) { return std::numeric_limits<double>::quiet_NaN () ; }
+  //
+  const double xmin = min () ;
+  const double xmax = max () ;
+  if      ( 0 == p ) { return xmin ; }
+  else if ( 1 == p ) { return xmax ; }
+  //
+  compress () ;
+  //
+  const std::size_t n = m_centroids.size () ;
+  if ( 1 == n ) { return m_centroids.front ().first ; }
+  //
+  const double total  = weight () ;
+  const double target = p * total ;
+  //
+  // left tail: interpolate between the minimum and the first centroid
+  const Centroid& first = m_centroids.front () ;
+  if ( target < 0.5 * first.second )
+    { return xmin + ( first.first - xmin ) * target / ( 0.5 * first.second ) ; }
+  //
+  // right tail: interpolate between the last centroid and the maximum
+  const Centroid& last = m_centroids.back () ;
+  if ( target > total - 0.5 * last.second )
+    { return xmax - ( xmax - last.first ) * ( total - target ) / ( 0.5 * last.second ) ; }
+  //
+  // bulk: interpolate between the centers of adjacent centroids
+  double cumulative = 0.5 * first.second ;
+  for ( std::size_t i = 0 ; i + 1 < n ; ++i )
+    {
+      const Centroid& c1 = m_centroids [ i     ] ;
+      const Centroid& c2 = m_centroids [ i + 1 ] ;
+      const double    dw = 0.5 * ( c1.second + c2.second ) ;
+      if ( target <= cumulative + dw )
+        { return c1.first + ( c2.first - c1.first ) * ( target - cumulative ) / dw ; }
+      cumulative += dw ;
+    }
+  //
+  return last.first ;
+}
+// ============================================================================
+// get quantiles for (sorted) probabilities
+// ============================================================================
+std::vector<double> Ostap::Math::TDigest::quantiles
+( const std::vector<double>& ps ) const
+{
+  std::vector<double> result {} ;
+  result.reserve   ( ps.size () + 2 ) ; // ATTENTION!!!
+  result.push_back ( this->min ()   ) ; // ADD MIN
+  for ( const double p : ps ) { result.push_back ( quantile ( p ) ) ; }
+  result.push_back ( this->max ()   ) ; // ADD MAX
+  return result ;
+}
+// ============================================================================
+// get N equidistant quantiles
+// ============================================================================
+std::vector<double> Ostap::Math::TDigest::quantiles
+( const unsigned short N ) const
+{
+  Ostap::Assert ( 1 <= N ,
+                  "Invalid quantile index "                     ,
+                  "Ostap::Math::TDigest"                        ,
+                  INVALID_QUANTILE_INDEX  , __FILE__ , __LINE__ ) ;
+  //
+  std::vector<double> ps ( N ) ;
+  for ( std::size_t i = 0 ; i < N ; ++ i ) { ps [ i ] = ( i + 1.0 ) / ( N + 1 ) ; }
+  return quantiles ( ps ) ;
+}
+// ============================================================================
+// get the (approximate) cumulative distribution function
+// ============================================================================
+double Ostap::Math::TDigest::cdf
+( const double x ) const
+{
+  if ( !ok () ) { return std::numeric_limits<double>::quiet_NaN () ; }
+  //
+  const double xmin = min () ;
+  const double xmax = max () ;
+  if      ( x <  xmin ) { return 0 ; }
+  else if ( x >= xmax ) { return 1 ; }
+  //
+  compress () ;
+  //
+  const std::size_t n     = m_centroids.size () ;
+  const double      total = weight () ;
+  //
+  const Centroid& first = m_centroids.front () ;
+  const Centroid& last  = m_centroids.back  () ;
+  //
+  if ( 1 == n ) { return ( x - xmin ) / ( xmax - xmin ) ; }
+  //
+  if ( x < first.first )
+    { return first.first > xmin ? 0.5 * first.second * ( x - xmin ) / ( first.first - xmin ) / total : 0.0 ; }
+  if ( x >= last.first )
+    { return xmax > last.first  ? 1 - 0.5 * last.second * ( xmax - x ) / ( xmax - last.first ) / total : 1.0 ; }
+  //
+  double cumulative = 0.5 * first.second ;
+  for ( std::size_t i = 0 ; i + 1 < n ; ++i )
+    {
+      const Centroid& c1 = m_centroids [ i     ] ;
+      const Centroid& c2 = m_centroids [ i + 1 ] ;
+      const double    dw = 0.5 * ( c1.second + c2.second ) ;
+      if ( x < c2.first )
+        {
+          const double dx = c2.first - c1.first ;
+          return ( cumulative + ( 0 < dx ? dw * ( x - c1.first ) / dx : 0.0 ) ) / total ;
+        }
+      cumulative += dw ;
+    }
+  //
+  return cumulative / total ;
+}
+// ============================================================================
+// swap two objects
+// ============================================================================
+void Ostap::Math::TDigest::swap
+( Ostap::Math::TDigest& right )
+{
+  std::swap ( m_compression , right.m_compression ) ;
+  std::swap ( m_capacity    , right.m_capacity    ) ;
+  std::swap ( m_centroids   , right.m_centroids   ) ;
+  std::swap ( m_buffer      , right.m_buffer      ) ;
+  //
+  m_counter.swap ( right.m_counter ) ;
+}
+// ============================================================================
+//                                                                      The END
+// ============================================================================
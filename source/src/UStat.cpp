@@ -33,6 +33,7 @@
 #include "Ostap/UStat.h"
 #include "Ostap/Iterator.h"
 #include "Ostap/ProgressBar.h"
+#include "Ostap/KDTree.h"
 // ============================================================================
 // Local
 // ============================================================================
@@ -46,36 +47,6 @@
  *  @author Vanya BELYAEV Ivan.Belyaev@cern.ch
  */
 // ============================================================================
-namespace 
-{
-  // ==========================================================================
-  double getDistance
-  ( const RooArgSet* x , 
-    const RooArgSet* y )
-  {
-    if ( !x || !y ) { return -1 ; } // RETURN 
-    //
-    double result = 0.;
-    //
-    for ( auto* xa : *x )
-    {
-      if ( !xa ) { continue ; } 
-      const RooAbsArg*  ya   = y -> find ( *xa ) ;
-      if ( !ya ) { continue ; }       
-      const RooAbsReal* xv   = static_cast<const RooAbsReal*> ( xa ) ;
-      if ( !xv ) { continue ; }
-      const RooAbsReal* yv   = static_cast<const RooAbsReal*> ( ya ) ;
-      if ( !yv ) { continue ; }
-      const double      val  = xv -> getVal() - yv->getVal() ;
-      result                += val * val ;
-      //
-    }
-    //
-    return std::sqrt ( result ) ;
-  }
-  // ==========================================================================
-} //                                                 end of anonymous namespace  
-// ============================================================================
 /*  Calculate U-statistics 
  *  @param pdf   (input) PDF
  *  @param data  (input) data 
@@ -90,7 +61,8 @@ Ostap::StatusCode Ostap::UStat::calculate
   double&                        tStat ,
   TH1*                           hist  ,
   const RooArgSet*               args  , 
-  const Ostap::UStat::Uniformity algo  )  
+  const Ostap::UStat::Uniformity algo  , 
+  const unsigned short           nthreads )  
 {
   /// make a fake progress bar 
   Ostap::Utils::ProgressConf progress { 0 } ;
@@ -100,7 +72,8 @@ Ostap::StatusCode Ostap::UStat::calculate
                      tStat    ,
                      hist     ,
                      args     ,
-                     algo     ) ;                  
+                     algo     , 
+                     nthreads ) ;                  
 }
 // ============================================================================
 /*  calculate U-statistics 
@@ -118,7 +91,8 @@ Ostap::StatusCode Ostap::UStat::calculate
   double&                           tStat    ,
   TH1*                              hist     ,
   const RooArgSet*                  args     , 
-  const Ostap::UStat::Uniformity    algo     )  
+  const Ostap::UStat::Uniformity    algo     , 
+  const unsigned short              nthreads )  
 {
   //
   if ( nullptr == args ) { args = pdf.getObservables ( data ) ; }
@@ -143,77 +117,48 @@ Ostap::StatusCode Ostap::UStat::calculate
   /// volume of n-ball 
   const double volume = Ostap::Math::nball_volume ( dim ) ;
   //
-  // const RooDataSet*  cloned = (RooDataSet*)data.Clone() ;
-  // std::unique_ptr<RooDataSet> cloned  { new RooDataSet ( data ) } ;
-  std::unique_ptr<RooDataSet> cloned = std::make_unique<RooDataSet> ( data , nullptr ) ;
-  //
   const unsigned int num    = data.numEntries () ;
   //
-  typedef std::vector<double> StatU ;
-  StatU uvalues ( num , 0.0 ) ; 
-  //
-  const RooArgSet* event_x = 0 ;
-  const RooArgSet* event_y = 0 ;
-  //
   // get the observables 
   std::unique_ptr<RooArgSet> observables { pdf.getObservables ( data ) } ;
   //
+  // (1) collect the coordinates & evaluate PDF  
+  std::vector<double> points    ( std::size_t ( num ) * dim , 0.0 ) ;
+  std::vector<double> pdfValues ( num , 0.0 ) ;
+  //
   Ostap::Utils::ProgressBar bar ( num , progress ) ;
   for ( unsigned int i = 0 ; i < num ; ++i , ++bar ) 
   {
     //
-    // 1. Get "Event"
-    event_x = data . get(i) ;      
-    if ( 0 == event_x || 0 == event_x->getSize() ) { return INVALID_ENTRY ; } // RETURN 
-    //
-#if ROOT_VERSION ( 6 , 32 , 0 ) <= ROOT_VERSION_CODE 
-    std::unique_ptr<RooArgSet> event_i ( event_x -> selectCommon ( rargs ) ) ;
-#else
-    RooAbsCollection* xcoll = event_x -> selectCommon ( rargs ) ;
-    std::unique_ptr<RooArgSet> event_i ( static_cast<RooArgSet*> ( xcoll )) ;
-#endif
-    //
-    if ( !event_i || 0 == event_i->getSize() )     { return INVALID_ENTRY ; }             // RETURN 
-    //
-    // 2.Evaluate PDF 
+    const RooArgSet* event = data . get ( i ) ;      
+    if ( 0 == event || 0 == event->getSize() ) { return INVALID_ENTRY ; } // RETURN 
     //
-    ::assign ( *observables, *event_x ) ;
-    const double pdfValue = pdf . getVal ( *observables ) ;
-    //
-    const Int_t xs = event_i -> getSize () ;
-    //
-    // minimal distance 
-    double min_distance  = std::numeric_limits<double>::max () ;
-    for ( unsigned int j = 0 ; j < num ; ++j ) 
+    double* point = points.data () + std::size_t ( i ) * dim ;
+    unsigned int d = 0 ;
+    for ( const auto* a : rargs )
     {
-      if ( i == j ) { continue ; }
-      //
-      event_y = cloned -> get ( j ) ;      
-      if ( 0 == event_y || 0  == event_y->getSize() )  { return INVALID_ENTRY ; }            // RETURN 
-      //
-#if ROOT_VERSION ( 6 , 32 , 0 ) <= ROOT_VERSION_CODE 
-      std::unique_ptr<RooArgSet> event_j ( event_y -> selectCommon ( rargs ) ) ;
-#else
-      RooAbsCollection* ycoll = event_y -> selectCommon ( rargs ) ;
-      std::unique_ptr<RooArgSet> event_j ( static_cast<RooArgSet*> ( ycoll )) ;
-#endif
-      //
-      if ( !event_j     || xs != event_j->getSize() )  { return INVALID_ENTRY ; }            // RETURN 
-      //
-      const double distance = getDistance ( event_i.get() , event_j.get() ) ;
-      if ( distance < 0                             )  { return INVALID_ENTRY ; }
-      //
-      if ( 0 == j || distance <= min_distance ) { min_distance = distance  ; }
-      //
+      const RooAbsReal* v = dynamic_cast<const RooAbsReal*> ( event -> find ( *a ) ) ;
+      if ( !v ) { return INVALID_ENTRY ; }                                 // RETURN
+      point [ d++ ] = v -> getVal () ;
     }
     //
+    ::assign ( *observables, *event ) ;
+    pdfValues [ i ] = pdf . getVal ( *observables ) ;
+  }
+  //
+  // (2) find the nearest neighbours using k-d tree 
+  const Ostap::Math::KDTree tree      ( dim , std::move ( points ) ) ;
+  const std::vector<double> distances { tree.nearest_distances ( nthreads ) } ;
+  //
+  // (3) calculate U-values 
+  typedef std::vector<double> StatU ;
+  StatU uvalues ( num , 0.0 ) ; 
+  for ( unsigned int i = 0 ; i < num ; ++i ) 
+  {
     // volume of n-ball: 
-    const double vol   = volume * Ostap::Math::POW ( min_distance , dim ) ;
-    //
-    const double value = std::exp ( - vol * num * pdfValue ) ;
-    //
-    uvalues [ i ] = value ; 
+    const double vol   = volume * Ostap::Math::POW ( distances [ i ] , dim ) ;
     //
+    uvalues [ i ] = std::exp ( - vol * num * pdfValues [ i ] ) ;
   }
   //
   if ( hist ) { hist -> FillN ( uvalues.size() , uvalues.data() , nullptr ) ; }
@@ -13,6 +13,7 @@
 #include "Ostap/Beta.h"
 #include "Ostap/Bessel.h"
 #include "Ostap/BLOB.h"
+#include "Ostap/Batches.h"
 #include "Ostap/BSpline.h"
 #include "Ostap/Bernstein.h"
 #include "Ostap/Bernstein1D.h"
@@ -76,12 +77,14 @@
 #include "Ostap/HistoInterpolators.h"
 #include "Ostap/HistoMake.h"
 #include "Ostap/HistoStat.h"
+#include "Ostap/HistoWeight.h"
 #include "Ostap/IFuncs.h"
 #include "Ostap/IPower.hpp"
 #include "Ostap/Integrator.h"
 #include "Ostap/Interpolants.h"
 #include "Ostap/Interpolation.h"
 #include "Ostap/Iterator.h"
+#include "Ostap/KDTree.h"
 #include "Ostap/Kinematics.h"
 #include "Ostap/KramersKronig.h"
 #include "Ostap/Laplace.h"
@@ -165,11 +168,13 @@
 #include "Ostap/SVectorWithError.h"
 #include "Ostap/SVectorWithError.icpp"
 #include "Ostap/StatEntity.h"
+#include "Ostap/StatPlan.h"
 #include "Ostap/StatVar.h"
 #include "Ostap/Statistic.h"
 #include "Ostap/Stats.h"
 #include "Ostap/StatusCode.h"
 #include "Ostap/SymmetricMatrixTypes.h"
+#include "Ostap/TDigest.h"
 #include "Ostap/Tails.h"
 #include "Ostap/Tee.h"
 #include "Ostap/Tensors.h"
@@ -189,6 +194,7 @@
 #include "Ostap/Vector3DTypes.h"
 #include "Ostap/Vector3DWithError.h"
 #include "Ostap/Vector4DTypes.h"
+#include "Ostap/VectorCall.h"
 #include "Ostap/Voigt.h"
 #include "Ostap/WStatEntity.h"
 #include "Ostap/Workspace.h"